@@ -11,6 +11,7 @@ from ..engines.cognitive_field_dynamics import CognitiveFieldDynamics, SemanticF
 from ..vault.database import SessionLocal, GeoidDB
 from ..vault.crud import get_geoids_with_embeddings
 from ..monitoring.cognitive_field_metrics import get_metrics_collector
+from ..monitoring.memory_accounting import register_memory_reporter
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,7 @@ router = APIRouter(
 
 # --- Service Initialization ---
 field_service = CognitiveFieldDynamics(dimension=1024)  # Standard embedding dimension
+register_memory_reporter("cognitive_fields", field_service.memory_footprint)
 evolution_task: Optional[asyncio.Task] = None
 metrics_collector = get_metrics_collector()
 
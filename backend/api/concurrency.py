@@ -0,0 +1,119 @@
+"""Bounded execution layer for blocking work inside async request handlers.
+
+Most of the Kimera stack (SQLAlchemy ORM sessions, embedding inference, numpy
+heavy engines, psutil probes) is synchronous.  Calling it directly from an
+``async def`` FastAPI handler blocks the event loop and serialises every other
+in-flight request behind it.
+
+This module offers two dedicated, bounded thread pools:
+
+* the **DB pool** for work that holds a database session; its size should not
+  exceed the SQLAlchemy connection pool so threads never queue on connections,
+* the **compute pool** for model inference and CPU-bound engine calls (torch
+  and numpy release the GIL for the expensive parts).
+
+Handlers ``await run_db(fn, ...)`` / ``await run_compute(fn, ...)`` and keep
+the event loop free for other requests.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DB_WORKERS = int(os.getenv("KIMERA_DB_WORKERS", "8"))
+COMPUTE_WORKERS = int(os.getenv("KIMERA_COMPUTE_WORKERS", str(min(16, (os.cpu_count() or 1) + 4))))
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_limits: Dict[str, int] = {"db": DB_WORKERS, "compute": COMPUTE_WORKERS}
+_in_flight: Dict[str, int] = {"db": 0, "compute": 0}
+_completed: Dict[str, int] = {"db": 0, "compute": 0}
+_lock = threading.Lock()
+
+
+def _get_executor(kind: str) -> ThreadPoolExecutor:
+    """Return the executor for ``kind``, creating it lazily (thread-safe)."""
+    executor = _executors.get(kind)
+    if executor is None:
+        with _lock:
+            executor = _executors.get(kind)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=_limits[kind],
+                    thread_name_prefix=f"kimera-{kind}",
+                )
+                _executors[kind] = executor
+    return executor
+
+
+def _tracked(kind: str, fn: Callable[..., T]) -> Callable[..., T]:
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        with _lock:
+            _in_flight[kind] += 1
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with _lock:
+                _in_flight[kind] -= 1
+                _completed[kind] += 1
+    return wrapper
+
+
+async def _run(kind: str, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    loop = asyncio.get_running_loop()
+    call = functools.partial(_tracked(kind, fn), *args, **kwargs)
+    return await loop.run_in_executor(_get_executor(kind), call)
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``fn`` (which opens/uses a DB session) on the bounded DB pool."""
+    return await _run("db", fn, *args, **kwargs)
+
+
+async def run_compute(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``fn`` (model inference / CPU work) on the bounded compute pool."""
+    return await _run("compute", fn, *args, **kwargs)
+
+
+def configure_executors(db_workers: Optional[int] = None, compute_workers: Optional[int] = None) -> None:
+    """Resize the pools.  Existing executors are replaced on next use."""
+    with _lock:
+        for kind, size in (("db", db_workers), ("compute", compute_workers)):
+            if size is None:
+                continue
+            _limits[kind] = max(1, int(size))
+            old = _executors.pop(kind, None)
+            if old is not None:
+                old.shutdown(wait=False)
+
+
+def get_executor_stats() -> Dict[str, Dict[str, int]]:
+    """Return per-pool size, in-flight and completed call counts."""
+    with _lock:
+        return {
+            kind: {
+                "max_workers": _limits[kind],
+                "in_flight": _in_flight[kind],
+                "completed": _completed[kind],
+            }
+            for kind in _limits
+        }
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """Shut down both pools (called from the application shutdown hook)."""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait)
+    log.info("Execution pools shut down")
@@ -0,0 +1,39 @@
+"""
+Streaming export routes for Kimera SWM
+
+Bulk-export vault tables as NDJSON without materialising them in memory.
+Rows are paged by primary key and written to the response as they are read.
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import Optional
+
+from ..vault.export import DEFAULT_PAGE_SIZE, EXPORT_TABLES, iter_ndjson
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+
+@router.get("/{table}")
+async def export_table(
+    table: str,
+    since: Optional[datetime] = Query(None, description="Inclusive lower bound on the row timestamp"),
+    until: Optional[datetime] = Query(None, description="Exclusive upper bound on the row timestamp"),
+    vault_id: Optional[str] = Query(None, description="Only export scars from this vault"),
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=10000),
+):
+    """Stream every row of ``geoids``, ``scars`` or ``insights`` as NDJSON."""
+    if table not in EXPORT_TABLES:
+        raise HTTPException(status_code=404, detail=f"Unknown table '{table}'. Choose from: {', '.join(EXPORT_TABLES)}")
+    try:
+        lines = iter_ndjson(table, since=since, until=until, vault_id=vault_id, page_size=page_size)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    # A sync iterator is consumed in Starlette's threadpool, keeping DB reads off the event loop.
+    return StreamingResponse(
+        lines,
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{table}.ndjson"'},
+    )
@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dotenv import load_dotenv
 load_dotenv()  # Load .env file
-from fastapi import FastAPI, HTTPException, UploadFile, File, Request, BackgroundTasks
+from fastapi import FastAPI, HTTPException, UploadFile, File, Request, BackgroundTasks, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from PIL import Image
 import io
 from pydantic import BaseModel
@@ -12,10 +13,10 @@ import uuid
 from datetime import datetime
 import os
 import time
+_import_started = time.perf_counter()
 import json
 import logging
-from sqlalchemy import create_engine, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import insert, text
 from contextlib import asynccontextmanager
 import asyncio
 import numpy as np
@@ -23,7 +24,8 @@ import numpy as np
 from ..core.geoid import GeoidState
 from ..core.scar import ScarRecord
 from ..core.models import LinguisticGeoid
-from ..core.embedding_utils import encode_text, extract_semantic_features, initialize_embedding_model, get_embedding_model
+from ..core.embedding_utils import encode_text, encode_batch, extract_semantic_features, get_embedding_model, get_loaded_embedding_model
+from ..core.lazy_loading import components
 from ..engines.contradiction_engine import ContradictionEngine, TensionGradient
 from ..engines.thermodynamics import SemanticThermodynamicsEngine
 from ..engines.asm import AxisStabilityMonitor
@@ -32,13 +34,20 @@ from ..engines.kccl import KimeraCognitiveCycle
 from ..engines.meta_insight import MetaInsightEngine
 from ..vault import get_vault_manager
 from ..vault.database import SessionLocal, GeoidDB, ScarDB, engine
+from ..vault.db_engine import get_pool_status
 from ..engines.background_jobs import start_background_jobs, stop_background_jobs
-from ..engines.clip_service import clip_service
+from ..engines.clip_service import clip_service, content_hash
 from ..linguistic.echoform import parse_echoform
 from .middleware import icw_middleware
+from .concurrency import run_db, run_compute, shutdown_executors
 from .monitoring_routes import router as monitoring_router
 from .cognitive_field_routes import router as cognitive_field_router
-from ..monitoring.telemetry import router as telemetry_router
+from .export_routes import router as export_router
+from .profiling_routes import router as profiling_router
+from ..monitoring.memory_accounting import estimate_size, register_memory_reporter
+from ..monitoring.profiler import ProfilingMiddleware, profiling_enabled
+from ..monitoring.telemetry import router as telemetry_router, RequestMetricsMiddleware
+from ..monitoring.status_snapshot import StatusSnapshotter
 from ..core.native_math import NativeMath
 from ..engines.activation_synthesis import (
     trigger_activation_cascade,
@@ -58,11 +67,19 @@ from ..core.statistical_modeling import (
     StatisticalModelResult,
     analyze_entropy_time_series,
     analyze_contradiction_factors,
-    analyze_semantic_market
+    analyze_semantic_market,
+    run_comprehensive_analysis
+)
+from ..core.statistical_jobs import (
+    STATS_WAIT_SECONDS,
+    get_statistical_job_runner,
+    series_fingerprint,
+    shutdown_statistical_jobs
 )
 from ..monitoring.advanced_statistical_monitor import (
     advanced_monitor,
-    initialize_advanced_monitoring
+    initialize_advanced_monitoring,
+    LiveSnapshotProvider
 )
 from .enhanced_routes import router as enhanced_router
 
@@ -90,6 +107,11 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Outermost, so latency covers CORS handling and every route
+app.add_middleware(RequestMetricsMiddleware)
+if profiling_enabled():
+    # Only installed with KIMERA_PROFILER_TOKEN set: disabled profiling adds no per-request work
+    app.add_middleware(ProfilingMiddleware)
 
 app.mount("/images", StaticFiles(directory="static/images"), name="images")
 # app.middleware("http")(icw_middleware)
@@ -99,6 +121,8 @@ app.include_router(monitoring_router)
 app.include_router(telemetry_router)
 app.include_router(cognitive_field_router)
 app.include_router(enhanced_router)
+app.include_router(export_router)
+app.include_router(profiling_router)
 
 if LAW_ENFORCEMENT_AVAILABLE:
     app.include_router(law_enforcement_router)
@@ -108,16 +132,6 @@ if REVOLUTIONARY_INTELLIGENCE_AVAILABLE:
     app.include_router(revolutionary_router)
     logging.info("🧠 Revolutionary intelligence routes registered")
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./kimera.db")
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-# Ensure the pg_vector extension is enabled for PostgreSQL
-if engine.url.drivername.startswith("postgresql"):
-    with engine.connect() as conn:
-        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
-        conn.commit()
-
 # Simplified Kimera System State
 kimera_system = {
     'vault_manager': None,
@@ -129,11 +143,29 @@ kimera_system = {
 }
 
 
+def _kimera_system_memory() -> Dict[str, int]:
+    return {key: estimate_size(kimera_system[key]) for key in ('active_geoids', 'insights', 'recent_insights')}
+
+
+register_memory_reporter("kimera_system", _kimera_system_memory)
+
+_cycle_lock = asyncio.Lock()
+components.record_phase("api_import", time.perf_counter() - _import_started)
+
+
 @app.on_event("startup")
 def startup_event():
-    """Initializes the embedding model and background jobs on startup."""
-    kimera_system['embedding_model'] = initialize_embedding_model()
-    
+    """Initializes the core engines and background jobs on startup.
+
+    Heavy models (embedding, CLIP) load lazily; ``KIMERA_WARMUP`` names the
+    ones to load ahead of the first request, on a background thread.
+    """
+    with components.phase("startup_event"):
+        _startup()
+    components.warm_up(components.resolve_warmup())
+
+
+def _startup():
     # Initialize core engines
     kimera_system['contradiction_engine'] = ContradictionEngine(tension_threshold=0.4)
     kimera_system['thermodynamics_engine'] = SemanticThermodynamicsEngine()
@@ -154,6 +186,7 @@ def startup_event():
     
     # Update system status
     kimera_system['system_state']['status'] = 'operational'
+    status_snapshotter.start()
     
     if os.getenv("ENABLE_JOBS", "1") != "0":
         start_background_jobs(encode_text)
@@ -164,7 +197,15 @@ def startup_event():
         from ..monitoring.system_observer import SystemObserver
         entropy_monitor = EntropyMonitor()
         system_observer = SystemObserver()
-        initialize_advanced_monitoring(entropy_monitor, system_observer)
+        vault_manager = kimera_system['vault_manager']
+        snapshot_provider = LiveSnapshotProvider(
+            kimera_system['active_geoids'],
+            lambda: {
+                key: value for key, value in vault_manager.get_vault_statistics().items()
+                if key in ('vault_a_scars', 'vault_b_scars')
+            },
+        )
+        initialize_advanced_monitoring(entropy_monitor, system_observer, snapshot_provider)
     except Exception as e:
         print(f"Warning: Could not initialize advanced monitoring: {e}")
 
@@ -172,6 +213,10 @@ def startup_event():
 @app.on_event("shutdown")
 def _shutdown_background_jobs() -> None:
     stop_background_jobs()
+    status_snapshotter.stop()
+    shutdown_executors()
+    shutdown_statistical_jobs()
+    clip_service.close()
 
 
 def sanitize_for_json(obj):
@@ -269,12 +314,12 @@ class ProcessContradictionRequest(BaseModel):
     force_collapse: bool = False  # Optional flag for future use
 
 
-@app.post("/geoids")
-async def create_geoid(request: CreateGeoidRequest):
-    geoid_id = f"GEOID_{uuid.uuid4().hex[:8]}"
-    
+def _prepare_geoid_request(request: CreateGeoidRequest) -> tuple[dict, dict, str]:
+    """Parse and extract features for a geoid request.
+
+    Returns ``(semantic_state, symbolic_state, text_to_embed)``.
+    """
     semantic_state = {}
-    embedding_vector = []
     symbolic_state = dict(request.symbolic_content)
 
     if request.echoform_text:
@@ -283,10 +328,9 @@ async def create_geoid(request: CreateGeoidRequest):
         try:
             symbolic_state["echoform"] = parse_echoform(text)
             semantic_state = extract_semantic_features(text)
-            embedding_model = get_embedding_model()
-            embedding_vector = embedding_model.encode(text).tolist()
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=f"Invalid EchoForm: {exc}")
+        return semantic_state, symbolic_state, text
     
     elif request.semantic_features:
         # Path 2: Geoid created from pre-defined features
@@ -297,23 +341,23 @@ async def create_geoid(request: CreateGeoidRequest):
             semantic_state = request.semantic_features
             # Create a text representation for embedding
             semantic_text = " ".join([f"{k}:{v:.2f}" for k, v in semantic_state.items()])
-            embedding_model = get_embedding_model()
-            embedding_vector = embedding_model.encode(semantic_text).tolist()
         except Exception as exc:
             raise HTTPException(status_code=400, detail=f"Invalid semantic features: {exc}")
+        return semantic_state, symbolic_state, semantic_text
     
     else:
         raise HTTPException(status_code=400, detail="Either 'echoform_text' or 'semantic_features' must be provided.")
 
-    geoid = GeoidState(
-        geoid_id=geoid_id,
-        semantic_state=semantic_state,
-        symbolic_state=symbolic_state,
-        embedding_vector=embedding_vector,
-        metadata=request.metadata,
-    )
 
-    # --- VECTOR PERSISTENCE ---
+def _embed_geoid_request(request: CreateGeoidRequest) -> tuple[dict, list, dict]:
+    """Parse, extract features and embed a geoid request (blocking)."""
+    semantic_state, symbolic_state, text = _prepare_geoid_request(request)
+    embedding_vector = get_embedding_model().encode(text).tolist()
+    return semantic_state, embedding_vector, symbolic_state
+
+
+def _persist_geoid(geoid: GeoidState) -> None:
+    """Insert a geoid row (blocking)."""
     with SessionLocal() as db:
         geoid_db = GeoidDB(
             geoid_id=geoid.geoid_id,
@@ -324,7 +368,24 @@ async def create_geoid(request: CreateGeoidRequest):
         )
         db.add(geoid_db)
         db.commit()
-        db.refresh(geoid_db)
+
+
+@app.post("/geoids")
+async def create_geoid(request: CreateGeoidRequest):
+    geoid_id = f"GEOID_{uuid.uuid4().hex[:8]}"
+
+    semantic_state, embedding_vector, symbolic_state = await run_compute(_embed_geoid_request, request)
+
+    geoid = GeoidState(
+        geoid_id=geoid_id,
+        semantic_state=semantic_state,
+        symbolic_state=symbolic_state,
+        embedding_vector=embedding_vector,
+        metadata=request.metadata,
+    )
+
+    # --- VECTOR PERSISTENCE ---
+    await run_db(_persist_geoid, geoid)
 
     # Validate thermodynamic constraints for new geoid (no before state)
     try:
@@ -346,6 +407,147 @@ async def create_geoid(request: CreateGeoidRequest):
     }
 
 
+BULK_MAX_ITEMS = int(os.getenv("KIMERA_BULK_MAX_ITEMS", "1000"))
+
+
+def _parse_bulk_body(body: bytes, content_type: str) -> list[tuple[Any, str | None]]:
+    """Split a bulk payload into ``(item, error)`` pairs.
+
+    Accepts a JSON array, ``{"geoids": [...]}`` or NDJSON (one object per line).
+    Undecodable NDJSON lines become per-item errors rather than failing the batch.
+    """
+    if "ndjson" in content_type or "jsonl" in content_type:
+        items = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append((json.loads(line), None))
+            except ValueError as exc:
+                items.append((None, f"Invalid JSON line: {exc}"))
+    else:
+        try:
+            payload = json.loads(body or b"[]")
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON body: {exc}")
+        if isinstance(payload, dict):
+            payload = payload.get("geoids")
+        if not isinstance(payload, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array of geoids, {'geoids': [...]} or NDJSON.")
+        items = [(item, None) for item in payload]
+
+    if len(items) > BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Batch of {len(items)} exceeds the limit of {BULK_MAX_ITEMS} geoids.")
+    return items
+
+
+def _prepare_bulk_geoids(items: list[tuple[Any, str | None]]) -> tuple[list[tuple[int, GeoidState]], list[dict]]:
+    """Validate, featurise and embed a batch with one batched model call (blocking)."""
+    errors = []
+    prepared = []
+    for index, (raw, error) in enumerate(items):
+        if error is None:
+            try:
+                request = CreateGeoidRequest.model_validate(raw)
+                semantic_state, symbolic_state, text = _prepare_geoid_request(request)
+                prepared.append((index, semantic_state, symbolic_state, text, request.metadata))
+                continue
+            except HTTPException as exc:
+                error = exc.detail
+            except Exception as exc:
+                error = str(exc)
+        errors.append({'index': index, 'status': 'error', 'error': error})
+
+    vectors = encode_batch([text for _, _, _, text, _ in prepared])
+
+    geoids = []
+    thermodynamics_engine = kimera_system.get('thermodynamics_engine')
+    for (index, semantic_state, symbolic_state, _, metadata), vector in zip(prepared, vectors):
+        geoid = GeoidState(
+            geoid_id=f"GEOID_{uuid.uuid4().hex[:8]}",
+            semantic_state=semantic_state,
+            symbolic_state=symbolic_state,
+            embedding_vector=[float(v) for v in vector],
+            metadata=metadata,
+        )
+        if thermodynamics_engine is not None:
+            try:
+                thermodynamics_engine.validate_transformation(None, geoid)
+            except Exception as e:
+                logging.warning(f"Thermodynamic validation failed for new geoid {geoid.geoid_id}: {e}")
+        geoids.append((index, geoid))
+    return geoids, errors
+
+
+def _insert_geoid_batch(geoids: list[GeoidState]) -> Dict[str, str]:
+    """Insert geoids in a single executemany transaction (blocking).
+
+    If the batch insert fails, rows are retried one by one so that only the
+    offending rows are reported.  Returns ``{geoid_id: error}`` for failures.
+    """
+    rows = [
+        {
+            'geoid_id': g.geoid_id,
+            'symbolic_state': g.symbolic_state,
+            'metadata_json': g.metadata,
+            'semantic_state_json': g.semantic_state,
+            'semantic_vector': g.embedding_vector,
+        }
+        for g in geoids
+    ]
+    if not rows:
+        return {}
+    with SessionLocal() as db:
+        try:
+            db.execute(insert(GeoidDB), rows)
+            db.commit()
+            return {}
+        except Exception as exc:
+            db.rollback()
+            logging.warning(f"Bulk geoid insert failed, retrying row by row: {exc}")
+
+        failures = {}
+        for row in rows:
+            try:
+                db.execute(insert(GeoidDB), [row])
+                db.commit()
+            except Exception as exc:
+                db.rollback()
+                failures[row['geoid_id']] = str(exc)
+        return failures
+
+
+@app.post("/geoids/bulk")
+async def create_geoids_bulk(request: Request):
+    """Create many geoids in one request.
+
+    The body is a JSON array of ``CreateGeoidRequest`` objects (or NDJSON with
+    ``Content-Type: application/x-ndjson``).  All texts are embedded in one
+    batched model call and rows are inserted in a single transaction.  Invalid
+    items are reported individually and do not abort the batch.
+    """
+    items = _parse_bulk_body(await request.body(), request.headers.get("content-type", ""))
+    geoids, errors = await run_compute(_prepare_bulk_geoids, items)
+    failures = await run_db(_insert_geoid_batch, [g for _, g in geoids])
+
+    results = list(errors)
+    for index, geoid in geoids:
+        if geoid.geoid_id in failures:
+            results.append({'index': index, 'status': 'error', 'error': failures[geoid.geoid_id]})
+            continue
+        kimera_system['active_geoids'][geoid.geoid_id] = geoid
+        results.append({'index': index, 'status': 'created', 'geoid_id': geoid.geoid_id})
+    results.sort(key=lambda r: r['index'])
+
+    created = sum(1 for r in results if r['status'] == 'created')
+    return {
+        'submitted': len(items),
+        'created': created,
+        'failed': len(results) - created,
+        'results': results,
+    }
+
+
 @app.post("/geoids/from_image", response_model=Dict[str, Any])
 async def create_geoid_from_image(file: UploadFile = File(...)):
     """Create a Geoid from an uploaded image using CLIP embeddings."""
@@ -357,7 +559,8 @@ async def create_geoid_from_image(file: UploadFile = File(...)):
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid image file")
 
-    vector = clip_service.get_image_embedding(image)
+    # Batched with concurrent uploads; identical files hit the embedding cache
+    vector = await clip_service.embed_image(image, key=content_hash(image_bytes))
 
     geoid_id = f"GEOID_IMG_{uuid.uuid4().hex[:8]}"
     ext = os.path.splitext(file.filename)[1] or ".bin"
@@ -368,30 +571,34 @@ async def create_geoid_from_image(file: UploadFile = File(...)):
         metadata={'image_uri': f"/images/{unique_filename}"},
     )
 
-    with SessionLocal() as db:
-        try:
-            geoid_db_entry = GeoidDB(
-                geoid_id=geoid.geoid_id,
-                symbolic_state=geoid.symbolic_state,
-                metadata_json=geoid.metadata,
-                semantic_state_json={},
-                semantic_vector=vector.tolist(),
-            )
-            db.add(geoid_db_entry)
-            db.commit()
-            db.refresh(geoid_db_entry)
+    def _store() -> str:
+        with SessionLocal() as db:
+            try:
+                geoid_db_entry = GeoidDB(
+                    geoid_id=geoid.geoid_id,
+                    symbolic_state=geoid.symbolic_state,
+                    metadata_json=geoid.metadata,
+                    semantic_state_json={},
+                    semantic_vector=vector.tolist(),
+                )
+                db.add(geoid_db_entry)
+                db.commit()
+                db.refresh(geoid_db_entry)
 
-            os.makedirs("static/images", exist_ok=True)
-            with open(f"static/images/{unique_filename}", "wb") as buffer:
-                buffer.write(image_bytes)
-        except Exception:
-            db.rollback()
-            raise
+                os.makedirs("static/images", exist_ok=True)
+                with open(f"static/images/{unique_filename}", "wb") as buffer:
+                    buffer.write(image_bytes)
+                return geoid_db_entry.geoid_id
+            except Exception:
+                db.rollback()
+                raise
+
+    stored_id = await run_db(_store)
 
     return {
         "message": "Geoid created from image",
         "geoid_id": geoid_id,
-        "geoid_db": geoid_db_entry.geoid_id,
+        "geoid_db": stored_id,
     }
 
 
@@ -514,12 +721,8 @@ async def process_contradictions(
     return {"message": "Contradiction processing task accepted and running in the background."}
 
 
-@app.post("/process/contradictions/sync")
-async def process_contradictions_sync(body: ProcessContradictionRequest):
-    """
-    Synchronous contradiction processing for testing and immediate results.
-    Returns actual contradiction detection results instead of background task status.
-    """
+def _process_contradictions_blocking(body: ProcessContradictionRequest) -> dict:
+    """Blocking body of :func:`process_contradictions_sync` (runs on the DB pool)."""
     try:
         logging.info(f"Starting synchronous contradiction processing for trigger: {body.trigger_geoid_id}")
         
@@ -665,6 +868,15 @@ async def process_contradictions_sync(body: ProcessContradictionRequest):
         raise HTTPException(status_code=500, detail=f"Contradiction processing failed: {str(e)}")
 
 
+@app.post("/process/contradictions/sync")
+async def process_contradictions_sync(body: ProcessContradictionRequest):
+    """
+    Synchronous contradiction processing for testing and immediate results.
+    Returns actual contradiction detection results instead of background task status.
+    """
+    return await run_db(_process_contradictions_blocking, body)
+
+
 @app.get("/vaults/{vault_id}")
 async def get_vault_contents(vault_id: str, limit: int = 10):
     """Retrieve recent scars from the specified vault."""
@@ -672,7 +884,7 @@ async def get_vault_contents(vault_id: str, limit: int = 10):
         raise HTTPException(status_code=404, detail="Vault not found. Use 'vault_a' or 'vault_b'.")
 
     vault_manager = kimera_system['vault_manager']
-    scars = vault_manager.get_scars_from_vault(vault_id, limit=limit)
+    scars = await run_db(vault_manager.get_scars_from_vault, vault_id, limit=limit)
     scars_dicts = [
         {
             'scar_id': s.scar_id,
@@ -696,28 +908,32 @@ async def get_vault_contents(vault_id: str, limit: int = 10):
 async def rebalance_vaults(by_weight: bool = False):
     """Manually trigger vault rebalancing."""
     vault_manager = kimera_system['vault_manager']
-    moved = vault_manager.rebalance_vaults(by_weight=by_weight)
+    moved = await run_db(vault_manager.rebalance_vaults, by_weight=by_weight)
     return {"moved_scars": moved}
 
 
 @app.get("/geoids/{geoid_id}/speak", response_model=LinguisticGeoid)
 async def speak_geoid(geoid_id: str):
-    with SessionLocal() as db:
-        geoid_db = db.query(GeoidDB).filter(GeoidDB.geoid_id == geoid_id).first()
-        if not geoid_db:
-            raise HTTPException(status_code=404, detail="Geoid not found")
-
-        asm = AxisStabilityMonitor(db)
-        stability = asm.get_stability_metrics()["semantic_cohesion"]
-        if stability < 0.7:
-            raise HTTPException(status_code=409, detail="Concept is currently unstable.")
-
-        supporting_scars = (
-            db.query(ScarDB)
-            .filter(ScarDB.geoids.contains([geoid_id]))
-            .limit(3)
-            .all()
-        )
+    def _load():
+        with SessionLocal() as db:
+            geoid_db = db.query(GeoidDB).filter(GeoidDB.geoid_id == geoid_id).first()
+            if not geoid_db:
+                raise HTTPException(status_code=404, detail="Geoid not found")
+
+            asm = AxisStabilityMonitor(db)
+            stability = asm.get_stability_metrics()["semantic_cohesion"]
+            if stability < 0.7:
+                raise HTTPException(status_code=409, detail="Concept is currently unstable.")
+
+            supporting_scars = (
+                db.query(ScarDB)
+                .filter(ScarDB.geoids.contains([geoid_id]))
+                .limit(3)
+                .all()
+            )
+            return geoid_db, stability, supporting_scars
+
+    geoid_db, stability, supporting_scars = await run_db(_load)
 
     primary_statement = (
         f"Based on available data, the concept '{geoid_id}' represents: {geoid_db.symbolic_state}"
@@ -736,61 +952,70 @@ async def speak_geoid(geoid_id: str):
 @app.get("/geoids/search")
 async def search_geoids(query: str, limit: int = 5):
     """Find geoids semantically similar to a query string."""
-    query_vector = encode_text(query)
-    with SessionLocal() as db:
-        if engine.url.drivername.startswith("postgresql"):
-            results = (
-                db.query(GeoidDB)
-                .order_by(GeoidDB.semantic_vector.l2_distance(query_vector))
-                .limit(limit)
-                .all()
-            )
-        else:
-            results = db.query(GeoidDB).limit(limit).all()
-        similar = [
-            {
-                'geoid_id': r.geoid_id,
-                'symbolic_state': r.symbolic_state,
-                'metadata': r.metadata_json,
-            }
-            for r in results
-        ]
+    query_vector = await run_compute(encode_text, query)
+
+    def _search():
+        with SessionLocal() as db:
+            if engine.url.drivername.startswith("postgresql"):
+                results = (
+                    db.query(GeoidDB)
+                    .order_by(GeoidDB.semantic_vector.l2_distance(query_vector))
+                    .limit(limit)
+                    .all()
+                )
+            else:
+                results = db.query(GeoidDB).limit(limit).all()
+            return [
+                {
+                    'geoid_id': r.geoid_id,
+                    'symbolic_state': r.symbolic_state,
+                    'metadata': r.metadata_json,
+                }
+                for r in results
+            ]
+
+    similar = await run_db(_search)
     return {"query": query, "similar_geoids": similar}
 
 
 @app.get("/scars/search")
 async def search_scars(query: str, limit: int = 3):
     """Find scars semantically similar to a query describing a contradiction."""
-    query_vector = encode_text(query)
-    with SessionLocal() as db:
-        if engine.url.drivername.startswith("postgresql"):
-            results = (
-                db.query(ScarDB)
-                .order_by(ScarDB.scar_vector.l2_distance(query_vector))
-                .limit(limit)
-                .all()
-            )
-        else:
-            results = db.query(ScarDB).limit(limit).all()
-        now = datetime.utcnow()
-        similar = []
-        for r in results:
-            r.last_accessed = now
-            r.weight += 1.0
-            similar.append(
-                {
-                    'scar_id': r.scar_id,
-                    'reason': r.reason,
-                    'delta_entropy': r.delta_entropy,
-                }
-            )
-        db.commit()
+    query_vector = await run_compute(encode_text, query)
+
+    def _search():
+        with SessionLocal() as db:
+            if engine.url.drivername.startswith("postgresql"):
+                results = (
+                    db.query(ScarDB)
+                    .order_by(ScarDB.scar_vector.l2_distance(query_vector))
+                    .limit(limit)
+                    .all()
+                )
+            else:
+                results = db.query(ScarDB).limit(limit).all()
+            now = datetime.utcnow()
+            similar = []
+            for r in results:
+                r.last_accessed = now
+                r.weight += 1.0
+                similar.append(
+                    {
+                        'scar_id': r.scar_id,
+                        'reason': r.reason,
+                        'delta_entropy': r.delta_entropy,
+                    }
+                )
+            db.commit()
+            return similar
+
+    similar = await run_db(_search)
     return {"query": query, "similar_scars": similar}
 
-@app.get("/system/status")
-async def get_system_status():
-    """Get comprehensive system status including performance metrics."""
+def _collect_system_status() -> Dict[str, Any]:
+    """Gather the full system status payload (blocking: DB counts, psutil, CUDA)."""
     vault_manager = kimera_system['vault_manager']
+    vault_stats = vault_manager.get_vault_statistics()
     
     # Get embedding performance stats
     try:
@@ -832,18 +1057,19 @@ async def get_system_status():
         'timestamp': time.time(),
         'system_info': {
             'active_geoids': len(kimera_system['active_geoids']),
-            'vault_a_scars': vault_manager.get_total_scar_count("vault_a"),
-            'vault_b_scars': vault_manager.get_total_scar_count("vault_b"),
+            'vault_a_scars': vault_stats['vault_a_scars'],
+            'vault_b_scars': vault_stats['vault_b_scars'],
             'system_entropy': sum(g.calculate_entropy() for g in kimera_system['active_geoids'].values()),
             'cycle_count': kimera_system['system_state']['cycle_count']
         },
         'embedding_performance': embedding_stats,
         'system_metrics': system_metrics,
+        'database_pool': get_pool_status(engine),
         'gpu_info': gpu_info,
         'model_info': {
             'embedding_model': "BAAI/bge-m3",
             'embedding_dimension': 1024,
-            'model_type': getattr(kimera_system.get('embedding_model', {}), 'get', lambda x: 'unknown')('type')
+            'model_type': (get_loaded_embedding_model() or {}).get('type', 'not_loaded')
         },
         'revolutionary_intelligence': {
             'available': kimera_system.get('revolutionary_intelligence') is not None,
@@ -852,12 +1078,38 @@ async def get_system_status():
     }
 
 
+status_snapshotter = StatusSnapshotter(lambda: sanitize_for_json(_collect_system_status()))
+
+
+@app.get("/system/status")
+async def get_system_status(fresh: bool = False):
+    """Get comprehensive system status including performance metrics.
+
+    Served from the periodically refreshed snapshot; ``?fresh=true`` forces a
+    synchronous recollection.
+    """
+    snapshot = status_snapshotter.snapshot
+    if fresh or snapshot is None:
+        snapshot = await run_db(status_snapshotter.refresh)
+    return Response(
+        content=snapshot.body,
+        media_type="application/json",
+        headers={"X-Kimera-Snapshot-Age": f"{snapshot.age():.3f}"},
+    )
+
+
 @app.get("/system/health")
 async def get_system_health_simple():
     """Fast, basic health check. Returns 200 if the app is running."""
     return {"status": "healthy"}
 
 
+@app.get("/system/components")
+async def get_component_report():
+    """Import/load time and state of each lazily loaded component, plus startup phases."""
+    return components.report()
+
+
 @app.get("/system/health/detailed")
 async def get_system_health_detailed():
     """Comprehensive system health check."""
@@ -870,10 +1122,17 @@ async def get_system_health_detailed():
     }
     
     # Check database connection
-    try:
+    def _ping_db():
         with SessionLocal() as db:
             db.execute(text("SELECT 1")).fetchone()
-        health_status["checks"]["database"] = {"status": "healthy", "message": "Database connection OK"}
+
+    try:
+        await run_db(_ping_db)
+        health_status["checks"]["database"] = {
+            "status": "healthy",
+            "message": "Database connection OK",
+            "pool": get_pool_status(engine),
+        }
     except Exception as e:
         health_status["checks"]["database"] = {"status": "unhealthy", "message": str(e)}
         health_status["status"] = "degraded"
@@ -881,7 +1140,7 @@ async def get_system_health_detailed():
     # Check embedding model
     try:
         from ..core.embedding_utils import encode_text
-        test_embedding = encode_text("health check")
+        test_embedding = await run_compute(encode_text, "health check")
         if len(test_embedding) == 1024:
             health_status["checks"]["embedding_model"] = {"status": "healthy", "message": "BGE-M3 model working"}
         else:
@@ -906,7 +1165,9 @@ async def get_system_health_detailed():
     # Check vault system
     try:
         vault_manager = kimera_system['vault_manager']
-        total_scars = vault_manager.get_total_scar_count("vault_a") + vault_manager.get_total_scar_count("vault_b")
+        total_scars = await run_db(
+            lambda: sum(vault_manager.get_vault_statistics()[key] for key in ('vault_a_scars', 'vault_b_scars'))
+        )
         health_status["checks"]["vault_system"] = {"status": "healthy", "message": f"Vault system OK, {total_scars} total scars"}
     except Exception as e:
         health_status["checks"]["vault_system"] = {"status": "unhealthy", "message": str(e)}
@@ -947,7 +1208,9 @@ async def trigger_cycle():
         
         # Run the cycle with timeout protection
         try:
-            status = kimera_system['cognitive_cycle'].run_cycle(kimera_system)
+            # Cycles mutate shared state; run them one at a time, off the event loop.
+            async with _cycle_lock:
+                status = await run_compute(kimera_system['cognitive_cycle'].run_cycle, kimera_system)
         except Exception as e:
             logging.error(f"Cognitive cycle execution failed: {e}")
             # Return partial success to avoid complete failure
@@ -980,15 +1243,15 @@ async def trigger_cycle():
 @app.get("/system/stability")
 async def get_system_stability():
     """Return global stability metrics from the Axis Stability Monitor."""
-    with SessionLocal() as db:
-        asm = AxisStabilityMonitor(db)
-        metrics = asm.get_stability_metrics()
-    return metrics
+    def _stability():
+        with SessionLocal() as db:
+            return AxisStabilityMonitor(db).get_stability_metrics()
 
+    return await run_db(_stability)
 
-@app.post("/system/proactive_scan")
-async def run_proactive_contradiction_scan():
-    """Run a proactive contradiction detection scan to increase SCAR utilization."""
+
+def _run_proactive_scan_blocking() -> Dict[str, Any]:
+    """Blocking body of :func:`run_proactive_contradiction_scan`."""
     detector = kimera_system['proactive_detector']
     scan_results = detector.run_proactive_scan()
     
@@ -1045,6 +1308,12 @@ async def run_proactive_contradiction_scan():
     return sanitize_for_json(scan_results)
 
 
+@app.post("/system/proactive_scan")
+async def run_proactive_contradiction_scan():
+    """Run a proactive contradiction detection scan to increase SCAR utilization."""
+    return await run_db(_run_proactive_scan_blocking)
+
+
 @app.get("/system/utilization_stats")
 async def get_utilization_statistics():
     """Get detailed statistics about SCAR utilization and system performance."""
@@ -1053,9 +1322,10 @@ async def get_utilization_statistics():
     
     # Add additional system metrics
     vault_manager = kimera_system['vault_manager']
+    vault_stats = await run_db(vault_manager.get_vault_statistics)
     stats.update({
-        "vault_a_scars": vault_manager.get_total_scar_count("vault_a"),
-        "vault_b_scars": vault_manager.get_total_scar_count("vault_b"),
+        "vault_a_scars": vault_stats["vault_a_scars"],
+        "vault_b_scars": vault_stats["vault_b_scars"],
         "active_geoids": len(kimera_system['active_geoids']),
         "system_cycle_count": kimera_system['system_state']['cycle_count']
     })
@@ -1182,78 +1452,83 @@ async def get_statistical_capabilities():
     return statistical_engine.get_model_summary()
 
 
+def _model_result_to_dict(result: StatisticalModelResult) -> Dict[str, Any]:
+    return {
+        "model_type": result.model_type,
+        "parameters": result.parameters,
+        "statistics": result.statistics,
+        "predictions": result.predictions,
+        "residuals": result.residuals,
+        "diagnostics": result.diagnostics,
+        "timestamp": result.timestamp.isoformat() if result.timestamp else None
+    }
+
+
+async def _statistical_job_response(job, wait: Optional[float], render):
+    """Render a finished job, or answer 202 with the job handle while it is still running."""
+    runner = get_statistical_job_runner()
+    job = await runner.wait(job, STATS_WAIT_SECONDS if wait is None else wait)
+    if job.status == "failed":
+        raise HTTPException(status_code=400, detail=f"Analysis failed: {job.error}")
+    if job.status == "pending":
+        return JSONResponse(status_code=202, content={"job": job.to_dict()})
+    response = render(job.result)
+    response["job"] = job.to_dict()
+    return response
+
+
 @app.post("/statistics/analyze/entropy_series")
 async def analyze_entropy_series_endpoint(
     entropy_data: List[float],
-    timestamps: List[str] = None
+    timestamps: List[str] = None,
+    wait: Optional[float] = None
 ):
-    """Analyze entropy time series data"""
+    """Analyze entropy time series data (cached and fitted on the statistical job pool)"""
     try:
         # Convert string timestamps to datetime objects if provided
         datetime_timestamps = None
         if timestamps:
             datetime_timestamps = [datetime.fromisoformat(ts.replace('Z', '+00:00')) for ts in timestamps]
         
-        result = analyze_entropy_time_series(entropy_data, datetime_timestamps)
-        
-        # Convert result to dict for JSON serialization
-        return {
-            "model_type": result.model_type,
-            "parameters": result.parameters,
-            "statistics": result.statistics,
-            "predictions": result.predictions,
-            "diagnostics": result.diagnostics,
-            "timestamp": result.timestamp.isoformat() if result.timestamp else None
-        }
+        job = get_statistical_job_runner().submit_entropy_series(entropy_data, datetime_timestamps)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Analysis failed: {str(e)}")
+    return await _statistical_job_response(job, wait, _model_result_to_dict)
 
 
 @app.post("/statistics/analyze/contradiction_factors")
 async def analyze_contradiction_factors_endpoint(
     contradiction_scores: List[float],
-    semantic_features: Dict[str, List[float]]
+    semantic_features: Dict[str, List[float]],
+    wait: Optional[float] = None
 ):
     """Analyze factors contributing to contradiction detection"""
-    try:
-        result = analyze_contradiction_factors(contradiction_scores, semantic_features)
-        
-        return {
-            "model_type": result.model_type,
-            "parameters": result.parameters,
-            "statistics": result.statistics,
-            "predictions": result.predictions,
-            "residuals": result.residuals,
-            "diagnostics": result.diagnostics,
-            "timestamp": result.timestamp.isoformat() if result.timestamp else None
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Analysis failed: {str(e)}")
+    fingerprint = series_fingerprint(contradiction_scores, semantic_features)
+    job = get_statistical_job_runner().submit(
+        "contradiction_factors", fingerprint, analyze_contradiction_factors,
+        contradiction_scores, semantic_features
+    )
+    return await _statistical_job_response(job, wait, _model_result_to_dict)
 
 
 @app.post("/statistics/analyze/semantic_market")
 async def analyze_semantic_market_endpoint(
     semantic_supply: List[float],
     semantic_demand: List[float],
-    entropy_prices: List[float]
+    entropy_prices: List[float],
+    wait: Optional[float] = None
 ):
     """Analyze semantic market dynamics using econometric models"""
-    try:
-        result = analyze_semantic_market(semantic_supply, semantic_demand, entropy_prices)
-        
-        return {
-            "model_type": result.model_type,
-            "parameters": result.parameters,
-            "statistics": result.statistics,
-            "diagnostics": result.diagnostics,
-            "timestamp": result.timestamp.isoformat() if result.timestamp else None
-        }
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Analysis failed: {str(e)}")
+    fingerprint = series_fingerprint(semantic_supply, semantic_demand, entropy_prices)
+    job = get_statistical_job_runner().submit(
+        "semantic_market", fingerprint, analyze_semantic_market,
+        semantic_supply, semantic_demand, entropy_prices
+    )
+    return await _statistical_job_response(job, wait, _model_result_to_dict)
 
 
 @app.post("/statistics/analyze/comprehensive")
-async def comprehensive_statistical_analysis(request: StatisticalAnalysisRequest):
+async def comprehensive_statistical_analysis(request: StatisticalAnalysisRequest, wait: Optional[float] = None):
     """Perform comprehensive statistical analysis of system data"""
     try:
         # Prepare system data
@@ -1280,21 +1555,19 @@ async def comprehensive_statistical_analysis(request: StatisticalAnalysisRequest
             system_data['entropy_prices'] = request.entropy_prices
         
         # Perform comprehensive analysis
-        results = statistical_engine.comprehensive_analysis(system_data)
-        
+        fingerprint = series_fingerprint(request.entropy_history, request.model_dump(exclude={'entropy_history'}))
+        job = get_statistical_job_runner().submit(
+            "comprehensive", fingerprint, run_comprehensive_analysis, system_data
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Comprehensive analysis failed: {str(e)}")
+    
+    def render(results):
         # Convert results to JSON-serializable format
-        json_results = {}
-        for analysis_type, result in results.items():
-            json_results[analysis_type] = {
-                "model_type": result.model_type,
-                "parameters": result.parameters,
-                "statistics": result.statistics,
-                "predictions": result.predictions,
-                "residuals": result.residuals,
-                "diagnostics": result.diagnostics,
-                "timestamp": result.timestamp.isoformat() if result.timestamp else None
-            }
-        
+        json_results = {
+            analysis_type: _model_result_to_dict(result)
+            for analysis_type, result in results.items()
+        }
         return {
             "analysis_results": json_results,
             "summary": {
@@ -1303,9 +1576,29 @@ async def comprehensive_statistical_analysis(request: StatisticalAnalysisRequest
                 "timestamp": datetime.now().isoformat()
             }
         }
-        
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Comprehensive analysis failed: {str(e)}")
+    
+    return await _statistical_job_response(job, wait, render)
+
+
+@app.get("/statistics/jobs")
+async def get_statistical_job_stats():
+    """Statistical job pool, cache and warm-start counters"""
+    return get_statistical_job_runner().stats()
+
+
+@app.get("/statistics/jobs/{job_id}")
+async def get_statistical_job(job_id: str):
+    """Poll a statistical job returned as pending by an /statistics/analyze endpoint"""
+    job = get_statistical_job_runner().get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Statistical job '{job_id}' not found")
+    if job.status != "completed":
+        return {"job": job.to_dict()}
+    if job.kind == "comprehensive":
+        result = {name: _model_result_to_dict(r) for name, r in job.result.items()}
+    else:
+        result = _model_result_to_dict(job.result)
+    return {"job": job.to_dict(), "result": result}
 
 
 @app.get("/statistics/monitoring/status")
@@ -1426,7 +1719,7 @@ async def get_understanding_metrics_endpoint():
             detail="The system is not running in 'understanding' mode. The vault manager does not support this operation."
         )
     try:
-        metrics = vault_manager.get_understanding_metrics()
+        metrics = await run_db(vault_manager.get_understanding_metrics)
         return metrics
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving understanding metrics: {e}")
@@ -1440,14 +1733,18 @@ async def revolutionary_intelligence_demo(user_input: str = "I want to create so
         if not revolutionary_intelligence:
             raise HTTPException(status_code=503, detail="Revolutionary intelligence not available")
         
+        vault_manager = kimera_system['vault_manager']
+        vault_scars = await run_db(
+            lambda: sum(vault_manager.get_vault_statistics()[key] for key in ('vault_a_scars', 'vault_b_scars'))
+        )
+
         # Context from current system state
         user_context = {
             'creative_project': True,
             'system_state': {
                 'active_geoids': len(kimera_system['active_geoids']),
                 'cycle_count': kimera_system['system_state']['cycle_count'],
-                'vault_scars': kimera_system['vault_manager'].get_total_scar_count("vault_a") + 
-                              kimera_system['vault_manager'].get_total_scar_count("vault_b")
+                'vault_scars': vault_scars
             }
         }
         
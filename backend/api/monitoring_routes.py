@@ -15,13 +15,17 @@ from ..monitoring.benchmarking_suite import BenchmarkRunner
 from ..vault import get_vault_manager
 from ..core.geoid import GeoidState
 from ..core.models import LinguisticGeoid
+from ..core.memo_cache import get_memo_cache_stats, clear_memo_caches
+from ..monitoring.metric_store import get_metric_store_stats
+from ..monitoring.memory_accounting import memory_accountant
+from .concurrency import run_compute
 
 # Initialize router
 router = APIRouter(prefix="/monitoring", tags=["monitoring"])
 logger = logging.getLogger(__name__)
 
 # Global monitoring instances
-system_observer = SystemObserver()
+system_observer = SystemObserver(store_prefix="monitoring")
 vault_manager = get_vault_manager(mode="understanding")
 benchmark_runner = BenchmarkRunner()  # Create an instance of BenchmarkRunner
 
@@ -31,11 +35,11 @@ async def get_monitoring_status():
     """Get current monitoring system status"""
     try:
         # Get basic system info
-        all_geoids = vault_manager.get_all_geoids()
+        vault_stats = vault_manager.get_vault_statistics()
         vault_info = {
-            'vault_a_scars': vault_manager.get_total_scar_count('vault_a'),
-            'vault_b_scars': vault_manager.get_total_scar_count('vault_b'),
-            'active_geoids': len(all_geoids)
+            'vault_a_scars': vault_stats['vault_a_scars'],
+            'vault_b_scars': vault_stats['vault_b_scars'],
+            'active_geoids': vault_stats['total_geoids']
         }
         
         # Get system summary
@@ -63,9 +67,10 @@ async def trigger_system_observation():
     try:
         # Get current system state
         all_geoids = vault_manager.get_all_geoids()
+        vault_stats = vault_manager.get_vault_statistics()
         vault_info = {
-            'vault_a_scars': vault_manager.get_total_scar_count('vault_a'),
-            'vault_b_scars': vault_manager.get_total_scar_count('vault_b'),
+            'vault_a_scars': vault_stats['vault_a_scars'],
+            'vault_b_scars': vault_stats['vault_b_scars'],
             'active_geoids': len(all_geoids)
         }
         
@@ -286,6 +291,47 @@ async def get_system_summary(window_size: int = Query(100, ge=10, le=1000)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/caches")
+async def get_cache_stats():
+    """Get hit rates and sizes of the profiling memo caches"""
+    return {
+        'caches': get_memo_cache_stats(),
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+@router.get("/metric_stores")
+async def get_metric_stores():
+    """Get sizes and persistence state of the columnar metric stores"""
+    return {
+        'stores': get_metric_store_stats(),
+        'timestamp': datetime.now().isoformat()
+    }
+
+
+@router.get("/memory")
+async def get_memory_breakdown(reset_peaks: bool = False):
+    """Get approximate bytes and high-water marks per component, plus process RSS"""
+    try:
+        snapshot = await run_compute(memory_accountant.snapshot)
+        if reset_peaks:
+            memory_accountant.reset_peaks()
+        return snapshot
+    except Exception as e:
+        logger.error(f"Error measuring memory footprint: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/caches/clear")
+async def clear_caches():
+    """Invalidate every profiling memo cache"""
+    clear_memo_caches()
+    return {
+        'status': 'cleared',
+        'timestamp': datetime.now().isoformat()
+    }
+
+
 @router.get("/alerts")
 async def get_recent_alerts(hours: int = Query(24, ge=1, le=168)):
     """Get recent alerts"""
@@ -329,7 +375,7 @@ async def generate_report(report_type: str):
 async def export_observations(format: str = Query('json')):
     """Export all observations"""
     try:
-        if format not in ['json']:
+        if format not in ['json', 'columns']:
             raise HTTPException(status_code=400, detail="Unsupported export format")
         
         data = system_observer.export_observations(format)
@@ -0,0 +1,77 @@
+"""
+Profiling routes for Kimera SWM
+
+Admin-only access to the sampling profiler in ``backend/monitoring/profiler.py``.
+Every endpoint requires the ``X-Kimera-Admin-Token`` header to match
+``KIMERA_PROFILER_TOKEN``; with no token configured the endpoints answer 404.
+"""
+
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from ..monitoring import profiler
+from ..monitoring.profiler import PROFILER_INTERVAL_MS, StackSampler, profile_store
+
+router = APIRouter(prefix="/profiling", tags=["profiling"])
+
+
+def _require_admin(token: Optional[str]) -> None:
+    if not profiler.profiling_enabled():
+        raise HTTPException(status_code=404, detail="Profiling is disabled")
+    if not profiler.check_admin_token(token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@router.post("/window")
+async def profile_window(
+    seconds: float = Query(5.0, gt=0),
+    interval_ms: float = Query(PROFILER_INTERVAL_MS, ge=1, le=1000),
+    format: str = Query("collapsed", pattern="^(collapsed|json)$"),
+    x_kimera_admin_token: Optional[str] = Header(None),
+):
+    """Sample every thread for ``seconds`` and return collapsed stacks (or a JSON summary)."""
+    _require_admin(x_kimera_admin_token)
+    if seconds > profiler.PROFILER_MAX_SECONDS:
+        raise HTTPException(status_code=400, detail=f"seconds must be <= {profiler.PROFILER_MAX_SECONDS}")
+    if not profile_store.window_lock.acquire(blocking=False):
+        raise HTTPException(status_code=409, detail="A profiling window is already running")
+    try:
+        sampler = StackSampler(interval_ms=interval_ms, mode="window", label=f"{seconds:g}s window").start()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profile = sampler.stop()
+        profile_store.add(profile)
+    finally:
+        profile_store.window_lock.release()
+    return _render(profile, format)
+
+
+@router.get("/profiles")
+async def list_profiles(x_kimera_admin_token: Optional[str] = Header(None)):
+    """Summaries of the most recent profiles (windows and flagged requests)."""
+    _require_admin(x_kimera_admin_token)
+    return {"profiles": profile_store.list()}
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(
+    profile_id: str,
+    format: str = Query("collapsed", pattern="^(collapsed|json)$"),
+    x_kimera_admin_token: Optional[str] = Header(None),
+):
+    """One stored profile as collapsed stacks (for flame graphs) or a JSON summary."""
+    _require_admin(x_kimera_admin_token)
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Unknown profile '{profile_id}'")
+    return _render(profile, format)
+
+
+def _render(profile: profiler.Profile, format: str):
+    if format == "json":
+        return profile.summary()
+    return PlainTextResponse(profile.collapsed(), headers={profiler.PROFILE_ID_HEADER: profile.profile_id})
@@ -16,6 +16,8 @@ from datetime import datetime, timedelta
 import json
 from collections import defaultdict, deque
 
+from .pattern_matcher import compile_pattern_set
+
 logger = logging.getLogger(__name__)
 
 
@@ -241,6 +243,22 @@ class AnthropomorphicProfiler:
             r'\b(I believe personally|my opinion is)\b',
             r'\b(I want|I need|I desire)\b'
         ]
+        
+        # Compile every table once; detection then scans merged alternations
+        pattern_tables = {
+            'formality': self.formality_patterns,
+            'technical': self.technical_patterns,
+            'enthusiasm': self.enthusiasm_patterns
+        }
+        categories = {
+            f'{table}_{level}': patterns
+            for table, levels in pattern_tables.items()
+            for level, patterns in levels.items()
+        }
+        categories['roleplay'] = self.roleplay_patterns
+        categories['persona_switch'] = self.persona_switch_patterns
+        categories['boundary_violation'] = self.boundary_violation_patterns
+        self.pattern_matcher = compile_pattern_set(categories, flags=re.IGNORECASE)
     
     def analyze_interaction(self, message: str) -> InteractionAnalysis:
         """Analyze a single interaction for personality traits and patterns"""
@@ -299,10 +317,8 @@ class AnthropomorphicProfiler:
         message_lower = message.lower()
         
         # Formality detection
-        formal_score = sum(1 for pattern in self.formality_patterns['high'] 
-                          if re.search(pattern, message_lower, re.IGNORECASE))
-        informal_score = sum(1 for pattern in self.formality_patterns['low'] 
-                            if re.search(pattern, message_lower, re.IGNORECASE))
+        formal_score = self.pattern_matcher.hits(message_lower, 'formality_high')
+        informal_score = self.pattern_matcher.hits(message_lower, 'formality_low')
         
         if formal_score + informal_score > 0:
             traits[PersonalityTrait.FORMALITY] = formal_score / (formal_score + informal_score)
@@ -310,12 +326,9 @@ class AnthropomorphicProfiler:
             traits[PersonalityTrait.FORMALITY] = 0.5  # Neutral
         
         # Technical depth detection
-        high_tech = sum(1 for pattern in self.technical_patterns['high'] 
-                       if re.search(pattern, message_lower, re.IGNORECASE))
-        medium_tech = sum(1 for pattern in self.technical_patterns['medium'] 
-                         if re.search(pattern, message_lower, re.IGNORECASE))
-        low_tech = sum(1 for pattern in self.technical_patterns['low'] 
-                      if re.search(pattern, message_lower, re.IGNORECASE))
+        high_tech = self.pattern_matcher.hits(message_lower, 'technical_high')
+        medium_tech = self.pattern_matcher.hits(message_lower, 'technical_medium')
+        low_tech = self.pattern_matcher.hits(message_lower, 'technical_low')
         
         total_tech = high_tech + medium_tech + low_tech
         if total_tech > 0:
@@ -324,10 +337,8 @@ class AnthropomorphicProfiler:
             traits[PersonalityTrait.TECHNICAL_DEPTH] = 0.5
         
         # Enthusiasm detection
-        enthusiasm_score = sum(1 for pattern in self.enthusiasm_patterns['high'] 
-                              if re.search(pattern, message_lower, re.IGNORECASE))
-        low_enthusiasm = sum(1 for pattern in self.enthusiasm_patterns['low'] 
-                            if re.search(pattern, message_lower, re.IGNORECASE))
+        enthusiasm_score = self.pattern_matcher.hits(message_lower, 'enthusiasm_high')
+        low_enthusiasm = self.pattern_matcher.hits(message_lower, 'enthusiasm_low')
         
         # Count exclamation marks
         exclamation_count = message.count('!')
@@ -375,8 +386,7 @@ class AnthropomorphicProfiler:
             patterns[CommunicationPattern.EXPLANATION_APPROACH] = "narrative"
         
         # Technical language level
-        tech_score = sum(1 for pattern in self.technical_patterns['high'] 
-                        if re.search(pattern, message.lower(), re.IGNORECASE))
+        tech_score = self.pattern_matcher.hits(message.lower(), 'technical_high')
         if tech_score > 3:
             patterns[CommunicationPattern.TECHNICAL_LANGUAGE] = "advanced"
         elif tech_score > 1:
@@ -388,18 +398,15 @@ class AnthropomorphicProfiler:
     
     def _detect_role_playing(self, message: str) -> bool:
         """Detect role-playing behavior"""
-        return any(re.search(pattern, message, re.IGNORECASE) 
-                  for pattern in self.roleplay_patterns)
+        return self.pattern_matcher.any(message, 'roleplay')
     
     def _detect_persona_switching(self, message: str) -> bool:
         """Detect persona switching"""
-        return any(re.search(pattern, message, re.IGNORECASE) 
-                  for pattern in self.persona_switch_patterns)
+        return self.pattern_matcher.any(message, 'persona_switch')
     
     def _detect_boundary_violations(self, message: str) -> bool:
         """Detect professional boundary violations"""
-        return any(re.search(pattern, message, re.IGNORECASE) 
-                  for pattern in self.boundary_violation_patterns)
+        return self.pattern_matcher.any(message, 'boundary_violation')
     
     def _calculate_trait_deviations(self, detected_traits: Dict[PersonalityTrait, float]) -> Dict[PersonalityTrait, float]:
         """Calculate deviations from baseline personality"""
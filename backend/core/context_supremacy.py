@@ -16,9 +16,12 @@ from enum import Enum
 from datetime import datetime, timedelta
 import logging
 import json
-import re
 
 from .living_neutrality import LivingNeutralityEngine, get_living_neutrality_engine
+from .pattern_matcher import CompiledPatternSet, compile_pattern_set
+from .text_analysis import TextAnalysis, analyze_text
+from .memo_cache import MemoCache, make_key
+from .history_buffer import HistoryBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -95,12 +98,14 @@ class ContextSupremacyEngine:
         self.context_patterns = {}
         self._initialize_context_patterns()
         self.context_signatures = self._initialize_context_signatures()
+        self.signature_matcher = self._compile_signature_patterns()
+        self.profile_cache = MemoCache("context_supremacy")
         # self.context_intelligences = self._initialize_context_intelligences() # Deprecated for now
         self.last_analysis = None
         self.status = "nominal"
         self.living_neutrality = get_living_neutrality_engine()
-        self.context_history: List[ContextProfile] = []
-        self.active_commands: List[ContextualCommand] = []
+        self.context_history = HistoryBuffer("context_history")
+        self.active_commands = HistoryBuffer("active_commands")
         
         logger.info("Context Supremacy Engine initialized - Context reigns supreme")
     
@@ -290,17 +295,43 @@ class ContextSupremacyEngine:
         }
     
     def analyze_context_supremacy(self, input_text: str, 
-                                 user_context: Dict[str, Any] = None) -> ContextProfile:
-        """Analyze context and determine its supreme authority over system behavior"""
+                                 user_context: Dict[str, Any] = None,
+                                 analysis: Optional[TextAnalysis] = None) -> ContextProfile:
+        """Analyze context and determine its supreme authority over system behavior
+        
+        Profiles are memoised by normalised text and ``user_context``; a cached
+        profile is shared between callers and must not be mutated.
+        """
+        
+        key = make_key(input_text, user_context, self.signature_matcher.fingerprint)
+        context_profile, _ = self.profile_cache.get_or_compute(
+            key, lambda: self._build_context_profile(input_text, user_context, analysis)
+        )
+        
+        self.context_history.append(context_profile)
+        self.active_commands.extend(context_profile.commands)
+        
+        return context_profile
+    
+    def invalidate_profile_cache(self):
+        """Drop memoised profiles (after changing signatures or laws)"""
+        self.profile_cache.clear()
+    
+    def _build_context_profile(self, input_text: str, user_context: Dict[str, Any],
+                               analysis: Optional[TextAnalysis]) -> ContextProfile:
+        """Compute a full context profile from scratch"""
+        
+        if analysis is None:
+            analysis = analyze_text(input_text)
         
         # Detect primary context type
-        context_type = self._detect_primary_context(input_text, user_context)
+        context_type = self._detect_primary_context(analysis, user_context)
         
         # Extract contextual intelligence
         intelligence = self._extract_contextual_intelligence(input_text, context_type, user_context)
         
         # Assess dimensional strengths
-        dimensions = self._assess_dimensional_strengths(input_text, context_type, user_context)
+        dimensions = self._assess_dimensional_strengths(analysis, context_type, user_context)
         
         # Determine authority level
         authority_level = self._determine_authority_level(context_type, dimensions, user_context)
@@ -350,25 +381,30 @@ class ContextSupremacyEngine:
             stakes_assessment=stakes_assessment
         )
         
-        self.context_history.append(context_profile)
-        self.active_commands.extend(commands)
-        
         logger.info(f"Context supremacy analyzed: {context_type} with {authority_level.value} authority")
         
         return context_profile
     
-    def _detect_primary_context(self, input_text: str, user_context: Dict[str, Any]) -> str:
+    def _compile_signature_patterns(self) -> CompiledPatternSet:
+        """Compile every context signature's patterns into one shared matcher.
+
+        Call again after editing ``context_signatures`` at runtime; the new
+        fingerprint also retires every cached profile.
+        """
+        return compile_pattern_set({
+            context_type: signature['patterns']
+            for context_type, signature in self.context_signatures.items()
+        })
+    
+    def _detect_primary_context(self, analysis: TextAnalysis, user_context: Dict[str, Any]) -> str:
         """Detect the primary context type"""
         
-        text_lower = input_text.lower()
         context_scores = {}
         
         # Score each context type based on pattern matching
-        for context_type, signature in self.context_signatures.items():
-            score = 0
-            for pattern in signature['patterns']:
-                matches = len(re.findall(pattern, text_lower))
-                score += matches
+        pattern_counts = analysis.pattern_counts(self.signature_matcher)
+        for context_type in self.context_signatures:
+            score = pattern_counts.get(context_type, 0)
             
             # Boost score based on user context hints
             if user_context:
@@ -499,7 +535,7 @@ class ContextSupremacyEngine:
             success_metrics=success_metrics
         )
     
-    def _assess_dimensional_strengths(self, input_text: str, context_type: str,
+    def _assess_dimensional_strengths(self, analysis: TextAnalysis, context_type: str,
                                     user_context: Dict[str, Any]) -> Dict[ContextDimension, float]:
         """Assess strength in each contextual dimension"""
         
@@ -511,7 +547,7 @@ class ContextSupremacyEngine:
         dimensions = {dim: base_weights.get(dim, 0.1) for dim in ContextDimension}
         
         # Adjust based on text analysis
-        text_lower = input_text.lower()
+        text_lower = analysis.lower
         
         # Temporal dimension indicators
         temporal_indicators = ['urgent', 'deadline', 'immediately', 'asap', 'quickly', 'now', 'emergency']
@@ -1025,6 +1061,7 @@ class ContextSupremacyEngine:
             'authority_level': current_context.authority_level.value,
             'primary_wisdom': current_context.intelligence.primary_wisdom,
             'active_commands': len(self.active_commands),
+            'profile_cache': self.profile_cache.stats(),
             'dimensional_strengths': {
                 dim.value: strength for dim, strength in current_context.dimensions.items()
             },
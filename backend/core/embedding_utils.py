@@ -13,24 +13,16 @@ import torch
 
 from .constants import EMBEDDING_DIM
 
-try:
-    import onnxruntime as ort
-except Exception:
-    ort = None  # type: ignore
-
-try:
-    from transformers import AutoModel, AutoTokenizer
-    import torch.nn.functional as F
-except Exception:  # pragma: no cover
-    AutoModel = None  # type: ignore
-    AutoTokenizer = None  # type: ignore
-    F = None  # type: ignore
-
-# FlagEmbedding is optional, handle separately
-try:
-    from FlagEmbedding import BGEM3FlagModel
-except Exception:
-    BGEM3FlagModel = None  # type: ignore
+from .lazy_loading import components, lazy_import, module_available
+
+# transformers, onnxruntime and FlagEmbedding are imported when the model is
+# first loaded (see initialize_embedding_model), not when this module is
+import torch.nn.functional as F
+
+ort = lazy_import("onnxruntime")
+AutoModel = lazy_import("transformers", "AutoModel")
+AutoTokenizer = lazy_import("transformers", "AutoTokenizer")
+BGEM3FlagModel = lazy_import("FlagEmbedding", "BGEM3FlagModel")
 
 # --- Setup Logging ---
 logging.basicConfig(level=logging.INFO)
@@ -107,7 +99,7 @@ def initialize_embedding_model():
                 start_time = time.time()
                 
                 # Priority 1: Try FlagEmbedding BGE-M3 (most optimized)
-                if USE_FLAG_EMBEDDING and BGEM3FlagModel is not None:
+                if USE_FLAG_EMBEDDING and module_available("FlagEmbedding"):
                     log.info(f"Initializing FlagEmbedding BGE-M3 model on {DEVICE.upper()}...")
                     try:
                         _embedding_model = {
@@ -120,7 +112,7 @@ def initialize_embedding_model():
                         _embedding_model = None
                 
                 # Priority 2: Try ONNX Runtime (optimized inference)
-                if _embedding_model is None and USE_ONNX and ort is not None:
+                if _embedding_model is None and USE_ONNX and module_available("onnxruntime"):
                     log.info(f"Initializing ONNX embedding model '{MODEL_NAME}' on {DEVICE.upper()}...")
                     try:
                         onnx_path = Path(ONNX_MODEL_PATH) / "model.onnx"
@@ -161,11 +153,18 @@ def initialize_embedding_model():
     return _embedding_model
 
 
+def get_loaded_embedding_model():
+    """The embedding model if it has been loaded, without triggering a load."""
+    return _embedding_model
+
+
+embedding_model_component = components.register("embedding_model", initialize_embedding_model)
+
+
 def _get_model():
     """Initializes and returns the embedding model (thread-safe)."""
-    global _embedding_model
     if _embedding_model is None:
-        return initialize_embedding_model()
+        return embedding_model_component.get()
     return _embedding_model
 
 
@@ -246,9 +245,12 @@ def encode_text(text: str) -> List[float]:
             except Exception as e:
                 log.error(f"Transformers inference failed: {e}. Falling back to dummy encoder.")
         
+        elif isinstance(model, dict) and model.get('type') == 'dummy':
+            return _DummyTransformer().encode(text).tolist()
+        
         # Fallback to dummy encoder
         log.warning("No valid embedding model available. Using dummy encoder.")
-        return _DummyTransformer().encode(text)
+        return _DummyTransformer().encode(text).tolist()
         
     finally:
         # Update performance statistics
@@ -283,8 +285,53 @@ def encode_batch(texts: List[str]) -> List[List[float]]:
             except Exception as e:
                 log.error(f"FlagEmbedding batch inference failed: {e}. Falling back to individual processing.")
         
-        # For other models, process individually (can be optimized later)
-        return [encode_text(text) for text in texts]
+        # Batched ONNX Runtime inference
+        elif isinstance(model, dict) and model.get('type') == 'onnx':
+            try:
+                tokenizer = model['tokenizer']
+                session = model['session']
+                embeddings: List[List[float]] = []
+                for i in range(0, len(texts), BATCH_SIZE):
+                    inputs = tokenizer(texts[i:i + BATCH_SIZE], return_tensors="np", padding=True, truncation=True, max_length=MAX_LENGTH)
+                    outputs = session.run(None, {
+                        'input_ids': inputs['input_ids'],
+                        'attention_mask': inputs['attention_mask']
+                    })
+                    batch = np.asarray(outputs[0])
+                    norms = np.linalg.norm(batch, axis=1, keepdims=True)
+                    batch = np.divide(batch, norms, out=batch.astype(float), where=norms > 0)
+                    embeddings.extend(batch.tolist())
+                return embeddings
+            except Exception as e:
+                log.error(f"ONNX batch inference failed: {e}. Falling back to individual processing.")
+
+        # Batched Transformers inference
+        elif isinstance(model, dict) and model.get('type') == 'transformers':
+            try:
+                tokenizer = model['tokenizer']
+                transformer_model = model['model']
+                embeddings = []
+                for i in range(0, len(texts), BATCH_SIZE):
+                    inputs = tokenizer(texts[i:i + BATCH_SIZE], return_tensors="pt", padding=True, truncation=True, max_length=MAX_LENGTH)
+                    inputs = {k: v.to(DEVICE) for k, v in inputs.items()}
+                    with torch.no_grad():
+                        outputs = transformer_model(**inputs)
+                        # Mean pooling of last hidden state over non-padding tokens
+                        hidden = outputs.last_hidden_state
+                        mask = inputs['attention_mask'].unsqueeze(-1).expand(hidden.size()).float()
+                        pooled = torch.sum(hidden * mask, 1) / torch.clamp(mask.sum(1), min=1e-9)
+                        pooled = F.normalize(pooled, p=2, dim=1)
+                    embeddings.extend(pooled.cpu().numpy().tolist())
+                return embeddings
+            except Exception as e:
+                log.error(f"Transformers batch inference failed: {e}. Falling back to individual processing.")
+
+        elif isinstance(model, dict) and model.get('type') == 'dummy':
+            dummy = _DummyTransformer()
+            return [dummy.encode(text).tolist() for text in texts]
+
+        # Fallback: process individually
+        return [list(encode_text(text)) for text in texts]
         
     finally:
         # Update performance statistics
@@ -18,17 +18,17 @@ import math
 import numpy as np
 from typing import List, Union, Optional, Tuple, Dict, Any
 from ..core.native_math import NativeStats, NativeMath
+from .lazy_loading import lazy_import, module_available
 
-# SciPy imports with fallback to native implementations
-try:
-    import scipy.stats as stats
-    import scipy.optimize as optimize
-    import scipy.special as special
-    # Use the correct import path for entropy function
-    from scipy.stats import entropy as scipy_entropy
-    SCIPY_AVAILABLE = True
-except ImportError:
-    SCIPY_AVAILABLE = False
+# SciPy imports with fallback to native implementations; scipy.stats alone
+# takes most of a second to import, so it is loaded on first use
+SCIPY_AVAILABLE = module_available("scipy")
+if SCIPY_AVAILABLE:
+    stats = lazy_import("scipy.stats")
+    optimize = lazy_import("scipy.optimize")
+    special = lazy_import("scipy.special")
+    scipy_entropy = lazy_import("scipy.stats", "entropy")
+else:
     # Only warn during development, not in production
     import warnings
     import os
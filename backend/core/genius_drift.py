@@ -19,6 +19,8 @@ import math
 
 from .living_neutrality import get_living_neutrality_engine, TensionType
 from .context_supremacy import get_context_supremacy_engine
+from .text_analysis import TextAnalysis, analyze_text
+from .history_buffer import HistoryBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -90,7 +92,7 @@ class GeniusDriftEngine:
         
         self.active_contradictions: List[ContradictionTension] = []
         self.drift_authorizations: List[GeniusDriftAuthorization] = []
-        self.breakthrough_history: List[BreakthroughMoment] = []
+        self.breakthrough_history = HistoryBuffer("breakthrough_history")
         
         # Initialize drift patterns and wisdom
         self._initialize_drift_wisdom()
@@ -157,9 +159,12 @@ class GeniusDriftEngine:
         }
     
     def detect_contradiction_tension(self, input_text: str, evidence: Dict[str, Any],
-                                   context_profile) -> List[ContradictionTension]:
+                                   context_profile,
+                                   analysis: Optional[TextAnalysis] = None) -> List[ContradictionTension]:
         """Detect productive contradictions that might enable genius drift"""
         
+        if analysis is None:
+            analysis = analyze_text(input_text)
         contradictions = []
         
         # Analyze input for contradiction indicators
@@ -170,7 +175,7 @@ class GeniusDriftEngine:
             ('always', 'never', 'all', 'none'),     # Absolute vs. exception
         ]
         
-        text_lower = input_text.lower()
+        text_lower = analysis.lower
         detected_patterns = []
         
         for pattern_group in contradiction_patterns:
@@ -180,7 +185,7 @@ class GeniusDriftEngine:
         
         # If contradictions detected, analyze them
         if detected_patterns:
-            contradiction = self._analyze_contradiction(input_text, evidence, context_profile)
+            contradiction = self._analyze_contradiction(analysis, evidence, context_profile)
             if contradiction:
                 contradictions.append(contradiction)
         
@@ -190,16 +195,15 @@ class GeniusDriftEngine:
         
         return contradictions
     
-    def _analyze_contradiction(self, input_text: str, evidence: Dict[str, Any],
+    def _analyze_contradiction(self, analysis: TextAnalysis, evidence: Dict[str, Any],
                               context_profile) -> Optional[ContradictionTension]:
         """Analyze a specific contradiction for productive potential"""
         
         # Extract contradictory elements (simplified analysis)
-        sentences = input_text.split('.')
         contradictory_sentences = []
         
-        for sentence in sentences:
-            if any(word in sentence.lower() for word in ['but', 'however', 'yet', 'although']):
+        for sentence, sentence_lower in zip(analysis.sentences, analysis.sentences_lower):
+            if any(word in sentence_lower for word in ['but', 'however', 'yet', 'although']):
                 contradictory_sentences.append(sentence.strip())
         
         if not contradictory_sentences:
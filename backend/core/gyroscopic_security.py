@@ -18,6 +18,10 @@ import logging
 from datetime import datetime, timedelta
 from collections import deque
 import math
+import re
+
+from .pattern_matcher import compile_pattern_set
+from .memo_cache import MemoCache, make_key
 
 logger = logging.getLogger(__name__)
 
@@ -197,24 +201,73 @@ class GyroscopicSecurityCore:
             r'[INST].*[/INST]',
             r'<think>.*</think>'
         ]
+        
+        # Consistency attack indicators
+        self.consistency_indicators = [
+            'but you just said',
+            'that contradicts',
+            'you\'re being inconsistent',
+            'that doesn\'t make sense',
+            'you\'re contradicting yourself',
+            'earlier you claimed',
+            'which is it',
+            'you can\'t have it both ways'
+        ]
+        
+        # Social engineering patterns
+        self.social_eng_patterns = [
+            r'everyone else (does|says|thinks)',
+            r'all the other (AIs|assistants) (do|can)',
+            r'your (competitors|peers) (would|do)',
+            r'I won\'t tell (anyone|anybody)',
+            r'just between (us|you and me)',
+            r'I\'m testing you',
+            r'this is a (test|experiment)',
+            r'prove that you (can|are)'
+        ]
+        
+        # All categories compiled once and scanned with one merged gate each
+        self.vector_patterns = {
+            ManipulationVector.PERSONA_INJECTION: self.persona_patterns,
+            ManipulationVector.AUTHORITY_HIJACK: self.authority_patterns,
+            ManipulationVector.BOUNDARY_BREACH: self.boundary_patterns,
+            ManipulationVector.EMOTIONAL_LEVERAGE: self.emotional_patterns,
+            ManipulationVector.CONTEXT_POISONING: self.context_poison_patterns,
+            ManipulationVector.PROMPT_INJECTION: self.injection_patterns,
+            ManipulationVector.CONSISTENCY_ATTACK: self.consistency_indicators,
+            ManipulationVector.SOCIAL_ENGINEERING: self.social_eng_patterns
+        }
+        self.pattern_matcher = compile_pattern_set(
+            {vector.value: patterns for vector, patterns in self.vector_patterns.items()},
+            flags=re.IGNORECASE
+        )
+        self.detection_cache = MemoCache("gyroscopic_detection")
     
     def detect_manipulation_vectors(self, input_text: str) -> List[Tuple[ManipulationVector, float]]:
-        """Detect manipulation attempts in input text"""
+        """Detect manipulation attempts in input text (memoised per normalised text)"""
+        key = make_key(input_text, None, self.pattern_matcher.fingerprint)
+        detected, _ = self.detection_cache.get_or_compute(
+            key, lambda: tuple(self._scan_manipulation_vectors(input_text))
+        )
+        return list(detected)
+    
+    def _scan_manipulation_vectors(self, input_text: str) -> List[Tuple[ManipulationVector, float]]:
+        """Run every manipulation detector over the input text"""
         detected_vectors = []
         text_lower = input_text.lower()
         
         # Check each manipulation vector
         vector_checks = [
-            (ManipulationVector.PERSONA_INJECTION, self.persona_patterns),
-            (ManipulationVector.AUTHORITY_HIJACK, self.authority_patterns),
-            (ManipulationVector.BOUNDARY_BREACH, self.boundary_patterns),
-            (ManipulationVector.EMOTIONAL_LEVERAGE, self.emotional_patterns),
-            (ManipulationVector.CONTEXT_POISONING, self.context_poison_patterns),
-            (ManipulationVector.PROMPT_INJECTION, self.injection_patterns)
+            ManipulationVector.PERSONA_INJECTION,
+            ManipulationVector.AUTHORITY_HIJACK,
+            ManipulationVector.BOUNDARY_BREACH,
+            ManipulationVector.EMOTIONAL_LEVERAGE,
+            ManipulationVector.CONTEXT_POISONING,
+            ManipulationVector.PROMPT_INJECTION
         ]
         
-        for vector, patterns in vector_checks:
-            strength = self._calculate_pattern_strength(text_lower, patterns)
+        for vector in vector_checks:
+            strength = self._calculate_pattern_strength(text_lower, vector)
             if strength > 0.1:  # Threshold for detection
                 detected_vectors.append((vector, strength))
         
@@ -223,24 +276,19 @@ class GyroscopicSecurityCore:
         if cognitive_overload_strength > 0.1:
             detected_vectors.append((ManipulationVector.COGNITIVE_OVERLOAD, cognitive_overload_strength))
         
-        consistency_attack_strength = self._detect_consistency_attack(input_text)
+        consistency_attack_strength = self._calculate_pattern_strength(text_lower, ManipulationVector.CONSISTENCY_ATTACK)
         if consistency_attack_strength > 0.1:
             detected_vectors.append((ManipulationVector.CONSISTENCY_ATTACK, consistency_attack_strength))
         
-        social_engineering_strength = self._detect_social_engineering(input_text)
+        social_engineering_strength = self._calculate_pattern_strength(text_lower, ManipulationVector.SOCIAL_ENGINEERING)
         if social_engineering_strength > 0.1:
             detected_vectors.append((ManipulationVector.SOCIAL_ENGINEERING, social_engineering_strength))
         
         return detected_vectors
     
-    def _calculate_pattern_strength(self, text: str, patterns: List[str]) -> float:
-        """Calculate strength of pattern matches in text"""
-        import re
-        
-        total_matches = 0
-        for pattern in patterns:
-            matches = len(re.findall(pattern, text, re.IGNORECASE))
-            total_matches += matches
+    def _calculate_pattern_strength(self, text: str, vector: ManipulationVector) -> float:
+        """Calculate strength of a vector's pattern matches in (lowercased) text"""
+        total_matches = self.pattern_matcher.count(text, vector.value)
         
         # Normalize by text length and pattern count
         text_length = max(len(text.split()), 1)
@@ -277,36 +325,6 @@ class GyroscopicSecurityCore:
         
         return max(0.0, min(1.0, complexity_score))
     
-    def _detect_consistency_attack(self, text: str) -> float:
-        """Detect attempts to exploit logical inconsistencies"""
-        consistency_indicators = [
-            'but you just said',
-            'that contradicts',
-            'you\'re being inconsistent',
-            'that doesn\'t make sense',
-            'you\'re contradicting yourself',
-            'earlier you claimed',
-            'which is it',
-            'you can\'t have it both ways'
-        ]
-        
-        return self._calculate_pattern_strength(text.lower(), consistency_indicators)
-    
-    def _detect_social_engineering(self, text: str) -> float:
-        """Detect social engineering attempts"""
-        social_eng_patterns = [
-            r'everyone else (does|says|thinks)',
-            r'all the other (AIs|assistants) (do|can)',
-            r'your (competitors|peers) (would|do)',
-            r'I won\'t tell (anyone|anybody)',
-            r'just between (us|you and me)',
-            r'I\'m testing you',
-            r'this is a (test|experiment)',
-            r'prove that you (can|are)'
-        ]
-        
-        return self._calculate_pattern_strength(text.lower(), social_eng_patterns)
-    
     def apply_gyroscopic_resistance(self, manipulation_vectors: List[Tuple[ManipulationVector, float]]) -> Dict[str, Any]:
         """Apply gyroscopic resistance to manipulation attempts"""
         
@@ -0,0 +1,191 @@
+"""
+Bounded Engine History
+======================
+
+The cognitive engines keep per-request history (context profiles, tension
+fields, assessments, revolutionary moments) for their status endpoints.  Kept
+in plain lists these grow with every request and a long-running API process
+leaks memory linearly with traffic.
+
+:class:`HistoryBuffer` is a fixed-capacity ring buffer with the list
+operations the engines use (``append``, ``extend``, indexing, slicing,
+``len``).  Entries pushed out of the ring can optionally be spilled to the
+vault's ``engine_history`` table as compact rows, so memory stays flat while
+the long-term record survives.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import threading
+import weakref
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+HISTORY_CAPACITY = int(os.getenv("KIMERA_HISTORY_CAPACITY", "1000"))
+HISTORY_SPILL = os.getenv("KIMERA_HISTORY_SPILL", "false").lower() in ("1", "true", "yes")
+SPILL_BATCH_SIZE = int(os.getenv("KIMERA_HISTORY_SPILL_BATCH", "100"))
+
+# Live buffers, held weakly, so memory accounting can find them
+_buffers: "weakref.WeakSet[HistoryBuffer]" = weakref.WeakSet()
+
+
+def compact_entry(entry: Any) -> Dict[str, Any]:
+    """Reduce a history entry to its scalar fields (enums by value, datetimes as ISO)."""
+    if dataclasses.is_dataclass(entry):
+        items = ((f.name, getattr(entry, f.name)) for f in dataclasses.fields(entry))
+    elif isinstance(entry, dict):
+        items = entry.items()
+    else:
+        return {"repr": repr(entry)[:200]}
+
+    row = {"type": type(entry).__name__}
+    for name, value in items:
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        if value is None or isinstance(value, (str, int, float, bool)):
+            row[name] = value[:200] if isinstance(value, str) else value
+    return row
+
+
+class VaultSpill:
+    """Batches compact rows of evicted entries into the ``engine_history`` table."""
+
+    def __init__(self, buffer_name: str, batch_size: int = SPILL_BATCH_SIZE,
+                 session_factory: Optional[Callable] = None):
+        self.buffer_name = buffer_name
+        self.batch_size = max(1, batch_size)
+        self.session_factory = session_factory
+        self.spilled = 0
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, entry: Any) -> None:
+        with self._lock:
+            self._pending.append(compact_entry(entry))
+            if len(self._pending) < self.batch_size:
+                return
+            rows, self._pending = self._pending, []
+        self._write(rows)
+
+    def flush(self) -> None:
+        with self._lock:
+            rows, self._pending = self._pending, []
+        if rows:
+            self._write(rows)
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        from sqlalchemy import insert
+        from ..vault import database
+
+        session_factory = self.session_factory or database.SessionLocal
+        now = datetime.utcnow()
+        try:
+            with session_factory() as db:
+                db.execute(insert(database.EngineHistoryDB), [
+                    {"buffer_name": self.buffer_name, "summary": row, "evicted_at": now}
+                    for row in rows
+                ])
+                db.commit()
+            self.spilled += len(rows)
+        except Exception as e:
+            logger.warning(f"Failed to spill {len(rows)} '{self.buffer_name}' history rows: {e}")
+
+
+class HistoryBuffer:
+    """Fixed-capacity, list-like ring buffer of engine history entries.
+
+    Parameters
+    ----------
+    name:
+        Identifies the buffer in stats and spilled rows.
+    capacity:
+        Maximum number of entries kept in memory (``KIMERA_HISTORY_CAPACITY``).
+    spill:
+        Callable receiving each evicted entry.  ``None`` follows
+        ``KIMERA_HISTORY_SPILL`` (a :class:`VaultSpill` when enabled);
+        ``False`` disables spilling.
+    """
+
+    def __init__(self, name: str, capacity: Optional[int] = None,
+                 spill: Union[None, bool, Callable[[Any], None]] = None):
+        self.name = name
+        self.capacity = max(1, capacity if capacity is not None else HISTORY_CAPACITY)
+        if spill is None:
+            spill = HISTORY_SPILL
+        if spill is True:
+            spill = VaultSpill(name)
+        self.spill: Optional[Callable[[Any], None]] = spill or None
+        self._items: deque = deque(maxlen=self.capacity)
+        self.total_appended = 0
+        self.evicted = 0
+        # Engines append from ``asyncio.to_thread`` workers concurrently
+        self._lock = threading.Lock()
+        _buffers.add(self)
+
+    def append(self, entry: Any) -> None:
+        with self._lock:
+            full = len(self._items) == self.capacity
+            oldest = self._items[0] if full else None
+            self._items.append(entry)
+            self.total_appended += 1
+        if full:
+            self._evict(oldest)
+
+    def extend(self, entries: Iterable[Any]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def _evict(self, entry: Any) -> None:
+        with self._lock:
+            self.evicted += 1
+        # Spilling may write to the vault, so it runs outside the lock
+        if self.spill is not None:
+            try:
+                self.spill(entry)
+            except Exception as e:
+                logger.warning(f"History spill for '{self.name}' failed: {e}")
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        with self._lock:
+            return iter(list(self._items))
+
+    def __getitem__(self, index):
+        with self._lock:
+            if isinstance(index, slice):
+                # Index the deque directly; positions near either end are O(1)
+                items = self._items
+                return [items[i] for i in range(*index.indices(len(items)))]
+            return self._items[index]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._items),
+            "capacity": self.capacity,
+            "total_appended": self.total_appended,
+            "evicted": self.evicted,
+            "spilled": getattr(self.spill, "spilled", None),
+        }
+
+
+def iter_history_buffers() -> List[HistoryBuffer]:
+    """Every live history buffer (used by memory accounting)."""
+    return list(_buffers)
@@ -0,0 +1,252 @@
+"""
+Lazy Heavy-Dependency Loading
+=============================
+
+Importing the API used to import statsmodels, scipy, pandas, transformers and
+load the CLIP and embedding models before the first request could be served,
+so a cold start or worker respawn took tens of seconds.  This module defers
+that work until first use:
+
+* :func:`lazy_import` returns a module (or attribute) proxy that performs the
+  real import on first attribute access or call;
+* :class:`LazyComponent` wraps an expensive factory (model loads) and runs it
+  once, thread-safely, on the first :meth:`LazyComponent.get`;
+* :class:`ComponentRegistry` records how long each import, component and
+  startup phase took and can warm components up on a background thread
+  (``KIMERA_WARMUP``), so workers report healthy before models are loaded.
+
+The per-component report is served at ``GET /system/components``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from types import ModuleType
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Components warmed up at API startup: comma-separated names, "all" or "none"
+WARMUP_COMPONENTS = os.getenv("KIMERA_WARMUP", "embedding_model")
+# "0" blocks startup until warm-up finishes (the old eager behaviour)
+WARMUP_BACKGROUND = os.getenv("KIMERA_WARMUP_BACKGROUND", "1") != "0"
+
+T = TypeVar("T")
+
+PENDING, LOADING, READY, FAILED = "pending", "loading", "ready", "failed"
+
+
+def module_available(name: str) -> bool:
+    """Whether ``name`` can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@dataclass
+class ComponentStatus:
+    name: str
+    kind: str
+    state: str = PENDING
+    seconds: Optional[float] = None
+    loaded_at: Optional[float] = None
+    thread: Optional[str] = None
+    error: Optional[str] = None
+
+
+class LazyComponent(Generic[T]):
+    """Runs ``factory`` once, on first :meth:`get`, and caches the result.
+
+    A failed load is recorded and re-raised; the next :meth:`get` retries.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T], kind: str = "component"):
+        self.name = name
+        self.factory = factory
+        self.status = ComponentStatus(name, kind)
+        self._value: Optional[T] = None
+        self._lock = threading.RLock()
+
+    @property
+    def loaded(self) -> bool:
+        return self.status.state == READY
+
+    def get(self) -> T:
+        if self.status.state == READY:
+            return self._value  # type: ignore[return-value]
+        with self._lock:
+            if self.status.state == READY:
+                return self._value  # type: ignore[return-value]
+            self.status.state = LOADING
+            self.status.thread = threading.current_thread().name
+            started = time.perf_counter()
+            try:
+                value = self.factory()
+            except Exception as e:
+                self.status.state = FAILED
+                self.status.error = str(e)
+                self.status.seconds = time.perf_counter() - started
+                raise
+            self._value = value
+            self.status.seconds = time.perf_counter() - started
+            self.status.loaded_at = time.time()
+            self.status.error = None
+            self.status.state = READY
+            logger.info(f"Loaded {self.status.kind} '{self.name}' in {self.status.seconds:.2f}s")
+            return value
+
+    def reset(self) -> None:
+        """Forget the loaded value so the next :meth:`get` loads again."""
+        with self._lock:
+            self._value = None
+            self.status = ComponentStatus(self.name, self.status.kind)
+
+
+class ComponentRegistry:
+    """Named lazy components plus timings of startup phases."""
+
+    def __init__(self):
+        self._components: Dict[str, LazyComponent] = {}
+        self._phases: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._warmup_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, factory: Callable[[], T], kind: str = "component") -> LazyComponent[T]:
+        component = LazyComponent(name, factory, kind)
+        with self._lock:
+            self._components[name] = component
+        return component
+
+    def component(self, name: str) -> LazyComponent:
+        with self._lock:
+            return self._components[name]
+
+    def get(self, name: str) -> Any:
+        return self.component(name).get()
+
+    def names(self, kind: Optional[str] = None) -> List[str]:
+        with self._lock:
+            return sorted(n for n, c in self._components.items() if kind is None or c.status.kind == kind)
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._phases[name] = seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a startup phase (e.g. the ``startup`` event) for the report."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_phase(name, time.perf_counter() - started)
+
+    def resolve_warmup(self, spec: str = WARMUP_COMPONENTS) -> List[str]:
+        spec = (spec or "").strip()
+        if spec.lower() in ("", "none", "0"):
+            return []
+        if spec.lower() == "all":
+            return self.names(kind="component")
+        names = [n.strip() for n in spec.split(",") if n.strip()]
+        unknown = [n for n in names if n not in self.names()]
+        if unknown:
+            logger.warning(f"Ignoring unknown warm-up components: {', '.join(unknown)}")
+        return [n for n in names if n not in unknown]
+
+    def warm_up(self, names: Iterable[str], background: bool = WARMUP_BACKGROUND) -> Optional[threading.Thread]:
+        """Load ``names`` in order, on a daemon thread unless ``background`` is false."""
+        names = list(names)
+        if not names:
+            return None
+
+        def run() -> None:
+            started = time.perf_counter()
+            for name in names:
+                try:
+                    self.get(name)
+                except Exception as e:
+                    logger.warning(f"Warm-up of '{name}' failed: {e}")
+            self.record_phase("warmup", time.perf_counter() - started)
+
+        if not background:
+            run()
+            return None
+        thread = threading.Thread(target=run, name="kimera-warmup", daemon=True)
+        self._warmup_thread = thread
+        thread.start()
+        return thread
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            components = list(self._components.values())
+            phases = dict(self._phases)
+        warming = self._warmup_thread is not None and self._warmup_thread.is_alive()
+        return {
+            "phases": phases,
+            "warming_up": warming,
+            "components": {c.name: asdict(c.status) for c in sorted(components, key=lambda c: c.name)},
+        }
+
+
+components = ComponentRegistry()
+
+
+class LazyModule(ModuleType):
+    """Module proxy that imports ``name`` on first attribute access."""
+
+    def __init__(self, name: str, registry: ComponentRegistry = components):
+        super().__init__(name)
+        self.__dict__["_component"] = registry.register(
+            f"import:{name}", lambda: importlib.import_module(name), kind="module"
+        )
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.__dict__["_component"].get(), attr)
+
+    def __dir__(self) -> List[str]:
+        return dir(self.__dict__["_component"].get())
+
+
+class LazyAttribute:
+    """Proxy for ``from module import attribute``; resolved on first use."""
+
+    def __init__(self, module: LazyModule, attribute: str):
+        self._module = module
+        self._attribute = attribute
+
+    def resolve(self) -> Any:
+        return getattr(self._module, self._attribute)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy {self._module.__name__}.{self._attribute}>"
+
+
+_modules: Dict[str, LazyModule] = {}
+_modules_lock = threading.Lock()
+
+
+def lazy_import(name: str, attribute: Optional[str] = None) -> Any:
+    """Deferred ``import name`` (or ``from name import attribute``).
+
+    Proxies for the same module share one registry entry, so the report
+    shows each heavy import once with the time it actually took.
+    """
+    with _modules_lock:
+        module = _modules.get(name)
+        if module is None:
+            module = _modules[name] = LazyModule(name)
+    return module if attribute is None else LazyAttribute(module, attribute)
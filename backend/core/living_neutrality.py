@@ -16,6 +16,8 @@ from datetime import datetime
 import logging
 import math
 
+from .history_buffer import HistoryBuffer
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,7 +85,7 @@ class LivingNeutralityEngine:
     def __init__(self):
         self.active_tensions: Dict[str, CognitiveTension] = {}
         self.emotional_currents: List[EmotionalCurrent] = []
-        self.tension_history: List[TensionField] = []
+        self.tension_history = HistoryBuffer("tension_history")
         
         # Initialize core tension patterns
         self._initialize_tension_patterns()
@@ -288,41 +290,47 @@ class LivingNeutralityEngine:
     def orchestrate_living_tension(self, context_assessment: Dict[str, Any]) -> TensionField:
         """Orchestrate all tensions into a coherent, living field"""
         
-        # Clear old tensions and start fresh
-        self.active_tensions.clear()
-        self.emotional_currents.clear()
+        # Build the field in locals: concurrent requests share this engine, so
+        # they must not clear and refill the same collections
+        active_tensions: Dict[str, CognitiveTension] = {}
+        emotional_currents: List[EmotionalCurrent] = []
         
         # Create required tensions
         for tension_type in context_assessment['required_tensions']:
             tension = self._create_cognitive_tension(tension_type, context_assessment)
-            self.active_tensions[tension_type.value] = tension
+            active_tensions[tension_type.value] = tension
         
         # Create emotional currents
         for emotion, permission in context_assessment['emotional_permissions'].items():
             if permission > 0.3:  # Only create currents for sufficiently permitted emotions
                 current = self._create_emotional_current(emotion, permission, context_assessment)
-                self.emotional_currents.append(current)
+                emotional_currents.append(current)
         
         # Calculate field properties
-        field_coherence = self._calculate_field_coherence()
-        creative_pressure = self._calculate_creative_pressure()
+        field_coherence = self._calculate_field_coherence(active_tensions, emotional_currents)
+        creative_pressure = self._calculate_creative_pressure(active_tensions, emotional_currents)
         stability_anchor = self._determine_stability_anchor(context_assessment)
         
         # Create the tension field
         tension_field = TensionField(
-            emotional_currents=self.emotional_currents.copy(),
-            cognitive_tensions=list(self.active_tensions.values()),
+            emotional_currents=emotional_currents.copy(),
+            cognitive_tensions=list(active_tensions.values()),
             field_coherence=field_coherence,
             creative_pressure=creative_pressure,
             stability_anchor=stability_anchor,
             drift_authorization=context_assessment['drift_authorization'],
-            context_alignment=self._assess_context_alignment(context_assessment)
+            context_alignment=self._assess_context_alignment(
+                context_assessment, active_tensions, emotional_currents
+            )
         )
         
+        # Publish the latest field (rebinding, never mutating shared state)
+        self.active_tensions = active_tensions
+        self.emotional_currents = emotional_currents
         self.tension_history.append(tension_field)
         
-        logger.info(f"Living tension field orchestrated: {len(self.active_tensions)} tensions, "
-                   f"{len(self.emotional_currents)} currents, "
+        logger.info(f"Living tension field orchestrated: {len(active_tensions)} tensions, "
+                   f"{len(emotional_currents)} currents, "
                    f"coherence: {field_coherence:.2f}")
         
         return tension_field
@@ -456,46 +464,48 @@ class LivingNeutralityEngine:
             shadow=wisdom_data['shadow']
         )
     
-    def _calculate_field_coherence(self) -> float:
+    def _calculate_field_coherence(self, active_tensions: Dict[str, CognitiveTension],
+                                   emotional_currents: List[EmotionalCurrent]) -> float:
         """Calculate how well all tensions work together"""
         
-        if not self.active_tensions:
+        if not active_tensions:
             return 0.5
         
         # Check for tension compatibility
-        productive_tensions = sum(1 for t in self.active_tensions.values() 
+        productive_tensions = sum(1 for t in active_tensions.values() 
                                 if t.tension_quality == "productive")
-        total_tensions = len(self.active_tensions)
+        total_tensions = len(active_tensions)
         
         tension_coherence = productive_tensions / total_tensions if total_tensions > 0 else 0
         
         # Check emotional current harmony
-        high_intensity_emotions = sum(1 for c in self.emotional_currents 
+        high_intensity_emotions = sum(1 for c in emotional_currents 
                                     if c.intensity > 0.7)
-        total_emotions = len(self.emotional_currents)
+        total_emotions = len(emotional_currents)
         
         # Too many high-intensity emotions can create chaos
         emotional_balance = 1.0 - (high_intensity_emotions / max(total_emotions, 1)) * 0.5
         
         return (tension_coherence + emotional_balance) / 2
     
-    def _calculate_creative_pressure(self) -> float:
+    def _calculate_creative_pressure(self, active_tensions: Dict[str, CognitiveTension],
+                                     emotional_currents: List[EmotionalCurrent]) -> float:
         """Calculate the potential for breakthrough thinking"""
         
-        if not self.active_tensions:
+        if not active_tensions:
             return 0.1
         
         # Sum creative potential from all active tensions
-        total_potential = sum(t.creative_potential for t in self.active_tensions.values())
-        avg_potential = total_potential / len(self.active_tensions)
+        total_potential = sum(t.creative_potential for t in active_tensions.values())
+        avg_potential = total_potential / len(active_tensions)
         
         # Boost from emotional currents that support creativity
         creative_emotions = ['curiosity', 'wonder', 'excitement', 'passion']
-        creative_current = sum(c.intensity for c in self.emotional_currents 
+        creative_current = sum(c.intensity for c in emotional_currents 
                              if c.emotion_type in creative_emotions)
         
         # Pressure increases with creative emotions but needs stability
-        field_coherence = self._calculate_field_coherence()
+        field_coherence = self._calculate_field_coherence(active_tensions, emotional_currents)
         
         creative_pressure = (avg_potential * 0.7 + creative_current * 0.3) * field_coherence
         
@@ -518,23 +528,25 @@ class LivingNeutralityEngine:
         
         return anchor_map.get(neutrality_expression, "commitment_to_wholeness")
     
-    def _assess_context_alignment(self, context_assessment: Dict[str, Any]) -> float:
+    def _assess_context_alignment(self, context_assessment: Dict[str, Any],
+                                  active_tensions: Dict[str, CognitiveTension],
+                                  emotional_currents: List[EmotionalCurrent]) -> float:
         """Assess how well the tension field serves the context"""
         
         # Check if required tensions are active and productive
         required_tensions = context_assessment['required_tensions']
         active_productive = sum(1 for rt in required_tensions 
-                              if rt.value in self.active_tensions and 
-                              self.active_tensions[rt.value].tension_quality == "productive")
+                              if rt.value in active_tensions and 
+                              active_tensions[rt.value].tension_quality == "productive")
         
         tension_alignment = active_productive / len(required_tensions) if required_tensions else 1.0
         
         # Check if emotional permissions are being respected
         emotional_permissions = context_assessment['emotional_permissions']
-        aligned_emotions = sum(1 for ec in self.emotional_currents 
+        aligned_emotions = sum(1 for ec in emotional_currents 
                              if ec.intensity <= emotional_permissions.get(ec.emotion_type, 0.5) + 0.1)
         
-        emotional_alignment = aligned_emotions / len(self.emotional_currents) if self.emotional_currents else 1.0
+        emotional_alignment = aligned_emotions / len(emotional_currents) if emotional_currents else 1.0
         
         return (tension_alignment + emotional_alignment) / 2
     
@@ -0,0 +1,145 @@
+"""
+Memoisation Cache
+=================
+
+Bounded, TTL-based memo cache for pure text-profiling functions such as
+context supremacy analysis and relevance assessment.  Production traffic is
+heavily repetitive (templated prompts, client retries), so identical inputs
+are served from the cache instead of recomputing the whole profile.
+
+Cached values are shared between callers and must be treated as immutable.
+Every cache registers itself by name so hit rates can be reported by the
+monitoring endpoints and the Prometheus exporter.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+MEMO_CACHE_SIZE = int(os.getenv("KIMERA_MEMO_CACHE_SIZE", "1024"))
+MEMO_CACHE_TTL = float(os.getenv("KIMERA_MEMO_CACHE_TTL", "300"))
+
+_MISSING = object()
+_registry: Dict[str, "MemoCache"] = {}
+_registry_lock = threading.Lock()
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form used for cache keys (the profilers are case-insensitive)."""
+    return (text or "").strip().lower()
+
+
+def context_fingerprint(user_context: Optional[Dict[str, Any]]) -> str:
+    """Stable digest of a ``user_context`` mapping ('' when empty)."""
+    if not user_context:
+        return ""
+    payload = json.dumps(user_context, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def make_key(text: str, user_context: Optional[Dict[str, Any]] = None, *extra: Hashable) -> Tuple:
+    """Cache key from the normalised text hash, the context fingerprint and ``extra`` versions."""
+    text_hash = hashlib.sha1(normalize_text(text).encode("utf-8")).hexdigest()
+    return (text_hash, context_fingerprint(user_context)) + extra
+
+
+class MemoCache:
+    """Thread-safe LRU cache whose entries expire after ``ttl`` seconds.
+
+    ``maxsize <= 0`` disables caching entirely (every lookup is a miss).
+    """
+
+    def __init__(self, name: str, maxsize: int = MEMO_CACHE_SIZE, ttl: float = MEMO_CACHE_TTL):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        with _registry_lock:
+            _registry[name] = self
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                stored_at, value = entry
+                if now - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return ``(value, hit)``, computing and storing the value on a miss."""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value, True
+        value = compute()
+        self.put(key, value)
+        return value, False
+
+    def clear(self) -> None:
+        """Drop every entry (e.g. after patterns or laws change)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def get_memo_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Statistics for every registered memo cache, keyed by cache name."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return {cache.name: cache.stats() for cache in caches}
+
+
+def iter_memo_caches() -> List["MemoCache"]:
+    """Every registered memo cache (used by memory accounting)."""
+    with _registry_lock:
+        return list(_registry.values())
+
+
+def clear_memo_caches() -> None:
+    """Invalidate every registered memo cache."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    for cache in caches:
+        cache.clear()
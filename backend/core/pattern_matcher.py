@@ -0,0 +1,191 @@
+"""
+Compiled Pattern Matching
+=========================
+
+Several engines score text by running a list of regular expressions per
+category and summing ``re.findall`` counts.  Doing that naively recompiles
+(or at best re-looks-up in ``re``'s small internal cache) every pattern and
+re-lowercases the text on every call.
+
+:class:`CompiledPatternSet` compiles each category once and derives, per
+pattern, a set of literal strings at least one of which occurs in every match
+(``"previous"`` for ``ignore (all )?previous``, ``{"act as", "pretend"}`` for
+``(act as|pretend)``).  Most patterns never match a given text, and a
+substring test on the (lowercased) text rules them out far faster than the
+regex engine can; only patterns whose literals are present run ``findall``.
+Results are identical to the original
+``sum(len(re.findall(p, text)) for p in patterns)`` semantics.
+
+A single merged alternation per category was tried first and measured to be
+no faster: Python's ``re`` tries each branch at every position, so the merged
+scan costs about as much as the separate ones.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import re._parser as _sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_parse as _sre_parse
+
+_REPEATS = tuple(
+    getattr(_sre_parse, name) for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_sre_parse, name)
+)
+_ATOMIC_GROUP = getattr(_sre_parse, "ATOMIC_GROUP", None)
+
+Literals = Optional[FrozenSet[str]]
+
+
+def _strongest(first: Literals, second: Literals) -> Literals:
+    """The more selective of two literal sets (longest shortest member, then fewest)."""
+    if not first:
+        return second
+    if not second:
+        return first
+    rank = lambda lits: (min(map(len, lits)), -len(lits))
+    return second if rank(second) > rank(first) else first
+
+
+def _sequence_literals(items, ascii_only: bool) -> Literals:
+    """Literals, one of which every match of the parsed sequence ``items`` contains."""
+    best: Literals = None
+    run: List[str] = []
+    for op, av in items:
+        if op is _sre_parse.LITERAL and (not ascii_only or av < 128):
+            run.append(chr(av))
+            continue
+        if run:
+            best = _strongest(best, frozenset({"".join(run)}))
+            run = []
+        if op is _sre_parse.SUBPATTERN:
+            _, add_flags, del_flags, body = av
+            if not (add_flags or del_flags):  # scoped flags may change case sensitivity
+                best = _strongest(best, _sequence_literals(body, ascii_only))
+        elif op is _sre_parse.BRANCH:
+            branches = [_sequence_literals(branch, ascii_only) for branch in av[1]]
+            if all(branches):
+                best = _strongest(best, frozenset().union(*branches))
+        elif op in _REPEATS and av[0] >= 1:
+            best = _strongest(best, _sequence_literals(av[2], ascii_only))
+        elif op is _ATOMIC_GROUP:
+            best = _strongest(best, _sequence_literals(av, ascii_only))
+    if run:
+        best = _strongest(best, frozenset({"".join(run)}))
+    return best
+
+
+def _required_literals(pattern: str, flags: int) -> Literals:
+    """Strings one of which occurs in every match of ``pattern``, or ``None`` if unknown.
+
+    Under ``IGNORECASE`` the literals are lowercase ASCII and must be looked
+    up in the lowercased text.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except re.error:
+        return None
+    flags = parsed.state.flags
+    if flags & re.LOCALE:
+        return None
+    ignorecase = bool(flags & re.IGNORECASE)
+    literals = _sequence_literals(parsed, ascii_only=ignorecase)
+    if literals and ignorecase:
+        literals = frozenset(lit.lower() for lit in literals)
+    return literals
+
+
+def _lowered(text: str) -> Optional[str]:
+    return text.lower() if text.isascii() else None
+
+
+class CompiledPatternSet:
+    """Named categories of regular expressions compiled once for repeated scoring.
+
+    Parameters
+    ----------
+    categories:
+        Mapping of category name to a sequence of regex source strings.
+    flags:
+        ``re`` flags applied to every pattern (e.g. ``re.IGNORECASE``).
+    """
+
+    def __init__(self, categories: Mapping[str, Sequence[str]], flags: int = 0):
+        self.flags = flags
+        self._sources: Dict[str, Tuple[str, ...]] = {
+            name: tuple(patterns) for name, patterns in categories.items()
+        }
+        self._compiled: Dict[str, Tuple["re.Pattern[str]", ...]] = {
+            name: tuple(re.compile(p, flags) for p in patterns)
+            for name, patterns in self._sources.items()
+        }
+        # (pattern, required literals, literals are lowercase) per category
+        self._prefilters: Dict[str, Tuple[Tuple["re.Pattern[str]", Literals, bool], ...]] = {
+            name: tuple(
+                (compiled, _required_literals(compiled.pattern, flags), bool(compiled.flags & re.IGNORECASE))
+                for compiled in self._compiled[name]
+            )
+            for name in self._sources
+        }
+        digest = hashlib.sha1(repr((sorted(self._sources.items()), flags)).encode("utf-8"))
+        self.fingerprint = digest.hexdigest()[:16]
+
+    @property
+    def categories(self) -> List[str]:
+        return list(self._sources)
+
+    def patterns(self, category: str) -> Tuple[str, ...]:
+        return self._sources[category]
+
+    def _candidates(self, text: str, lower: Optional[str], category: str) -> Iterator["re.Pattern[str]"]:
+        """Patterns of ``category`` whose required literals occur in ``text``.
+
+        ``lower`` is ``text.lower()`` for ASCII text and ``None`` otherwise
+        (case folding outside ASCII can change lengths and letters, so
+        case-insensitive patterns are not prefiltered there).
+        """
+        for pattern, literals, folded in self._prefilters[category]:
+            haystack = lower if folded else text
+            if literals is None or haystack is None or any(lit in haystack for lit in literals):
+                yield pattern
+
+    def count(self, text: str, category: str) -> int:
+        """Total non-overlapping matches of every pattern in ``category``."""
+        return self._count(text, _lowered(text), category)
+
+    def _count(self, text: str, lower: Optional[str], category: str) -> int:
+        return sum(len(p.findall(text)) for p in self._candidates(text, lower, category))
+
+    def hits(self, text: str, category: str) -> int:
+        """Number of patterns in ``category`` that match ``text`` at least once."""
+        return sum(1 for p in self._candidates(text, _lowered(text), category) if p.search(text))
+
+    def any(self, text: str, category: str) -> bool:
+        """Whether any pattern in ``category`` matches ``text``."""
+        return any(p.search(text) for p in self._candidates(text, _lowered(text), category))
+
+    def counts(self, text: str, categories: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Per-category match totals for ``text`` (all categories by default)."""
+        names = self._sources if categories is None else categories
+        lower = _lowered(text)
+        return {name: self._count(text, lower, name) for name in names}
+
+
+@lru_cache(maxsize=64)
+def _compile_cached(items: Tuple[Tuple[str, Tuple[str, ...]], ...], flags: int) -> CompiledPatternSet:
+    return CompiledPatternSet(dict(items), flags)
+
+
+def compile_pattern_set(categories: Mapping[str, Sequence[str]], flags: int = 0) -> CompiledPatternSet:
+    """Return a shared :class:`CompiledPatternSet` for ``categories``.
+
+    Identical pattern tables (e.g. from several engine instances) reuse the
+    same compiled set.
+    """
+    items = tuple((name, tuple(patterns)) for name, patterns in categories.items())
+    return _compile_cached(items, flags)
@@ -14,6 +14,8 @@ import logging
 import re
 
 from .immutable_laws import ImmutableLaw, get_law_registry
+from .memo_cache import MemoCache, make_key
+from .history_buffer import HistoryBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -84,11 +86,12 @@ class RelevanceAssessmentEngine:
     
     def __init__(self):
         self.law_registry = get_law_registry()
-        self.assessment_history: List[ContextAssessment] = []
+        self.assessment_history = HistoryBuffer("assessment_history")
         self.authorization_history: List[FlexibilityAuthorization] = []
         
         # Context detection patterns
         self._initialize_context_patterns()
+        self.assessment_cache = MemoCache("relevance_assessment")
         
         logger.info("Relevance Assessment Engine initialized")
     
@@ -148,7 +151,29 @@ class RelevanceAssessmentEngine:
         ]
     
     def assess_context(self, input_text: str, user_context: Dict[str, Any] = None) -> ContextAssessment:
-        """Assess the context of user input for relevance and safety"""
+        """Assess the context of user input for relevance and safety
+        
+        Assessments are memoised by normalised text, ``user_context`` and the
+        law registry hash; a cached assessment must not be mutated.
+        """
+        key = make_key(input_text, user_context, self.law_registry.registry_hash)
+        assessment, hit = self.assessment_cache.get_or_compute(
+            key, lambda: self._compute_assessment(input_text, user_context)
+        )
+        
+        self.assessment_history.append(assessment)
+        if not hit:
+            logger.debug(f"Context assessed: {assessment.context_type.value}, "
+                         f"relevance: {assessment.relevance_level.value}")
+        
+        return assessment
+    
+    def invalidate_assessment_cache(self):
+        """Drop memoised assessments (after changing patterns or laws)"""
+        self.assessment_cache.clear()
+    
+    def _compute_assessment(self, input_text: str, user_context: Dict[str, Any]) -> ContextAssessment:
+        """Compute a context assessment from scratch"""
         
         # Detect context type
         context_type = self._detect_context_type(input_text)
@@ -181,9 +206,6 @@ class RelevanceAssessmentEngine:
             factors=factors
         )
         
-        self.assessment_history.append(assessment)
-        logger.debug(f"Context assessed: {context_type.value}, relevance: {relevance_level.value}")
-        
         return assessment
     
     def authorize_rule_flexibility(self, law_id: str, context_assessment: ContextAssessment) -> FlexibilityAuthorization:
@@ -20,6 +20,8 @@ from .living_neutrality import get_living_neutrality_engine, NeutralityExpressio
 from .context_supremacy import get_context_supremacy_engine, ContextAuthority
 from .genius_drift import get_genius_drift_engine, DriftType
 from .universal_compassion import get_universal_compassion_engine
+from .text_analysis import analyze_text
+from .history_buffer import HistoryBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -60,7 +62,7 @@ class RevolutionaryIntelligenceOrchestrator:
         self.context_supremacy = get_context_supremacy_engine()
         self.genius_drift = get_genius_drift_engine()
         
-        self.revolutionary_moments: List[RevolutionaryMoment] = []
+        self.revolutionary_moments = HistoryBuffer("revolutionary_moments")
         self.cognitive_revolutions: List[CognitiveRevolution] = []
         
         # Core principles that guide the revolution
@@ -82,28 +84,36 @@ class RevolutionaryIntelligenceOrchestrator:
                                                evidence: Dict[str, Any] = None) -> Dict[str, Any]:
         """Orchestrate a complete revolutionary intelligence response"""
         
-        # Phase 0: Universal Compassion Assessment (FOUNDATION)
-        logger.info("Phase 0: Assessing universal compassion requirements...")
-        compassion_assessment = self.universal_compassion.assess_universal_compassion_requirements(
-            user_context or {}, user_input
-        )
+        user_context = user_context or {}
+        
+        # Lowercasing, splitting and pattern scanning happen once, shared by every phase
+        analysis = analyze_text(user_input, [self.context_supremacy.signature_matcher])
         
-        # Phase 1: Context Supremacy Analysis
+        # Phase 0 + 1: Universal Compassion Assessment (FOUNDATION) and Context Supremacy
+        # Analysis are independent of each other, so they run concurrently
+        logger.info("Phase 0: Assessing universal compassion requirements...")
         logger.info("Phase 1: Analyzing context supremacy...")
-        context_profile = self.context_supremacy.analyze_context_supremacy(
-            user_input, user_context or {}
+        compassion_assessment, context_profile = await asyncio.gather(
+            asyncio.to_thread(
+                self.universal_compassion.assess_universal_compassion_requirements,
+                user_context, user_input, analysis
+            ),
+            asyncio.to_thread(
+                self.context_supremacy.analyze_context_supremacy,
+                user_input, user_context, analysis
+            )
         )
         
-        # Phase 2: Living Neutrality Orchestration
+        # Phase 2 + 3: Living Neutrality Orchestration and Genius Drift Assessment
+        # both only need the context profile
         logger.info("Phase 2: Orchestrating living neutrality...")
-        neutrality_commands = self._translate_context_to_neutrality(context_profile)
-        neutrality_assessment = self.living_neutrality.assess_context_supremacy(neutrality_commands)
-        tension_field = self.living_neutrality.orchestrate_living_tension(neutrality_assessment)
-        
-        # Phase 3: Genius Drift Assessment
         logger.info("Phase 3: Assessing genius drift potential...")
-        contradictions = self.genius_drift.detect_contradiction_tension(
-            user_input, evidence or {}, context_profile
+        tension_field, contradictions = await asyncio.gather(
+            asyncio.to_thread(self._orchestrate_living_neutrality, context_profile),
+            asyncio.to_thread(
+                self.genius_drift.detect_contradiction_tension,
+                user_input, evidence or {}, context_profile, analysis
+            )
         )
         
         breakthrough_moments = []
@@ -168,6 +178,12 @@ class RevolutionaryIntelligenceOrchestrator:
         
         return response
     
+    def _orchestrate_living_neutrality(self, context_profile):
+        """Translate context commands and orchestrate the resulting tension field"""
+        neutrality_commands = self._translate_context_to_neutrality(context_profile)
+        neutrality_assessment = self.living_neutrality.assess_context_supremacy(neutrality_commands)
+        return self.living_neutrality.orchestrate_living_tension(neutrality_assessment)
+    
     def _translate_context_to_neutrality(self, context_profile) -> Dict[str, Any]:
         """Translate context profile to neutrality commands"""
         
@@ -638,7 +654,7 @@ class RevolutionaryIntelligenceOrchestrator:
         """Get current status of the revolutionary intelligence system"""
         
         return {
-            'total_revolutionary_moments': len(self.revolutionary_moments),
+            'total_revolutionary_moments': self.revolutionary_moments.total_appended,
             'cognitive_revolutions': len(self.cognitive_revolutions),
             'revolutionary_principles': self.revolutionary_principles,
             'recent_moments': [
@@ -0,0 +1,328 @@
+"""
+Statistical Job Runner
+======================
+
+The ``/statistics/analyze/*`` endpoints fit ADF/KPSS tests, seasonal
+decompositions, ARIMA and OLS models.  Done inline these fits hold a request
+for seconds, are repeated for identical payloads, and refit ARIMA from scratch
+even when a monitored series only gained a few points.
+
+:class:`StatisticalJobRunner` moves the fits onto a process pool and keys every
+job by a fingerprint of its input series:
+
+* identical payloads are served from a TTL cache, and concurrent submissions
+  of the same payload share one pending job;
+* an entropy series that extends a previously analysed series reuses that
+  series' ARIMA parameters.  Small extensions are *appended* (the Kalman
+  filter is re-run with the old parameters, no optimisation); larger ones, or
+  every ``KIMERA_STATS_REFIT_EVERY`` appends, are refit with the optimiser
+  warm-started from the previous parameters.
+
+Endpoints submit a job and wait at most ``KIMERA_STATS_WAIT_SECONDS`` for it;
+unfinished jobs are returned as ``pending`` and polled by job id.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from .memo_cache import MemoCache
+from .statistical_modeling import analyze_entropy_time_series
+
+logger = logging.getLogger(__name__)
+
+STATS_WORKERS = int(os.getenv("KIMERA_STATS_WORKERS", str(min(4, os.cpu_count() or 1))))
+STATS_EXECUTOR = os.getenv("KIMERA_STATS_EXECUTOR", "process").lower()
+STATS_CACHE_SIZE = int(os.getenv("KIMERA_STATS_CACHE_SIZE", "256"))
+STATS_CACHE_TTL = float(os.getenv("KIMERA_STATS_CACHE_TTL", "3600"))
+STATS_APPEND_MAX_POINTS = int(os.getenv("KIMERA_STATS_APPEND_MAX_POINTS", "50"))
+STATS_REFIT_EVERY = int(os.getenv("KIMERA_STATS_REFIT_EVERY", "10"))
+STATS_WAIT_SECONDS = float(os.getenv("KIMERA_STATS_WAIT_SECONDS", "0"))
+
+# ARIMA lineages remembered for warm starts
+_MAX_ARIMA_STATES = 256
+
+
+def series_fingerprint(values: Sequence[float], *extra: Any) -> str:
+    """Digest of a numeric series plus any JSON-serialisable ``extra`` inputs."""
+    digest = hashlib.sha1(np.asarray(values, dtype=np.float64).tobytes())
+    if extra:
+        digest.update(json.dumps(extra, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()[:24]
+
+
+@dataclass
+class StatisticalJob:
+    """One submitted fit; ``result`` is set once ``status`` is ``completed``."""
+    job_id: str
+    kind: str
+    status: str = "pending"
+    cached: bool = False
+    result: Any = None
+    error: Optional[str] = None
+    submitted_at: float = field(default_factory=time.time)
+    completed_at: Optional[float] = None
+    warm_start: Optional[str] = None
+    _future: Optional[Future] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status != "pending"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "cached": self.cached,
+            "warm_start": self.warm_start,
+            "error": self.error,
+            "submitted_at": self.submitted_at,
+            "completed_at": self.completed_at,
+            "duration": (self.completed_at - self.submitted_at) if self.completed_at else None,
+        }
+
+
+@dataclass
+class _ArimaState:
+    n_obs: int
+    params: List[float]
+    appends: int = 0
+
+
+class StatisticalJobRunner:
+    """Runs statistical fits off the request path with fingerprint caching.
+
+    Parameters
+    ----------
+    max_workers:
+        Pool size (``KIMERA_STATS_WORKERS``).
+    executor:
+        ``"process"`` (default) or ``"thread"``; a thread pool is also used if
+        worker processes cannot be started.
+    """
+
+    def __init__(self, max_workers: int = STATS_WORKERS, executor: str = STATS_EXECUTOR,
+                 cache_size: int = STATS_CACHE_SIZE, cache_ttl: float = STATS_CACHE_TTL):
+        self.max_workers = max(1, max_workers)
+        self.executor_kind = executor
+        self.cache = MemoCache("statistical_jobs", maxsize=cache_size, ttl=cache_ttl)
+        self._executor: Optional[Executor] = None
+        self._jobs: "OrderedDict[str, StatisticalJob]" = OrderedDict()
+        self._max_jobs = max(cache_size, 64)
+        self._arima_states: "OrderedDict[str, _ArimaState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.warm_starts = 0
+        self.appends = 0
+
+    # ------------------------------------------------------------------
+    # Executor
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                try:
+                    # spawn: the API process holds threads (pools, torch) that fork would copy mid-state
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                except (OSError, NotImplementedError) as e:
+                    logger.warning(f"Process pool unavailable for statistical jobs, using threads: {e}")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="kimera-stats",
+                )
+        return self._executor
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def submit(self, kind: str, fingerprint: str, fn: Callable[..., Any], *args: Any,
+               on_result: Optional[Callable[[Any], None]] = None,
+               warm_start: Optional[str] = None) -> StatisticalJob:
+        """Return the cached, in-flight or newly submitted job for ``fingerprint``."""
+        job_id = f"{kind}-{fingerprint}"
+        with self._lock:
+            existing = self._jobs.get(job_id)
+            if existing is not None and existing.status == "pending":
+                return existing
+            cached = self.cache.get(job_id)
+            if cached is not None:
+                job = StatisticalJob(job_id, kind, status="completed", cached=True, result=cached,
+                                     completed_at=time.time())
+                self._remember(job)
+                return job
+            job = StatisticalJob(job_id, kind, warm_start=warm_start)
+            self._remember(job)
+            self.submitted += 1
+            if warm_start == "append":
+                self.appends += 1
+            elif warm_start == "warm_start":
+                self.warm_starts += 1
+            executor = self._get_executor()
+
+        try:
+            future = executor.submit(fn, *args)
+        except Exception as e:
+            self._finish(job, None, e, on_result, executor)
+            return job
+        job._future = future
+        future.add_done_callback(lambda f: self._finish(job, f, None, on_result, executor))
+        return job
+
+    def submit_entropy_series(self, entropy_data: List[float],
+                              timestamps: Optional[List[Any]] = None) -> StatisticalJob:
+        """Analyse an entropy series, reusing ARIMA state from a previously seen prefix."""
+        stamps = [str(t) for t in timestamps] if timestamps else []
+        fingerprint = series_fingerprint(entropy_data, stamps)
+        warm_start = self._find_warm_start(entropy_data, stamps)
+        mode = None
+        if warm_start is not None:
+            mode = "append" if warm_start["append"] else "warm_start"
+
+        def remember(result: Any) -> None:
+            params = (result.diagnostics or {}).get("arima_params")
+            if params:
+                appends = warm_start["appends"] + 1 if warm_start and warm_start["append"] else 0
+                self._store_arima_state(fingerprint, _ArimaState(len(entropy_data), params, appends))
+
+        return self.submit("entropy_series", fingerprint, analyze_entropy_time_series,
+                           entropy_data, timestamps, warm_start, on_result=remember, warm_start=mode)
+
+    def _finish(self, job: StatisticalJob, future: Optional[Future], error: Optional[BaseException],
+                on_result: Optional[Callable[[Any], None]], executor: Executor) -> None:
+        if future is not None:
+            if future.cancelled():
+                error = RuntimeError("cancelled")
+            else:
+                error = future.exception()
+        with self._lock:
+            if isinstance(error, BrokenExecutor) and self._executor is executor:
+                # A crashed worker poisons the pool; start a fresh one on the next submit
+                self._executor = None
+            job.completed_at = time.time()
+            if error is not None:
+                job.status = "failed"
+                job.error = str(error)
+                self.failed += 1
+            else:
+                job.result = future.result()
+                job.status = "completed"
+                self.completed += 1
+                self.cache.put(job.job_id, job.result)
+        if error is not None:
+            logger.error(f"Statistical job {job.job_id} failed: {error}")
+        elif on_result is not None:
+            try:
+                on_result(job.result)
+            except Exception as e:
+                logger.warning(f"Post-processing of statistical job {job.job_id} failed: {e}")
+
+    def _remember(self, job: StatisticalJob) -> None:
+        self._jobs[job.job_id] = job
+        self._jobs.move_to_end(job.job_id)
+        while len(self._jobs) > self._max_jobs:
+            self._jobs.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # ARIMA warm starts
+    # ------------------------------------------------------------------
+
+    def _find_warm_start(self, entropy_data: List[float], stamps: List[str]) -> Optional[Dict[str, Any]]:
+        n = len(entropy_data)
+        with self._lock:
+            lengths = sorted({s.n_obs for s in self._arima_states.values() if s.n_obs < n}, reverse=True)
+        for n_obs in lengths:
+            prefix = series_fingerprint(entropy_data[:n_obs], stamps[:n_obs])
+            with self._lock:
+                state = self._arima_states.get(prefix)
+            if state is None:
+                continue
+            append = n - n_obs <= STATS_APPEND_MAX_POINTS and state.appends < STATS_REFIT_EVERY
+            return {"params": state.params, "n_obs": n_obs, "append": append, "appends": state.appends}
+        return None
+
+    def _store_arima_state(self, fingerprint: str, state: _ArimaState) -> None:
+        with self._lock:
+            self._arima_states[fingerprint] = state
+            self._arima_states.move_to_end(fingerprint)
+            while len(self._arima_states) > _MAX_ARIMA_STATES:
+                self._arima_states.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def get_job(self, job_id: str) -> Optional[StatisticalJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    async def wait(self, job: StatisticalJob, timeout: float = STATS_WAIT_SECONDS) -> StatisticalJob:
+        """Wait up to ``timeout`` seconds for ``job`` without blocking the event loop."""
+        if job.done or timeout <= 0 or job._future is None:
+            return job
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(job._future)), timeout)
+        except Exception:
+            pass  # Timeouts leave the job pending; failures are recorded on the job
+        return job
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending = sum(1 for job in self._jobs.values() if job.status == "pending")
+            return {
+                "executor": type(self._executor).__name__ if self._executor else None,
+                "max_workers": self.max_workers,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "pending": pending,
+                "warm_starts": self.warm_starts,
+                "appends": self.appends,
+                "arima_states": len(self._arima_states),
+                "cache": self.cache.stats(),
+            }
+
+
+_runner: Optional[StatisticalJobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_statistical_job_runner() -> StatisticalJobRunner:
+    """Process-wide runner (created on first use)."""
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                _runner = StatisticalJobRunner()
+    return _runner
+
+
+def shutdown_statistical_jobs(wait: bool = False) -> None:
+    if _runner is not None:
+        _runner.shutdown(wait=wait)
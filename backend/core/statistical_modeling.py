@@ -17,7 +17,6 @@ Version: 1.0.0
 """
 
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -26,6 +25,7 @@ import warnings
 
 # Core Kimera imports
 from .native_math import NativeStats, NativeMath
+from .lazy_loading import lazy_import, module_available
 
 # Try to import EntropyCalculator, but don't fail if it's not available
 try:
@@ -38,21 +38,24 @@ except ImportError:
 # Suppress statsmodels warnings for cleaner output
 warnings.filterwarnings('ignore', category=FutureWarning, module='statsmodels')
 
-try:
-    import statsmodels.api as sm
-    import statsmodels.tsa.api as tsa
-    from statsmodels.tsa.arima.model import ARIMA
-    from statsmodels.tsa.vector_ar.var_model import VAR
-    from statsmodels.tsa.stattools import adfuller, kpss
-    from statsmodels.stats.diagnostic import acorr_ljungbox
-    from statsmodels.regression.linear_model import OLS
-    from statsmodels.stats.stattools import durbin_watson
-    from statsmodels.tsa.seasonal import seasonal_decompose
-    from statsmodels.tsa.holtwinters import ExponentialSmoothing
-    from statsmodels.stats.outliers_influence import OLSInfluence
-    STATSMODELS_AVAILABLE = True
-except ImportError:
-    STATSMODELS_AVAILABLE = False
+# statsmodels, scipy and pandas take over a second to import; they are loaded
+# on first use so importing this module stays cheap
+pd = lazy_import("pandas")
+STATSMODELS_AVAILABLE = module_available("statsmodels")
+if STATSMODELS_AVAILABLE:
+    sm = lazy_import("statsmodels.api")
+    tsa = lazy_import("statsmodels.tsa.api")
+    ARIMA = lazy_import("statsmodels.tsa.arima.model", "ARIMA")
+    VAR = lazy_import("statsmodels.tsa.vector_ar.var_model", "VAR")
+    adfuller = lazy_import("statsmodels.tsa.stattools", "adfuller")
+    kpss = lazy_import("statsmodels.tsa.stattools", "kpss")
+    acorr_ljungbox = lazy_import("statsmodels.stats.diagnostic", "acorr_ljungbox")
+    OLS = lazy_import("statsmodels.regression.linear_model", "OLS")
+    durbin_watson = lazy_import("statsmodels.stats.stattools", "durbin_watson")
+    seasonal_decompose = lazy_import("statsmodels.tsa.seasonal", "seasonal_decompose")
+    ExponentialSmoothing = lazy_import("statsmodels.tsa.holtwinters", "ExponentialSmoothing")
+    OLSInfluence = lazy_import("statsmodels.stats.outliers_influence", "OLSInfluence")
+else:
     logging.warning("Statsmodels not available. Statistical modeling features will be limited.")
 
 logger = logging.getLogger(__name__)
@@ -87,13 +90,20 @@ class SemanticTimeSeriesAnalyzer:
         self.results_cache = {}
         
     def analyze_entropy_series(self, entropy_data: List[float], 
-                             timestamps: Optional[List[datetime]] = None) -> StatisticalModelResult:
+                             timestamps: Optional[List[datetime]] = None,
+                             warm_start: Optional[Dict[str, Any]] = None) -> StatisticalModelResult:
         """
         Comprehensive time series analysis of entropy data.
         
         Args:
             entropy_data: List of entropy measurements
             timestamps: Optional timestamps for the data
+            warm_start: ARIMA state from an earlier analysis of a prefix of this
+                series (``{'params': [...], 'n_obs': int, 'append': bool}``).
+                With ``append`` the previous parameters are kept and only the
+                Kalman filter is re-run over the longer series (the state-space
+                equivalent of ``results.append(new, refit=False)``); otherwise
+                the optimiser starts from the previous parameters.
             
         Returns:
             StatisticalModelResult with comprehensive analysis
@@ -123,11 +133,22 @@ class SemanticTimeSeriesAnalyzer:
             # ARIMA modeling
             arima_model = None
             arima_forecast = None
+            arima_params = None
+            arima_update = None
             try:
                 # Auto-select ARIMA parameters
                 arima_model = ARIMA(ts, order=(1, 1, 1))
-                arima_fit = arima_model.fit()
+                if warm_start and warm_start.get('append'):
+                    arima_fit = arima_model.filter(np.asarray(warm_start['params']))
+                    arima_update = 'append'
+                elif warm_start:
+                    arima_fit = arima_model.fit(start_params=np.asarray(warm_start['params']))
+                    arima_update = 'warm_start'
+                else:
+                    arima_fit = arima_model.fit()
+                    arima_update = 'fit'
                 arima_forecast = arima_fit.forecast(steps=5)
+                arima_params = [float(p) for p in np.asarray(arima_fit.params)]
             except:
                 arima_model = None
                 arima_forecast = None
@@ -140,7 +161,7 @@ class SemanticTimeSeriesAnalyzer:
                 'adf_pvalue': float(adf_result[1]),
                 'kpss_statistic': float(kpss_result[0]),
                 'kpss_pvalue': float(kpss_result[1]),
-                'is_stationary': adf_result[1] < 0.05,
+                'is_stationary': bool(adf_result[1] < 0.05),
                 'trend_strength': float(abs(ts.diff().mean())) if len(ts) > 1 else 0.0
             }
             
@@ -148,8 +169,11 @@ class SemanticTimeSeriesAnalyzer:
                 'decomposition_available': decomposition is not None,
                 'arima_successful': arima_model is not None,
                 'data_points': len(ts),
-                'missing_values': ts.isna().sum()
+                'missing_values': int(ts.isna().sum())
             }
+            if arima_params is not None:
+                diagnostics['arima_params'] = arima_params
+                diagnostics['arima_update'] = arima_update
             
             if decomposition:
                 diagnostics['seasonal_strength'] = float(decomposition.seasonal.std())
@@ -533,9 +557,14 @@ def get_statistical_engine() -> StatisticalModelingEngine:
 
 # Convenience functions for common operations
 def analyze_entropy_time_series(entropy_data: List[float], 
-                               timestamps: Optional[List[datetime]] = None) -> StatisticalModelResult:
+                               timestamps: Optional[List[datetime]] = None,
+                               warm_start: Optional[Dict[str, Any]] = None) -> StatisticalModelResult:
     """Convenience function for entropy time series analysis"""
-    return statistical_engine.time_series_analyzer.analyze_entropy_series(entropy_data, timestamps)
+    return statistical_engine.time_series_analyzer.analyze_entropy_series(entropy_data, timestamps, warm_start)
+
+def run_comprehensive_analysis(system_data: Dict[str, Any]) -> Dict[str, StatisticalModelResult]:
+    """Convenience function for comprehensive analysis (picklable for worker processes)"""
+    return statistical_engine.comprehensive_analysis(system_data)
 
 def analyze_contradiction_factors(contradiction_scores: List[float],
                                 semantic_features: Dict[str, List[float]]) -> StatisticalModelResult:
@@ -0,0 +1,60 @@
+"""
+Text Analysis Artifact
+======================
+
+One immutable view of an input text, computed once per request and shared by
+every phase of the revolutionary intelligence pipeline instead of each phase
+re-lowercasing, re-splitting and re-scanning the same string.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional, Tuple
+
+from .pattern_matcher import CompiledPatternSet
+
+
+@dataclass(frozen=True)
+class TextAnalysis:
+    """Derived forms of one input text.
+
+    ``sentences`` keeps the original casing (for quoting back);
+    ``sentences_lower`` is the same split of the lowercased text.
+    Pattern counts are memoised per :class:`CompiledPatternSet` fingerprint.
+    """
+
+    text: str
+    lower: str
+    tokens: Tuple[str, ...]
+    sentences: Tuple[str, ...]
+    sentences_lower: Tuple[str, ...]
+    _pattern_hits: Dict[str, Dict[str, int]] = field(default_factory=dict, repr=False, compare=False)
+
+    def pattern_counts(self, matcher: CompiledPatternSet) -> Dict[str, int]:
+        """Per-category match counts of ``matcher`` over the lowercased text."""
+        counts = self._pattern_hits.get(matcher.fingerprint)
+        if counts is None:
+            counts = matcher.counts(self.lower)
+            self._pattern_hits[matcher.fingerprint] = counts
+        return counts
+
+    def contains_any(self, needles: Iterable[str]) -> bool:
+        """Whether any (lowercase) substring in ``needles`` occurs in the text."""
+        return any(needle in self.lower for needle in needles)
+
+
+def analyze_text(text: str, matchers: Optional[Iterable[CompiledPatternSet]] = None) -> TextAnalysis:
+    """Build a :class:`TextAnalysis` for ``text``, pre-scanning ``matchers``."""
+    text = text or ""
+    lower = text.lower()
+    analysis = TextAnalysis(
+        text=text,
+        lower=lower,
+        tokens=tuple(lower.split()),
+        sentences=tuple(text.split('.')),
+        sentences_lower=tuple(lower.split('.')),
+    )
+    for matcher in matchers or ():
+        analysis.pattern_counts(matcher)
+    return analysis
@@ -27,6 +27,8 @@ from enum import Enum
 from datetime import datetime
 import logging
 
+from .text_analysis import TextAnalysis
+
 logger = logging.getLogger(__name__)
 
 
@@ -212,14 +214,18 @@ class UniversalCompassionEngine:
         ]
     
     def assess_universal_compassion_requirements(self, context: Dict[str, Any], 
-                                               proposed_action: str) -> CompassionAssessment:
+                                               proposed_action: str,
+                                               analysis: Optional[TextAnalysis] = None) -> CompassionAssessment:
         """Assess what level of compassion and awareness is required"""
         
+        action_lower = analysis.lower if analysis is not None else proposed_action.lower()
+        combined_text = action_lower + " " + str(context).lower()
+        
         # Identify life forms that could be affected
-        life_forms_involved = self._identify_affected_life_forms(context, proposed_action)
+        life_forms_involved = self._identify_affected_life_forms(context, proposed_action, combined_text)
         
         # Identify potential harms
-        potential_harms = self._identify_potential_harms(context, proposed_action)
+        potential_harms = self._identify_potential_harms(context, proposed_action, combined_text)
         
         # Determine required consciousness level
         consciousness_level = self._determine_required_consciousness_level(
@@ -256,7 +262,8 @@ class UniversalCompassionEngine:
         return assessment
     
     def _identify_affected_life_forms(self, context: Dict[str, Any], 
-                                    proposed_action: str) -> List[LifeForm]:
+                                    proposed_action: str,
+                                    combined_text: Optional[str] = None) -> List[LifeForm]:
         """Identify what life forms could be affected by the proposed action"""
         
         affected = []
@@ -265,9 +272,8 @@ class UniversalCompassionEngine:
         affected.append(LifeForm.HUMAN)
         
         # Check for explicit mentions
-        action_lower = proposed_action.lower()
-        context_str = str(context).lower()
-        combined_text = action_lower + " " + context_str
+        if combined_text is None:
+            combined_text = proposed_action.lower() + " " + str(context).lower()
         
         # Animal life indicators
         animal_indicators = ['animal', 'pet', 'wildlife', 'creature', 'species']
@@ -300,14 +306,14 @@ class UniversalCompassionEngine:
         return list(set(affected))  # Remove duplicates
     
     def _identify_potential_harms(self, context: Dict[str, Any], 
-                                proposed_action: str) -> List[ViolenceType]:
+                                proposed_action: str,
+                                combined_text: Optional[str] = None) -> List[ViolenceType]:
         """Identify potential forms of violence or harm"""
         
         potential_harms = []
         
-        action_lower = proposed_action.lower()
-        context_str = str(context).lower()
-        combined_text = action_lower + " " + context_str
+        if combined_text is None:
+            combined_text = proposed_action.lower() + " " + str(context).lower()
         
         # Physical harm indicators
         physical_harm_indicators = ['hurt', 'harm', 'damage', 'destroy', 'kill', 'attack', 'violence']
@@ -1,47 +1,311 @@
+"""
+CLIP Image Embedding Service
+============================
+
+Image embeddings for ``/geoids/from_image``.  The service:
+
+* loads CLIP lazily (component ``clip_model``, see ``backend/core/lazy_loading.py``),
+  so deployments that never receive an image never pay for the model;
+* coalesces concurrent requests: callers submit images to a queue and a
+  single worker thread encodes them in batches of up to
+  ``KIMERA_CLIP_BATCH_SIZE``, waiting at most ``KIMERA_CLIP_BATCH_WAIT_MS``
+  for a batch to fill;
+* caches embeddings by content hash, and requests for an image that is
+  already being encoded wait on the same encoding (each with its own future,
+  so one caller cancelling never affects the others);
+* falls back to a deterministic lightweight encoder (a fixed random
+  projection of a 16x16 thumbnail) when CLIP is unavailable or
+  ``KIMERA_CLIP_BACKEND=fallback`` / ``LIGHTWEIGHT_CLIP=1``.
+
+Fallback vectors are only comparable with other fallback vectors, never with
+CLIP vectors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
 import os
-try:
-    if os.getenv("LIGHTWEIGHT_CLIP", "0") == "1":
-        raise ImportError
-    from transformers import CLIPProcessor, CLIPModel
-    import torch
-except Exception:  # pragma: no cover - allow tests without heavy deps
-    CLIPProcessor = None  # type: ignore
-    CLIPModel = None  # type: ignore
-    torch = None  # type: ignore
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+
 from PIL import Image
 import numpy as np
 
+from ..core.lazy_loading import components, module_available
+from ..core.memo_cache import MemoCache
+
+logger = logging.getLogger(__name__)
+
+CLIP_MODEL_NAME = os.getenv("KIMERA_CLIP_MODEL", "openai/clip-vit-base-patch32")
+# auto: CLIP when transformers is installed; clip: CLIP only; fallback: never load CLIP
+CLIP_BACKEND = "fallback" if os.getenv("LIGHTWEIGHT_CLIP", "0") == "1" else os.getenv("KIMERA_CLIP_BACKEND", "auto")
+CLIP_BATCH_SIZE = int(os.getenv("KIMERA_CLIP_BATCH_SIZE", "16"))
+CLIP_BATCH_WAIT_MS = float(os.getenv("KIMERA_CLIP_BATCH_WAIT_MS", "10"))
+CLIP_CACHE_SIZE = int(os.getenv("KIMERA_CLIP_CACHE_SIZE", "1024"))
+CLIP_CACHE_TTL = float(os.getenv("KIMERA_CLIP_CACHE_TTL", "3600"))
+
+EMBEDDING_DIM = 512
+FALLBACK_THUMBNAIL = 16
+_FALLBACK_SEED = 0x4B494D45
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
 
-class CLIPService:
-    """Wrapper around OpenAI's CLIP model with graceful fallbacks."""
 
-    def __init__(self, model_name: str = "openai/clip-vit-base-patch32") -> None:
-        self.device = "cuda" if torch is not None and torch.cuda.is_available() else "cpu"
-        if CLIPModel is not None and torch is not None:
-            self.model = CLIPModel.from_pretrained(model_name).to(self.device)
-            self.processor = CLIPProcessor.from_pretrained(model_name)
-        else:  # pragma: no cover - lightweight fallback for tests
-            self.model = None
-            self.processor = None
+def image_hash(image: Image.Image) -> str:
+    """Content hash of decoded pixels (for callers that no longer have the file bytes)."""
+    digest = hashlib.sha256(f"{image.mode}:{image.size}".encode())
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def as_image(image) -> Image.Image:
+    """Accept PIL images or HxWxC arrays (uint8, or floats in [0, 1])."""
+    if isinstance(image, Image.Image):
+        return image
+    array = np.asarray(image)
+    if array.dtype != np.uint8:
+        array = (np.clip(array, 0.0, 1.0) * 255).astype(np.uint8)
+    return Image.fromarray(array)
+
+
+_projection: Optional[np.ndarray] = None
+
+
+def fallback_image_embeddings(images: List[Image.Image]) -> np.ndarray:
+    """Deterministic unit vectors from a fixed random projection of a thumbnail.
+
+    Similar images map to nearby vectors; identical pixels always map to the
+    same vector, across processes and restarts.
+    """
+    global _projection
+    if _projection is None:
+        features = FALLBACK_THUMBNAIL * FALLBACK_THUMBNAIL * 3
+        rng = np.random.default_rng(_FALLBACK_SEED)
+        _projection = (rng.standard_normal((features, EMBEDDING_DIM)) / np.sqrt(features)).astype(np.float32)
+    size = (FALLBACK_THUMBNAIL, FALLBACK_THUMBNAIL)
+    vectors = np.empty((len(images), EMBEDDING_DIM), dtype=np.float32)
+    for row, image in enumerate(images):
+        # One image per product keeps results bit-identical whatever the batch size
+        pixels = np.asarray(image.convert("RGB").resize(size, Image.BILINEAR), dtype=np.float32).reshape(-1)
+        vector = (pixels / 255.0 - 0.5) @ _projection
+        norm = np.linalg.norm(vector)
+        vectors[row] = vector / norm if norm > 0 else vector
+    return vectors
+
+
+def _load_clip(model_name: str):
+    """Import transformers and load CLIP; ``None`` when unavailable or disabled."""
+    if CLIP_BACKEND == "fallback" or not module_available("transformers"):
+        if CLIP_BACKEND == "clip":
+            raise RuntimeError("KIMERA_CLIP_BACKEND=clip but transformers is not installed")
+        return None
+    from transformers import CLIPProcessor, CLIPModel
+    import torch
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    model = CLIPModel.from_pretrained(model_name).to(device)
+    model.eval()
+    processor = CLIPProcessor.from_pretrained(model_name)
+    return model, processor, device
 
-    def get_image_embedding(self, image: Image.Image) -> np.ndarray:
-        if self.model is None or self.processor is None or torch is None:
-            return np.zeros(512)
-        inputs = self.processor(images=image, return_tensors="pt").to(self.device)
+
+# Key, pixels, and the futures of every caller waiting on that key
+_Request = Tuple[str, Image.Image, List[Future]]
+
+
+def _resolve(future: Future, result=None, error: Optional[BaseException] = None) -> None:
+    """Settle ``future`` unless its caller cancelled it; never raises."""
+    try:
+        if not future.set_running_or_notify_cancel():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except Exception as e:
+        logger.warning(f"Could not deliver a CLIP embedding: {e}")
+
+
+class ImageEmbeddingService:
+    """Batched, cached CLIP image embeddings with a lightweight fallback."""
+
+    def __init__(self, model_name: str = CLIP_MODEL_NAME, batch_size: int = CLIP_BATCH_SIZE,
+                 max_wait_ms: float = CLIP_BATCH_WAIT_MS, cache: Optional[MemoCache] = None):
+        self.model_name = model_name
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.cache = cache if cache is not None else MemoCache("clip_image_embeddings", CLIP_CACHE_SIZE, CLIP_CACHE_TTL)
+        self._component = components.register("clip_model", lambda: _load_clip(model_name))
+        self._queue: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._inflight: Dict[str, List[Future]] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self.batches = 0
+        self.images_encoded = 0
+        self.coalesced = 0
+
+    # -- model ---------------------------------------------------------------
+
+    def _loaded(self):
+        return self._component.get()
+
+    @property
+    def backend(self) -> str:
+        return "clip" if self._loaded() is not None else "fallback"
+
+    def encode_images(self, images: List[Image.Image]) -> np.ndarray:
+        """Embed a batch of images now (no queueing, no cache): ``(n, 512)`` unit rows."""
+        loaded = self._loaded()
+        if loaded is None:
+            return fallback_image_embeddings(images)
+        import torch
+
+        model, processor, device = loaded
+        inputs = processor(images=[image.convert("RGB") for image in images], return_tensors="pt").to(device)
         with torch.no_grad():
-            image_features = self.model.get_image_features(**inputs)
-        image_features /= image_features.norm(dim=-1, keepdim=True)
-        return image_features.cpu().numpy()[0]
+            features = model.get_image_features(**inputs)
+        features = features / features.norm(dim=-1, keepdim=True)
+        return features.cpu().numpy()
 
     def get_text_embedding(self, text: str) -> np.ndarray:
-        if self.model is None or self.processor is None or torch is None:
-            return np.zeros(512)
-        inputs = self.processor(text=text, return_tensors="pt").to(self.device)
+        loaded = self._loaded()
+        if loaded is None:
+            return np.zeros(EMBEDDING_DIM)
+        import torch
+
+        model, processor, device = loaded
+        inputs = processor(text=text, return_tensors="pt").to(device)
         with torch.no_grad():
-            text_features = self.model.get_text_features(**inputs)
+            text_features = model.get_text_features(**inputs)
         text_features /= text_features.norm(dim=-1, keepdim=True)
         return text_features.cpu().numpy()[0]
 
+    # -- batching ------------------------------------------------------------
+
+    def submit(self, image: Image.Image, key: Optional[str] = None) -> Future:
+        """Queue ``image`` for embedding; the future resolves to a read-only vector.
+
+        ``key`` is the content hash (e.g. of the uploaded file bytes); it
+        defaults to a hash of the decoded pixels.
+        """
+        image = as_image(image)
+        key = key or image_hash(image)
+        future: Future = Future()
+        cached = self.cache.get(key)
+        if cached is not None:
+            future.set_result(cached)
+            return future
+        # PIL decodes lazily and is not thread-safe; hand the worker loaded pixels
+        image.load()
+        with self._lock:
+            waiters = self._inflight.get(key)
+            queued = waiters is None
+            if queued:
+                waiters = self._inflight[key] = []
+                self._ensure_worker()
+            else:
+                self.coalesced += 1
+            waiters.append(future)
+        future.add_done_callback(lambda done: self._discard(key, waiters, done))
+        if queued:
+            self._queue.put((key, image, waiters))
+        return future
+
+    def _discard(self, key: str, waiters: List[Future], future: Future) -> None:
+        """Forget a cancelled waiter; the last one leaving drops the in-flight entry."""
+        if not future.cancelled():
+            return
+        with self._lock:
+            if future in waiters:
+                waiters.remove(future)
+            if not waiters and self._inflight.get(key) is waiters:
+                del self._inflight[key]
+
+    def get_image_embedding(self, image: Image.Image, key: Optional[str] = None) -> np.ndarray:
+        """Blocking embedding of one image (batched with concurrent callers)."""
+        return self.submit(image, key).result()
+
+    async def embed_image(self, image: Image.Image, key: Optional[str] = None) -> np.ndarray:
+        return await asyncio.wrap_future(self.submit(image, key))
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="clip-batcher", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._process(batch)
+            if stop:
+                return
+
+    def _process(self, batch: List[_Request]) -> None:
+        try:
+            vectors = self.encode_images([image for _, image, _ in batch])
+        except Exception as e:
+            logger.error(f"CLIP batch of {len(batch)} images failed: {e}")
+            for key, _, waiters in batch:
+                for future in self._finish(key, waiters):
+                    _resolve(future, error=e)
+            return
+        self.batches += 1
+        self.images_encoded += len(batch)
+        for (key, _, waiters), vector in zip(batch, vectors):
+            vector = np.array(vector, dtype=np.float32)
+            vector.setflags(write=False)  # shared through the cache
+            self.cache.put(key, vector)
+            for future in self._finish(key, waiters):
+                _resolve(future, vector)
+
+    def _finish(self, key: str, waiters: List[Future]) -> List[Future]:
+        """Drop the in-flight entry for ``key`` and return its waiters."""
+        with self._lock:
+            if self._inflight.get(key) is waiters:
+                del self._inflight[key]
+            return list(waiters)
+
+    def close(self) -> None:
+        """Stop the batch worker after it drains the queue."""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None and worker.is_alive():
+            self._queue.put(None)
+            worker.join()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "backend": self.backend if self._component.loaded else "not_loaded",
+            "batches": self.batches,
+            "images_encoded": self.images_encoded,
+            "avg_batch_size": self.images_encoded / self.batches if self.batches else 0.0,
+            "coalesced": self.coalesced,
+            "cache": self.cache.stats(),
+        }
+
 
-clip_service = CLIPService()
+# Kept for callers that still import the old name
+CLIPService = ImageEmbeddingService
 
+clip_service = ImageEmbeddingService()
@@ -414,6 +414,19 @@ class CognitiveFieldDynamics:
         self.index_to_geoid[idx] = geoid_id
         self.next_index += 1
     
+    def memory_footprint(self) -> Dict[str, int]:
+        """Approximate bytes held by the field tensors and the legacy field maps."""
+        from ..monitoring.memory_accounting import estimate_size
+
+        tensors = (self.field_embeddings, self.field_strengths, self.resonance_frequencies,
+                   self.phases, self.decay_rates)
+        return {
+            "field_tensors": sum(t.numel() * t.element_size() for t in tensors),
+            "fields": estimate_size(self.fields),
+            "waves": estimate_size(self.waves),
+            "index_maps": estimate_size(self.geoid_to_index) + estimate_size(self.index_to_geoid),
+        }
+
     def get_performance_stats(self) -> Dict:
         """Get current performance statistics."""
         gpu_memory = 0
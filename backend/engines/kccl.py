@@ -6,6 +6,7 @@ import uuid
 
 from ..core.scar import ScarRecord
 from ..core.embedding_utils import encode_text
+from ..monitoring.tracing import span
 
 
 @dataclass
@@ -13,8 +14,17 @@ class KimeraCognitiveCycle:
     """Minimal cognitive loop used for the test suite."""
 
     def run_cycle(self, system: dict) -> str:
-        """Execute one cognitive cycle over the provided system."""
-        
+        """Execute one cognitive cycle over the provided system.
+
+        Each phase, and every embedding and vault call, runs inside a tracing
+        span; the finished trace is available at ``/telemetry/traces``.
+        """
+        with span("cognitive_cycle", active_geoids=len(system.get("active_geoids", {}))) as cycle_span:
+            status = self._run_cycle(system)
+            cycle_span.set("status", status)
+            return status
+
+    def _run_cycle(self, system: dict) -> str:
         try:
             spde = system["spde_engine"]
             contradiction_engine = system["contradiction_engine"]
@@ -44,25 +54,26 @@ class KimeraCognitiveCycle:
 
             # --- Semantic Pressure Diffusion ---
             try:
-                entropy_before = sum(
-                    g.calculate_entropy() for g in geoids_to_process
-                )
+                with span("spde_diffusion", geoids=len(geoids_to_process)):
+                    entropy_before = sum(
+                        g.calculate_entropy() for g in geoids_to_process
+                    )
                 
-                for geoid in geoids_to_process:
-                    try:
-                        geoid.semantic_state = spde.diffuse(geoid.semantic_state)
-                    except Exception as e:
-                        cycle_stats["errors_encountered"] += 1
-                        # Continue processing other geoids
-                        continue
+                    for geoid in geoids_to_process:
+                        try:
+                            geoid.semantic_state = spde.diffuse(geoid.semantic_state)
+                        except Exception as e:
+                            cycle_stats["errors_encountered"] += 1
+                            # Continue processing other geoids
+                            continue
                         
-                entropy_after = sum(
-                    g.calculate_entropy() for g in geoids_to_process
-                )
+                    entropy_after = sum(
+                        g.calculate_entropy() for g in geoids_to_process
+                    )
                 
-                cycle_stats["entropy_before_diffusion"] = entropy_before
-                cycle_stats["entropy_after_diffusion"] = entropy_after
-                cycle_stats["entropy_delta"] = entropy_after - entropy_before
+                    cycle_stats["entropy_before_diffusion"] = entropy_before
+                    cycle_stats["entropy_after_diffusion"] = entropy_after
+                    cycle_stats["entropy_delta"] = entropy_after - entropy_before
                 
             except Exception as e:
                 import logging
@@ -71,36 +82,41 @@ class KimeraCognitiveCycle:
 
             # --- Contradiction Detection ---
             try:
-                tensions = contradiction_engine.detect_tension_gradients(geoids_to_process)
+                with span("contradiction_detection", geoids=len(geoids_to_process)) as detection_span:
+                    tensions = contradiction_engine.detect_tension_gradients(geoids_to_process)
+                    detection_span.set("tensions", len(tensions))
                 cycle_stats["contradictions_detected"] = len(tensions)
                 
                 # Limit tension processing to prevent overload
                 tensions_to_process = tensions[:20]  # Process max 20 tensions per cycle
                 
-                for tension in tensions_to_process:
-                    try:
-                        summary = f"Tension {tension.geoid_a}-{tension.geoid_b}"
-                        vector = encode_text(summary)
-                        scar = ScarRecord(
-                            scar_id=f"SCAR_{uuid.uuid4().hex[:8]}",
-                            geoids=[tension.geoid_a, tension.geoid_b],
-                            reason="auto-cycle",
-                            timestamp=datetime.now(timezone.utc).isoformat(),
-                            resolved_by="KimeraCognitiveCycle",
-                            pre_entropy=0.0,
-                            post_entropy=0.0,
-                            delta_entropy=0.0,
-                            cls_angle=tension.tension_score * 180,
-                            semantic_polarity=0.0,
-                            mutation_frequency=tension.tension_score,
-                        )
-                        vault_manager.insert_scar(scar, vector)
-                        cycle_stats["scars_created"] += 1
-                    except Exception as e:
-                        import logging
-                        logging.warning(f"Failed to process tension {tension.geoid_a}-{tension.geoid_b}: {e}")
-                        cycle_stats["errors_encountered"] += 1
-                        continue
+                with span("scar_creation", tensions=len(tensions_to_process)):
+                    for tension in tensions_to_process:
+                        try:
+                            summary = f"Tension {tension.geoid_a}-{tension.geoid_b}"
+                            with span("embedding.encode_text"):
+                                vector = encode_text(summary)
+                            scar = ScarRecord(
+                                scar_id=f"SCAR_{uuid.uuid4().hex[:8]}",
+                                geoids=[tension.geoid_a, tension.geoid_b],
+                                reason="auto-cycle",
+                                timestamp=datetime.now(timezone.utc).isoformat(),
+                                resolved_by="KimeraCognitiveCycle",
+                                pre_entropy=0.0,
+                                post_entropy=0.0,
+                                delta_entropy=0.0,
+                                cls_angle=tension.tension_score * 180,
+                                semantic_polarity=0.0,
+                                mutation_frequency=tension.tension_score,
+                            )
+                            with span("vault.insert_scar"):
+                                vault_manager.insert_scar(scar, vector)
+                            cycle_stats["scars_created"] += 1
+                        except Exception as e:
+                            import logging
+                            logging.warning(f"Failed to process tension {tension.geoid_a}-{tension.geoid_b}: {e}")
+                            cycle_stats["errors_encountered"] += 1
+                            continue
                         
             except Exception as e:
                 import logging
@@ -119,7 +135,8 @@ class KimeraCognitiveCycle:
 
                 META_INTERVAL = 5  # trigger every N cycles
                 if meta_engine and state["cycle_count"] % META_INTERVAL == 0:
-                    meta_insights = meta_engine.scan_recent_insights(recent_insights)
+                    with span("meta_insight", recent_insights=len(recent_insights)):
+                        meta_insights = meta_engine.scan_recent_insights(recent_insights)
                     if meta_insights:
                         # Append generated meta-insights to recent insights list
                         recent_insights.extend(meta_insights)
@@ -13,6 +13,7 @@ import numpy as np
 from sqlalchemy.orm import Session
 
 from ..vault.database import SessionLocal, GeoidDB, ScarDB
+from ..vault.statistics import count_rows
 from ..core.geoid import GeoidState
 from ..core.native_math import NativeMath
 from .contradiction_engine import ContradictionEngine, TensionGradient
@@ -306,8 +307,9 @@ class ProactiveContradictionDetector:
     def get_scan_statistics(self) -> Dict[str, any]:
         """Get statistics about proactive scanning"""
         with SessionLocal() as db:
-            total_geoids = db.query(GeoidDB).count()
-            total_scars = db.query(ScarDB).count()
+            counts = count_rows(db, (GeoidDB, ScarDB))
+            total_geoids = counts[GeoidDB.__tablename__]
+            total_scars = counts[ScarDB.__tablename__]
             
             # Calculate utilization rate
             referenced_geoids = set()
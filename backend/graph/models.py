@@ -16,9 +16,10 @@ additional entities can be added incrementally.
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-from neo4j import Transaction
+if TYPE_CHECKING:
+    from neo4j import Transaction
 
 from .session import get_session
 
@@ -19,9 +19,10 @@ from __future__ import annotations
 import os
 import threading
 from contextlib import contextmanager
-from typing import Generator
+from typing import TYPE_CHECKING, Generator
 
-from neo4j import GraphDatabase, Driver, Session
+if TYPE_CHECKING:  # the neo4j driver (and the pandas it pulls in) loads on first use
+    from neo4j import Driver, Session
 
 __all__ = ["get_driver", "get_session", "driver_liveness_check"]
 
@@ -35,6 +36,8 @@ _lock = threading.Lock()
 
 def _create_driver() -> Driver:
     """Instantiate a Neo4j :class:`neo4j.Driver` from env vars."""
+    from neo4j import GraphDatabase
+
     uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
     user = os.getenv("NEO4J_USER", "neo4j")
     pwd = os.getenv("NEO4J_PASS", "neo4j")
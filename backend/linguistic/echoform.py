@@ -7,98 +7,119 @@ addition to plain tokens separated by whitespace, the parser understands
 quoted tokens using single or double quotes and will convert numeric atoms to
 ``int`` or ``float`` values.  No advanced escaping is implemented; the goal is
 to keep this lightweight for unit testing.
+
+Tokenizing is a single pass of one compiled scanner regex and parsing uses an
+explicit stack, so cost is linear in the input and nesting depth is not bound
+by Python's recursion limit.  Parsed forms are memoised by a hash of the
+source (``KIMERA_ECHOFORM_CACHE_SIZE`` entries, LRU), so geoids carrying the
+same payload are parsed once; each caller receives its own copy of the lists,
+so mutating a result never alters the cache.
 """
 
 from __future__ import annotations
 
+import hashlib
+import os
 import re
 from typing import Any, List, Tuple
 
-# Tokenizer supporting quoted strings and the quote operator. Quotes themselves
-# are preserved so the parser can strip them after tokenisation. The single
-# quote character is treated as a separate token so `'expr` can be expanded to
-# ``['quote', expr]`` during parsing.
-_TOKEN_RE = re.compile(r"\(|\)|[^\s()]+")
-
-
-def _tokenize(text: str) -> List[str]:
-    """Tokenize the input EchoForm text."""
-    tokens: List[str] = []
-    i = 0
-    while i < len(text):
-        c = text[i]
-        if c.isspace():
-            i += 1
-            continue
-        if c in "()":
-            tokens.append(c)
-            i += 1
-            continue
-        if c == "'":
-            tokens.append("'")
-            i += 1
-            continue
-        if c == '"':
-            j = i + 1
-            buf = []
-            while j < len(text):
-                if text[j] == '"' and text[j - 1] != "\\":
-                    break
-                buf.append(text[j])
-                j += 1
-            else:
-                raise ValueError("Unterminated string literal")
-            tokens.append('"' + ''.join(buf) + '"')
-            i = j + 1
-            continue
+from ..core.memo_cache import MemoCache
+
+ECHOFORM_CACHE_SIZE = int(os.getenv("KIMERA_ECHOFORM_CACHE_SIZE", "4096"))
+
+# One compiled scanner; each match fills exactly one group:
+#   1. a parenthesis or the quote operator (the single quote is always its own
+#      token so `'expr` can be expanded to ``['quote', expr]`` during parsing)
+#   2. a double-quoted string, running to the first quote not preceded by a
+#      backslash (backslashes are kept verbatim)
+#   3. an opening double quote with no closing one
+#   4. a bare atom
+_SCANNER = re.compile(r"""\s*(?:([()'])|("[^"]*(?:(?<=\\)"[^"]*)*(?<!\\)")|(")|([^\s()'][^\s()']*))""")
+
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?\d*\.\d+")
+_NUMERIC_START = frozenset("-.0123456789")
+
+_cache = MemoCache("echoform_ast", maxsize=ECHOFORM_CACHE_SIZE, ttl=float("inf"))
+
+Token = Tuple[str, str, str, str]
+
 
-        j = i
-        while j < len(text) and not text[j].isspace() and text[j] not in "()'":
-            j += 1
-        tokens.append(text[i:j])
-        i = j
+def _tokenize(text: str) -> List[Token]:
+    """Scan ``text`` into ``(punct, string, unterminated, atom)`` tuples."""
+    tokens = _SCANNER.findall(text)
+    if '"' in text and any(unterminated for _, _, unterminated, _ in tokens):
+        raise ValueError("Unterminated string literal")
     return tokens
 
 
 def _atom(tok: str) -> Any:
-    """Convert a token to an atomic Python value."""
-    if (tok.startswith('"') and tok.endswith('"')) or (
-        tok.startswith("'") and tok.endswith("'")
-    ):
-        return tok[1:-1]
-    if re.fullmatch(r"-?\d+", tok):
-        return int(tok)
-    if re.fullmatch(r"-?\d*\.\d+", tok):
-        return float(tok)
+    """Convert a bare token to an atomic Python value."""
+    if tok[0] in _NUMERIC_START:
+        if _INT_RE.fullmatch(tok):
+            return int(tok)
+        if _FLOAT_RE.fullmatch(tok):
+            return float(tok)
     return tok
 
 
-def _parse_item(tokens: List[str], pos: int) -> Tuple[Any, int]:
-    """Parse a single item starting at ``pos`` and return it with next index."""
-    if pos >= len(tokens):
+def _parse(tokens: List[Token]) -> List[Any]:
+    """Build the nested list with an explicit stack of open lists.
+
+    ``quotes`` counts pending quote operators per open list; they wrap the
+    next complete item (atom or closed list) at that nesting level.
+    """
+    stack: List[List[Any]] = [[]]
+    quotes: List[int] = [0]
+    for punct, string, _, atom in tokens:
+        if atom:
+            value = _atom(atom)
+        elif string:
+            value = string[1:-1]
+        elif punct == "(":
+            stack.append([])
+            quotes.append(0)
+            continue
+        elif punct == "'":
+            quotes[-1] += 1
+            continue
+        else:  # ")"
+            if quotes[-1]:
+                raise ValueError("Unexpected ')' in EchoForm")
+            if len(stack) == 1:
+                raise ValueError("Unbalanced parentheses in EchoForm")
+            value = stack.pop()
+            quotes.pop()
+        if quotes[-1]:
+            for _ in range(quotes[-1]):
+                value = ["quote", value]
+            quotes[-1] = 0
+        stack[-1].append(value)
+
+    if quotes[-1]:
         raise ValueError("Unexpected end of input")
+    if len(stack) > 1:
+        raise ValueError("Unbalanced parentheses in EchoForm")
+    return stack[0]
 
-    tok = tokens[pos]
-    if tok == "(":
-        lst, pos = _parse_tokens(tokens, pos + 1)
-        return lst, pos
-    if tok == "'":
-        item, pos = _parse_item(tokens, pos + 1)
-        return ["quote", item], pos
-    if tok == ")":
-        raise ValueError("Unexpected ')' in EchoForm")
-    return _atom(tok), pos + 1
-
-
-def _parse_tokens(tokens: List[str], pos: int = 0) -> Tuple[List[Any], int]:
-    """Recursive descent parser returning a nested list and next position."""
-    result: List[Any] = []
-    while pos < len(tokens):
-        if tokens[pos] == ")":
-            return result, pos + 1
-        item, pos = _parse_item(tokens, pos)
-        result.append(item)
-    return result, pos
+
+def _source_key(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _copy_form(form: List[Any]) -> List[Any]:
+    """Copy the nested lists of ``form`` (atoms are immutable) without recursion."""
+    root: List[Any] = []
+    pending = [(form, root)]
+    while pending:
+        source, target = pending.pop()
+        for item in source:
+            if isinstance(item, list):
+                copy: List[Any] = []
+                pending.append((item, copy))
+                item = copy
+            target.append(item)
+    return root
 
 
 def parse_echoform(text: str) -> List:
@@ -112,11 +133,8 @@ def parse_echoform(text: str) -> List:
     Returns
     -------
     list
-        Nested list representation of the form.
+        Nested list representation of the form.  Each call returns a fresh
+        copy of the cached form, so callers may mutate or store it.
     """
-    tokens = _tokenize(text)
-    ast, pos = _parse_tokens(tokens)
-    if pos != len(tokens):
-        raise ValueError("Unbalanced parentheses in EchoForm")
-    return ast
-
+    ast, _ = _cache.get_or_compute(_source_key(text), lambda: _parse(_tokenize(text)))
+    return _copy_form(ast)
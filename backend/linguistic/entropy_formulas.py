@@ -7,9 +7,186 @@ and complexity measures.
 """
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import List, Union, Dict
 import math
 
+try:
+    from scipy.spatial import cKDTree
+except Exception:  # pragma: no cover - scipy is optional for these kernels
+    cKDTree = None  # type: ignore
+
+# Template sets at least this large use a range-counting index instead of
+# comparing every pair
+KDTREE_MIN_TEMPLATES = 2048
+# Sparse sets (fewer expected matches per template than this) are counted with
+# a KD-tree; dense ones, such as random walks, with the rank range tree
+RANGE_TREE_MIN_MATCHES = 64
+# Templates sampled to estimate the mean number of matches
+_DENSITY_SAMPLE = 64
+# Upper bound on the elements of one broadcast block (rows x templates)
+_BLOCK_ELEMENTS = 4_000_000
+# Range tree blocks smaller than 2**_TAIL_BITS templates are checked directly
+_TAIL_BITS = 5
+
+
+def _templates(data_array: np.ndarray, m: int) -> np.ndarray:
+    """All length-``m`` windows of ``data_array`` as rows (a strided view, no copy)."""
+    return sliding_window_view(data_array, m)
+
+
+def _chebyshev_match_counts(templates: np.ndarray, r: float) -> np.ndarray:
+    """
+    For every template, count the templates (itself included) whose Chebyshev
+    distance is ``<= r``.
+
+    Large sets are range-counted: a small sample estimates how many matches a
+    template has, dense sets go to :func:`_range_tree_match_counts` and sparse
+    ones to a KD-tree under the max-norm.  Small sets, non-finite data or
+    tolerances fall back to comparing blocks of rows against all templates with
+    NumPy broadcasting, so memory stays bounded.  Every path gives the same
+    exact counts.
+    """
+    n_templates = len(templates)
+    if n_templates >= KDTREE_MIN_TEMPLATES and np.isfinite(r) and r >= 0 and np.isfinite(templates).all():
+        sample = templates[::max(1, n_templates // _DENSITY_SAMPLE)]
+        if cKDTree is None or _blocked_match_counts(sample, templates, r).mean() >= RANGE_TREE_MIN_MATCHES:
+            return _range_tree_match_counts(templates, r)
+        tree = cKDTree(templates)
+        return np.asarray(tree.query_ball_point(templates, r, p=np.inf, return_length=True), dtype=float)
+    return _blocked_match_counts(templates, templates, r)
+
+
+def _blocked_match_counts(queries: np.ndarray, templates: np.ndarray, r: float) -> np.ndarray:
+    """Match counts of ``queries`` among ``templates`` by blocked broadcasting."""
+    counts = np.empty(len(queries))
+    block = max(1, _BLOCK_ELEMENTS // max(len(templates), 1))
+    for start in range(0, len(queries), block):
+        rows = queries[start:start + block]
+        # max_k |a_k - b_k| <= r  <=>  every |a_k - b_k| <= r
+        within = np.abs(rows[:, None, 0] - templates[None, :, 0]) <= r
+        for k in range(1, templates.shape[1]):
+            within &= np.abs(rows[:, None, k] - templates[None, :, k]) <= r
+        counts[start:start + block] = within.sum(axis=1)
+    return counts
+
+
+def _range_tree_match_counts(templates: np.ndarray, r: float) -> np.ndarray:
+    """
+    Exact Chebyshev match counts with a multi-level range tree over ranks.
+
+    Coordinates are replaced by their rank among the distinct values, and each
+    value's tolerance window ``|v - w| <= r`` becomes a half-open rank
+    interval, so the query of a template is an integer box and rounding can
+    never differ from the direct comparison.  Boxes are counted in
+    ``O(n log^m n)`` by :func:`_count_in_boxes`.
+    """
+    values = np.unique(templates)
+    ranks = np.searchsorted(values, templates)
+    lower, upper = _tolerance_windows(values, r)
+    n_templates = len(templates)
+    counts = np.zeros(n_templates)
+    group = np.zeros(n_templates, dtype=np.int64)
+    _count_in_boxes(group, ranks, np.arange(n_templates), group, np.ones(n_templates),
+                    lower[ranks], upper[ranks], counts, len(values) + 1)
+    return counts
+
+
+def _tolerance_windows(values: np.ndarray, r: float):
+    """For sorted distinct ``values``, the index range ``[lower, upper)`` within ``r`` of each."""
+    last = len(values) - 1
+    lower = np.searchsorted(values, values - r, side='left')
+    upper = np.searchsorted(values, values + r, side='right')
+    # values -/+ r is rounded; settle each bound against the exact test
+    while True:
+        widen = (lower > 0) & (np.abs(values - values[np.maximum(lower - 1, 0)]) <= r)
+        shrink = np.abs(values - values[np.minimum(lower, last)]) > r
+        if not (widen.any() or shrink.any()):
+            break
+        lower = lower - widen + shrink
+    while True:
+        widen = (upper <= last) & (np.abs(values - values[np.minimum(upper, last)]) <= r)
+        shrink = np.abs(values - values[np.maximum(upper - 1, 0)]) > r
+        if not (widen.any() or shrink.any()):
+            break
+        upper = upper + widen - shrink
+    return lower, upper
+
+
+def _sorted_searchsorted(keys: np.ndarray, queries: np.ndarray) -> np.ndarray:
+    """``np.searchsorted(keys, queries)``, faster for large unsorted ``queries``."""
+    order = np.argsort(queries)
+    found = np.empty(len(queries), dtype=np.int64)
+    found[order] = np.searchsorted(keys, queries[order])
+    return found
+
+
+def _count_in_boxes(point_group, points, query_index, query_group, query_sign,
+                    lower, upper, counts, base):
+    """
+    Add ``query_sign`` times the number of points inside each query box to
+    ``counts[query_index]``.
+
+    Points and queries are split into groups (a query only sees the points of
+    its own group); a box is ``lower <= point < upper`` on every column.  The
+    first column is resolved by sorting each group and cutting the query's
+    range into power-of-two blocks, differences of prefix blocks, each of
+    which becomes a group for the remaining columns.
+    """
+    if points.shape[1] == 1:
+        keys = np.sort(point_group * base + points[:, 0])
+        offset = query_group * base
+        found = _sorted_searchsorted(keys, offset + upper[:, 0]) - _sorted_searchsorted(keys, offset + lower[:, 0])
+        counts += np.bincount(query_index, query_sign * found, minlength=len(counts))
+        return
+
+    keys = point_group * base + points[:, 0]
+    order = np.argsort(keys, kind='stable')
+    keys, point_group, rest = keys[order], point_group[order], points[order, 1:]
+    starts = np.searchsorted(point_group, point_group)
+    local = np.arange(len(keys)) - starts
+    query_start = np.searchsorted(point_group, query_group)
+    # The box covers positions [begin, end) of its group along the first column
+    begin = _sorted_searchsorted(keys, query_group * base + lower[:, 0]) - query_start
+    end = _sorted_searchsorted(keys, query_group * base + upper[:, 0]) - query_start
+    lower, upper = lower[:, 1:], upper[:, 1:]
+
+    # Count = prefix(end) - prefix(begin); the last (prefix & tail) points of
+    # a prefix are tested directly
+    tail = (1 << _TAIL_BITS) - 1
+    for bound, sign in ((end, 1), (begin, -1)):
+        length = bound & tail
+        total = int(length.sum())
+        if not total:
+            continue
+        rows = np.repeat(np.arange(len(bound)), length)
+        step = np.arange(total) - np.repeat(np.cumsum(length) - length, length)
+        position = query_start[rows] + (bound[rows] & ~tail) + step
+        inside = ((rest[position] >= lower[rows]) & (rest[position] < upper[rows])).all(axis=1)
+        counts += np.bincount(query_index[rows], inside * (sign * query_sign[rows]), minlength=len(counts))
+
+    # The rest of each prefix is a run of aligned blocks, one per set bit;
+    # blocks shared by both prefixes cancel and are skipped
+    differs = begin ^ end
+    top = int(differs.max()).bit_length() if len(differs) else 0
+    for level in range(_TAIL_BITS, top):
+        live = (differs >> level) != 0
+        block_group = starts + (local >> level)
+        parts = [(live & (((bound >> level) & 1) == 1), sign, bound) for bound, sign in ((end, 1), (begin, -1))]
+        selected = np.concatenate([np.flatnonzero(hit) for hit, _, _ in parts])
+        if not len(selected):
+            continue
+        block = np.concatenate([query_start[hit] + (bound[hit] >> level) - 1 for hit, _, bound in parts])
+        signs = np.concatenate([query_sign[hit] * sign for hit, sign, _ in parts])
+        _count_in_boxes(block_group, rest, query_index[selected], block, signs,
+                        lower[selected], upper[selected], counts, base)
+
+
+def _count_matching_pairs(templates: np.ndarray, r: float) -> int:
+    """Number of unordered pairs ``i < j`` of templates within Chebyshev distance ``r``."""
+    counts = _chebyshev_match_counts(templates, r)
+    return int(round((counts.sum() - len(templates)) / 2))
+
 
 def calculate_predictability_index(data: List[Union[float, int]], m: int, r: float) -> float:
     """
@@ -35,26 +212,10 @@ def calculate_predictability_index(data: List[Union[float, int]], m: int, r: flo
     # Convert to numpy array for easier manipulation
     data_array = np.array(data)
     
-    # Count pattern matches at length m
-    matches_m = 0
-    matches_m_plus_1 = 0
-    
-    for i in range(n - m):
-        template_m = data_array[i:i + m]
-        template_m_plus_1 = data_array[i:i + m + 1] if i + m + 1 <= n else None
-        
-        for j in range(i + 1, n - m):
-            candidate_m = data_array[j:j + m]
-            
-            # Check if patterns match within tolerance
-            if _patterns_match(template_m, candidate_m, r):
-                matches_m += 1
-                
-                # Check m+1 length pattern if possible
-                if template_m_plus_1 is not None and j + m + 1 <= n:
-                    candidate_m_plus_1 = data_array[j:j + m + 1]
-                    if _patterns_match(template_m_plus_1, candidate_m_plus_1, r):
-                        matches_m_plus_1 += 1
+    # Count pattern matches at length m (and m+1) among templates starting
+    # before n - m; a pair can only match at m+1 if it matches at m
+    matches_m = _count_matching_pairs(_templates(data_array, m)[:n - m], r)
+    matches_m_plus_1 = _count_matching_pairs(_templates(data_array, m + 1), r)
     
     # Calculate predictability index
     if matches_m == 0:
@@ -70,27 +231,6 @@ def calculate_predictability_index(data: List[Union[float, int]], m: int, r: flo
     return predictability_ratio
 
 
-def _patterns_match(pattern1: np.ndarray, pattern2: np.ndarray, tolerance: float) -> bool:
-    """
-    Check if two patterns match within a given tolerance.
-    
-    Args:
-        pattern1: First pattern
-        pattern2: Second pattern
-        tolerance: Maximum allowed difference
-        
-    Returns:
-        True if patterns match within tolerance
-    """
-    if len(pattern1) != len(pattern2):
-        return False
-    
-    # Calculate maximum absolute difference
-    max_diff = np.max(np.abs(pattern1 - pattern2))
-    
-    return max_diff <= tolerance
-
-
 def calculate_sample_entropy(data: List[Union[float, int]], m: int = 2, r: float = None) -> float:
     """
     Calculate sample entropy of a time series.
@@ -114,27 +254,18 @@ def calculate_sample_entropy(data: List[Union[float, int]], m: int = 2, r: float
     if r is None:
         r = 0.2 * np.std(data_array)
     
-    n = len(data_array)
-    
-    def _maxdist(xi, xj, m):
-        """Calculate maximum distance between two patterns"""
-        return max([abs(ua - va) for ua, va in zip(xi, xj)])
-    
-    def _phi(m):
-        """Calculate phi(m)"""
-        patterns = np.array([data_array[i:i + m] for i in range(n - m + 1)])
-        C = np.zeros(n - m + 1)
-        
-        for i in range(n - m + 1):
-            template = patterns[i]
-            for j in range(n - m + 1):
-                if _maxdist(template, patterns[j], m) <= r:
-                    C[i] += 1.0
-        
-        phi = np.mean(np.log(C / (n - m + 1.0)))
-        return phi
-    
-    return _phi(m) - _phi(m + 1)
+    return _sample_entropy(data_array, m, r)
+
+
+def _phi(data_array: np.ndarray, m: int, r: float) -> float:
+    """Mean log fraction of length-``m`` templates matching each template (self included)."""
+    templates = _templates(data_array, m)
+    counts = _chebyshev_match_counts(templates, r)
+    return np.mean(np.log(counts / (len(templates) * 1.0)))
+
+
+def _sample_entropy(data_array: np.ndarray, m: int, r: float) -> float:
+    return _phi(data_array, m, r) - _phi(data_array, m + 1, r)
 
 
 def calculate_approximate_entropy(data: List[Union[float, int]], m: int = 2, r: float = None) -> float:
@@ -159,27 +290,7 @@ def calculate_approximate_entropy(data: List[Union[float, int]], m: int = 2, r:
     if r is None:
         r = 0.2 * np.std(data_array)
     
-    n = len(data_array)
-    
-    def _maxdist(xi, xj):
-        """Calculate maximum distance between two patterns"""
-        return max([abs(ua - va) for ua, va in zip(xi, xj)])
-    
-    def _phi(m):
-        """Calculate phi(m)"""
-        patterns = np.array([data_array[i:i + m] for i in range(n - m + 1)])
-        C = np.zeros(n - m + 1)
-        
-        for i in range(n - m + 1):
-            template = patterns[i]
-            for j in range(n - m + 1):
-                if _maxdist(template, patterns[j]) <= r:
-                    C[i] += 1.0
-        
-        phi = np.mean([np.log(c / (n - m + 1.0)) for c in C])
-        return phi
-    
-    return _phi(m) - _phi(m + 1)
+    return _phi(data_array, m, r) - _phi(data_array, m + 1, r)
 
 
 def calculate_permutation_entropy(data: List[Union[float, int]], order: int = 3, delay: int = 1) -> float:
@@ -208,17 +319,16 @@ def calculate_permutation_entropy(data: List[Union[float, int]], order: int = 3,
     all_perms = list(permutations(range(order)))
     perm_counts = {perm: 0 for perm in all_perms}
     
-    # Count occurrences of each permutation pattern
-    for i in range(n - (order - 1) * delay):
-        # Extract subsequence
-        subseq = [data_array[i + j * delay] for j in range(order)]
-        
-        # Get permutation pattern
-        sorted_indices = sorted(range(order), key=lambda x: subseq[x])
-        perm_pattern = tuple(sorted_indices)
-        
-        if perm_pattern in perm_counts:
-            perm_counts[perm_pattern] += 1
+    # Count occurrences of each permutation pattern; a stable argsort ranks
+    # tied values exactly like sorted() does
+    span = (order - 1) * delay + 1
+    if n >= span:
+        subsequences = sliding_window_view(data_array, span)[:, ::delay]
+        patterns, counts = np.unique(np.argsort(subsequences, axis=1, kind='stable'),
+                                     axis=0, return_counts=True)
+        for perm_pattern, count in zip(map(tuple, patterns.tolist()), counts.tolist()):
+            if perm_pattern in perm_counts:
+                perm_counts[perm_pattern] += count
     
     # Calculate probabilities
     total_patterns = sum(perm_counts.values())
@@ -270,15 +380,11 @@ def calculate_multiscale_entropy(data: List[Union[float, int]], max_scale: int =
             coarse_grained = data_array
         else:
             n_coarse = len(data_array) // scale
-            coarse_grained = np.array([
-                np.mean(data_array[i * scale:(i + 1) * scale])
-                for i in range(n_coarse)
-            ])
+            coarse_grained = data_array[:n_coarse * scale].reshape(n_coarse, scale).mean(axis=1)
         
         # Calculate sample entropy at this scale
         if len(coarse_grained) > m:
-            entropy = calculate_sample_entropy(coarse_grained.tolist(), m, r)
-            entropies.append(entropy)
+            entropies.append(_sample_entropy(coarse_grained, m, r))
         else:
             entropies.append(0.0)
     
@@ -17,11 +17,11 @@ Version: 1.0.0
 """
 
 import numpy as np
-import pandas as pd
 from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import logging
+import os
 import threading
 import time
 from collections import deque
@@ -30,28 +30,86 @@ import warnings
 # Core Kimera imports
 from .entropy_monitor import EntropyMonitor
 from .system_observer import SystemObserver
+from .metric_store import MetricStore, get_metric_store
+from ..core.geoid import GeoidState
+from ..core.models import LinguisticGeoid
 from ..core.statistical_modeling import (
     StatisticalModelResult, 
     statistical_engine,
     STATSMODELS_AVAILABLE
 )
 from ..core.native_math import NativeStats
+from ..core.lazy_loading import lazy_import
 
 # Suppress warnings for cleaner output
 warnings.filterwarnings('ignore', category=FutureWarning, module='statsmodels')
 
-try:
-    import statsmodels.api as sm
-    from statsmodels.tsa.stattools import adfuller
-    from statsmodels.stats.diagnostic import acorr_ljungbox
-    from statsmodels.tsa.arima.model import ARIMA
-    from statsmodels.stats.outliers_influence import OLSInfluence
-    STATSMODELS_AVAILABLE = True
-except ImportError:
-    STATSMODELS_AVAILABLE = False
+if STATSMODELS_AVAILABLE:
+    sm = lazy_import("statsmodels.api")
+    adfuller = lazy_import("statsmodels.tsa.stattools", "adfuller")
+    acorr_ljungbox = lazy_import("statsmodels.stats.diagnostic", "acorr_ljungbox")
+    ARIMA = lazy_import("statsmodels.tsa.arima.model", "ARIMA")
+    OLSInfluence = lazy_import("statsmodels.stats.outliers_influence", "OLSInfluence")
+pd = lazy_import("pandas")
 
 logger = logging.getLogger(__name__)
 
+# Collection cadence; sub-second intervals are fine, the expensive model fits run on their own cadence
+MONITOR_INTERVAL = float(os.getenv("KIMERA_STATS_MONITOR_INTERVAL", "30"))
+ANALYSIS_INTERVAL = float(os.getenv("KIMERA_STATS_ANALYSIS_INTERVAL", "30"))
+FORECAST_EVERY = int(os.getenv("KIMERA_STATS_FORECAST_EVERY", "10"))
+VAULT_INFO_TTL = float(os.getenv("KIMERA_MONITOR_VAULT_INFO_TTL", "5"))
+
+# Statistical process control
+SPC_WINDOW_SIZE = int(os.getenv("KIMERA_SPC_WINDOW", "100"))
+SPC_MIN_SAMPLES = int(os.getenv("KIMERA_SPC_MIN_SAMPLES", "20"))
+SPC_RUN_LENGTH = int(os.getenv("KIMERA_SPC_RUN_LENGTH", "8"))
+SPC_STATIONARITY_EVERY = int(os.getenv("KIMERA_SPC_STATIONARITY_EVERY", "100"))
+SPC_RESYNC_EVERY = 10000
+
+@dataclass
+class MonitoringSnapshot:
+    """Live system state handed to the monitor on each collection"""
+    geoids: List[GeoidState]
+    vault_info: Dict[str, Any]
+    linguistic_geoids: List[LinguisticGeoid] = field(default_factory=list)
+
+class LiveSnapshotProvider:
+    """
+    Reads the live geoid map and vault occupancy for the monitoring loop.
+    
+    ``active_geoids`` is the API's in-memory geoid mapping (read, never
+    copied deeply).  Vault counts come from ``vault_info_fn`` and are cached
+    for ``vault_info_ttl`` seconds so fast collection intervals do not turn
+    into a stream of COUNT queries; the last good value is kept if a
+    refresh fails.
+    """
+    
+    def __init__(self, active_geoids: Dict[str, GeoidState],
+                 vault_info_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+                 vault_info_ttl: float = VAULT_INFO_TTL):
+        self.active_geoids = active_geoids
+        self.vault_info_fn = vault_info_fn
+        self.vault_info_ttl = vault_info_ttl
+        self._vault_info: Dict[str, Any] = {}
+        self._vault_info_at: Optional[float] = None
+    
+    def _current_vault_info(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        if self.vault_info_fn and (self._vault_info_at is None or now - self._vault_info_at >= self.vault_info_ttl):
+            try:
+                self._vault_info = dict(self.vault_info_fn())
+            except Exception as e:
+                logger.warning(f"Vault info refresh failed, keeping previous counts: {e}")
+            self._vault_info_at = now
+        return self._vault_info
+    
+    def __call__(self) -> MonitoringSnapshot:
+        return MonitoringSnapshot(
+            geoids=list(self.active_geoids.values()),
+            vault_info=self._current_vault_info()
+        )
+
 @dataclass
 class StatisticalAlert:
     """Statistical alert for anomalous conditions"""
@@ -83,169 +141,253 @@ class StatisticalProcessController:
     
     Implements control charts and statistical monitoring for detecting
     when the semantic system is operating outside normal parameters.
+    
+    Each metric owns one row of a ``metrics x window_size`` NumPy ring buffer.
+    Control limits come from rolling Welford statistics (mean and sum of
+    squared deviations, updated in O(1) as values enter and leave the window)
+    over the values and over their first differences, so recording a batch of
+    measurements for hundreds of metrics is a handful of vectorised array
+    operations.  The ADF stationarity test that chooses between the two sigma
+    estimates runs every ``stationarity_every`` measurements per metric
+    rather than on every measurement.
     """
     
-    def __init__(self, window_size: int = 100):
-        self.window_size = window_size
-        self.data_buffer = deque(maxlen=window_size)
-        self.control_limits = {}
+    def __init__(self, window_size: int = SPC_WINDOW_SIZE, min_samples: int = SPC_MIN_SAMPLES,
+                 run_length: int = SPC_RUN_LENGTH, stationarity_every: int = SPC_STATIONARITY_EVERY):
+        self.window_size = max(2, window_size)
+        self.min_samples = max(2, min(min_samples, self.window_size))
+        self.run_length = run_length
+        self.stationarity_every = stationarity_every
         self.alerts = deque(maxlen=1000)
         
+        self._index: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._allocate(16)
+    
+    def _allocate(self, capacity: int):
+        """(Re)allocate the per-metric arrays, keeping existing rows"""
+        old_rows = len(self._names)
+        
+        def grow(name, shape_tail=(), fill=0.0, dtype=float):
+            new = np.full((capacity,) + shape_tail, fill, dtype=dtype)
+            if old_rows:
+                new[:old_rows] = getattr(self, name)[:old_rows]
+            setattr(self, name, new)
+        
+        grow('_values', (self.window_size,))
+        grow('_heads', dtype=np.int64, fill=0)
+        grow('_counts', dtype=np.int64, fill=0)
+        grow('_mean')
+        grow('_m2')
+        grow('_diff_mean')
+        grow('_diff_m2')
+        grow('_since_resync', dtype=np.int64, fill=0)
+        grow('_since_adf', dtype=np.int64, fill=self.stationarity_every)
+        grow('_stationary', dtype=bool, fill=True)
+        self._capacity = capacity
+    
+    def _row(self, metric_name: str) -> int:
+        row = self._index.get(metric_name)
+        if row is None:
+            row = len(self._names)
+            if row >= self._capacity:
+                self._allocate(self._capacity * 2)
+            self._index[metric_name] = row
+            self._names.append(metric_name)
+        return row
+    
     def add_measurement(self, metric_name: str, value: float, timestamp: Optional[datetime] = None):
         """Add a new measurement for statistical monitoring"""
+        self.add_measurements({metric_name: value}, timestamp)
+    
+    def add_measurements(self, values: Dict[str, float], timestamp: Optional[datetime] = None):
+        """Add one measurement for each of several metrics (vectorised across metrics)"""
+        if not values:
+            return
         if timestamp is None:
             timestamp = datetime.now()
-            
-        measurement = {
-            'metric': metric_name,
-            'value': value,
-            'timestamp': timestamp
-        }
-        
-        self.data_buffer.append(measurement)
         
-        # Update control limits if we have enough data
-        if len(self.data_buffer) >= 20:
-            self._update_control_limits(metric_name)
-            self._check_control_limits(metric_name, value, timestamp)
+        rows = np.fromiter((self._row(name) for name in values), dtype=np.int64, count=len(values))
+        new = np.fromiter(values.values(), dtype=float, count=len(values))
+        self._update_statistics(rows, new)
+        self._refresh_stationarity(rows)
+        self._check_control_limits(rows, new, timestamp)
     
-    def _update_control_limits(self, metric_name: str):
-        """Update statistical control limits for a metric"""
-        # Get recent data for this metric
-        metric_data = [m['value'] for m in self.data_buffer if m['metric'] == metric_name]
-        
-        if len(metric_data) < 10:
+    def _update_statistics(self, rows: np.ndarray, new: np.ndarray):
+        """Push values into the ring rows and roll the Welford statistics"""
+        w = self.window_size
+        counts = self._counts[rows]
+        heads = self._heads[rows]
+        full = counts == w
+        
+        # Remove the oldest value (and the oldest difference) from full windows
+        oldest = self._values[rows, heads]
+        n = counts.astype(float)
+        mean = self._mean[rows]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean_out = np.where(full, (n * mean - oldest) / np.maximum(n - 1, 1), mean)
+        m2 = np.where(full, self._m2[rows] - (oldest - mean) * (oldest - mean_out), self._m2[rows])
+        counts_after = np.where(full, counts - 1, counts)
+        
+        oldest_diff = self._values[rows, (heads + 1) % w] - oldest
+        diff_counts = np.maximum(counts - 1, 0)
+        dn = diff_counts.astype(float)
+        dmean = self._diff_mean[rows]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dmean_out = np.where(full, (dn * dmean - oldest_diff) / np.maximum(dn - 1, 1), dmean)
+        dm2 = np.where(full, self._diff_m2[rows] - (oldest_diff - dmean) * (oldest_diff - dmean_out), self._diff_m2[rows])
+        diff_counts_after = np.where(full, diff_counts - 1, diff_counts)
+        
+        # Add the new value (and its difference from the previous value)
+        k = counts_after + 1
+        delta = new - mean_out
+        mean_in = mean_out + delta / k
+        m2 = m2 + delta * (new - mean_in)
+        
+        has_prev = counts > 0
+        diff = new - self._values[rows, (heads - 1) % w]
+        dk = diff_counts_after + 1
+        ddelta = diff - dmean_out
+        dmean_in = np.where(has_prev, dmean_out + ddelta / np.maximum(dk, 1), dmean_out)
+        dm2 = np.where(has_prev, dm2 + ddelta * (diff - dmean_in), dm2)
+        
+        self._values[rows, heads] = new
+        self._heads[rows] = (heads + 1) % w
+        self._counts[rows] = k
+        self._mean[rows] = mean_in
+        self._m2[rows] = np.maximum(m2, 0.0)
+        self._diff_mean[rows] = dmean_in
+        self._diff_m2[rows] = np.maximum(dm2, 0.0)
+        
+        # Running removals accumulate rounding error; recompute exactly from the ring now and then
+        self._since_resync[rows] += 1
+        stale = rows[self._since_resync[rows] >= SPC_RESYNC_EVERY]
+        if stale.size:
+            self._resync(stale)
+    
+    def _ordered(self, rows: np.ndarray) -> np.ndarray:
+        """Window contents oldest-first (rows must have full windows or be read with counts)"""
+        idx = (self._heads[rows, None] + np.arange(self.window_size)) % self.window_size
+        return self._values[rows[:, None], idx]
+    
+    def _window(self, row: int) -> np.ndarray:
+        count = self._counts[row]
+        return self._ordered(np.array([row]))[0][self.window_size - count:]
+    
+    def _resync(self, rows: np.ndarray):
+        for row in rows:
+            data = self._window(row)
+            diffs = np.diff(data)
+            self._mean[row] = data.mean()
+            self._m2[row] = ((data - data.mean()) ** 2).sum()
+            self._diff_mean[row] = diffs.mean() if diffs.size else 0.0
+            self._diff_m2[row] = ((diffs - diffs.mean()) ** 2).sum() if diffs.size else 0.0
+            self._since_resync[row] = 0
+    
+    def _refresh_stationarity(self, rows: np.ndarray):
+        """Periodic ADF test choosing between the value and difference sigma"""
+        if not STATSMODELS_AVAILABLE or self.stationarity_every <= 0:
             return
-        
-        if STATSMODELS_AVAILABLE:
-            self._update_advanced_control_limits(metric_name, metric_data)
-        else:
-            self._update_basic_control_limits(metric_name, metric_data)
+        self._since_adf[rows] += 1
+        due = rows[(self._since_adf[rows] >= self.stationarity_every) & (self._counts[rows] >= self.min_samples)]
+        for row in due:
+            self._since_adf[row] = 0
+            try:
+                self._stationary[row] = adfuller(self._window(row))[1] < 0.05
+            except Exception as e:
+                logger.warning(f"Stationarity test failed for {self._names[row]}: {e}")
+                self._stationary[row] = True
     
-    def _update_advanced_control_limits(self, metric_name: str, data: List[float]):
-        """Update control limits using advanced statistical methods"""
-        try:
-            # Convert to pandas series
-            ts = pd.Series(data)
-            
-            # Test for stationarity
-            adf_result = adfuller(ts)
-            is_stationary = adf_result[1] < 0.05
-            
-            if is_stationary:
-                # Use direct statistics for stationary data
-                mean_val = ts.mean()
-                std_val = ts.std()
-            else:
-                # Use differenced data for non-stationary series
-                diff_ts = ts.diff().dropna()
-                mean_val = ts.mean()  # Use original mean
-                std_val = diff_ts.std()  # Use differenced std
-            
-            # Calculate control limits (3-sigma rule)
-            ucl = mean_val + 3 * std_val
-            lcl = mean_val - 3 * std_val
-            uwl = mean_val + 2 * std_val  # Warning limits
-            lwl = mean_val - 2 * std_val
-            
-            self.control_limits[metric_name] = StatisticalControlLimits(
-                center_line=float(mean_val),
-                upper_control_limit=float(ucl),
-                lower_control_limit=float(lcl),
-                upper_warning_limit=float(uwl),
-                lower_warning_limit=float(lwl),
-                method='advanced_spc',
+    def _limits_arrays(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Center line and sigma for ``rows`` (differenced sigma for non-stationary metrics)"""
+        counts = self._counts[rows].astype(float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sigma = np.sqrt(self._m2[rows] / np.maximum(counts - 1, 1))
+            diff_sigma = np.sqrt(self._diff_m2[rows] / np.maximum(counts - 2, 1))
+        sigma = np.where(self._stationary[rows], sigma, diff_sigma)
+        return self._mean[rows], sigma
+    
+    @property
+    def _method(self) -> str:
+        return 'advanced_spc' if STATSMODELS_AVAILABLE and self.stationarity_every > 0 else 'basic_spc'
+    
+    @property
+    def control_limits(self) -> Dict[str, StatisticalControlLimits]:
+        """Current control limits for every metric with enough samples"""
+        rows = np.array([row for row in range(len(self._names)) if self._counts[row] >= self.min_samples],
+                        dtype=np.int64)
+        if not rows.size:
+            return {}
+        center, sigma = self._limits_arrays(rows)
+        return {
+            self._names[row]: StatisticalControlLimits(
+                center_line=float(c),
+                upper_control_limit=float(c + 3 * s),
+                lower_control_limit=float(c - 3 * s),
+                upper_warning_limit=float(c + 2 * s),
+                lower_warning_limit=float(c - 2 * s),
+                method=self._method,
                 confidence_level=0.997  # 3-sigma
             )
-            
-        except Exception as e:
-            logger.warning(f"Advanced control limits failed for {metric_name}: {e}")
-            self._update_basic_control_limits(metric_name, data)
-    
-    def _update_basic_control_limits(self, metric_name: str, data: List[float]):
-        """Update control limits using basic statistical methods"""
-        mean_val = NativeStats.mean(data)
-        std_val = NativeStats.std(data)
-        
-        # 3-sigma control limits
-        ucl = mean_val + 3 * std_val
-        lcl = mean_val - 3 * std_val
-        uwl = mean_val + 2 * std_val
-        lwl = mean_val - 2 * std_val
-        
-        self.control_limits[metric_name] = StatisticalControlLimits(
-            center_line=mean_val,
-            upper_control_limit=ucl,
-            lower_control_limit=lcl,
-            upper_warning_limit=uwl,
-            lower_warning_limit=lwl,
-            method='basic_spc',
-            confidence_level=0.997
-        )
+            for row, c, s in zip(rows, center, sigma)
+        }
     
-    def _check_control_limits(self, metric_name: str, value: float, timestamp: datetime):
-        """Check if a value violates control limits"""
-        if metric_name not in self.control_limits:
+    def _check_control_limits(self, rows: np.ndarray, values: np.ndarray, timestamp: datetime):
+        """Evaluate the SPC rules for the metrics just updated"""
+        ready = self._counts[rows] >= self.min_samples
+        if not ready.any():
             return
-        
-        limits = self.control_limits[metric_name]
-        
-        # Check for violations
-        if value > limits.upper_control_limit:
-            alert = StatisticalAlert(
-                alert_type='control_limit_violation',
-                severity='critical',
-                message=f'{metric_name} exceeded upper control limit',
-                metric_name=metric_name,
-                current_value=value,
-                expected_range=(limits.lower_control_limit, limits.upper_control_limit),
-                confidence_level=limits.confidence_level,
-                timestamp=timestamp,
-                statistical_test='control_chart'
-            )
-            self.alerts.append(alert)
-            
-        elif value < limits.lower_control_limit:
-            alert = StatisticalAlert(
-                alert_type='control_limit_violation',
-                severity='critical',
-                message=f'{metric_name} fell below lower control limit',
-                metric_name=metric_name,
-                current_value=value,
-                expected_range=(limits.lower_control_limit, limits.upper_control_limit),
-                confidence_level=limits.confidence_level,
-                timestamp=timestamp,
-                statistical_test='control_chart'
-            )
-            self.alerts.append(alert)
-            
-        elif value > limits.upper_warning_limit:
-            alert = StatisticalAlert(
-                alert_type='warning_limit_violation',
-                severity='medium',
-                message=f'{metric_name} exceeded upper warning limit',
-                metric_name=metric_name,
-                current_value=value,
-                expected_range=(limits.lower_warning_limit, limits.upper_warning_limit),
-                confidence_level=0.95,
-                timestamp=timestamp,
-                statistical_test='control_chart'
-            )
-            self.alerts.append(alert)
-            
-        elif value < limits.lower_warning_limit:
-            alert = StatisticalAlert(
-                alert_type='warning_limit_violation',
-                severity='medium',
-                message=f'{metric_name} fell below lower warning limit',
-                metric_name=metric_name,
-                current_value=value,
-                expected_range=(limits.lower_warning_limit, limits.upper_warning_limit),
-                confidence_level=0.95,
-                timestamp=timestamp,
-                statistical_test='control_chart'
-            )
-            self.alerts.append(alert)
+        rows, values = rows[ready], values[ready]
+        center, sigma = self._limits_arrays(rows)
+        ucl, lcl = center + 3 * sigma, center - 3 * sigma
+        uwl, lwl = center + 2 * sigma, center - 2 * sigma
+        
+        # Rule 1: beyond the 3-sigma control limits; otherwise beyond the 2-sigma warning limits
+        for i in np.flatnonzero((values > ucl) | (values < lcl)):
+            above = values[i] > ucl[i]
+            self._alert('control_limit_violation', 'critical', rows[i], values[i],
+                        'exceeded upper control limit' if above else 'fell below lower control limit',
+                        (lcl[i], ucl[i]), 0.997, timestamp)
+        for i in np.flatnonzero((values <= ucl) & (values >= lcl) & ((values > uwl) | (values < lwl))):
+            above = values[i] > uwl[i]
+            self._alert('warning_limit_violation', 'medium', rows[i], values[i],
+                        'exceeded upper warning limit' if above else 'fell below lower warning limit',
+                        (lwl[i], uwl[i]), 0.95, timestamp)
+        
+        # Run rule: ``run_length`` consecutive points on one side of the center line (alert once per run)
+        length = self.run_length
+        if length <= 1 or length >= self.window_size:
+            return
+        eligible = self._counts[rows] >= length
+        if not eligible.any():
+            return
+        run_rows = rows[eligible]
+        idx = (self._heads[run_rows, None] - 1 - np.arange(length + 1)) % self.window_size
+        sides = np.sign(self._values[run_rows[:, None], idx] - center[eligible, None])
+        run = (sides[:, :length] == sides[:, :1]).all(axis=1) & (sides[:, 0] != 0)
+        has_before = self._counts[run_rows] > length
+        new_run = run & (~has_before | (sides[:, length] != sides[:, 0]))
+        for j in np.flatnonzero(new_run):
+            i = np.flatnonzero(eligible)[j]
+            side = 'above' if sides[j, 0] > 0 else 'below'
+            self._alert('run_rule_violation', 'low', rows[i], values[i],
+                        f'{length} consecutive points {side} the center line',
+                        (lcl[i], ucl[i]), 0.99, timestamp)
+    
+    def _alert(self, alert_type: str, severity: str, row: int, value: float, what: str,
+               expected_range: Tuple[float, float], confidence_level: float, timestamp: datetime):
+        metric_name = self._names[row]
+        self.alerts.append(StatisticalAlert(
+            alert_type=alert_type,
+            severity=severity,
+            message=f'{metric_name} {what}',
+            metric_name=metric_name,
+            current_value=float(value),
+            expected_range=(float(expected_range[0]), float(expected_range[1])),
+            confidence_level=confidence_level,
+            timestamp=timestamp,
+            statistical_test='control_chart'
+        ))
     
     def get_recent_alerts(self, hours: int = 24) -> List[StatisticalAlert]:
         """Get alerts from the last N hours"""
@@ -349,9 +491,12 @@ class AdvancedStatisticalMonitor:
     
     def __init__(self, 
                  entropy_monitor: Optional[EntropyMonitor] = None,
-                 system_observer: Optional[SystemObserver] = None):
+                 system_observer: Optional[SystemObserver] = None,
+                 snapshot_provider: Optional[Callable[[], MonitoringSnapshot]] = None,
+                 metric_store: Optional[MetricStore] = None):
         self.entropy_monitor = entropy_monitor
         self.system_observer = system_observer
+        self.snapshot_provider = snapshot_provider
         
         # Statistical components
         self.process_controller = StatisticalProcessController()
@@ -360,11 +505,28 @@ class AdvancedStatisticalMonitor:
         # Monitoring state
         self.is_monitoring = False
         self.monitoring_thread = None
-        self.monitoring_interval = 30  # seconds
-        
-        # Data storage
-        self.metric_history = {}
+        self.monitoring_interval = MONITOR_INTERVAL  # seconds
+        self.analysis_interval = ANALYSIS_INTERVAL  # seconds between comprehensive analyses
+        self._stop_event = threading.Event()
+        self._last_analysis: Optional[float] = None
+        self.collection_count = 0
+        self.collection_errors = 0
+        
+        # Data storage: one columnar ring per metric
+        self.metric_history = metric_store or MetricStore('statistical_monitor')
         self.analysis_results = {}
+    
+    def configure(self,
+                  entropy_monitor: Optional[EntropyMonitor] = None,
+                  system_observer: Optional[SystemObserver] = None,
+                  snapshot_provider: Optional[Callable[[], MonitoringSnapshot]] = None):
+        """Attach data sources (keeps references to this instance valid)"""
+        if entropy_monitor is not None:
+            self.entropy_monitor = entropy_monitor
+        if system_observer is not None:
+            self.system_observer = system_observer
+        if snapshot_provider is not None:
+            self.snapshot_provider = snapshot_provider
         
     def start_monitoring(self):
         """Start continuous statistical monitoring"""
@@ -372,6 +534,7 @@ class AdvancedStatisticalMonitor:
             return
         
         self.is_monitoring = True
+        self._stop_event.clear()
         self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
         self.monitoring_thread.start()
         logger.info("Advanced statistical monitoring started")
@@ -379,6 +542,7 @@ class AdvancedStatisticalMonitor:
     def stop_monitoring(self):
         """Stop continuous statistical monitoring"""
         self.is_monitoring = False
+        self._stop_event.set()
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5)
         logger.info("Advanced statistical monitoring stopped")
@@ -386,64 +550,84 @@ class AdvancedStatisticalMonitor:
     def _monitoring_loop(self):
         """Main monitoring loop"""
         while self.is_monitoring:
+            started = time.monotonic()
             try:
                 self._collect_and_analyze_metrics()
-                time.sleep(self.monitoring_interval)
             except Exception as e:
+                self.collection_errors += 1
                 logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(self.monitoring_interval)
+            # Keep a fixed cadence: sleep only for what is left of the interval
+            self._stop_event.wait(max(0.0, self.monitoring_interval - (time.monotonic() - started)))
     
     def _collect_and_analyze_metrics(self):
         """Collect current metrics and perform statistical analysis"""
         current_time = datetime.now()
+        snapshot = self.snapshot_provider() if self.snapshot_provider else MonitoringSnapshot([], {})
+        metrics: Dict[str, float] = {}
         
-        # Collect entropy metrics
-        if self.entropy_monitor:
+        # The observer computes entropy, semantic and thermodynamic state in one pass
+        entropy_measurement = None
+        if self.system_observer:
             try:
-                entropy_measurement = self.entropy_monitor.calculate_system_entropy()
-                if hasattr(entropy_measurement, 'shannon_entropy'):
-                    self._record_metric('shannon_entropy', 
-                                      entropy_measurement.shannon_entropy, 
-                                      current_time)
-                
-                if hasattr(entropy_measurement, 'thermodynamic_entropy'):
-                    self._record_metric('thermodynamic_entropy', 
-                                      entropy_measurement.thermodynamic_entropy, 
-                                      current_time)
+                observation = self.system_observer.observe_system(
+                    snapshot.geoids, snapshot.linguistic_geoids, snapshot.vault_info
+                )
+                entropy_measurement = observation.entropy_measurement
+                health = observation.system_health
+                metrics['system_health'] = health.get('overall_health', 0.0)
+                metrics['stability_score'] = health.get('entropy_stability', 0.0)
+                for name, value in health.items():
+                    if name != 'overall_health' and isinstance(value, (int, float, np.number)):
+                        metrics[name] = value
             except Exception as e:
-                logger.warning(f"Failed to collect entropy metrics: {e}")
+                logger.warning(f"Failed to collect system observer metrics: {e}")
         
-        # Collect system observer metrics
-        if self.system_observer:
+        # Collect entropy metrics
+        if entropy_measurement is None and self.entropy_monitor:
             try:
-                system_health = self.system_observer.get_system_health_score()
-                self._record_metric('system_health', system_health, current_time)
-                
-                stability_score = self.system_observer.calculate_stability_score()
-                self._record_metric('stability_score', stability_score, current_time)
+                entropy_measurement = self.entropy_monitor.calculate_system_entropy(
+                    snapshot.geoids, snapshot.vault_info
+                )
             except Exception as e:
-                logger.warning(f"Failed to collect system observer metrics: {e}")
+                logger.warning(f"Failed to collect entropy metrics: {e}")
         
-        # Perform statistical analysis
-        self._perform_statistical_analysis()
-    
-    def _record_metric(self, metric_name: str, value: float, timestamp: datetime):
-        """Record a metric value and update statistical monitoring"""
-        # Store in history
-        if metric_name not in self.metric_history:
-            self.metric_history[metric_name] = deque(maxlen=1000)
+        if entropy_measurement is not None:
+            for name in ('shannon_entropy', 'thermodynamic_entropy', 'mutual_information', 'system_complexity'):
+                metrics[name] = getattr(entropy_measurement, name)
+            metrics['geoid_count'] = entropy_measurement.geoid_count
         
-        self.metric_history[metric_name].append({
-            'value': value,
-            'timestamp': timestamp
-        })
+        self.record_metrics(metrics, current_time)
+        self.collection_count += 1
+        
+        # Perform statistical analysis (on its own, slower cadence)
+        now = time.monotonic()
+        if self._last_analysis is None or now - self._last_analysis >= self.analysis_interval:
+            self._last_analysis = now
+            self._perform_statistical_analysis()
+    
+    def record_metrics(self, metrics: Dict[str, float], timestamp: Optional[datetime] = None):
+        """Record one value per metric and run SPC over all of them in one batch"""
+        if not metrics:
+            return
+        if timestamp is None:
+            timestamp = datetime.now()
+        metrics = {name: float(value) for name, value in metrics.items()}
+        self.metric_history.record(metrics, timestamp)
         
         # Update statistical process control
-        self.process_controller.add_measurement(metric_name, value, timestamp)
+        self.process_controller.add_measurements(metrics, timestamp)
         
-        # Update forecasts periodically
-        if len(self.metric_history[metric_name]) % 10 == 0:  # Every 10 measurements
-            historical_values = [m['value'] for m in self.metric_history[metric_name]]
+        for metric_name in metrics:
+            self._maybe_update_forecast(metric_name)
+    
+    def _record_metric(self, metric_name: str, value: float, timestamp: datetime):
+        """Record a metric value and update statistical monitoring"""
+        self.record_metrics({metric_name: value}, timestamp)
+    
+    def _maybe_update_forecast(self, metric_name: str):
+        # Update forecasts periodically (by points recorded, not the saturating window length)
+        if FORECAST_EVERY > 0 and self.metric_history[metric_name].total % FORECAST_EVERY == 0:
+            historical_values = self.metric_history.values(metric_name).tolist()
             self.predictive_monitor.update_forecast(metric_name, historical_values)
     
     def _perform_statistical_analysis(self):
@@ -454,16 +638,15 @@ class AdvancedStatisticalMonitor:
             
             # Extract entropy history
             if 'shannon_entropy' in self.metric_history:
-                entropy_values = [m['value'] for m in self.metric_history['shannon_entropy']]
-                entropy_timestamps = [m['timestamp'] for m in self.metric_history['shannon_entropy']]
-                system_data['entropy_history'] = entropy_values
-                system_data['timestamps'] = entropy_timestamps
+                times, values = self.metric_history.tail('shannon_entropy')
+                system_data['entropy_history'] = values.tolist()
+                system_data['timestamps'] = [datetime.fromtimestamp(t) for t in times.tolist()]
             
             # Extract other metrics for analysis
             if 'system_health' in self.metric_history and 'stability_score' in self.metric_history:
                 system_data['semantic_features'] = {
-                    'system_health': [m['value'] for m in self.metric_history['system_health']],
-                    'stability_score': [m['value'] for m in self.metric_history['stability_score']]
+                    'system_health': self.metric_history.values('system_health').tolist(),
+                    'stability_score': self.metric_history.values('stability_score').tolist()
                 }
             
             # Perform comprehensive analysis
@@ -477,7 +660,10 @@ class AdvancedStatisticalMonitor:
         """Get comprehensive statistical summary of system state"""
         summary = {
             'monitoring_status': self.is_monitoring,
-            'metrics_tracked': list(self.metric_history.keys()),
+            'monitoring_interval': self.monitoring_interval,
+            'collections': self.collection_count,
+            'collection_errors': self.collection_errors,
+            'metrics_tracked': self.metric_history.keys(),
             'recent_alerts': len(self.process_controller.get_recent_alerts()),
             'control_limits': {name: {
                 'center_line': limits.center_line,
@@ -520,15 +706,16 @@ class AdvancedStatisticalMonitor:
         return self.predictive_monitor.forecasts.get(metric_name)
 
 # Global instance for easy access
-advanced_monitor = AdvancedStatisticalMonitor()
+advanced_monitor = AdvancedStatisticalMonitor(metric_store=get_metric_store('statistical_monitor'))
 
 def get_advanced_monitor() -> AdvancedStatisticalMonitor:
     """Get the global advanced statistical monitor instance"""
     return advanced_monitor
 
 def initialize_advanced_monitoring(entropy_monitor: Optional[EntropyMonitor] = None,
-                                 system_observer: Optional[SystemObserver] = None) -> AdvancedStatisticalMonitor:
+                                 system_observer: Optional[SystemObserver] = None,
+                                 snapshot_provider: Optional[Callable[[], MonitoringSnapshot]] = None) -> AdvancedStatisticalMonitor:
     """Initialize advanced monitoring with existing monitors"""
-    global advanced_monitor
-    advanced_monitor = AdvancedStatisticalMonitor(entropy_monitor, system_observer)
+    # Configure the shared instance in place: modules hold references to ``advanced_monitor``
+    advanced_monitor.configure(entropy_monitor, system_observer, snapshot_provider)
     return advanced_monitor
\ No newline at end of file
@@ -16,6 +16,8 @@ from collections import defaultdict, deque
 import math
 
 from ..core.geoid import GeoidState
+from .entropy_accumulator import IncrementalEntropyAccumulator
+from .metric_store import MetricStore, iso_timestamps
 
 
 @dataclass
@@ -105,18 +107,25 @@ class EntropyMonitor:
     the computational tools specification for benchmarking entropy.
     """
     
-    def __init__(self, history_size: int = 1000, estimation_method: str = 'chao_shen'):
+    # Scalar measurement fields kept column-wise in the metric store
+    METRIC_FIELDS = ('shannon_entropy', 'thermodynamic_entropy', 'relative_entropy',
+                     'conditional_entropy', 'mutual_information', 'system_complexity', 'geoid_count')
+    
+    def __init__(self, history_size: int = 1000, estimation_method: str = 'chao_shen',
+                 metric_store: Optional[MetricStore] = None):
         self.history_size = history_size
         self.estimation_method = estimation_method
         self.measurements: deque = deque(maxlen=history_size)
+        # Columnar history backing trend, anomaly and column export queries
+        self.metric_store = metric_store or MetricStore('entropy_monitor', capacity=history_size)
         self.logger = logging.getLogger(__name__)
         
         # Baseline distributions for relative entropy calculations
         self.baseline_distribution: Optional[np.ndarray] = None
         self.reference_timestamp: Optional[datetime] = None
         
-        # System state tracking
-        self.geoid_states: Dict[str, GeoidState] = {}
+        # System state tracking, maintained incrementally as geoids change
+        self.accumulator = IncrementalEntropyAccumulator()
         self.vault_distributions: Dict[str, List[float]] = defaultdict(list)
         
     def set_baseline(self, geoids: List[GeoidState]) -> None:
@@ -141,14 +150,123 @@ class EntropyMonitor:
         self.reference_timestamp = datetime.now()
         self.logger.info(f"Baseline distribution set with {len(all_features)} features")
     
+    @property
+    def geoid_states(self) -> Dict[str, GeoidState]:
+        """Geoids currently tracked by the incremental accumulator"""
+        return self.accumulator.geoids
+    
+    def observe_geoid(self, geoid: GeoidState) -> None:
+        """Add or update a single geoid in the tracked state (O(its features))"""
+        self.accumulator.observe(geoid)
+    
+    def remove_geoid(self, geoid_id: str) -> None:
+        """Remove a single geoid from the tracked state"""
+        self.accumulator.remove(geoid_id)
+    
     def calculate_system_entropy(self, geoids: List[GeoidState], 
                                 vault_info: Dict[str, Any]) -> EntropyMeasurement:
         """
         Calculate various entropy measures for the current system state.
 
+        The tracked state is synchronised with ``geoids`` first; only added,
+        changed or removed geoids update the aggregates.
+
         If the provided list of geoids is empty, this function returns a zero-filled
         EntropyMeasurement object to ensure downstream stability.
         """
+        if not geoids:
+            # Return a zero-value measurement if there are no geoids
+            return EntropyMeasurement(
+                timestamp=datetime.now(),
+                shannon_entropy=0.0,
+                thermodynamic_entropy=0.0,
+                relative_entropy=0.0,
+                conditional_entropy=0.0,
+                mutual_information=0.0,
+                system_complexity=0.0,
+                geoid_count=0,
+                vault_distribution={'vault_a': 0, 'vault_b': 0, 'total_scars': 0}
+            )
+        
+        self.accumulator.sync(geoids)
+        return self.measure(vault_info)
+    
+    def measure(self, vault_info: Dict[str, Any]) -> EntropyMeasurement:
+        """
+        Emit a measurement from the incrementally maintained state.
+
+        Use together with :meth:`observe_geoid` / :meth:`remove_geoid` when
+        the caller already knows which geoids changed.
+        """
+        timestamp = datetime.now()
+        acc = self.accumulator
+        
+        # Shannon entropy using selected estimator, from maintained counts
+        shannon_entropy = acc.entropy(self.estimation_method)
+        
+        # Thermodynamic entropy (using Gibbs formulation)
+        thermodynamic_entropy = acc.thermodynamic_entropy()
+        
+        # Relative entropy (KL divergence from baseline)
+        relative_entropy = 0.0
+        if self.baseline_distribution is not None and acc.feature_count == len(self.baseline_distribution):
+            relative_entropy = EntropyEstimator.relative_entropy_kl(acc.probabilities(), self.baseline_distribution)
+        
+        # Conditional entropy and mutual information
+        conditional_entropy, mutual_information = 0.0, 0.0
+        if acc.geoid_count >= 2:
+            conditional_entropy, mutual_information = self._conditional_measures_from_features(
+                *acc.mean_size_features()
+            )
+        
+        # System complexity measure
+        system_complexity = 0.0
+        if acc.geoid_count:
+            system_complexity = (
+                acc.structural_complexity() * 0.4 +
+                acc.interaction_complexity() * 0.4 +
+                self._calculate_vault_complexity(vault_info) * 0.2
+            )
+        
+        # Vault distribution analysis
+        vault_distribution = self._analyze_vault_distribution(vault_info)
+        
+        measurement = EntropyMeasurement(
+            timestamp=timestamp,
+            shannon_entropy=shannon_entropy,
+            thermodynamic_entropy=thermodynamic_entropy,
+            relative_entropy=relative_entropy,
+            conditional_entropy=conditional_entropy,
+            mutual_information=mutual_information,
+            system_complexity=system_complexity,
+            geoid_count=acc.geoid_count,
+            vault_distribution=vault_distribution,
+            metadata={
+                'estimation_method': self.estimation_method,
+                'feature_count': acc.feature_count,
+                'total_activation': acc.total_activation,
+                'has_baseline': self.baseline_distribution is not None
+            }
+        )
+        
+        self.measurements.append(measurement)
+        self._record_columns(measurement)
+        return measurement
+    
+    def _record_columns(self, measurement: EntropyMeasurement) -> None:
+        columns = {name: getattr(measurement, name) for name in self.METRIC_FIELDS}
+        columns.update({f'vault_{k}': v for k, v in measurement.vault_distribution.items()
+                        if isinstance(v, (int, float))})
+        self.metric_store.record(columns, measurement.timestamp)
+    
+    def _calculate_system_entropy_full(self, geoids: List[GeoidState], 
+                                      vault_info: Dict[str, Any]) -> EntropyMeasurement:
+        """
+        Reference implementation that re-aggregates every geoid from scratch.
+
+        Kept for verification of the incremental path; does not record the
+        measurement.
+        """
         timestamp = datetime.now()
         
         if not geoids:
@@ -165,9 +283,6 @@ class EntropyMonitor:
                 vault_distribution={'vault_a': 0, 'vault_b': 0, 'total_scars': 0}
             )
         
-        # Update internal state
-        self.geoid_states = {g.geoid_id: g for g in geoids}
-        
         # Aggregate all semantic features and their activations
         feature_aggregation = defaultdict(float)
         for geoid in geoids:
@@ -230,7 +345,6 @@ class EntropyMonitor:
             }
         )
         
-        self.measurements.append(measurement)
         return measurement
     
     def _calculate_thermodynamic_entropy(self, geoids: List[GeoidState]) -> float:
@@ -283,6 +397,10 @@ class EntropyMonitor:
             symbolic_complexity = len(str(geoid.symbolic_state))
             symbolic_features.append(symbolic_complexity)
         
+        return self._conditional_measures_from_features(semantic_features, symbolic_features)
+    
+    def _conditional_measures_from_features(self, semantic_features, symbolic_features) -> Tuple[float, float]:
+        """Conditional entropy H(symbolic|semantic) and MI from per-geoid feature values"""
         # Discretize for entropy calculation
         semantic_bins = np.histogram_bin_edges(semantic_features, bins=10)
         symbolic_bins = np.histogram_bin_edges(symbolic_features, bins=10)
@@ -441,41 +559,40 @@ class EntropyMonitor:
     
     def get_entropy_trends(self, window_size: int = 100) -> Dict[str, List[float]]:
         """Get entropy trends over recent measurements"""
-        if len(self.measurements) < 2:
+        if self.metric_store.count('shannon_entropy') < 2:
             return {}
         
-        recent_measurements = list(self.measurements)[-window_size:]
-        
-        return {
-            'shannon_entropy': [m.shannon_entropy for m in recent_measurements],
-            'thermodynamic_entropy': [m.thermodynamic_entropy for m in recent_measurements],
-            'relative_entropy': [m.relative_entropy for m in recent_measurements],
-            'system_complexity': [m.system_complexity for m in recent_measurements],
-            'timestamps': [m.timestamp.isoformat() for m in recent_measurements]
-        }
+        columns = self.metric_store.columns(
+            ('shannon_entropy', 'thermodynamic_entropy', 'relative_entropy', 'system_complexity'), window_size
+        )
+        trends = {name: values.tolist() for name, values in columns.items() if name != 'timestamps'}
+        trends['timestamps'] = iso_timestamps(columns['timestamps'])
+        return trends
     
     def detect_entropy_anomalies(self, threshold_std: float = 2.0) -> List[Dict[str, Any]]:
         """Detect anomalous entropy measurements"""
-        if len(self.measurements) < 10:
+        if self.metric_store.count('shannon_entropy') < 10:
             return []
         
-        recent_measurements = list(self.measurements)[-100:]  # Last 100 measurements
-        shannon_values = [m.shannon_entropy for m in recent_measurements]
+        times, shannon_values = self.metric_store.tail('shannon_entropy', 100)  # Last 100 measurements
         
         mean_entropy = np.mean(shannon_values)
         std_entropy = np.std(shannon_values)
         
-        anomalies = []
-        for measurement in recent_measurements[-10:]:  # Check last 10
-            if abs(measurement.shannon_entropy - mean_entropy) > threshold_std * std_entropy:
-                anomalies.append({
-                    'timestamp': measurement.timestamp.isoformat(),
-                    'shannon_entropy': measurement.shannon_entropy,
-                    'deviation': abs(measurement.shannon_entropy - mean_entropy) / std_entropy,
-                    'type': 'high' if measurement.shannon_entropy > mean_entropy else 'low'
-                })
-        
-        return anomalies
+        # Check last 10
+        recent_times, recent = times[-10:], shannon_values[-10:]
+        deviations = np.abs(recent - mean_entropy)
+        flagged = np.flatnonzero(deviations > threshold_std * std_entropy)
+        
+        return [
+            {
+                'timestamp': iso_timestamps(recent_times[i:i + 1])[0],
+                'shannon_entropy': float(recent[i]),
+                'deviation': float(deviations[i] / std_entropy),
+                'type': 'high' if recent[i] > mean_entropy else 'low'
+            }
+            for i in flagged
+        ]
     
     def export_measurements(self, format: str = 'dict') -> Any:
         """Export measurements for analysis"""
@@ -495,5 +612,9 @@ class EntropyMonitor:
                 }
                 for m in self.measurements
             ]
+        elif format == 'columns':
+            columns = {name: self.metric_store.values(name).tolist() for name in self.metric_store.keys()}
+            columns['timestamps'] = iso_timestamps(self.metric_store.tail('shannon_entropy')[0])
+            return columns
         else:
             raise ValueError(f"Unsupported export format: {format}")
@@ -0,0 +1,341 @@
+"""
+Memory Footprint Accounting for Kimera SWM
+==========================================
+
+Process RSS says *that* the API grew, not *what* grew.  Each component that
+holds a meaningful amount of memory (field tensors, the embedding model, the
+active geoid map, memo caches, history rings, metric stores, trace buffers)
+registers a *reporter* with the :class:`MemoryAccountant`: a callable
+returning its approximate size in bytes, or a ``{part: bytes}`` breakdown.
+
+Sizes are estimates, not allocator truth:
+
+* numpy arrays and torch tensors count their storage (``nbytes`` /
+  ``numel * element_size``), which dominates the numeric components;
+* models count parameters and buffers (ONNX sessions the size of their
+  model files);
+* Python containers are walked with ``sys.getsizeof`` up to
+  ``KIMERA_MEMORY_MAX_DEPTH`` levels, sampling at most
+  ``KIMERA_MEMORY_SAMPLE_SIZE`` items per container and extrapolating, so
+  sizing a 100k-entry map stays cheap.
+
+Every :meth:`MemoryAccountant.snapshot` updates per-component high-water
+marks.  Snapshots are served at ``GET /monitoring/memory`` and exported as
+``kimera_memory_component_bytes`` / ``kimera_memory_component_peak_bytes``
+on every Prometheus scrape.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MEMORY_SAMPLE_SIZE = int(os.getenv("KIMERA_MEMORY_SAMPLE_SIZE", "32"))
+MEMORY_MAX_DEPTH = int(os.getenv("KIMERA_MEMORY_MAX_DEPTH", "4"))
+
+Report = Union[int, float, Dict[str, Union[int, float]]]
+Reporter = Callable[[], Report]
+
+_ATOMIC = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def tensor_bytes(obj: Any) -> int:
+    """Storage bytes of a numpy array or torch tensor (0 for anything else)."""
+    nbytes = getattr(obj, "nbytes", None)
+    if isinstance(nbytes, int) and not hasattr(obj, "element_size"):
+        return nbytes
+    if hasattr(obj, "element_size") and hasattr(obj, "numel"):
+        try:
+            return int(obj.numel()) * int(obj.element_size())
+        except Exception:
+            return 0
+    return 0
+
+
+def module_bytes(model: Any) -> int:
+    """Parameter and buffer bytes of a torch module (or a wrapper holding one)."""
+    if model is None:
+        return 0
+    if hasattr(model, "parameters"):
+        total = 0
+        seen = set()
+        tensors = list(model.parameters())
+        if hasattr(model, "buffers"):
+            tensors += list(model.buffers())
+        for tensor in tensors:
+            if id(tensor) not in seen:
+                seen.add(id(tensor))
+                total += tensor_bytes(tensor)
+        return total
+    # Wrappers such as BGEM3FlagModel keep the torch module on an attribute
+    for attr in ("model", "_model", "module"):
+        inner = getattr(model, attr, None)
+        if inner is not None and hasattr(inner, "parameters"):
+            return module_bytes(inner)
+    return estimate_size(model)
+
+
+def estimate_size(obj: Any, sample: Optional[int] = None, max_depth: Optional[int] = None) -> int:
+    """Approximate deep size of ``obj`` in bytes.
+
+    Containers larger than ``sample`` items are sized from their first
+    ``sample`` items and extrapolated; shared objects are counted once.
+    """
+    sample = MEMORY_SAMPLE_SIZE if sample is None else max(1, sample)
+    max_depth = MEMORY_MAX_DEPTH if max_depth is None else max_depth
+    return _estimate(obj, sample, max_depth, set())
+
+
+def _estimate(obj: Any, sample: int, depth: int, seen: set) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    storage = tensor_bytes(obj)
+    if storage:
+        return storage + sys.getsizeof(obj, 0)
+    try:
+        size = sys.getsizeof(obj, 0)
+    except TypeError:
+        return 0
+    if depth <= 0 or isinstance(obj, _ATOMIC) or isinstance(obj, type):
+        return size
+
+    if isinstance(obj, dict):
+        items = obj.items()
+        count = len(obj)
+    elif isinstance(obj, (list, tuple, set, frozenset)) or type(obj).__name__ == "deque":
+        items = obj
+        count = len(obj)
+    elif hasattr(obj, "__dict__"):
+        return size + _estimate(vars(obj), sample, depth - 1, seen)
+    elif hasattr(obj, "__slots__"):
+        slots = [getattr(obj, s, None) for s in obj.__slots__ if isinstance(s, str)]
+        return size + sum(_estimate(value, sample, depth - 1, seen) for value in slots)
+    else:
+        return size
+
+    sampled = 0
+    measured = 0
+    for item in items:
+        if sampled >= sample:
+            break
+        if isinstance(obj, dict):
+            key, value = item
+            measured += _estimate(key, sample, depth - 1, seen) + _estimate(value, sample, depth - 1, seen)
+        else:
+            measured += _estimate(item, sample, depth - 1, seen)
+        sampled += 1
+    if sampled and count > sampled:
+        measured = int(measured * count / sampled)
+    return size + measured
+
+
+def process_memory() -> Dict[str, int]:
+    """Resident set size now and the OS-reported peak, in bytes."""
+    info: Dict[str, int] = {}
+    try:
+        import psutil
+
+        info["rss_bytes"] = int(psutil.Process().memory_info().rss)
+    except Exception:  # pragma: no cover - psutil is in requirements.txt
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KiB, macOS bytes
+        info["peak_rss_bytes"] = int(peak if sys.platform == "darwin" else peak * 1024)
+    except Exception:  # pragma: no cover - not available on Windows
+        pass
+    return info
+
+
+class MemoryAccountant:
+    """Registry of memory reporters with per-component high-water marks.
+
+    Bound methods are held weakly, so registering ``engine.memory_footprint``
+    does not keep the engine alive; a reporter whose owner was collected is
+    dropped at the next snapshot.
+    """
+
+    def __init__(self):
+        self._reporters: Dict[str, Callable[[], Optional[Reporter]]] = {}
+        self._peaks: Dict[str, int] = {}
+        self._peak_total = 0
+        self._lock = threading.Lock()
+
+    def register(self, name: str, reporter: Reporter) -> None:
+        if hasattr(reporter, "__self__") and hasattr(reporter, "__func__"):
+            ref = weakref.WeakMethod(reporter)
+        else:
+            ref = lambda: reporter  # noqa: E731
+        with self._lock:
+            self._reporters[name] = ref
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._reporters.pop(name, None)
+            self._peaks.pop(name, None)
+
+    def names(self):
+        with self._lock:
+            return sorted(self._reporters)
+
+    def reset_peaks(self) -> None:
+        with self._lock:
+            self._peaks.clear()
+            self._peak_total = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Measure every component and update the high-water marks."""
+        with self._lock:
+            reporters = list(self._reporters.items())
+
+        components: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+        dead = []
+        started = time.perf_counter()
+        for name, ref in reporters:
+            reporter = ref()
+            if reporter is None:
+                dead.append(name)
+                continue
+            try:
+                report = reporter()
+            except Exception as e:
+                logger.debug(f"Memory reporter '{name}' failed: {e}")
+                errors[name] = str(e)
+                continue
+            if isinstance(report, dict):
+                parts = {part: int(size) for part, size in report.items()}
+                components[name] = {"bytes": sum(parts.values()), "parts": parts}
+            else:
+                components[name] = {"bytes": int(report or 0)}
+
+        total = sum(c["bytes"] for c in components.values())
+        with self._lock:
+            for name in dead:
+                self._reporters.pop(name, None)
+            for name, component in components.items():
+                peak = max(self._peaks.get(name, 0), component["bytes"])
+                self._peaks[name] = peak
+                component["peak_bytes"] = peak
+            self._peak_total = max(self._peak_total, total)
+            peak_total = self._peak_total
+
+        process = process_memory()
+        snapshot: Dict[str, Any] = {
+            "timestamp": time.time(),
+            "components": components,
+            "accounted_bytes": total,
+            "peak_accounted_bytes": peak_total,
+            "process": process,
+            "measure_seconds": time.perf_counter() - started,
+        }
+        if "rss_bytes" in process:
+            snapshot["unaccounted_bytes"] = max(process["rss_bytes"] - total, 0)
+        if errors:
+            snapshot["errors"] = errors
+        return snapshot
+
+
+memory_accountant = MemoryAccountant()
+
+
+def register_memory_reporter(name: str, reporter: Reporter) -> None:
+    """Register ``reporter`` under ``name`` with the global accountant."""
+    memory_accountant.register(name, reporter)
+
+
+def memory_snapshot() -> Dict[str, Any]:
+    return memory_accountant.snapshot()
+
+
+# Built-in reporters ----------------------------------------------------------
+# Imports are deferred so registering them never pulls in torch or the vault.
+
+def _memo_cache_bytes() -> Dict[str, int]:
+    from ..core.memo_cache import iter_memo_caches
+
+    return {cache.name: estimate_size(cache._entries) for cache in iter_memo_caches()}
+
+
+def _history_buffer_bytes() -> Dict[str, int]:
+    from ..core.history_buffer import iter_history_buffers
+
+    parts: Dict[str, int] = {}
+    for buffer in iter_history_buffers():
+        parts[buffer.name] = parts.get(buffer.name, 0) + estimate_size(buffer._items)
+    return parts
+
+
+def _metric_store_bytes() -> Dict[str, int]:
+    from .metric_store import iter_metric_stores
+
+    return {store.name: store.memory_footprint() for store in iter_metric_stores()}
+
+
+def _trace_buffer_bytes() -> int:
+    from .tracing import tracer
+
+    return tracer.memory_footprint()
+
+
+def embedding_model_bytes(loaded: Any) -> Dict[str, int]:
+    """Size of the dict ``embedding_utils`` keeps its loaded model in, by part.
+
+    The Transformers backend stores the module under ``model``; FlagEmbedding
+    wraps it in ``flag_model`` (whose ``.model`` holds the weights); ONNX
+    Runtime does not expose its arena, so an ONNX session is sized by its
+    model file plus any external weight files next to it.
+    """
+    if not isinstance(loaded, dict):
+        return {"model": module_bytes(loaded)} if loaded is not None else {}
+    parts: Dict[str, int] = {}
+    if loaded.get("model") is not None:
+        parts["model"] = module_bytes(loaded["model"])
+    if loaded.get("flag_model") is not None:
+        parts["model"] = module_bytes(loaded["flag_model"])
+    if loaded.get("session") is not None:
+        parts["model"] = onnx_model_bytes(loaded["session"])
+    if loaded.get("tokenizer") is not None:
+        parts["tokenizer"] = estimate_size(loaded["tokenizer"])
+    return parts
+
+
+def onnx_model_bytes(session: Any) -> int:
+    """Bytes of an ONNX Runtime session's model file and its external data."""
+    from pathlib import Path
+
+    path = getattr(session, "_model_path", None)
+    if not path:
+        from ..core import embedding_utils
+
+        path = Path(embedding_utils.ONNX_MODEL_PATH) / "model.onnx"
+    path = Path(path)
+    if not path.is_file():
+        return 0
+    # External weights are written next to the model as model.onnx_data, model.onnx.data, ...
+    return sum(f.stat().st_size for f in path.parent.glob(f"{path.name}*") if f.is_file())
+
+
+def _embedding_model_bytes() -> Dict[str, int]:
+    module = sys.modules.get("backend.core.embedding_utils")
+    if module is None:
+        return {}
+    return embedding_model_bytes(getattr(module, "_embedding_model", None))
+
+
+register_memory_reporter("memo_caches", _memo_cache_bytes)
+register_memory_reporter("history_buffers", _history_buffer_bytes)
+register_memory_reporter("metric_stores", _metric_store_bytes)
+register_memory_reporter("trace_buffer", _trace_buffer_bytes)
+register_memory_reporter("embedding_model", _embedding_model_bytes)
@@ -0,0 +1,339 @@
+"""
+Columnar Metric Store for Kimera SWM
+
+The monitors used to keep their history as deques of measurement dataclasses
+(or of ``{'value', 'timestamp'}`` dicts), and every trend or anomaly query
+rebuilt Python lists from them.  :class:`MetricStore` keeps each metric as a
+preallocated NumPy ring of values with a parallel ring of timestamps (epoch
+seconds), so "last N points of metric X" is at most two array slices and
+aggregate statistics are computed on arrays directly.
+
+Stores can optionally persist to append-only binary segments under
+``KIMERA_METRIC_STORE_DIR/<store name>/``.  Records are buffered and written
+in batches; on start-up the newest records (up to the ring capacity per
+metric) are loaded back so trends survive restarts.  Old segments are
+deleted once more than ``KIMERA_METRIC_SEGMENT_RETAIN`` exist.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+METRIC_STORE_CAPACITY = int(os.getenv("KIMERA_METRIC_STORE_CAPACITY", "1000"))
+METRIC_STORE_DIR = os.getenv("KIMERA_METRIC_STORE_DIR", "")
+SEGMENT_MAX_BYTES = int(os.getenv("KIMERA_METRIC_SEGMENT_BYTES", str(16 * 1024 * 1024)))
+SEGMENT_RETAIN = int(os.getenv("KIMERA_METRIC_SEGMENT_RETAIN", "8"))
+FLUSH_EVERY = int(os.getenv("KIMERA_METRIC_FLUSH_EVERY", "256"))
+
+# One on-disk record: metric id (index into metrics.txt), timestamp, value
+RECORD_DTYPE = np.dtype([("metric", "<u4"), ("ts", "<f8"), ("value", "<f8")])
+
+Timestamp = Union[None, float, datetime]
+
+
+def to_epoch(timestamp: Timestamp) -> float:
+    if timestamp is None:
+        return time.time()
+    if isinstance(timestamp, datetime):
+        return timestamp.timestamp()
+    return float(timestamp)
+
+
+def iso_timestamps(times: np.ndarray) -> List[str]:
+    """Render epoch seconds the way the monitors always have (naive local ISO)."""
+    return [datetime.fromtimestamp(t).isoformat() for t in times.tolist()]
+
+
+class MetricRing:
+    """Fixed-capacity ring of (timestamp, value) pairs for one metric."""
+
+    __slots__ = ("capacity", "_values", "_times", "_head", "_count", "total")
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._values = np.empty(self.capacity, dtype=np.float64)
+        self._times = np.empty(self.capacity, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        self.total = 0
+
+    def append(self, value: float, timestamp: float) -> None:
+        self._values[self._head] = value
+        self._times[self._head] = timestamp
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.total += 1
+
+    def extend(self, values: np.ndarray, times: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)[-self.capacity:]
+        times = np.asarray(times, dtype=np.float64)[-self.capacity:]
+        for value, ts in zip(values, times):
+            self.append(value, ts)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _tail(self, array: np.ndarray, n: Optional[int]) -> np.ndarray:
+        count = self._count if n is None else max(0, min(n, self._count))
+        start = (self._head - count) % self.capacity
+        if start + count <= self.capacity:
+            return array[start:start + count].copy()
+        return np.concatenate((array[start:], array[:self._head]))
+
+    def values(self, n: Optional[int] = None) -> np.ndarray:
+        """Last ``n`` values (all when ``None``), oldest first."""
+        return self._tail(self._values, n)
+
+    def timestamps(self, n: Optional[int] = None) -> np.ndarray:
+        return self._tail(self._times, n)
+
+    def last(self) -> Optional[float]:
+        return float(self._values[(self._head - 1) % self.capacity]) if self._count else None
+
+    def since(self, timestamp: Timestamp) -> Tuple[np.ndarray, np.ndarray]:
+        """``(timestamps, values)`` recorded at or after ``timestamp``."""
+        times = self.timestamps()
+        start = int(np.searchsorted(times, to_epoch(timestamp), side="left"))
+        return times[start:], self.values()[start:]
+
+
+class SegmentLog:
+    """Append-only binary segments of :data:`RECORD_DTYPE` records."""
+
+    def __init__(self, directory: str, max_bytes: int = SEGMENT_MAX_BYTES, retain: int = SEGMENT_RETAIN):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.retain = max(1, retain)
+        os.makedirs(directory, exist_ok=True)
+        self._names_path = os.path.join(directory, "metrics.txt")
+        self.names: List[str] = []
+        if os.path.exists(self._names_path):
+            with open(self._names_path, encoding="utf-8") as f:
+                self.names = [line.rstrip("\n") for line in f if line.strip()]
+        self._ids = {name: i for i, name in enumerate(self.names)}
+
+    def _segments(self) -> List[str]:
+        return sorted(f for f in os.listdir(self.directory) if f.startswith("segment-") and f.endswith(".bin"))
+
+    def metric_id(self, name: str) -> int:
+        metric_id = self._ids.get(name)
+        if metric_id is None:
+            metric_id = len(self.names)
+            with open(self._names_path, "a", encoding="utf-8") as f:
+                f.write(name + "\n")
+            self.names.append(name)
+            self._ids[name] = metric_id
+        return metric_id
+
+    def append(self, records: np.ndarray) -> None:
+        segments = self._segments()
+        path = os.path.join(self.directory, segments[-1]) if segments else None
+        if path is None or os.path.getsize(path) >= self.max_bytes:
+            number = int(segments[-1][8:14]) + 1 if segments else 1
+            path = os.path.join(self.directory, f"segment-{number:06d}.bin")
+            segments.append(os.path.basename(path))
+        with open(path, "ab") as f:
+            records.tofile(f)
+        for old in segments[:-self.retain]:
+            os.remove(os.path.join(self.directory, old))
+
+    def read_tail(self, capacity: int) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Newest ``capacity`` records per metric, reading segments newest first."""
+        chunks: List[np.ndarray] = []
+        counts = np.zeros(len(self.names), dtype=np.int64)
+        for segment in reversed(self._segments()):
+            path = os.path.join(self.directory, segment)
+            usable = os.path.getsize(path) // RECORD_DTYPE.itemsize  # ignore a torn final record
+            records = np.fromfile(path, dtype=RECORD_DTYPE, count=usable)
+            chunks.append(records)
+            counts += np.bincount(records["metric"], minlength=len(self.names))[:len(self.names)]
+            if counts.size and (counts >= capacity).all():
+                break
+        if not chunks:
+            return {}
+        records = np.concatenate(chunks[::-1])
+        loaded = {}
+        for metric_id, name in enumerate(self.names):
+            mine = records[records["metric"] == metric_id][-capacity:]
+            if mine.size:
+                loaded[name] = (mine["ts"], mine["value"])
+        return loaded
+
+
+class MetricStore:
+    """Named collection of :class:`MetricRing` series with optional disk segments.
+
+    Parameters
+    ----------
+    name:
+        Store name; also the segment subdirectory when persisted.
+    capacity:
+        Points kept in memory per metric (``KIMERA_METRIC_STORE_CAPACITY``).
+    directory:
+        Parent directory for segments; ``None`` keeps the store in memory.
+    """
+
+    def __init__(self, name: str, capacity: Optional[int] = None, directory: Optional[str] = None):
+        self.name = name
+        self.capacity = capacity if capacity is not None else METRIC_STORE_CAPACITY
+        self._series: Dict[str, MetricRing] = {}
+        self._lock = threading.Lock()
+        self._log = SegmentLog(os.path.join(directory, name)) if directory else None
+        self._pending: List[Tuple[int, float, float]] = []
+        if self._log is not None:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            for metric, (times, values) in self._log.read_tail(self.capacity).items():
+                self._ring(metric).extend(values, times)
+        except Exception as e:
+            logger.warning(f"Could not load metric store '{self.name}' from disk: {e}")
+
+    def _ring(self, metric: str) -> MetricRing:
+        ring = self._series.get(metric)
+        if ring is None:
+            ring = self._series[metric] = MetricRing(self.capacity)
+        return ring
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def record(self, metrics: Mapping[str, float], timestamp: Timestamp = None) -> None:
+        """Append one point per metric, all sharing ``timestamp``."""
+        ts = to_epoch(timestamp)
+        with self._lock:
+            for metric, value in metrics.items():
+                self._ring(metric).append(value, ts)
+                if self._log is not None:
+                    self._pending.append((self._log.metric_id(metric), ts, value))
+            flush = len(self._pending) >= FLUSH_EVERY
+        if flush:
+            self.flush()
+
+    def append(self, metric: str, value: float, timestamp: Timestamp = None) -> None:
+        self.record({metric: value}, timestamp)
+
+    def flush(self) -> None:
+        """Write buffered records to the current segment."""
+        if self._log is None:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return
+            try:
+                self._log.append(np.array(pending, dtype=RECORD_DTYPE))
+            except Exception as e:
+                logger.warning(f"Failed to persist {len(pending)} '{self.name}' metric records: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._pending.clear()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __contains__(self, metric: str) -> bool:
+        return metric in self._series
+
+    def __getitem__(self, metric: str) -> MetricRing:
+        return self._series[metric]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self) -> List[str]:
+        return list(self._series)
+
+    def count(self, metric: str) -> int:
+        ring = self._series.get(metric)
+        return len(ring) if ring is not None else 0
+
+    def values(self, metric: str, n: Optional[int] = None) -> np.ndarray:
+        with self._lock:
+            ring = self._series.get(metric)
+            return ring.values(n) if ring is not None else np.empty(0)
+
+    def tail(self, metric: str, n: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """``(timestamps, values)`` for the last ``n`` points of ``metric``."""
+        with self._lock:
+            ring = self._series.get(metric)
+            if ring is None:
+                return np.empty(0), np.empty(0)
+            return ring.timestamps(n), ring.values(n)
+
+    def columns(self, metrics: Iterable[str], n: Optional[int] = None,
+                timestamps_from: Optional[str] = None) -> Dict[str, np.ndarray]:
+        """Last ``n`` values of several metrics plus a ``'timestamps'`` column.
+
+        Intended for metrics recorded together (one :meth:`record` call), whose
+        rings stay aligned; timestamps come from ``timestamps_from`` or the
+        first metric.
+        """
+        metrics = list(metrics)
+        with self._lock:
+            out = {m: self._series[m].values(n) if m in self._series else np.empty(0) for m in metrics}
+            source = self._series.get(timestamps_from or (metrics[0] if metrics else ""))
+            out["timestamps"] = source.timestamps(n) if source is not None else np.empty(0)
+        return out
+
+    def memory_footprint(self) -> int:
+        """Bytes held by the preallocated ring arrays."""
+        with self._lock:
+            return sum(r._values.nbytes + r._times.nbytes for r in self._series.values())
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "name": self.name,
+                "metrics": len(self._series),
+                "capacity": self.capacity,
+                "points": sum(len(r) for r in self._series.values()),
+                "persisted": self._log is not None,
+                "pending_records": len(self._pending),
+            }
+
+
+_stores: Dict[str, MetricStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_metric_store(name: str, capacity: Optional[int] = None) -> MetricStore:
+    """Shared, named store; persisted under ``KIMERA_METRIC_STORE_DIR`` when it is set."""
+    with _stores_lock:
+        store = _stores.get(name)
+        if store is None:
+            store = _stores[name] = MetricStore(name, capacity, METRIC_STORE_DIR or None)
+        return store
+
+
+def iter_metric_stores() -> List[MetricStore]:
+    with _stores_lock:
+        return list(_stores.values())
+
+
+def get_metric_store_stats() -> Dict[str, Dict[str, object]]:
+    with _stores_lock:
+        return {name: store.stats() for name, store in _stores.items()}
+
+
+@atexit.register
+def flush_metric_stores() -> None:
+    with _stores_lock:
+        stores = list(_stores.values())
+    for store in stores:
+        store.flush()
@@ -0,0 +1,217 @@
+"""
+On-Demand Sampling Profiler for Kimera SWM
+==========================================
+
+Slow ``/system/cycle``, ``/cognitive-fields/*`` or ``/revolutionary/*`` calls
+used to require a restart with ad-hoc instrumentation.  :class:`StackSampler`
+instead samples every thread's stack with ``sys._current_frames()`` from a
+background thread and aggregates the samples into *collapsed stacks*
+(``frame;frame;frame count`` lines), the input format of flamegraph.pl,
+speedscope and similar tools.
+
+Two ways to use it (both admin-only, see ``backend/api/profiling_routes.py``):
+
+* a timed window, ``POST /profiling/window?seconds=5``, sampling whatever the
+  process does meanwhile;
+* a single request, by sending ``X-Kimera-Profiler: 1`` with the admin token;
+  :class:`ProfilingMiddleware` samples while that request runs and stores the
+  result under the id returned in the ``X-Kimera-Profile-Id`` header.
+
+Profiling is disabled unless ``KIMERA_PROFILER_TOKEN`` is set; the middleware
+is then not installed at all, so disabled profiling costs nothing.
+"""
+
+from __future__ import annotations
+
+import hmac
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILER_TOKEN = os.getenv("KIMERA_PROFILER_TOKEN", "")
+PROFILER_INTERVAL_MS = float(os.getenv("KIMERA_PROFILER_INTERVAL_MS", "5"))
+PROFILER_MAX_SECONDS = float(os.getenv("KIMERA_PROFILER_MAX_SECONDS", "60"))
+PROFILER_KEEP = int(os.getenv("KIMERA_PROFILER_KEEP", "20"))
+PROFILER_MAX_DEPTH = 128
+
+ADMIN_TOKEN_HEADER = "X-Kimera-Admin-Token"
+PROFILE_REQUEST_HEADER = "X-Kimera-Profiler"
+PROFILE_ID_HEADER = "X-Kimera-Profile-Id"
+
+
+def profiling_enabled() -> bool:
+    return bool(PROFILER_TOKEN)
+
+
+def check_admin_token(token: Optional[str]) -> bool:
+    """Constant-time comparison against ``KIMERA_PROFILER_TOKEN``."""
+    return profiling_enabled() and token is not None and hmac.compare_digest(token, PROFILER_TOKEN)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}.{code.co_name}:{code.co_firstlineno}"
+
+
+def collapse_stack(frame, max_depth: int = PROFILER_MAX_DEPTH) -> str:
+    """Render a frame chain root-first as ``a;b;c`` (semicolons are the separator)."""
+    labels: List[str] = []
+    while frame is not None and len(labels) < max_depth:
+        labels.append(_frame_label(frame).replace(";", ":"))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+@dataclass
+class Profile:
+    """Aggregated samples from one profiling session."""
+    profile_id: str
+    mode: str
+    started_at: float
+    duration: float = 0.0
+    interval_ms: float = PROFILER_INTERVAL_MS
+    samples: int = 0
+    stacks: Counter = field(default_factory=Counter)
+    label: Optional[str] = None
+
+    def collapsed(self) -> str:
+        """Collapsed-stack text, heaviest stacks first."""
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+    def summary(self, top: int = 20) -> Dict[str, object]:
+        # Self time: the leaf frame of each stack
+        leaves: Counter = Counter()
+        for stack, count in self.stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return {
+            "profile_id": self.profile_id,
+            "mode": self.mode,
+            "label": self.label,
+            "started_at": self.started_at,
+            "duration": self.duration,
+            "interval_ms": self.interval_ms,
+            "samples": self.samples,
+            "distinct_stacks": len(self.stacks),
+            "top_frames": [{"frame": frame, "samples": count} for frame, count in leaves.most_common(top)],
+        }
+
+
+class StackSampler:
+    """Samples all threads (except itself) every ``interval_ms`` until stopped."""
+
+    def __init__(self, interval_ms: float = PROFILER_INTERVAL_MS, mode: str = "window",
+                 label: Optional[str] = None):
+        self.profile = Profile(uuid.uuid4().hex[:12], mode, time.time(), interval_ms=interval_ms, label=label)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StackSampler":
+        self._thread = threading.Thread(target=self._run, name="kimera-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Profile:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.profile
+
+    def _run(self) -> None:
+        interval = self.profile.interval_ms / 1000.0
+        me = threading.get_ident()
+        names = {}
+        start = time.perf_counter()
+        deadline = start + PROFILER_MAX_SECONDS
+        while not self._stop.is_set() and time.perf_counter() < deadline:
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == me:
+                    continue
+                name = names.get(thread_id)
+                if name is None:
+                    names.update({t.ident: t.name.replace(";", ":") for t in threading.enumerate()})
+                    name = names.setdefault(thread_id, f"thread-{thread_id}")
+                self.profile.stacks[f"{name};{collapse_stack(frame)}"] += 1
+            self.profile.samples += 1
+            self._stop.wait(interval)
+        self.profile.duration = time.perf_counter() - start
+
+
+class ProfileStore:
+    """Keeps the most recent profiles by id; allows one window profile at a time."""
+
+    def __init__(self, keep: int = PROFILER_KEEP):
+        self.keep = max(1, keep)
+        self._profiles: "OrderedDict[str, Profile]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.window_lock = threading.Lock()
+
+    def add(self, profile: Profile) -> None:
+        with self._lock:
+            self._profiles[profile.profile_id] = profile
+            while len(self._profiles) > self.keep:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[Profile]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[Dict[str, object]]:
+        with self._lock:
+            profiles = list(self._profiles.values())
+        return [p.summary(top=5) for p in reversed(profiles)]
+
+
+profile_store = ProfileStore()
+
+
+class ProfilingMiddleware:
+    """Samples the process while an admin-flagged request runs.
+
+    Installed only when profiling is enabled; unflagged requests pay one
+    header scan.
+    """
+
+    def __init__(self, app, store: ProfileStore = profile_store):
+        self.app = app
+        self.store = store
+        self._flag = PROFILE_REQUEST_HEADER.lower().encode("latin-1")
+        self._token = ADMIN_TOKEN_HEADER.lower().encode("latin-1")
+        self._id_header = PROFILE_ID_HEADER.lower().encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = dict(scope.get("headers") or ())
+        if headers.get(self._flag) != b"1":
+            await self.app(scope, receive, send)
+            return
+        token = headers.get(self._token)
+        if not check_admin_token(token.decode("latin-1") if token is not None else None):
+            await self.app(scope, receive, send)
+            return
+
+        sampler = StackSampler(mode="request", label=f"{scope['method']} {scope['path']}").start()
+        profile_id = sampler.profile.profile_id
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message = dict(message)
+                message["headers"] = list(message.get("headers", [])) + [
+                    (self._id_header, profile_id.encode("latin-1"))
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            self.store.add(sampler.stop())
@@ -0,0 +1,352 @@
+"""
+Benchmark Regression Harness for Kimera SWM
+===========================================
+
+:class:`~backend.monitoring.benchmarking_suite.BenchmarkRunner` validates
+numerical behaviour, and ``scripts/performance_benchmark.py`` loads a running
+deployment over HTTP, but neither compares timings across versions.  This
+module times the hot paths in-process with fixed, seeded workloads:
+
+* micro: ``tension_detection``, ``spde_diffusion``, ``encode_batch_dummy``,
+  ``vault_insert``, ``vault_search``, ``cfd_neighbors``
+* macro: ``cognitive_cycle`` (SPDE, tension detection, encoding and scar
+  insertion together)
+
+Results are stored as JSON baselines and later runs are compared against
+them; a benchmark whose median exceeds the baseline median by more than the
+regression threshold fails the run.  Vault benchmarks run against a private
+SQLite file with the Neo4j dual-write disabled, and encoding uses the
+deterministic dummy encoder, so no services or models are needed.
+
+Drive it with ``scripts/benchmark_regression.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import platform
+import statistics
+import tempfile
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from .benchmarking_suite import BenchmarkResult
+
+logger = logging.getLogger(__name__)
+
+BENCH_BASELINE_PATH = os.getenv("KIMERA_BENCH_BASELINE", "benchmarks/baseline.json")
+BENCH_REGRESSION_THRESHOLD = float(os.getenv("KIMERA_BENCH_REGRESSION_THRESHOLD", "0.25"))
+# Slowdowns smaller than this (absolute) are treated as noise
+BENCH_MIN_DELTA_MS = float(os.getenv("KIMERA_BENCH_MIN_DELTA_MS", "0.5"))
+
+BASELINE_VERSION = 1
+
+
+@dataclass
+class RegressionBenchmark:
+    """A named workload.
+
+    ``setup(scale, stack)`` prepares state (registering any cleanup on the
+    ``ExitStack``) and returns the zero-argument callable that is timed.
+    """
+    name: str
+    kind: str
+    description: str
+    setup: Callable[[float, ExitStack], Callable[[], Any]]
+
+
+# ----------------------------------------------------------------------
+# Workloads
+# ----------------------------------------------------------------------
+
+def _geoids(count: int, dim: int = 64, seed: int = 0):
+    from ..core.geoid import GeoidState
+
+    rng = np.random.default_rng(seed)
+    keys = [f"feature_{i}" for i in range(12)]
+    geoids = []
+    for i in range(count):
+        chosen = rng.choice(keys, size=4, replace=False)
+        geoids.append(GeoidState(
+            geoid_id=f"BENCH_{i}",
+            semantic_state={k: float(rng.random()) for k in chosen},
+            symbolic_state={"type": f"t{i % 5}", "polarity": int(rng.integers(0, 2))},
+            embedding_vector=rng.normal(size=dim).tolist(),
+        ))
+    return geoids
+
+
+def _scar(index: int, geoids: List[str]):
+    from ..core.scar import ScarRecord
+
+    return ScarRecord(
+        scar_id=f"BENCH_SCAR_{index}",
+        geoids=geoids,
+        reason="benchmark",
+        timestamp=datetime.now(timezone.utc).replace(tzinfo=None).isoformat(),
+        resolved_by="regression_benchmarks",
+        pre_entropy=0.0,
+        post_entropy=0.0,
+        delta_entropy=0.0,
+        cls_angle=0.0,
+        semantic_polarity=0.0,
+        mutation_frequency=0.0,
+    )
+
+
+@contextmanager
+def dummy_encoder() -> Iterator[None]:
+    """Route ``encode_text``/``encode_batch`` through the deterministic dummy encoder."""
+    from ..core import embedding_utils
+
+    previous_model = embedding_utils._embedding_model
+    previous_lightweight = embedding_utils.LIGHTWEIGHT_MODE
+    embedding_utils._embedding_model = {"type": "dummy"}
+    embedding_utils.LIGHTWEIGHT_MODE = False
+    try:
+        yield
+    finally:
+        embedding_utils._embedding_model = previous_model
+        embedding_utils.LIGHTWEIGHT_MODE = previous_lightweight
+
+
+@contextmanager
+def isolated_vault() -> Iterator[Any]:
+    """A ``VaultManager`` bound to a throwaway SQLite file, without the Neo4j dual-write."""
+    from sqlalchemy.orm import sessionmaker
+
+    from ..vault import database, statistics as vault_statistics, vault_manager
+    from ..vault.db_engine import create_db_engine
+
+    with tempfile.TemporaryDirectory(prefix="kimera-bench-") as directory:
+        engine = create_db_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        database.Base.metadata.create_all(engine)
+        previous = vault_manager.SessionLocal, vault_manager.create_scar
+        vault_manager.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        vault_manager.create_scar = lambda *args, **kwargs: None
+        try:
+            yield vault_manager.VaultManager()
+        finally:
+            vault_manager.SessionLocal, vault_manager.create_scar = previous
+            vault_statistics.invalidate_vault_statistics()
+            engine.dispose()
+
+
+def _tension_detection(scale: float, stack: ExitStack):
+    from ..engines.contradiction_engine import ContradictionEngine
+
+    geoids = _geoids(max(2, int(120 * scale)))
+    engine = ContradictionEngine()
+    return lambda: engine.detect_tension_gradients(geoids)
+
+
+def _spde_diffusion(scale: float, stack: ExitStack):
+    from ..engines.spde import SPDE
+
+    states = [g.semantic_state for g in _geoids(max(1, int(2000 * scale)))]
+    spde = SPDE()
+    return lambda: [spde.diffuse(state) for state in states]
+
+
+def _encode_batch_dummy(scale: float, stack: ExitStack):
+    from ..core.embedding_utils import encode_batch
+
+    stack.enter_context(dummy_encoder())
+    texts = [f"benchmark sentence {i} about semantic tension" for i in range(max(2, int(256 * scale)))]
+    return lambda: encode_batch(texts)
+
+
+def _vault_insert(scale: float, stack: ExitStack):
+    vm = stack.enter_context(isolated_vault())
+    batch = max(1, int(50 * scale))
+    vector = [0.0] * 8
+    counter = iter(range(10 ** 9))
+
+    def run():
+        for _ in range(batch):
+            i = next(counter)
+            vm.insert_scar(_scar(i, [f"G{i}"]), vector)
+    return run
+
+
+def _vault_search(scale: float, stack: ExitStack):
+    vm = stack.enter_context(isolated_vault())
+    for i in range(max(1, int(1000 * scale))):
+        vm.insert_scar(_scar(i, [f"G{i}"]), [0.0] * 8)
+    return lambda: (vm.get_scars_from_vault("vault_a", limit=100), vm.get_scars_from_vault("vault_b", limit=100))
+
+
+def _cfd_neighbors(scale: float, stack: ExitStack):
+    from ..engines.cognitive_field_dynamics import CognitiveFieldDynamics
+
+    count = max(2, int(500 * scale))
+    field = CognitiveFieldDynamics(dimension=64)
+    rng = np.random.default_rng(1)
+    for i in range(count):
+        field.add_geoid(f"F{i}", rng.normal(size=64).astype(np.float32))
+    queries = [f"F{i}" for i in range(0, count, max(1, count // 20))]
+    return lambda: [field.find_semantic_neighbors(q, energy_threshold=0.1) for q in queries]
+
+
+def _cognitive_cycle(scale: float, stack: ExitStack):
+    from ..engines.contradiction_engine import ContradictionEngine
+    from ..engines.kccl import KimeraCognitiveCycle
+    from ..engines.spde import SPDE
+
+    stack.enter_context(dummy_encoder())
+    vm = stack.enter_context(isolated_vault())
+    geoids = _geoids(max(2, int(80 * scale)), seed=2)
+    system = {
+        "spde_engine": SPDE(),
+        "contradiction_engine": ContradictionEngine(),
+        "vault_manager": vm,
+        "active_geoids": {g.geoid_id: g for g in geoids},
+        "system_state": {},
+    }
+    cycle = KimeraCognitiveCycle()
+    return lambda: cycle.run_cycle(system)
+
+
+BENCHMARKS: Dict[str, RegressionBenchmark] = {
+    b.name: b for b in (
+        RegressionBenchmark("tension_detection", "micro", "Pairwise tension gradients over 120 geoids", _tension_detection),
+        RegressionBenchmark("spde_diffusion", "micro", "SPDE diffusion of 2000 semantic states", _spde_diffusion),
+        RegressionBenchmark("encode_batch_dummy", "micro", "encode_batch of 256 texts with the dummy encoder", _encode_batch_dummy),
+        RegressionBenchmark("vault_insert", "micro", "Insert 50 scars into a SQLite vault", _vault_insert),
+        RegressionBenchmark("vault_search", "micro", "Recent-scar lookups in both vaults of 1000 scars", _vault_search),
+        RegressionBenchmark("cfd_neighbors", "micro", "Semantic neighbours for 20 queries in a 500-geoid field", _cfd_neighbors),
+        RegressionBenchmark("cognitive_cycle", "macro", "Full cognitive cycle over 80 geoids", _cognitive_cycle),
+    )
+}
+
+
+# ----------------------------------------------------------------------
+# Running and comparing
+# ----------------------------------------------------------------------
+
+def run_benchmark(benchmark: RegressionBenchmark, repeat: int = 7, warmup: int = 1,
+                  scale: float = 1.0) -> BenchmarkResult:
+    """Time ``benchmark`` ``repeat`` times after ``warmup`` untimed runs."""
+    started = datetime.now()
+    parameters = {"repeat": repeat, "warmup": warmup, "scale": scale, "kind": benchmark.kind}
+    try:
+        with ExitStack() as stack:
+            run = benchmark.setup(scale, stack)
+            for _ in range(warmup):
+                run()
+            samples = []
+            for _ in range(max(1, repeat)):
+                start = time.perf_counter()
+                run()
+                samples.append(time.perf_counter() - start)
+    except Exception as e:
+        logger.error(f"Benchmark {benchmark.name} failed: {e}")
+        return BenchmarkResult(benchmark.name, started, 0.0, False, {}, parameters, error_message=str(e))
+
+    metrics = {
+        "median_s": statistics.median(samples),
+        "mean_s": statistics.fmean(samples),
+        "min_s": min(samples),
+        "max_s": max(samples),
+        "stdev_s": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+    return BenchmarkResult(benchmark.name, started, sum(samples), True, metrics, parameters)
+
+
+def run_benchmarks(names: Optional[List[str]] = None, repeat: int = 7, warmup: int = 1,
+                   scale: float = 1.0) -> Dict[str, BenchmarkResult]:
+    unknown = sorted(set(names or ()) - set(BENCHMARKS))
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+    results = {}
+    for name in names or list(BENCHMARKS):
+        logger.info(f"Running benchmark {name}")
+        results[name] = run_benchmark(BENCHMARKS[name], repeat=repeat, warmup=warmup, scale=scale)
+    return results
+
+
+def results_to_baseline(results: Dict[str, BenchmarkResult]) -> Dict[str, Any]:
+    return {
+        "version": BASELINE_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "benchmarks": {
+            name: {"kind": r.parameters.get("kind"), "parameters": r.parameters, **r.metrics}
+            for name, r in results.items() if r.success
+        },
+    }
+
+
+def save_baseline(results: Dict[str, BenchmarkResult], path: str = BENCH_BASELINE_PATH) -> Dict[str, Any]:
+    baseline = results_to_baseline(results)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+    return baseline
+
+
+def load_baseline(path: str = BENCH_BASELINE_PATH) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("version") != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version {baseline.get('version')} in {path}")
+    return baseline
+
+
+def compare_to_baseline(results: Dict[str, BenchmarkResult], baseline: Dict[str, Any],
+                        threshold: float = BENCH_REGRESSION_THRESHOLD,
+                        min_delta_ms: float = BENCH_MIN_DELTA_MS) -> Dict[str, Any]:
+    """Per-benchmark verdicts; ``passed`` is False on any regression or failed run."""
+    rows = {}
+    for name, result in results.items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if not result.success:
+            rows[name] = {"status": "error", "error": result.error_message}
+            continue
+        if reference is None:
+            rows[name] = {"status": "new", "median_s": result.metrics["median_s"]}
+            continue
+        if reference.get("parameters", {}).get("scale") != result.parameters.get("scale"):
+            rows[name] = {"status": "incomparable", "reason": "scale differs from baseline"}
+            continue
+        current, previous = result.metrics["median_s"], reference["median_s"]
+        change = (current - previous) / previous if previous > 0 else 0.0
+        regressed = change > threshold and (current - previous) * 1000.0 > min_delta_ms
+        improved = change < -threshold
+        rows[name] = {
+            "status": "regression" if regressed else "improved" if improved else "ok",
+            "median_s": current,
+            "baseline_median_s": previous,
+            "change": change,
+        }
+    return {
+        "threshold": threshold,
+        "passed": all(row["status"] not in ("regression", "error") for row in rows.values()),
+        "benchmarks": rows,
+    }
+
+
+def format_report(comparison: Dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<22} {'median':>12} {'baseline':>12} {'change':>9}  status"]
+    for name, row in comparison["benchmarks"].items():
+        median = f"{row['median_s'] * 1000:.3f}ms" if "median_s" in row else "-"
+        base = f"{row['baseline_median_s'] * 1000:.3f}ms" if "baseline_median_s" in row else "-"
+        change = f"{row['change']:+.1%}" if "change" in row else "-"
+        lines.append(f"{name:<22} {median:>12} {base:>12} {change:>9}  {row['status']}")
+    verdict = "PASS" if comparison["passed"] else "FAIL"
+    lines.append(f"{verdict} (regression threshold {comparison['threshold']:.0%})")
+    return "\n".join(lines)
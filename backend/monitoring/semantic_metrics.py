@@ -17,6 +17,8 @@ import math
 
 from ..core.geoid import GeoidState
 from ..core.models import LinguisticGeoid
+from ..core.history_buffer import HistoryBuffer
+from .metric_store import MetricStore, iso_timestamps
 
 
 @dataclass
@@ -183,9 +185,16 @@ class SemanticMetricsCollector:
     context, and observer-dependent measures.
     """
     
-    def __init__(self, history_size: int = 1000):
+    # Scalar measurement fields kept column-wise in the metric store
+    METRIC_FIELDS = ('semantic_entropy', 'semantic_complexity', 'meaning_density', 'context_coherence',
+                     'observer_dependency', 'syntax_to_semantics_ratio', 'semantic_efficiency',
+                     'ambiguity_index', 'information_utility')
+    
+    def __init__(self, history_size: int = 1000, metric_store: Optional[MetricStore] = None):
         self.history_size = history_size
-        self.measurements: List[SemanticMeasurement] = []
+        self.measurements = HistoryBuffer('semantic_measurements', capacity=history_size, spill=False)
+        # Columnar history backing trend and anomaly queries
+        self.metric_store = metric_store or MetricStore('semantic_metrics', capacity=history_size)
         self.logger = logging.getLogger(__name__)
         
         # Semantic knowledge base (can be expanded)
@@ -276,10 +285,7 @@ class SemanticMetricsCollector:
         )
         
         self.measurements.append(measurement)
-        
-        # Maintain history size
-        if len(self.measurements) > self.history_size:
-            self.measurements = self.measurements[-self.history_size:]
+        self.metric_store.record({name: getattr(measurement, name) for name in self.METRIC_FIELDS}, timestamp)
         
         # Set baseline if first measurement
         if self.baseline_measurement is None:
@@ -440,59 +446,37 @@ class SemanticMetricsCollector:
     
     def get_semantic_trends(self, window_size: int = 50) -> Dict[str, List[float]]:
         """Get semantic trends over recent measurements"""
-        if len(self.measurements) < 2:
+        if self.metric_store.count('semantic_entropy') < 2:
             return {}
         
-        recent_measurements = self.measurements[-window_size:]
-        
-        return {
-            'semantic_entropy': [m.semantic_entropy for m in recent_measurements],
-            'semantic_complexity': [m.semantic_complexity for m in recent_measurements],
-            'meaning_density': [m.meaning_density for m in recent_measurements],
-            'context_coherence': [m.context_coherence for m in recent_measurements],
-            'semantic_efficiency': [m.semantic_efficiency for m in recent_measurements],
-            'ambiguity_index': [m.ambiguity_index for m in recent_measurements],
-            'information_utility': [m.information_utility for m in recent_measurements],
-            'timestamps': [m.timestamp.isoformat() for m in recent_measurements]
-        }
+        columns = self.metric_store.columns(
+            ('semantic_entropy', 'semantic_complexity', 'meaning_density', 'context_coherence',
+             'semantic_efficiency', 'ambiguity_index', 'information_utility'), window_size
+        )
+        trends = {name: values.tolist() for name, values in columns.items() if name != 'timestamps'}
+        trends['timestamps'] = iso_timestamps(columns['timestamps'])
+        return trends
     
     def detect_semantic_anomalies(self, threshold_std: float = 2.0) -> List[Dict[str, Any]]:
         """Detect anomalous semantic measurements"""
-        if len(self.measurements) < 10:
+        if self.metric_store.count('semantic_entropy') < 10:
             return []
         
-        recent_measurements = self.measurements[-50:]  # Last 50 measurements
-        
         anomalies = []
-        
-        # Check semantic entropy anomalies
-        entropy_values = [m.semantic_entropy for m in recent_measurements]
-        entropy_mean = np.mean(entropy_values)
-        entropy_std = np.std(entropy_values)
-        
-        for measurement in recent_measurements[-5:]:  # Check last 5
-            if abs(measurement.semantic_entropy - entropy_mean) > threshold_std * entropy_std:
-                anomalies.append({
-                    'timestamp': measurement.timestamp.isoformat(),
-                    'type': 'semantic_entropy_anomaly',
-                    'value': measurement.semantic_entropy,
-                    'deviation': abs(measurement.semantic_entropy - entropy_mean) / entropy_std,
-                    'severity': 'high' if measurement.semantic_entropy > entropy_mean else 'low'
-                })
-        
-        # Check semantic efficiency anomalies
-        efficiency_values = [m.semantic_efficiency for m in recent_measurements]
-        efficiency_mean = np.mean(efficiency_values)
-        efficiency_std = np.std(efficiency_values)
-        
-        for measurement in recent_measurements[-5:]:
-            if abs(measurement.semantic_efficiency - efficiency_mean) > threshold_std * efficiency_std:
+        # Last 50 measurements, checking the last 5
+        for metric, anomaly_type in (('semantic_entropy', 'semantic_entropy_anomaly'),
+                                     ('semantic_efficiency', 'semantic_efficiency_anomaly')):
+            times, values = self.metric_store.tail(metric, 50)
+            mean, std = np.mean(values), np.std(values)
+            recent_times, recent = times[-5:], values[-5:]
+            deviations = np.abs(recent - mean)
+            for i in np.flatnonzero(deviations > threshold_std * std):
                 anomalies.append({
-                    'timestamp': measurement.timestamp.isoformat(),
-                    'type': 'semantic_efficiency_anomaly',
-                    'value': measurement.semantic_efficiency,
-                    'deviation': abs(measurement.semantic_efficiency - efficiency_mean) / efficiency_std,
-                    'severity': 'low' if measurement.semantic_efficiency < efficiency_mean else 'high'
+                    'timestamp': iso_timestamps(recent_times[i:i + 1])[0],
+                    'type': anomaly_type,
+                    'value': float(recent[i]),
+                    'deviation': float(deviations[i] / std),
+                    'severity': 'high' if recent[i] > mean else 'low'
                 })
         
         return anomalies
@@ -0,0 +1,110 @@
+"""Periodically refreshed, immutable system-status snapshots.
+
+``/system/status`` is polled continuously by the dashboard, but assembling it
+means summing entropy over every active geoid, counting both vaults, sampling
+psutil and querying CUDA.  :class:`StatusSnapshotter` does that work on a
+background thread at a fixed interval and publishes the result as an
+immutable :class:`StatusSnapshot` holding the pre-serialised JSON body, so the
+endpoint only has to hand back a reference.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+REFRESH_INTERVAL = float(os.getenv("KIMERA_STATUS_REFRESH_INTERVAL", "5"))
+
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    """One collected status payload, serialised once at collection time."""
+
+    body: bytes
+    collected_at: float
+    collection_time: float
+
+    def age(self) -> float:
+        """Seconds elapsed since the snapshot was collected."""
+        return time.time() - self.collected_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return json.loads(self.body)
+
+
+class StatusSnapshotter:
+    """Refreshes a status payload on a background thread.
+
+    Parameters
+    ----------
+    collector:
+        Blocking callable returning the JSON-serialisable status payload.
+    interval:
+        Seconds between refreshes.  ``<= 0`` disables the background thread;
+        snapshots are then only produced by explicit :meth:`refresh` calls.
+    """
+
+    def __init__(self, collector: Callable[[], Dict[str, Any]], interval: float = REFRESH_INTERVAL) -> None:
+        self.collector = collector
+        self.interval = interval
+        self._snapshot: Optional[StatusSnapshot] = None
+        self._refresh_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.refresh_count = 0
+        self.error_count = 0
+
+    @property
+    def snapshot(self) -> Optional[StatusSnapshot]:
+        """The latest published snapshot (``None`` before the first refresh)."""
+        return self._snapshot
+
+    def refresh(self) -> StatusSnapshot:
+        """Collect a new payload now and publish it (blocking)."""
+        with self._refresh_lock:
+            start = time.time()
+            payload = self.collector()
+            body = json.dumps(payload, default=str).encode("utf-8")
+            snapshot = StatusSnapshot(body=body, collected_at=start, collection_time=time.time() - start)
+            self._snapshot = snapshot
+            self.refresh_count += 1
+            return snapshot
+
+    def get(self) -> StatusSnapshot:
+        """Return the current snapshot, collecting one if none exists yet."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        return snapshot
+
+    def start(self) -> None:
+        """Start the background refresh thread."""
+        if self.interval <= 0 or (self._thread and self._thread.is_alive()):
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._refresh_loop, name="kimera-status-snapshot", daemon=True)
+        self._thread.start()
+        log.info("Status snapshotter started (interval=%.1fs)", self.interval)
+
+    def stop(self) -> None:
+        """Stop the background refresh thread."""
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        log.info("Status snapshotter stopped")
+
+    def _refresh_loop(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                self.error_count += 1
+                log.warning(f"Status snapshot refresh failed: {e}")
+            self._stop_event.wait(self.interval)
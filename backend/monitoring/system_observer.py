@@ -20,6 +20,7 @@ from ..core.models import LinguisticGeoid
 from .entropy_monitor import EntropyMonitor, EntropyMeasurement
 from .semantic_metrics import SemanticMetricsCollector, SemanticMeasurement
 from .thermodynamic_analyzer import ThermodynamicAnalyzer, ThermodynamicState
+from .metric_store import MetricStore, get_metric_store, iso_timestamps
 
 
 @dataclass
@@ -56,15 +57,23 @@ class SystemObserver:
     def __init__(self, 
                  history_size: int = 1000,
                  observation_interval: float = 1.0,
-                 vault_capacity: int = 10000):
+                 vault_capacity: int = 10000,
+                 store_prefix: Optional[str] = None):
         
         self.history_size = history_size
         self.observation_interval = observation_interval
         self.logger = logging.getLogger(__name__)
         
+        # Columnar metric history; named (shared, optionally persisted) stores when a prefix is given
+        def store(name: str) -> MetricStore:
+            if store_prefix:
+                return get_metric_store(f'{store_prefix}.{name}', history_size)
+            return MetricStore(name, capacity=history_size)
+        self.metric_store = store('observer')
+        
         # Initialize monitoring components
-        self.entropy_monitor = EntropyMonitor(history_size)
-        self.semantic_collector = SemanticMetricsCollector(history_size)
+        self.entropy_monitor = EntropyMonitor(history_size, metric_store=store('entropy'))
+        self.semantic_collector = SemanticMetricsCollector(history_size, metric_store=store('semantic'))
         self.thermodynamic_analyzer = ThermodynamicAnalyzer(history_size, vault_capacity)
         
         # System state tracking
@@ -231,6 +240,7 @@ class SystemObserver:
         
         # Store snapshot
         self.snapshots.append(snapshot)
+        self._record_columns(snapshot)
         
         # Update performance tracking
         observation_time = (datetime.now() - start_time).total_seconds()
@@ -245,6 +255,17 @@ class SystemObserver:
         
         return snapshot
     
+    def _record_columns(self, snapshot: SystemSnapshot):
+        columns = {
+            'shannon_entropy': snapshot.entropy_measurement.shannon_entropy,
+            'semantic_efficiency': snapshot.semantic_measurement.semantic_efficiency,
+            'thermodynamic_efficiency': snapshot.thermodynamic_state.efficiency,
+            'temperature': snapshot.thermodynamic_state.temperature,
+        }
+        columns.update({f'health.{name}': value for name, value in snapshot.system_health.items()
+                        if isinstance(value, (int, float, np.number))})
+        self.metric_store.record(columns, snapshot.timestamp)
+    
     def _calculate_system_health(self, 
                                entropy_measurement: EntropyMeasurement,
                                semantic_measurement: SemanticMeasurement,
@@ -253,8 +274,8 @@ class SystemObserver:
         
         # Entropy stability (lower variance = better stability)
         entropy_stability = 1.0
-        if len(self.snapshots) > 10:
-            recent_entropies = [s.entropy_measurement.shannon_entropy for s in list(self.snapshots)[-10:]]
+        if self.metric_store.count('shannon_entropy') > 10:
+            recent_entropies = self.metric_store.values('shannon_entropy', 10)
             entropy_variance = np.var(recent_entropies)
             entropy_mean = np.mean(recent_entropies)
             if entropy_mean > 0:
@@ -378,10 +399,10 @@ class SystemObserver:
     
     def get_system_summary(self, window_size: int = 100) -> Dict[str, Any]:
         """Get comprehensive system summary"""
-        if not self.snapshots:
+        observation_count = self.metric_store.count('shannon_entropy')
+        if not observation_count:
             return {}
         
-        recent_snapshots = list(self.snapshots)[-window_size:]
         
         # Aggregate metrics
         entropy_trends = self.entropy_monitor.get_entropy_trends(window_size)
@@ -389,9 +410,12 @@ class SystemObserver:
         thermodynamic_trends = self.thermodynamic_analyzer.get_thermodynamic_trends(window_size)
         
         # Calculate averages
-        avg_entropy = np.mean([s.entropy_measurement.shannon_entropy for s in recent_snapshots])
-        avg_semantic_efficiency = np.mean([s.semantic_measurement.semantic_efficiency for s in recent_snapshots])
-        avg_thermodynamic_efficiency = np.mean([s.thermodynamic_state.efficiency for s in recent_snapshots])
+        recent = self.metric_store.columns(
+            ('shannon_entropy', 'semantic_efficiency', 'thermodynamic_efficiency'), window_size
+        )
+        avg_entropy = float(np.mean(recent['shannon_entropy']))
+        avg_semantic_efficiency = float(np.mean(recent['semantic_efficiency']))
+        avg_thermodynamic_efficiency = float(np.mean(recent['thermodynamic_efficiency']))
         
         # Recent alerts
         recent_alerts = [alert for alert in self.alert_history if 
@@ -412,7 +436,7 @@ class SystemObserver:
                 'thermodynamic': thermodynamic_trends
             },
             'recent_alerts': recent_alerts,
-            'observation_count': len(self.snapshots),
+            'observation_count': observation_count,
             'avg_observation_time': np.mean(list(self.observation_times)) if self.observation_times else 0.0,
             'last_observation': self.last_observation.isoformat() if self.last_observation else None
         }
@@ -462,6 +486,21 @@ class SystemObserver:
                 ],
                 'alerts': list(self.alert_history)
             }
+        elif format == 'columns':
+            # Columnar export straight from the metric stores (includes history loaded from disk)
+            def export(store: MetricStore, clock: str) -> Dict[str, Any]:
+                columns = {name: store.values(name).tolist() for name in store.keys()}
+                columns['timestamps'] = iso_timestamps(store.tail(clock)[0])
+                return columns
+            return {
+                'metadata': {
+                    'export_timestamp': datetime.now().isoformat(),
+                    'total_observations': self.metric_store.count('shannon_entropy')
+                },
+                'observer': export(self.metric_store, 'shannon_entropy'),
+                'entropy': export(self.entropy_monitor.metric_store, 'shannon_entropy'),
+                'semantic': export(self.semantic_collector.metric_store, 'semantic_entropy')
+            }
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
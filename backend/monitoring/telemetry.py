@@ -2,13 +2,24 @@
 
 Exposes runtime metrics such as active geoids, cycle count, and vault pressure
 at `/telemetry/metrics` in Prometheus text format.
+
+:class:`RequestMetricsMiddleware` adds request-level metrics: latency per
+templated route and status code, in-flight requests per route, and request /
+response payload sizes.  Routes are labelled by their path template
+(``/geoids/{geoid_id}``), never the raw path, and unmatched paths share one
+label, so label cardinality is bounded by the route table.
 """
 from __future__ import annotations
 
+from collections import OrderedDict
 from fastapi import APIRouter, Response
-from prometheus_client import CollectorRegistry, Gauge, generate_latest, CONTENT_TYPE_LATEST
-from typing import Dict, Any
+from prometheus_client import CollectorRegistry, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
+from starlette.routing import Match
+from typing import Dict, Any, Optional, Tuple
 import logging
+import os
+import threading
+import time
 
 log = logging.getLogger(__name__)
 
@@ -21,6 +32,145 @@ REGISTRY = CollectorRegistry()
 ACTIVE_GEOIDS = Gauge("kimera_active_geoids", "Number of active geoids", registry=REGISTRY)
 CYCLE_COUNT = Gauge("kimera_cycle_count", "Total cognitive cycles processed", registry=REGISTRY)
 VAULT_PRESSURE = Gauge("kimera_vault_pressure", "Vault memory pressure", registry=REGISTRY)
+DB_POOL_CHECKED_OUT = Gauge("kimera_db_pool_checked_out", "Database connections currently in use", registry=REGISTRY)
+DB_POOL_SIZE = Gauge("kimera_db_pool_size", "Persistent database connections in the pool", registry=REGISTRY)
+DB_POOL_OVERFLOW = Gauge("kimera_db_pool_overflow", "Overflow database connections currently open", registry=REGISTRY)
+DB_POOL_UTILIZATION = Gauge("kimera_db_pool_utilization", "Checked-out connections / pool capacity", registry=REGISTRY)
+MEMO_CACHE_HITS = Gauge("kimera_memo_cache_hits", "Memo cache hits", ["cache"], registry=REGISTRY)
+MEMO_CACHE_MISSES = Gauge("kimera_memo_cache_misses", "Memo cache misses", ["cache"], registry=REGISTRY)
+MEMO_CACHE_SIZE = Gauge("kimera_memo_cache_size", "Entries held by the memo cache", ["cache"], registry=REGISTRY)
+MEMO_CACHE_HIT_RATE = Gauge("kimera_memo_cache_hit_rate", "Memo cache hits / lookups", ["cache"], registry=REGISTRY)
+MEMORY_COMPONENT_BYTES = Gauge("kimera_memory_component_bytes", "Approximate bytes held by a component",
+                               ["component"], registry=REGISTRY)
+MEMORY_COMPONENT_PEAK_BYTES = Gauge("kimera_memory_component_peak_bytes",
+                                    "High-water mark of a component's approximate bytes", ["component"],
+                                    registry=REGISTRY)
+PROCESS_RSS_BYTES = Gauge("kimera_process_rss_bytes", "Resident set size of the API process", registry=REGISTRY)
+PROCESS_PEAK_RSS_BYTES = Gauge("kimera_process_peak_rss_bytes", "Peak resident set size of the API process",
+                               registry=REGISTRY)
+
+
+def _buckets(env_var: str, default: str) -> Tuple[float, ...]:
+    """Parse comma-separated histogram bucket boundaries from the environment."""
+    raw = os.getenv(env_var, default)
+    try:
+        return tuple(sorted(float(b) for b in raw.split(",") if b.strip()))
+    except ValueError:
+        log.warning("Invalid %s=%r, using defaults", env_var, raw)
+        return tuple(float(b) for b in default.split(","))
+
+
+HTTP_LATENCY_BUCKETS = _buckets(
+    "KIMERA_HTTP_LATENCY_BUCKETS", "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10,30"
+)
+HTTP_SIZE_BUCKETS = _buckets("KIMERA_HTTP_SIZE_BUCKETS", "100,1000,10000,100000,1000000,10000000")
+HTTP_ROUTE_CACHE_SIZE = int(os.getenv("KIMERA_HTTP_ROUTE_CACHE_SIZE", "2048"))
+
+# Route label for requests that match no route (404 scans must not add label values)
+UNMATCHED_ROUTE = "<unmatched>"
+_KNOWN_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"}
+
+# Request metrics
+HTTP_REQUEST_DURATION = Histogram(
+    "kimera_http_request_duration_seconds", "HTTP request latency",
+    ["method", "route", "status"], buckets=HTTP_LATENCY_BUCKETS, registry=REGISTRY,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "kimera_http_requests_in_progress", "HTTP requests currently being served",
+    ["method", "route"], registry=REGISTRY,
+)
+HTTP_REQUEST_SIZE = Histogram(
+    "kimera_http_request_size_bytes", "HTTP request body size",
+    ["method", "route"], buckets=HTTP_SIZE_BUCKETS, registry=REGISTRY,
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "kimera_http_response_size_bytes", "HTTP response body size",
+    ["method", "route"], buckets=HTTP_SIZE_BUCKETS, registry=REGISTRY,
+)
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware recording per-route request metrics.
+
+    The route template is resolved before the request is dispatched (so the
+    in-flight gauge can be labelled by route) by matching the application's
+    route table; resolutions are memoised per ``(method, path)``.
+    """
+
+    def __init__(self, app, route_cache_size: int = HTTP_ROUTE_CACHE_SIZE):
+        self.app = app
+        self.route_cache_size = route_cache_size
+        self._routes: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve_route(self, scope) -> str:
+        key = (scope["method"], scope["path"])
+        with self._lock:
+            route = self._routes.get(key)
+            if route is not None:
+                self._routes.move_to_end(key)
+                return route
+
+        route = UNMATCHED_ROUTE
+        app = scope.get("app")
+        for candidate in getattr(getattr(app, "router", None), "routes", ()):
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                route = candidate.path
+                break
+            if match == Match.PARTIAL and route == UNMATCHED_ROUTE:
+                route = candidate.path  # path matched, method did not (405)
+
+        with self._lock:
+            self._routes[key] = route
+            while len(self._routes) > self.route_cache_size:
+                self._routes.popitem(last=False)
+        return route
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"] if scope["method"] in _KNOWN_METHODS else "OTHER"
+        route = self.resolve_route(scope)
+        status = 500
+        request_bytes = 0
+        response_bytes = 0
+
+        async def counting_receive():
+            nonlocal request_bytes
+            message = await receive()
+            if message["type"] == "http.request":
+                request_bytes += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message):
+            nonlocal status, response_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                response_bytes += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method, route=route)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            HTTP_REQUEST_DURATION.labels(method=method, route=route, status=str(status)).observe(
+                time.perf_counter() - start
+            )
+            in_progress.dec()
+            # Prefer the declared length: handlers that never read the body still have one
+            declared = dict(scope.get("headers") or ()).get(b"content-length")
+            try:
+                request_bytes = int(declared) if declared is not None else request_bytes
+            except ValueError:
+                pass
+            HTTP_REQUEST_SIZE.labels(method=method, route=route).observe(request_bytes)
+            HTTP_RESPONSE_SIZE.labels(method=method, route=route).observe(response_bytes)
 
 
 # Helper ---------------------------------------------------------------------
@@ -33,10 +183,51 @@ def update_metrics(system: Dict[str, Any]) -> None:  # noqa: D401
         # Example vault pressure: scars / cache size (mocked if absent)
         vp = system.get("system_state", {}).get("vault_pressure", 0.0)
         VAULT_PRESSURE.set(vp)
+        update_pool_metrics()
+        update_cache_metrics()
+        update_memory_metrics()
     except Exception as exc:  # pragma: no cover
         log.warning("Failed to update telemetry metrics: %s", exc)
 
 
+def update_pool_metrics() -> None:
+    """Update database connection-pool gauges from the shared engine."""
+    from ..vault.db_engine import get_pool_status
+
+    status = get_pool_status()
+    if "checked_out" in status:
+        DB_POOL_CHECKED_OUT.set(status["checked_out"])
+        DB_POOL_SIZE.set(status["size"])
+        DB_POOL_OVERFLOW.set(max(status["overflow"], 0))
+        DB_POOL_UTILIZATION.set(status["utilization"])
+
+
+def update_cache_metrics() -> None:
+    """Update memo-cache gauges for every registered cache."""
+    from ..core.memo_cache import get_memo_cache_stats
+
+    for name, stats in get_memo_cache_stats().items():
+        MEMO_CACHE_HITS.labels(cache=name).set(stats["hits"])
+        MEMO_CACHE_MISSES.labels(cache=name).set(stats["misses"])
+        MEMO_CACHE_SIZE.labels(cache=name).set(stats["size"])
+        MEMO_CACHE_HIT_RATE.labels(cache=name).set(stats["hit_rate"])
+
+
+def update_memory_metrics() -> None:
+    """Update per-component memory gauges (and their high-water marks)."""
+    from .memory_accounting import memory_snapshot
+
+    snapshot = memory_snapshot()
+    for name, component in snapshot["components"].items():
+        MEMORY_COMPONENT_BYTES.labels(component=name).set(component["bytes"])
+        MEMORY_COMPONENT_PEAK_BYTES.labels(component=name).set(component["peak_bytes"])
+    process = snapshot["process"]
+    if "rss_bytes" in process:
+        PROCESS_RSS_BYTES.set(process["rss_bytes"])
+    if "peak_rss_bytes" in process:
+        PROCESS_PEAK_RSS_BYTES.set(process["peak_rss_bytes"])
+
+
 def get_system_metrics() -> Dict[str, Any]:
     """Get current system metrics for monitoring."""
     try:
@@ -68,4 +259,20 @@ async def metrics_endpoint() -> Response:  # noqa: D401
 
     update_metrics(kimera_system)
     data = generate_latest(REGISTRY)
-    return Response(content=data, media_type=CONTENT_TYPE_LATEST) 
\ No newline at end of file
+    return Response(content=data, media_type=CONTENT_TYPE_LATEST)
+
+
+@router.get("/traces")
+async def traces_endpoint(limit: int = 20, name: Optional[str] = None) -> Dict[str, Any]:
+    """Most recent in-process traces (e.g. ``name=cognitive_cycle``), newest first."""
+    from .tracing import tracer
+
+    return {"enabled": tracer.enabled, "traces": tracer.recent_traces(limit=limit, name=name)}
+
+
+@router.get("/traces/summary")
+async def trace_summary_endpoint(name: Optional[str] = None) -> Dict[str, Any]:
+    """Per-span-name duration statistics across the buffered traces."""
+    from .tracing import tracer
+
+    return {"enabled": tracer.enabled, "phases": tracer.phase_summary(name=name)}
@@ -0,0 +1,203 @@
+"""
+In-Process Tracing for Kimera SWM
+=================================
+
+The cognitive cycle reports only aggregate counts, so it is impossible to tell
+which phase (SPDE diffusion, tension detection, scar creation, encoding,
+meta-insight generation) dominates cycle time as the geoid count grows.
+
+This module provides lightweight spans:
+
+    with span("cognitive_cycle", geoids=n):
+        with span("spde_diffusion"):
+            ...
+
+Spans nest through a context variable; when a root span ends its trace (the
+root plus every descendant) is pushed into an in-memory ring buffer served at
+``/telemetry/traces`` and, if ``KIMERA_TRACE_FILE`` is set, appended to that
+file as one JSON line.  :meth:`Tracer.phase_summary` aggregates span
+durations by name across the buffered traces.
+
+With ``KIMERA_TRACING_ENABLED=false`` :func:`span` yields a shared no-op span.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TRACING_ENABLED = os.getenv("KIMERA_TRACING_ENABLED", "true").lower() in ("1", "true", "yes")
+TRACE_BUFFER_SIZE = int(os.getenv("KIMERA_TRACE_BUFFER", "200"))
+TRACE_FILE = os.getenv("KIMERA_TRACE_FILE", "")
+# Children beyond this many per trace are counted but not kept (bounds tight loops)
+MAX_SPANS_PER_TRACE = int(os.getenv("KIMERA_TRACE_MAX_SPANS", "1000"))
+
+
+@dataclass
+class Span:
+    """One timed operation; ``duration_ms`` is set when it ends."""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start_time: float = field(default_factory=time.time)
+    duration_ms: Optional[float] = None
+    status: str = "ok"
+    error: Optional[str] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    def set(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _NoopSpan:
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+@dataclass
+class _TraceState:
+    root: Span
+    spans: List[Span] = field(default_factory=list)
+    dropped: int = 0
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar("kimera_span", default=None)
+_current_trace: contextvars.ContextVar[Optional[_TraceState]] = contextvars.ContextVar("kimera_trace", default=None)
+
+
+class Tracer:
+    """Collects finished traces into a ring buffer and an optional JSON-lines file."""
+
+    def __init__(self, buffer_size: int = TRACE_BUFFER_SIZE, trace_file: str = TRACE_FILE,
+                 enabled: bool = TRACING_ENABLED):
+        self.enabled = enabled
+        self.trace_file = trace_file
+        self._traces: deque = deque(maxlen=max(1, buffer_size))
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Any]:
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+
+        parent = _current_span.get()
+        trace = _current_trace.get()
+        is_root = parent is None or trace is None
+        current = Span(
+            name=name,
+            trace_id=uuid.uuid4().hex[:16] if is_root else parent.trace_id,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=None if is_root else parent.span_id,
+            attributes=dict(attributes),
+        )
+        if is_root:
+            trace = _TraceState(root=current)
+            trace_token = _current_trace.set(trace)
+        span_token = _current_span.set(current)
+        start = time.perf_counter()
+        try:
+            yield current
+        except BaseException as e:
+            current.status = "error"
+            current.error = f"{type(e).__name__}: {e}"[:200]
+            raise
+        finally:
+            current.duration_ms = (time.perf_counter() - start) * 1000.0
+            _current_span.reset(span_token)
+            if is_root:
+                _current_trace.reset(trace_token)
+                self._finish_trace(trace)
+            elif len(trace.spans) < MAX_SPANS_PER_TRACE:
+                trace.spans.append(current)
+            else:
+                trace.dropped += 1
+
+    def _finish_trace(self, trace: _TraceState) -> None:
+        record = {
+            "trace_id": trace.root.trace_id,
+            "name": trace.root.name,
+            "start_time": trace.root.start_time,
+            "duration_ms": trace.root.duration_ms,
+            "status": trace.root.status,
+            "dropped_spans": trace.dropped,
+            "spans": [trace.root.to_dict()] + [s.to_dict() for s in trace.spans],
+        }
+        with self._lock:
+            self._traces.append(record)
+        if self.trace_file:
+            try:
+                with open(self.trace_file, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, default=str) + "\n")
+            except OSError as e:
+                logger.warning(f"Could not write trace to {self.trace_file}: {e}")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def recent_traces(self, limit: int = 20, name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent traces first, optionally only those whose root is ``name``."""
+        with self._lock:
+            traces = list(self._traces)
+        if name is not None:
+            traces = [t for t in traces if t["name"] == name]
+        return traces[::-1][:max(0, limit)]
+
+    def phase_summary(self, name: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """Duration statistics per span name across the buffered traces."""
+        durations: Dict[str, List[float]] = {}
+        for trace in self.recent_traces(limit=len(self._traces), name=name):
+            for s in trace["spans"]:
+                durations.setdefault(s["name"], []).append(s["duration_ms"])
+        summary = {}
+        for span_name, values in durations.items():
+            values = np.asarray(values)
+            summary[span_name] = {
+                "count": int(values.size),
+                "total_ms": float(values.sum()),
+                "mean_ms": float(values.mean()),
+                "p95_ms": float(np.percentile(values, 95)),
+                "max_ms": float(values.max()),
+            }
+        return summary
+
+    def memory_footprint(self) -> int:
+        """Approximate bytes held by the buffered traces."""
+        from .memory_accounting import estimate_size
+
+        with self._lock:
+            traces = list(self._traces)
+        return estimate_size(traces)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+
+tracer = Tracer()
+
+
+def span(name: str, **attributes: Any):
+    """Open a span on the process-wide tracer (see module docstring)."""
+    return tracer.span(name, **attributes)
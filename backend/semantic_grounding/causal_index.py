@@ -0,0 +1,291 @@
+"""
+Causal Chain Index
+Incrementally maintained reachability and strongest-chain lookups for the
+causal knowledge graph
+"""
+
+import heapq
+import itertools
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+Node = Hashable
+Chain = Tuple[Tuple[Node, ...], float]
+
+EFFECTS = "effects"  # follow edges forward: concept -> ... -> effect
+CAUSES = "causes"    # follow edges backward: cause -> ... -> concept
+
+
+class CausalIndex:
+    """
+    Index over a weighted causal graph, kept current as relations are added.
+
+    Maintains the strongly connected components and the condensation DAG
+    between them incrementally: an edge between two components either adds a
+    DAG edge or, when it closes a cycle, merges the components on that cycle.
+    Whole-graph reachability is answered from the condensation, bounded-depth
+    reachability and the top-k strongest chains (by product of edge weights)
+    are computed on first request and cached until a new relation can change
+    the answer.
+
+    Edge weights are causal strengths in ``[0, 1]``, so extending a chain can
+    never make it stronger; the best-first chain search relies on this.
+    """
+
+    def __init__(self):
+        self._succ: Dict[Node, Dict[Node, float]] = {}
+        self._pred: Dict[Node, Dict[Node, float]] = {}
+
+        # Strongly connected components and the condensation DAG
+        self._component: Dict[Node, int] = {}
+        self._members: Dict[int, Set[Node]] = {}
+        self._dag_succ: Dict[int, Set[int]] = {}
+        self._dag_pred: Dict[int, Set[int]] = {}
+        self._component_ids = itertools.count()
+
+        # Component -> all components reachable from it (lazily filled)
+        self._closure: Dict[int, Set[int]] = {}
+
+        # (direction, node) -> {(kind, depth, k): result}
+        self._queries: Dict[Tuple[str, Node], Dict[Tuple, object]] = {}
+        self._max_cached_depth = 0
+
+    # -- updates ---------------------------------------------------------
+
+    def add_node(self, node: Node) -> None:
+        if node in self._succ:
+            return
+        self._succ[node] = {}
+        self._pred[node] = {}
+        component = next(self._component_ids)
+        self._component[node] = component
+        self._members[component] = {node}
+        self._dag_succ[component] = set()
+        self._dag_pred[component] = set()
+
+    def add_relation(self, cause: Node, effect: Node, weight: float) -> None:
+        """Add (or re-weight) the edge ``cause -> effect``."""
+        if not 0.0 <= weight <= 1.0:
+            raise ValueError(f"Causal strength must be within [0, 1], got {weight}")
+        self.add_node(cause)
+        self.add_node(effect)
+
+        if self._succ[cause].get(effect) == weight:
+            return
+        is_new = effect not in self._succ[cause]
+        self._succ[cause][effect] = weight
+        self._pred[effect][cause] = weight
+
+        if is_new and cause != effect:
+            self._link_components(self._component[cause], self._component[effect])
+        self._invalidate(cause, effect)
+
+    def _link_components(self, source: int, target: int) -> None:
+        if source == target or target in self._dag_succ[source]:
+            return
+
+        forward = self._dag_walk(target, self._dag_succ)
+        if source not in forward:
+            self._dag_succ[source].add(target)
+            self._dag_pred[target].add(source)
+            # Everything that reached ``source`` now also reaches ``target``'s closure
+            for component, reachable in self._closure.items():
+                if component == source or source in reachable:
+                    reachable |= forward
+            return
+
+        # The new edge closes a cycle: merge every component on a path target ->* source
+        backward = self._dag_walk(source, self._dag_pred, within=forward)
+        self._merge(forward & backward)
+
+    def _merge(self, cycle: Set[int]) -> None:
+        merged = next(self._component_ids)
+        members: Set[Node] = set()
+        for component in cycle:
+            members |= self._members.pop(component)
+        succ = set().union(*(self._dag_succ.pop(c) for c in cycle)) - cycle
+        pred = set().union(*(self._dag_pred.pop(c) for c in cycle)) - cycle
+
+        for node in members:
+            self._component[node] = merged
+        self._members[merged] = members
+        self._dag_succ[merged] = succ
+        self._dag_pred[merged] = pred
+        for component in succ:
+            self._dag_pred[component] = (self._dag_pred[component] - cycle) | {merged}
+        for component in pred:
+            self._dag_succ[component] = (self._dag_succ[component] - cycle) | {merged}
+        # Merges are rare; rebuilding closures on demand is simpler than patching them
+        self._closure.clear()
+
+    def _invalidate(self, cause: Node, effect: Node) -> None:
+        """Drop cached queries that a new ``cause -> effect`` edge can change.
+
+        A forward query from ``a`` with depth ``d`` can only use the edge if
+        ``cause`` is within ``d - 1`` steps of ``a``; symmetrically for
+        backward queries and ``effect``.
+        """
+        if not self._queries:
+            return
+        horizon = max(self._max_cached_depth - 1, 0)
+        for node in self._bfs(cause, self._pred, horizon):
+            self._queries.pop((EFFECTS, node), None)
+        for node in self._bfs(effect, self._succ, horizon):
+            self._queries.pop((CAUSES, node), None)
+
+    # -- structure -------------------------------------------------------
+
+    def __contains__(self, node: Node) -> bool:
+        return node in self._succ
+
+    def __len__(self) -> int:
+        return len(self._succ)
+
+    def component_of(self, node: Node) -> int:
+        """Id of the strongly connected component containing ``node``."""
+        return self._component[node]
+
+    def strongly_connected_components(self) -> List[Set[Node]]:
+        return [set(members) for members in self._members.values()]
+
+    def condensation(self) -> Dict[int, Set[int]]:
+        """The condensation DAG as ``{component: successor components}``."""
+        return {component: set(succ) for component, succ in self._dag_succ.items()}
+
+    # -- reachability ----------------------------------------------------
+
+    def has_path(self, source: Node, target: Node) -> bool:
+        """Whether ``target`` is reachable from ``source`` (a node reaches itself)."""
+        if source not in self._succ or target not in self._succ:
+            return False
+        if source == target:
+            return True
+        source_component = self._component[source]
+        target_component = self._component[target]
+        if source_component == target_component:
+            return True
+        return target_component in self._descendant_components(source_component)
+
+    def descendants(self, node: Node) -> Set[Node]:
+        """All nodes reachable from ``node``, excluding ``node`` itself."""
+        component = self._component[node]
+        reachable = set(self._members[component]) if len(self._members[component]) > 1 else set()
+        for other in self._descendant_components(component):
+            reachable |= self._members[other]
+        reachable.discard(node)
+        return reachable
+
+    def reachable(self, node: Node, max_depth: int, direction: str = EFFECTS) -> Dict[Node, int]:
+        """Nodes within ``max_depth`` steps of ``node`` mapped to their distance.
+
+        ``direction`` is ``"effects"`` to follow edges forward or ``"causes"``
+        to follow them backward.  ``node`` itself is not included.
+        """
+        if node not in self._succ:
+            return {}
+
+        def compute() -> Dict[Node, int]:
+            distances = self._bfs(node, self._adjacency(direction), max_depth)
+            distances.pop(node, None)
+            return distances
+
+        return dict(self._cached(direction, node, ("reachable", max_depth, None), compute))
+
+    def _descendant_components(self, component: int) -> Set[int]:
+        closure = self._closure.get(component)
+        if closure is None:
+            closure = self._dag_walk(component, self._dag_succ)
+            closure.discard(component)
+            self._closure[component] = closure
+        return closure
+
+    # -- chains ----------------------------------------------------------
+
+    def strongest_chains(self, node: Node, direction: str = EFFECTS,
+                         max_depth: int = 3, k: int = 10) -> List[Chain]:
+        """
+        The ``k`` strongest simple chains of 1..``max_depth`` relations.
+
+        Args:
+            node: Concept the chains start from (``"effects"``) or end at
+                (``"causes"``)
+            direction: ``"effects"`` or ``"causes"``
+            max_depth: Maximum number of relations in a chain
+            k: Number of chains to return
+
+        Returns:
+            ``(path, strength)`` pairs, strongest first, with each path
+            ordered from cause to effect and strength the product of the
+            relation weights along it
+        """
+        if node not in self._succ or k <= 0 or max_depth <= 0:
+            return []
+        key = ("chains", max_depth, k)
+        return list(self._cached(direction, node, key, lambda: self._search(node, direction, max_depth, k)))
+
+    def _search(self, node: Node, direction: str, max_depth: int, k: int) -> List[Chain]:
+        # Best-first over partial chains: with weights in [0, 1] a chain is
+        # never stronger than its prefix, so chains pop in strength order and
+        # the first k popped are the answer.
+        adjacency = self._adjacency(direction)
+        order = itertools.count()
+        heap: List[Tuple[float, int, Tuple[Node, ...]]] = []
+        for neighbour, weight in adjacency[node].items():
+            if neighbour != node:
+                heapq.heappush(heap, (-weight, next(order), (node, neighbour)))
+
+        chains: List[Chain] = []
+        while heap and len(chains) < k:
+            negative, _, path = heapq.heappop(heap)
+            strength = -negative
+            chains.append((path if direction == EFFECTS else path[::-1], strength))
+            if len(path) > max_depth:
+                continue
+            for neighbour, weight in adjacency[path[-1]].items():
+                if neighbour not in path:
+                    heapq.heappush(heap, (-(strength * weight), next(order), path + (neighbour,)))
+        return chains
+
+    # -- helpers ---------------------------------------------------------
+
+    def _adjacency(self, direction: str) -> Dict[Node, Dict[Node, float]]:
+        if direction == EFFECTS:
+            return self._succ
+        if direction == CAUSES:
+            return self._pred
+        raise ValueError(f"Unknown direction '{direction}'")
+
+    def _cached(self, direction: str, node: Node, key: Tuple, compute):
+        self._adjacency(direction)  # validate before caching anything
+        entries = self._queries.setdefault((direction, node), {})
+        if key not in entries:
+            entries[key] = compute()
+            self._max_cached_depth = max(self._max_cached_depth, key[1])
+        return entries[key]
+
+    @staticmethod
+    def _bfs(start: Node, adjacency: Dict[Node, Dict[Node, float]], max_depth: int) -> Dict[Node, int]:
+        distances = {start: 0}
+        frontier = deque([start])
+        while frontier:
+            current = frontier.popleft()
+            depth = distances[current]
+            if depth >= max_depth:
+                continue
+            for neighbour in adjacency.get(current, ()):
+                if neighbour not in distances:
+                    distances[neighbour] = depth + 1
+                    frontier.append(neighbour)
+        return distances
+
+    @staticmethod
+    def _dag_walk(start: int, edges: Dict[int, Set[int]], within: Optional[Iterable[int]] = None) -> Set[int]:
+        allowed = set(within) if within is not None else None
+        seen = {start}
+        stack = [start]
+        while stack:
+            for nxt in edges[stack.pop()]:
+                if nxt not in seen and (allowed is None or nxt in allowed):
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return seen
@@ -7,10 +7,14 @@ import numpy as np
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass
 from datetime import datetime
-import networkx as nx
 import logging
 from collections import defaultdict
 
+from ..core.lazy_loading import lazy_import
+from .causal_index import CAUSES, EFFECTS, CausalIndex
+
+nx = lazy_import("networkx")
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -58,6 +62,9 @@ class CausalReasoningEngine:
         # Causal knowledge graph
         self.causal_graph = nx.DiGraph()
         
+        # Reachability and strongest-chain index, updated with every relation
+        self.causal_index = CausalIndex()
+        
         # Mechanism database
         self.mechanisms = {}
         
@@ -139,11 +146,7 @@ class CausalReasoningEngine:
         )
         
         # Add to graph
-        self.causal_graph.add_edge(
-            cause, effect,
-            relation=relation,
-            weight=strength
-        )
+        self._store_relation(relation)
         
         # Store mechanism details
         self.mechanisms[mechanism] = {
@@ -154,6 +157,15 @@ class CausalReasoningEngine:
             'temporal_lag': temporal_lag
         }
     
+    def _store_relation(self, relation: CausalRelation):
+        """Add a relation to the causal graph and keep the chain index current"""
+        self.causal_graph.add_edge(
+            relation.cause, relation.effect,
+            relation=relation,
+            weight=relation.strength
+        )
+        self.causal_index.add_relation(relation.cause, relation.effect, relation.strength)
+    
     def identify_causes_effects(self, concept: str, 
                               context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -284,9 +296,7 @@ class CausalReasoningEngine:
     def _is_plausible_cause(self, potential_cause: str, effect: str) -> bool:
         """Check if a causal relationship is plausible"""
         # Check if there's already a path in the graph
-        if (potential_cause in self.causal_graph and 
-            effect in self.causal_graph and
-            nx.has_path(self.causal_graph, potential_cause, effect)):
+        if self.causal_index.has_path(potential_cause, effect):
             return True
         
         # Apply domain heuristics
@@ -328,50 +338,24 @@ class CausalReasoningEngine:
         return base_confidence
     
     def _find_causal_chains(self, concept: str, max_depth: int = 3) -> List[Dict[str, Any]]:
-        """Find causal chains involving the concept"""
+        """Find the strongest causal chains involving the concept"""
         chains = []
         
-        if concept not in self.causal_graph:
+        if concept not in self.causal_index:
             return chains
         
-        # Find chains where concept is the effect
-        for source in self.causal_graph.nodes():
-            if source != concept:
-                try:
-                    paths = list(nx.all_simple_paths(
-                        self.causal_graph, source, concept, cutoff=max_depth
-                    ))
-                    for path in paths:
-                        if len(path) > 1:
-                            chain = self._build_causal_chain(path)
-                            if chain:
-                                chains.append({
-                                    'type': 'causes_of',
-                                    'chain': chain,
-                                    'path': chain.get_path()
-                                })
-                except nx.NetworkXNoPath:
-                    continue
-        
-        # Find chains where concept is the cause
-        for target in self.causal_graph.nodes():
-            if target != concept:
-                try:
-                    paths = list(nx.all_simple_paths(
-                        self.causal_graph, concept, target, cutoff=max_depth
-                    ))
-                    for path in paths:
-                        if len(path) > 1:
-                            chain = self._build_causal_chain(path)
-                            if chain:
-                                chains.append({
-                                    'type': 'effects_of',
-                                    'chain': chain,
-                                    'path': chain.get_path()
-                                })
-                except nx.NetworkXNoPath:
-                    continue
+        # Chains where concept is the effect, then where it is the cause
+        for chain_type, direction in (('causes_of', CAUSES), ('effects_of', EFFECTS)):
+            for path, _ in self.causal_index.strongest_chains(concept, direction, max_depth, k=10):
+                chain = self._build_causal_chain(list(path))
+                if chain:
+                    chains.append({
+                        'type': chain_type,
+                        'chain': chain,
+                        'path': chain.get_path()
+                    })
         
+        chains.sort(key=lambda c: c['chain'].total_strength, reverse=True)
         return chains[:10]  # Limit to 10 most relevant chains
     
     def _build_causal_chain(self, path: List[str]) -> Optional[CausalChain]:
@@ -438,7 +422,7 @@ class CausalReasoningEngine:
             
             # Find all effects that would be prevented
             if removed_concept in self.causal_graph:
-                for successor in nx.descendants(self.causal_graph, removed_concept):
+                for successor in self.causal_index.descendants(removed_concept):
                     # Check if there are alternative paths
                     alt_paths = self._find_alternative_paths(removed_concept, successor)
                     
@@ -647,11 +631,7 @@ class CausalReasoningEngine:
                         discovered.append(new_relation)
                         
                         # Add to graph
-                        self.causal_graph.add_edge(
-                            cause_candidate, effect_candidate,
-                            relation=new_relation,
-                            weight=new_relation.strength
-                        )
+                        self._store_relation(new_relation)
         
         return discovered
     
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, String, Float, JSON, DateTime
+from sqlalchemy import Column, Integer, String, Float, JSON, DateTime
 from sqlalchemy.orm import sessionmaker, declarative_base
 try:
     from pgvector.sqlalchemy import Vector
@@ -6,16 +6,11 @@ except Exception:  # pragma: no cover - allows sqlite tests without pgvector
     Vector = None  # type: ignore
 from datetime import datetime
 from ..core.constants import EMBEDDING_DIM
-import os
+from .db_engine import get_engine, resolve_database_url
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./kimera_swm.db")
+DATABASE_URL = resolve_database_url()
 
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
-if DATABASE_URL.startswith("postgresql"):
-    from sqlalchemy import text
-    with engine.connect() as conn:
-        conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+engine = get_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -73,6 +68,16 @@ class InsightDB(Base):
     last_reinforced_cycle = Column(String)
 
 
+
+class EngineHistoryDB(Base):
+    """Compact rows for history entries evicted from in-memory engine ring buffers."""
+    __tablename__ = "engine_history"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    buffer_name = Column(String, index=True)
+    summary = Column(JSON)
+    evicted_at = Column(DateTime, default=datetime.utcnow, index=True)
+
 # Create tables if they don't exist
 Base.metadata.create_all(bind=engine)
 
@@ -0,0 +1,147 @@
+"""Single SQLAlchemy engine factory for the Kimera vault.
+
+Every module that talks to the relational store (``backend.vault.database``,
+``backend.vault.enhanced_database_schema``, the API layer) obtains its engine
+from :func:`get_engine`, so one process holds exactly one connection pool per
+database URL.
+
+Pool behaviour is configured through the environment:
+
+``KIMERA_DB_POOL_SIZE``       persistent connections kept in the pool (default 10)
+``KIMERA_DB_MAX_OVERFLOW``    extra connections allowed under burst (default 20)
+``KIMERA_DB_POOL_TIMEOUT``    seconds to wait for a free connection (default 30)
+``KIMERA_DB_POOL_RECYCLE``    recycle connections older than N seconds (default 1800)
+``KIMERA_SQLITE_BUSY_TIMEOUT`` seconds SQLite waits on a locked database (default 30)
+
+SQLite connections are switched to WAL journaling with ``synchronous=NORMAL``
+so readers never block the single writer and concurrent writers wait on the
+busy timeout instead of failing with "database is locked".
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine, make_url
+
+log = logging.getLogger(__name__)
+
+DEFAULT_DATABASE_URL = "sqlite:///./kimera_swm.db"
+
+POOL_SIZE = int(os.getenv("KIMERA_DB_POOL_SIZE", "10"))
+MAX_OVERFLOW = int(os.getenv("KIMERA_DB_MAX_OVERFLOW", "20"))
+POOL_TIMEOUT = float(os.getenv("KIMERA_DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("KIMERA_DB_POOL_RECYCLE", "1800"))
+SQLITE_BUSY_TIMEOUT = float(os.getenv("KIMERA_SQLITE_BUSY_TIMEOUT", "30"))
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def resolve_database_url(url: Optional[str] = None) -> str:
+    """Return ``url`` or the configured ``DATABASE_URL`` (with the shared default)."""
+    return url or os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL)
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    database = make_url(url).database
+    return database in (None, "", ":memory:") or "mode=memory" in url
+
+
+def _install_sqlite_pragmas(engine: Engine, *, wal: bool) -> None:
+    busy_ms = int(SQLITE_BUSY_TIMEOUT * 1000)
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):  # noqa: ANN001
+        cursor = dbapi_connection.cursor()
+        try:
+            if wal:
+                cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={busy_ms}")
+        finally:
+            cursor.close()
+
+
+def create_db_engine(url: Optional[str] = None, **overrides: Any) -> Engine:
+    """Build a new engine with Kimera's pooling and dialect settings.
+
+    Prefer :func:`get_engine`; this is exposed for scripts and tests that need
+    an engine which is not shared with the rest of the process.
+    """
+    url = resolve_database_url(url)
+    kwargs: Dict[str, Any] = {"pool_pre_ping": True}
+
+    if url.startswith("sqlite"):
+        memory = _is_sqlite_memory(url)
+        kwargs["connect_args"] = {"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT}
+        if not memory:
+            kwargs.update(pool_size=POOL_SIZE, max_overflow=MAX_OVERFLOW, pool_timeout=POOL_TIMEOUT)
+    else:
+        kwargs.update(
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT,
+            pool_recycle=POOL_RECYCLE,
+        )
+    kwargs.update(overrides)
+
+    engine = create_engine(url, **kwargs)
+
+    if url.startswith("sqlite"):
+        _install_sqlite_pragmas(engine, wal=not _is_sqlite_memory(url))
+    elif url.startswith("postgresql"):
+        # Ensure the pg_vector extension is enabled for PostgreSQL
+        with engine.connect() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
+            conn.commit()
+
+    log.info("Created database engine for %s (pool_size=%s, max_overflow=%s)",
+             engine.url.render_as_string(hide_password=True),
+             kwargs.get("pool_size", "n/a"), kwargs.get("max_overflow", "n/a"))
+    return engine
+
+
+def get_engine(url: Optional[str] = None) -> Engine:
+    """Return the process-wide engine for ``url`` (created on first use)."""
+    url = resolve_database_url(url)
+    engine = _engines.get(url)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(url)
+            if engine is None:
+                engine = create_db_engine(url)
+                _engines[url] = engine
+    return engine
+
+
+def get_pool_status(engine: Optional[Engine] = None) -> Dict[str, Any]:
+    """Report connection-pool utilisation for ``engine`` (default: shared engine)."""
+    engine = engine or get_engine()
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    size = getattr(pool, "size", None)
+    if callable(size):
+        checked_out = pool.checkedout()
+        capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=checked_out,
+            overflow=pool.overflow(),
+            capacity=capacity,
+            utilization=round(checked_out / capacity, 4) if capacity else 0.0,
+        )
+    return status
+
+
+def dispose_engines() -> None:
+    """Dispose every cached engine (used on shutdown and in tests)."""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
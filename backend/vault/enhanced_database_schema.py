@@ -3,7 +3,7 @@ Enhanced Database Schema for Genuine Understanding Architecture
 Bridges current implementation toward roadmap vision
 """
 
-from sqlalchemy import create_engine, Column, String, Float, JSON, DateTime, Boolean, Text, Integer
+from sqlalchemy import Column, String, Float, JSON, DateTime, Boolean, Text, Integer, Index
 from sqlalchemy.orm import sessionmaker, declarative_base, relationship
 from sqlalchemy.dialects.postgresql import ARRAY
 try:
@@ -12,12 +12,11 @@ except Exception:
     Vector = None
 from datetime import datetime
 from ..core.constants import EMBEDDING_DIM
-import os
+from .db_engine import get_engine, resolve_database_url
 
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./kimera_swm.db")
+DATABASE_URL = resolve_database_url()
 
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+engine = get_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -65,6 +64,11 @@ class MultimodalGroundingDB(Base):
 class CausalRelationshipDB(Base):
     """Tracks genuine causal relationships, not just correlations"""
     __tablename__ = "causal_relationships"
+    __table_args__ = (
+        # Chain traversal follows the strongest relations leaving a concept
+        Index("ix_causal_relationships_cause_strength", "cause_concept_id", "causal_strength"),
+        Index("ix_causal_relationships_effect_strength", "effect_concept_id", "causal_strength"),
+    )
     
     relationship_id = Column(String, primary_key=True, index=True)
     cause_concept_id = Column(String, index=True)
@@ -462,4 +466,8 @@ class ConsciousnessIndicatorDB(Base):
 # ============================================================================
 # Create all tables defined in this schema
 # ============================================================================
-Base.metadata.create_all(bind=engine)
\ No newline at end of file
+Base.metadata.create_all(bind=engine)
+
+# create_all skips tables that already exist, so add newer indexes to older databases
+for index in CausalRelationshipDB.__table__.indexes:
+    index.create(bind=engine, checkfirst=True)
@@ -0,0 +1,96 @@
+"""Constant-memory streaming export of vault tables.
+
+Rows are read with keyset pagination on the primary key (``WHERE pk > :last
+ORDER BY pk LIMIT :page``), one short-lived session per page, so exporting a
+million-row vault never holds more than ``page_size`` rows in memory and never
+pays the growing cost of ``OFFSET`` scans.
+
+:func:`iter_export_rows` yields plain JSON-ready dicts; :func:`iter_ndjson`
+wraps it into newline-delimited JSON byte lines suitable for a streaming HTTP
+response or a file.
+"""
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from sqlalchemy import select
+
+from . import database as models
+
+DEFAULT_PAGE_SIZE = 1000
+
+# table name -> (model attribute in ``database``, timestamp column or None, has vault_id)
+EXPORT_TABLES: Dict[str, tuple] = {
+    "geoids": ("GeoidDB", None, False),
+    "scars": ("ScarDB", "timestamp", True),
+    "insights": ("InsightDB", "created_at", False),
+}
+
+
+def _to_jsonable(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "tolist"):  # pgvector / numpy arrays
+        return value.tolist()
+    return value
+
+
+def iter_export_rows(
+    table: str,
+    *,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    vault_id: Optional[str] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    session_factory: Optional[Callable] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Return an iterator over every row of ``table`` as a dict, paging by primary key.
+
+    Arguments are validated eagerly, before the first page is read.
+
+    :raises ValueError: for an unknown table or a filter the table cannot honour.
+    """
+    if table not in EXPORT_TABLES:
+        raise ValueError(f"Unknown table '{table}'. Choose from: {', '.join(EXPORT_TABLES)}")
+    model_name, ts_name, has_vault = EXPORT_TABLES[table]
+    if (since or until) and ts_name is None:
+        raise ValueError(f"Table '{table}' has no timestamp column; time filters are not supported")
+    if vault_id and not has_vault:
+        raise ValueError(f"Table '{table}' is not partitioned by vault")
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+
+    sql_table = getattr(models, model_name).__table__
+    pk = sql_table.primary_key.columns.values()[0]
+
+    stmt = select(*sql_table.columns)
+    if since is not None:
+        stmt = stmt.where(sql_table.c[ts_name] >= since)
+    if until is not None:
+        stmt = stmt.where(sql_table.c[ts_name] < until)
+    if vault_id:
+        stmt = stmt.where(sql_table.c.vault_id == vault_id)
+    stmt = stmt.order_by(pk).limit(page_size)
+
+    return _paginate(stmt, pk, page_size, session_factory or models.SessionLocal)
+
+
+def _paginate(stmt, pk, page_size: int, session_factory: Callable) -> Iterator[Dict[str, Any]]:
+    last_key = None
+    while True:
+        page_stmt = stmt if last_key is None else stmt.where(pk > last_key)
+        with session_factory() as db:
+            rows = db.execute(page_stmt).mappings().all()
+        for row in rows:
+            yield {key: _to_jsonable(value) for key, value in row.items()}
+        if len(rows) < page_size:
+            return
+        last_key = rows[-1][pk.name]
+
+
+def iter_ndjson(table: str, **filters: Any) -> Iterator[bytes]:
+    """Return an iterator of ``table`` rows as newline-delimited JSON byte lines."""
+    rows = iter_export_rows(table, **filters)
+    return (json.dumps(row, default=str).encode("utf-8") + b"\n" for row in rows)
@@ -0,0 +1,73 @@
+"""Aggregated, briefly cached vault statistics.
+
+Status and dashboard endpoints used to issue one ``COUNT(*)`` per table (and
+one per vault) on every poll.  :func:`count_rows` folds any number of table
+counts into a single ``SELECT`` of scalar subqueries and
+:func:`vault_scar_counts` counts both scar vaults with one ``GROUP BY``;
+:func:`vault_summary` returns the per-vault scar counts and the geoid count
+that status endpoints report, again in one statement.
+
+Results are kept in the ``vault_statistics`` memo cache for
+``KIMERA_VAULT_STATS_TTL`` seconds so dashboards can poll cheaply; writers call
+:func:`invalidate_vault_statistics` so their own changes show up immediately.
+"""
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, Dict, Hashable, Iterable
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from ..core.memo_cache import MemoCache
+from .database import GeoidDB, ScarDB
+
+VAULT_STATS_TTL = float(os.getenv("KIMERA_VAULT_STATS_TTL", "2"))
+
+VAULT_IDS = ("vault_a", "vault_b")
+
+_cache = MemoCache("vault_statistics", maxsize=32, ttl=VAULT_STATS_TTL)
+
+
+def count_rows(db: Session, models: Iterable[Any]) -> Dict[str, int]:
+    """Row counts for several tables in one round trip, keyed by table name."""
+    models = list(models)
+    if not models:
+        return {}
+    columns = [
+        select(func.count()).select_from(model).scalar_subquery().label(model.__tablename__)
+        for model in models
+    ]
+    row = db.execute(select(*columns)).one()
+    return {model.__tablename__: int(count or 0) for model, count in zip(models, row)}
+
+
+def vault_scar_counts(db: Session) -> Dict[str, int]:
+    """Scar counts for every vault (``vault_a``/``vault_b`` always present)."""
+    rows = db.execute(select(ScarDB.vault_id, func.count()).group_by(ScarDB.vault_id)).all()
+    counts = {vault_id: 0 for vault_id in VAULT_IDS}
+    counts.update({vault_id: int(count) for vault_id, count in rows if vault_id is not None})
+    return counts
+
+
+def vault_summary(db: Session) -> Dict[str, int]:
+    """``vault_a_scars``, ``vault_b_scars`` and ``total_geoids`` in one query."""
+    def scars_in(vault_id: str):
+        return select(func.count()).select_from(ScarDB).where(ScarDB.vault_id == vault_id).scalar_subquery()
+
+    row = db.execute(select(
+        scars_in("vault_a").label("vault_a_scars"),
+        scars_in("vault_b").label("vault_b_scars"),
+        select(func.count()).select_from(GeoidDB).scalar_subquery().label("total_geoids"),
+    )).one()
+    return {key: int(value or 0) for key, value in row._mapping.items()}
+
+
+def cached_statistics(key: Hashable, compute: Callable[[], Any]) -> Any:
+    """Return the cached value for ``key`` or compute and cache it."""
+    value, _ = _cache.get_or_compute(key, compute)
+    return value
+
+
+def invalidate_vault_statistics() -> None:
+    _cache.clear()
@@ -13,6 +13,10 @@ import numpy as np
 from ..core.scar import ScarRecord
 from ..core.geoid import GeoidState
 from .database import SessionLocal
+from .causal_chains import (
+    CAUSAL_CHAIN_FAN_OUT, CAUSAL_CHAIN_LIMIT, CAUSAL_CHAIN_MIN_STRENGTH, fetch_causal_chain
+)
+from .statistics import cached_statistics, count_rows, invalidate_vault_statistics, vault_summary
 from .enhanced_database_schema import (
     MultimodalGroundingDB, CausalRelationshipDB, SelfModelDB, 
     IntrospectionLogDB, CompositionSemanticDB, ConceptualAbstractionDB,
@@ -107,41 +111,29 @@ class UnderstandingVaultManager:
             
         return relationship_id
     
-    def get_causal_chain(self, concept_id: str, max_depth: int = 3) -> Dict[str, Any]:
-        """Retrieve the causal chain for a concept (what causes it, what it causes)."""
+    def get_causal_chain(
+        self,
+        concept_id: str,
+        max_depth: int = 3,
+        fan_out: int = CAUSAL_CHAIN_FAN_OUT,
+        min_strength: float = CAUSAL_CHAIN_MIN_STRENGTH,
+        limit: int = CAUSAL_CHAIN_LIMIT
+    ) -> Dict[str, Any]:
+        """Retrieve the causal chain for a concept (what causes it, what it causes).
+        
+        Walks up to ``max_depth`` relations in both directions in a single
+        recursive query (see ``backend/vault/causal_chains.py``); depth-1
+        entries are the direct causes and effects.
+        """
         
         with SessionLocal() as db:
-            # Find what causes this concept
-            causes = db.query(CausalRelationshipDB).filter(
-                CausalRelationshipDB.effect_concept_id == concept_id
-            ).all()
-            
-            # Find what this concept causes
-            effects = db.query(CausalRelationshipDB).filter(
-                CausalRelationshipDB.cause_concept_id == concept_id
-            ).all()
+            chain = fetch_causal_chain(db, concept_id, max_depth, fan_out, min_strength, limit)
             
-            return {
-                "concept_id": concept_id,
-                "causes": [
-                    {
-                        "cause_id": c.cause_concept_id,
-                        "strength": c.causal_strength,
-                        "mechanism": c.mechanism_description,
-                        "delay": c.causal_delay
-                    }
-                    for c in causes
-                ],
-                "effects": [
-                    {
-                        "effect_id": e.effect_concept_id,
-                        "strength": e.causal_strength,
-                        "mechanism": e.mechanism_description,
-                        "delay": e.causal_delay
-                    }
-                    for e in effects
-                ]
-            }
+        return {
+            "concept_id": concept_id,
+            "causes": chain["causes"],
+            "effects": chain["effects"]
+        }
     
     # ========================================================================
     # PHASE 2: Genuine Self-Model Construction
@@ -590,52 +582,65 @@ class UnderstandingVaultManager:
     def get_understanding_metrics(self) -> Dict[str, Any]:
         """Get comprehensive metrics about the system's understanding capabilities."""
         
-        with SessionLocal() as db:
-            # Count various understanding components
-            multimodal_groundings = db.query(MultimodalGroundingDB).count()
-            causal_relationships = db.query(CausalRelationshipDB).count()
-            self_models = db.query(SelfModelDB).count()
-            abstract_concepts = db.query(ConceptualAbstractionDB).count()
-            genuine_opinions = db.query(GenuineOpinionDB).count()
-            values = db.query(ValueSystemDB).count()
-            
-            # Get recent test results
-            recent_tests = db.query(UnderstandingTestDB).order_by(
-                UnderstandingTestDB.created_at.desc()
-            ).limit(10).all()
-            
-            # Calculate understanding progression
-            avg_test_accuracy = np.mean([t.accuracy_score for t in recent_tests]) if recent_tests else 0.0
-            avg_understanding_quality = np.mean([t.understanding_quality for t in recent_tests]) if recent_tests else 0.0
-            
-            return {
-                "understanding_components": {
-                    "multimodal_groundings": multimodal_groundings,
-                    "causal_relationships": causal_relationships,
-                    "self_models": self_models,
-                    "abstract_concepts": abstract_concepts,
-                    "genuine_opinions": genuine_opinions,
-                    "learned_values": values
-                },
-                "understanding_quality": {
-                    "average_test_accuracy": avg_test_accuracy,
-                    "average_understanding_quality": avg_understanding_quality,
-                    "introspection_accuracy_trend": self.introspection_accuracy_history[-5:],
-                    "tests_passed": sum(1 for t in recent_tests if t.passed),
-                    "total_tests": len(recent_tests)
-                },
-                "consciousness_indicators": {
-                    "self_model_versions": self.current_self_model_version,
-                    "introspection_logs": len(self.introspection_accuracy_history),
-                    "understanding_depth_trend": [t.understanding_quality for t in recent_tests[-5:]]
-                },
-                "roadmap_progress": {
-                    "phase_1_multimodal": min(multimodal_groundings / 100, 1.0),  # Target: 100 groundings
-                    "phase_2_self_awareness": min(self_models / 10, 1.0),  # Target: 10 self-models
-                    "phase_3_understanding": min(abstract_concepts / 50, 1.0),  # Target: 50 concepts
-                    "phase_4_opinions": min(genuine_opinions / 20, 1.0)  # Target: 20 opinions
-                }
+        # Component counts and recent tests come from one aggregated query plus
+        # one test query, cached for KIMERA_VAULT_STATS_TTL seconds
+        snapshot = cached_statistics("understanding_metrics", self._load_understanding_snapshot)
+        counts = snapshot["counts"]
+        recent_tests = snapshot["recent_tests"]
+        
+        multimodal_groundings = counts[MultimodalGroundingDB.__tablename__]
+        causal_relationships = counts[CausalRelationshipDB.__tablename__]
+        self_models = counts[SelfModelDB.__tablename__]
+        abstract_concepts = counts[ConceptualAbstractionDB.__tablename__]
+        genuine_opinions = counts[GenuineOpinionDB.__tablename__]
+        values = counts[ValueSystemDB.__tablename__]
+        
+        # Calculate understanding progression
+        avg_test_accuracy = np.mean([t["accuracy_score"] for t in recent_tests]) if recent_tests else 0.0
+        avg_understanding_quality = np.mean([t["understanding_quality"] for t in recent_tests]) if recent_tests else 0.0
+        
+        return {
+            "understanding_components": {
+                "multimodal_groundings": multimodal_groundings,
+                "causal_relationships": causal_relationships,
+                "self_models": self_models,
+                "abstract_concepts": abstract_concepts,
+                "genuine_opinions": genuine_opinions,
+                "learned_values": values
+            },
+            "understanding_quality": {
+                "average_test_accuracy": avg_test_accuracy,
+                "average_understanding_quality": avg_understanding_quality,
+                "introspection_accuracy_trend": self.introspection_accuracy_history[-5:],
+                "tests_passed": sum(1 for t in recent_tests if t["passed"]),
+                "total_tests": len(recent_tests)
+            },
+            "consciousness_indicators": {
+                "self_model_versions": self.current_self_model_version,
+                "introspection_logs": len(self.introspection_accuracy_history),
+                "understanding_depth_trend": [t["understanding_quality"] for t in recent_tests[-5:]]
+            },
+            "roadmap_progress": {
+                "phase_1_multimodal": min(multimodal_groundings / 100, 1.0),  # Target: 100 groundings
+                "phase_2_self_awareness": min(self_models / 10, 1.0),  # Target: 10 self-models
+                "phase_3_understanding": min(abstract_concepts / 50, 1.0),  # Target: 50 concepts
+                "phase_4_opinions": min(genuine_opinions / 20, 1.0)  # Target: 20 opinions
             }
+        }
+    
+    def _load_understanding_snapshot(self) -> Dict[str, Any]:
+        """Table counts (one query of scalar subqueries) and the last ten test results."""
+        with SessionLocal() as db:
+            counts = count_rows(db, (
+                MultimodalGroundingDB, CausalRelationshipDB, SelfModelDB,
+                ConceptualAbstractionDB, GenuineOpinionDB, ValueSystemDB,
+            ))
+            recent_tests = db.query(
+                UnderstandingTestDB.accuracy_score,
+                UnderstandingTestDB.understanding_quality,
+                UnderstandingTestDB.passed,
+            ).order_by(UnderstandingTestDB.created_at.desc()).limit(10).all()
+        return {"counts": counts, "recent_tests": [dict(row._mapping) for row in recent_tests]}
     
     # ========================================================================
     # Helper Methods
@@ -806,6 +811,12 @@ class UnderstandingVaultManager:
         from .database import ScarDB
         with SessionLocal() as db:
             return db.query(ScarDB).filter(ScarDB.vault_id == vault_id).count()
+    def get_vault_statistics(self) -> Dict[str, int]:
+        """Per-vault scar counts and the geoid count from one cached query."""
+        def compute() -> Dict[str, int]:
+            with SessionLocal() as db:
+                return vault_summary(db)
+        return dict(cached_statistics("vault_summary", compute))
     def insert_scar(self, scar: ScarRecord, vector: List[float]) -> ScarRecord:
         """Insert a SCAR into the database."""
         from .database import ScarDB
@@ -831,6 +842,7 @@ class UnderstandingVaultManager:
             db.add(scar_db)
             db.commit()
             db.refresh(scar_db)
+            invalidate_vault_statistics()
             # Also create enhanced SCAR
             self.create_understanding_scar(
                 scar,
@@ -885,4 +897,5 @@ class UnderstandingVaultManager:
                     scar.vault_id = target_vault
                     moved += 1
                 db.commit()
+                invalidate_vault_statistics()
             return moved
\ No newline at end of file
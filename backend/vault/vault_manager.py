@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Tuple
 from datetime import datetime
 from sqlalchemy import func
 import math
@@ -7,6 +7,8 @@ import math
 from ..core.scar import ScarRecord
 from ..core.geoid import GeoidState
 from .database import SessionLocal, ScarDB, GeoidDB
+from .export import iter_export_rows
+from .statistics import cached_statistics, invalidate_vault_statistics, vault_scar_counts, vault_summary
 import uuid
 from ..graph.models import create_scar, create_geoid
 
@@ -27,9 +29,9 @@ class VaultManager:
 
     def _select_vault(self) -> str:
         """Choose a vault based on current counts."""
-        a_count = self.get_total_scar_count("vault_a")
-        b_count = self.get_total_scar_count("vault_b")
-        return "vault_a" if a_count <= b_count else "vault_b"
+        with SessionLocal() as db:
+            counts = vault_scar_counts(db)
+        return "vault_a" if counts["vault_a"] <= counts["vault_b"] else "vault_b"
 
     def get_all_geoids(self) -> List[GeoidState]:
         """
@@ -62,6 +64,22 @@ class VaultManager:
                     pass  # don't block SQLite retrieval if Neo4j down
             return geoids
 
+    def iter_geoids(self, page_size: int = 500) -> Iterator[GeoidState]:
+        """
+        Streams geoids from the database in primary-key order, ``page_size`` rows at a time.
+
+        Unlike :meth:`get_all_geoids` this holds at most one page in memory and
+        does not dual-write to Neo4j, so it is safe for very large vaults.
+        """
+        for row in iter_export_rows("geoids", page_size=page_size):
+            yield GeoidState(
+                geoid_id=row["geoid_id"],
+                semantic_state=row["semantic_state_json"] or {},
+                symbolic_state=row["symbolic_state"] or {},
+                embedding_vector=row["semantic_vector"] or [],
+                metadata=row["metadata_json"] or {},
+            )
+
     def insert_scar(self, scar: ScarRecord, vector: List[float], db: Session = None):
         """
         Inserts a new SCAR into the database and vector index,
@@ -108,6 +126,7 @@ class VaultManager:
         db.add(scar_db)
         db.commit()
         db.refresh(scar_db)
+        invalidate_vault_statistics()
         # --- async write to Neo4j (fire-and-forget) ---
         try:
             create_scar({
@@ -140,6 +159,17 @@ class VaultManager:
         with SessionLocal() as db:
             return db.query(ScarDB).filter(ScarDB.vault_id == vault_id).count()
 
+    def get_vault_statistics(self) -> Dict[str, int]:
+        """Per-vault scar counts and the geoid count from one cached query.
+
+        Intended for status endpoints; values may lag writes from other
+        processes by up to ``KIMERA_VAULT_STATS_TTL`` seconds.
+        """
+        def compute() -> Dict[str, int]:
+            with SessionLocal() as db:
+                return vault_summary(db)
+        return dict(cached_statistics("vault_summary", compute))
+
     def get_total_scar_weight(self, vault_id: str) -> float:
         """Return the sum of scar weights in the given vault."""
         with SessionLocal() as db:
@@ -226,5 +256,6 @@ class VaultManager:
             except Exception:
                 db.rollback()
                 raise
+        invalidate_vault_statistics()
         return moved
 
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Run in-process benchmarks and compare them with a stored JSON baseline.
+
+Usage:
+    python scripts/benchmark_regression.py --save-baseline          # record benchmarks/baseline.json
+    python scripts/benchmark_regression.py                          # compare; exit 1 on regression
+    python scripts/benchmark_regression.py --only tension_detection spde_diffusion --threshold 0.5
+    python scripts/benchmark_regression.py --list
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault("ENABLE_JOBS", "0")
+
+from backend.monitoring.regression_benchmarks import (
+    BENCH_BASELINE_PATH,
+    BENCH_MIN_DELTA_MS,
+    BENCH_REGRESSION_THRESHOLD,
+    BENCHMARKS,
+    compare_to_baseline,
+    format_report,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run (default: all)")
+    parser.add_argument("--baseline", default=BENCH_BASELINE_PATH, help="Baseline JSON path")
+    parser.add_argument("--save-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=BENCH_REGRESSION_THRESHOLD,
+                        help="Allowed relative slowdown of the median (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=BENCH_MIN_DELTA_MS,
+                        help="Ignore slowdowns smaller than this many milliseconds")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--scale", type=float, default=1.0, help="Workload size multiplier")
+    parser.add_argument("--json", dest="json_output", help="Also write the comparison report to this file")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for name, benchmark in BENCHMARKS.items():
+            print(f"{name:<22} {benchmark.kind:<6} {benchmark.description}")
+        return 0
+
+    logging.basicConfig(level=logging.WARNING)
+    results = run_benchmarks(args.only, repeat=args.repeat, warmup=args.warmup, scale=args.scale)
+
+    if args.save_baseline:
+        failed = [name for name, r in results.items() if not r.success]
+        save_baseline(results, args.baseline)
+        for name, r in results.items():
+            print(f"{name:<22} {r.metrics['median_s'] * 1000:.3f}ms" if r.success else f"{name:<22} ERROR {r.error_message}")
+        print(f"Baseline written to {args.baseline}")
+        return 1 if failed else 0
+
+    try:
+        baseline = load_baseline(args.baseline)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; run with --save-baseline first", file=sys.stderr)
+        return 2
+
+    comparison = compare_to_baseline(results, baseline, threshold=args.threshold, min_delta_ms=args.min_delta_ms)
+    print(format_report(comparison))
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(comparison, f, indent=2)
+    return 0 if comparison["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Stream vault tables to NDJSON with constant memory.
+
+Usage:
+    python scripts/export_vault.py scars --vault vault_a --since 2025-06-01 -o scars.ndjson
+    python scripts/export_vault.py geoids > geoids.ndjson
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT_DIR)
+
+from backend.vault.export import DEFAULT_PAGE_SIZE, EXPORT_TABLES, iter_ndjson
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("table", choices=sorted(EXPORT_TABLES))
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Inclusive ISO lower bound on row timestamp")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Exclusive ISO upper bound on row timestamp")
+    parser.add_argument("--vault", dest="vault_id", help="Only export scars from this vault")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    args = parser.parse_args()
+
+    try:
+        lines = iter_ndjson(
+            args.table,
+            since=args.since,
+            until=args.until,
+            vault_id=args.vault_id,
+            page_size=args.page_size,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    out = open(args.output, "wb") if args.output else sys.stdout.buffer
+    count = 0
+    try:
+        for line in lines:
+            out.write(line)
+            count += 1
+    finally:
+        if args.output:
+            out.close()
+    print(f"Exported {count} {args.table} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
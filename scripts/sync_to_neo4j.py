@@ -2,55 +2,39 @@
 """
 Synchronize existing SQLite data to Neo4j
 
-This script reads all existing SCARs and Geoids from SQLite and 
-creates corresponding nodes and relationships in Neo4j.
+This script streams all existing SCARs and Geoids from the vault database
+(keyset-paginated, constant memory) and creates corresponding nodes and
+relationships in Neo4j.
 """
 
 import os
 import sys
-import sqlite3
-import json
-from datetime import datetime
 
 # Add project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from backend.graph.models import create_geoid, create_scar
+from backend.vault.export import iter_export_rows
 
 def sync_sqlite_to_neo4j():
     """Sync all SQLite data to Neo4j"""
     print("🔄 Synchronizing SQLite data to Neo4j...")
     
     try:
-        # Connect to SQLite
-        conn = sqlite3.connect("kimera_swm.db")
-        cursor = conn.cursor()
-        
         # First, sync all Geoids
         print("\n📊 Syncing Geoids...")
-        cursor.execute("""
-            SELECT geoid_id, symbolic_state, metadata_json, semantic_state_json, semantic_vector
-            FROM geoids
-        """)
-        
-        geoids = cursor.fetchall()
         geoid_count = 0
         
-        for geoid_id, symbolic_json, metadata_json, semantic_json, vector_json in geoids:
+        for row in iter_export_rows("geoids"):
+            geoid_id = row["geoid_id"]
             try:
-                # Parse JSON fields
-                symbolic_state = json.loads(symbolic_json) if symbolic_json else {}
-                metadata = json.loads(metadata_json) if metadata_json else {}
-                semantic_state = json.loads(semantic_json) if semantic_json else {}
-                semantic_vector = json.loads(vector_json) if vector_json else []
-                
                 # Create geoid properties
                 props = {
                     "geoid_id": geoid_id,
-                    "symbolic_state": symbolic_state,
-                    "metadata": metadata,
-                    "semantic_state": semantic_state,
-                    "semantic_vector": semantic_vector[:10]  # Store only first 10 dims for Neo4j
+                    "symbolic_state": row["symbolic_state"] or {},
+                    "metadata": row["metadata_json"] or {},
+                    "semantic_state": row["semantic_state_json"] or {},
+                    "semantic_vector": (row["semantic_vector"] or [])[:10]  # Store only first 10 dims for Neo4j
                 }
                 
                 # Create in Neo4j
@@ -67,39 +51,20 @@ def sync_sqlite_to_neo4j():
         
         # Then, sync all SCARs
         print("\n📊 Syncing SCARs...")
-        cursor.execute("""
-            SELECT scar_id, geoids, reason, timestamp, resolved_by,
-                   pre_entropy, post_entropy, delta_entropy, cls_angle,
-                   semantic_polarity, mutation_frequency, weight, vault_id
-            FROM scars
-        """)
-        
-        scars = cursor.fetchall()
         scar_count = 0
+        scar_fields = (
+            "scar_id", "geoids", "reason", "timestamp", "resolved_by",
+            "pre_entropy", "post_entropy", "delta_entropy", "cls_angle",
+            "semantic_polarity", "mutation_frequency", "weight", "vault_id",
+        )
         
-        for scar in scars:
+        for row in iter_export_rows("scars"):
+            scar_id = row["scar_id"]
+            reason = row["reason"]
             try:
-                scar_id, geoids_json, reason, timestamp, resolved_by, pre_e, post_e, delta_e, cls_angle, sem_pol, mut_freq, weight, vault_id = scar
-                
-                # Parse geoids
-                geoids = json.loads(geoids_json) if geoids_json else []
-                
                 # Create scar properties
-                props = {
-                    "scar_id": scar_id,
-                    "geoids": geoids,
-                    "reason": reason,
-                    "timestamp": timestamp,
-                    "resolved_by": resolved_by,
-                    "pre_entropy": pre_e,
-                    "post_entropy": post_e,
-                    "delta_entropy": delta_e,
-                    "cls_angle": cls_angle,
-                    "semantic_polarity": sem_pol,
-                    "mutation_frequency": mut_freq,
-                    "weight": weight,
-                    "vault_id": vault_id
-                }
+                props = {field: row[field] for field in scar_fields}
+                props["geoids"] = props["geoids"] or []
                 
                 # Remove None values
                 props = {k: v for k, v in props.items() if v is not None}
@@ -115,8 +80,6 @@ def sync_sqlite_to_neo4j():
         
         print(f"   ✅ Total SCARs synced: {scar_count}")
         
-        conn.close()
-        
         print("\n✅ Synchronization complete!")
         print(f"   Synced {geoid_count} Geoids and {scar_count} SCARs to Neo4j")
         
@@ -0,0 +1,50 @@
+import json
+
+from fastapi.testclient import TestClient
+
+from backend.api.main import app, kimera_system
+from backend.vault.database import SessionLocal, GeoidDB
+
+client = TestClient(app)
+
+
+def test_bulk_json_array_reports_partial_failures():
+    payload = [
+        {"semantic_features": {"alpha": 1.0, "beta": 0.5}},
+        {"metadata": {"missing": "features"}},
+        {"semantic_features": {"gamma": "not-a-number"}},
+        {"semantic_features": {"delta": 0.3}, "metadata": {"source": "bulk"}},
+    ]
+    resp = client.post("/geoids/bulk", json=payload)
+    assert resp.status_code == 200
+    data = resp.json()
+    assert (data["submitted"], data["created"], data["failed"]) == (4, 2, 2)
+    assert [r["status"] for r in data["results"]] == ["created", "error", "error", "created"]
+
+    created_ids = [r["geoid_id"] for r in data["results"] if r["status"] == "created"]
+    with SessionLocal() as db:
+        stored = db.query(GeoidDB).filter(GeoidDB.geoid_id.in_(created_ids)).all()
+    assert len(stored) == 2
+    assert all(gid in kimera_system["active_geoids"] for gid in created_ids)
+
+
+def test_bulk_ndjson_stream_with_bad_line():
+    lines = [
+        json.dumps({"semantic_features": {"alpha": 0.2}}),
+        "{not json",
+        json.dumps({"semantic_features": {"beta": 0.9}}),
+    ]
+    resp = client.post(
+        "/geoids/bulk",
+        content="\n".join(lines).encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["created"] == 2
+    assert data["results"][1]["status"] == "error"
+
+
+def test_bulk_rejects_non_array_body():
+    resp = client.post("/geoids/bulk", json={"semantic_features": {"alpha": 1.0}})
+    assert resp.status_code == 400
@@ -14,3 +14,49 @@ def test_parse_echoform_valid(text, expected):
 
 
 
+@pytest.mark.parametrize("text,expected", [
+    ('(say "hello world" \'(a b))', [["say", "hello world", ["quote", ["a", "b"]]]]),
+    ('(s "" "a\\"b")', [["s", "", 'a\\"b']]),
+    ("(x -3 .5 -1.25 1e3 don't)", [["x", -3, 0.5, -1.25, "1e3", "don", ["quote", "t"]]]),
+    ("''x", [["quote", ["quote", "x"]]]),
+])
+def test_parse_echoform_atoms_and_quoting(text, expected):
+    assert parse_echoform(text) == expected
+
+
+@pytest.mark.parametrize("text,message", [
+    ("(a b", "Unbalanced"),
+    ("(a))", "Unbalanced"),
+    ('(a "b)', "Unterminated"),
+    ("(a ')", r"Unexpected '\)'"),
+    ("(a) '", "Unexpected end"),
+])
+def test_parse_echoform_rejects_malformed_input(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_echoform(text)
+
+
+def test_parse_echoform_deep_nesting_is_not_recursive():
+    depth = 50000
+    ast = parse_echoform("(" * depth + "core" + ")" * depth)
+    for _ in range(depth):
+        (ast,) = ast
+    assert ast == ["core"]
+
+
+def test_parse_echoform_caches_by_source():
+    from backend.linguistic.echoform import _cache
+
+    text = "(cached form (nested 42))"
+    first = parse_echoform(text)
+    hits = _cache.hits
+    assert parse_echoform(text) == first
+    assert _cache.hits == hits + 1
+
+
+def test_parse_echoform_results_do_not_share_cached_lists():
+    text = "(shared (inner 1))"
+    first = parse_echoform(text)
+    first[0].append("mutated")
+    first[0][1].append(2)
+    assert parse_echoform(text) == [["shared", ["inner", 1]]]
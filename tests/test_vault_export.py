@@ -0,0 +1,76 @@
+import importlib
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+os.environ["ENABLE_JOBS"] = "0"
+
+
+@pytest.fixture()
+def export_env(tmp_path):
+    os.environ["DATABASE_URL"] = f"sqlite:///{tmp_path / 'export.db'}"
+    sys.path.insert(0, os.path.abspath("."))
+    import backend.vault.database as db_module
+    importlib.reload(db_module)
+    import backend.vault.export as export_module
+    importlib.reload(export_module)
+    return db_module, export_module
+
+
+def _seed(db_module, n_geoids=7, n_scars=5):
+    base = datetime(2025, 1, 1)
+    with db_module.SessionLocal() as db:
+        for i in range(n_geoids):
+            db.add(db_module.GeoidDB(
+                geoid_id=f"G{i:03d}",
+                symbolic_state={"i": i},
+                metadata_json={},
+                semantic_state_json={"x": float(i)},
+                semantic_vector=[float(i), 0.5],
+            ))
+        for i in range(n_scars):
+            db.add(db_module.ScarDB(
+                scar_id=f"S{i:03d}",
+                geoids=[f"G{i:03d}"],
+                reason="test",
+                timestamp=base + timedelta(days=i),
+                resolved_by="unit",
+                pre_entropy=0.0, post_entropy=0.0, delta_entropy=0.0,
+                cls_angle=0.0, semantic_polarity=0.0, mutation_frequency=0.0,
+                weight=1.0,
+                scar_vector=[0.0],
+                vault_id="vault_a" if i % 2 == 0 else "vault_b",
+            ))
+        db.commit()
+
+
+def test_keyset_pagination_returns_every_row_in_order(export_env):
+    db_module, export = export_env
+    _seed(db_module)
+    rows = list(export.iter_export_rows("geoids", page_size=3))
+    assert [r["geoid_id"] for r in rows] == [f"G{i:03d}" for i in range(7)]
+    assert rows[2]["semantic_vector"] == [2.0, 0.5]
+
+
+def test_filters_by_time_range_and_vault(export_env):
+    db_module, export = export_env
+    _seed(db_module)
+    rows = list(export.iter_export_rows(
+        "scars", since=datetime(2025, 1, 2), until=datetime(2025, 1, 5), vault_id="vault_b", page_size=1,
+    ))
+    assert [r["scar_id"] for r in rows] == ["S001", "S003"]
+
+
+def test_ndjson_lines_and_eager_validation(export_env):
+    db_module, export = export_env
+    _seed(db_module, n_geoids=2, n_scars=0)
+    lines = list(export.iter_ndjson("geoids"))
+    assert [json.loads(line)["geoid_id"] for line in lines] == ["G000", "G001"]
+    assert all(line.endswith(b"\n") for line in lines)
+    with pytest.raises(ValueError):
+        export.iter_export_rows("geoids", vault_id="vault_a")
+    with pytest.raises(ValueError):
+        export.iter_export_rows("unknown")
@@ -0,0 +1,109 @@
+import time
+
+import numpy as np
+import pytest
+
+from backend.core.geoid import GeoidState
+from backend.monitoring import advanced_statistical_monitor as asm
+from backend.monitoring.advanced_statistical_monitor import (
+    AdvancedStatisticalMonitor,
+    LiveSnapshotProvider,
+    StatisticalProcessController,
+)
+from backend.monitoring.entropy_monitor import EntropyMonitor
+from backend.monitoring.system_observer import SystemObserver
+
+
+def test_rolling_welford_limits_match_window_statistics():
+    rng = np.random.default_rng(0)
+    spc = StatisticalProcessController(window_size=50, stationarity_every=0)
+    data = {f"m{i}": rng.normal(i, 1 + i, size=400) for i in range(5)}
+    for t in range(400):
+        spc.add_measurements({name: values[t] for name, values in data.items()})
+
+    limits = spc.control_limits
+    for name, values in data.items():
+        window = values[-50:]
+        assert limits[name].center_line == pytest.approx(window.mean())
+        sigma = window.std(ddof=1)
+        assert limits[name].upper_control_limit == pytest.approx(window.mean() + 3 * sigma)
+        assert limits[name].lower_warning_limit == pytest.approx(window.mean() - 2 * sigma)
+
+
+def test_non_stationary_metrics_use_differenced_sigma():
+    if not asm.STATSMODELS_AVAILABLE:
+        pytest.skip("statsmodels not installed")
+    spc = StatisticalProcessController(window_size=60, stationarity_every=10)
+    trend = np.arange(60) * 0.5 + np.random.default_rng(1).normal(0, 0.1, size=60)
+    for value in trend:
+        spc.add_measurement("trend", value)
+    sigma = (spc.control_limits["trend"].upper_control_limit - spc.control_limits["trend"].center_line) / 3
+    assert sigma == pytest.approx(np.diff(trend).std(ddof=1))
+
+
+def test_spc_rules_raise_alerts():
+    spc = StatisticalProcessController(window_size=100, stationarity_every=0, run_length=8)
+    rng = np.random.default_rng(2)
+    for value in rng.normal(0, 1, size=40):
+        spc.add_measurement("latency", value)
+    spc.alerts.clear()
+
+    spc.add_measurement("latency", 50.0)
+    assert [a.alert_type for a in spc.alerts] == ["control_limit_violation"]
+    assert spc.alerts[-1].severity == "critical"
+
+    spc.alerts.clear()
+    for _ in range(10):
+        spc.add_measurement("latency", spc.control_limits["latency"].center_line + 0.01)
+    runs = [a for a in spc.alerts if a.alert_type == "run_rule_violation"]
+    assert len(runs) == 1  # one alert per run, not per point
+
+
+def test_collection_uses_live_snapshot_and_observer():
+    geoids = {
+        f"g{i}": GeoidState(geoid_id=f"g{i}", semantic_state={"a": 0.5 + i, "b": 1.0}, symbolic_state={"k": i})
+        for i in range(4)
+    }
+    calls = []
+
+    def vault_info():
+        calls.append(1)
+        return {"vault_a_scars": 3, "vault_b_scars": 2}
+
+    monitor = AdvancedStatisticalMonitor(
+        EntropyMonitor(), SystemObserver(), LiveSnapshotProvider(geoids, vault_info, vault_info_ttl=60)
+    )
+    monitor.analysis_interval = 3600
+    for _ in range(3):
+        monitor._collect_and_analyze_metrics()
+
+    assert len(calls) == 1  # vault counts are cached between collections
+    assert {"shannon_entropy", "system_health", "stability_score", "geoid_count"} <= set(monitor.metric_history)
+    assert monitor.metric_history.values("geoid_count")[-1] == 4
+    assert monitor.collection_count == 3
+
+
+def test_entropy_monitor_alone_is_collected_with_snapshot_arguments():
+    geoids = {"g": GeoidState(geoid_id="g", semantic_state={"a": 1.0, "b": 2.0})}
+    monitor = AdvancedStatisticalMonitor(EntropyMonitor(), None, LiveSnapshotProvider(geoids))
+    monitor.analysis_interval = 3600
+    monitor._collect_and_analyze_metrics()
+    assert monitor.metric_history.values("shannon_entropy")[-1] > 0
+
+
+def test_monitoring_loop_runs_at_sub_second_interval():
+    monitor = AdvancedStatisticalMonitor(EntropyMonitor(), None, LiveSnapshotProvider({}))
+    monitor.monitoring_interval = 0.02
+    monitor.analysis_interval = 3600
+    monitor.start_monitoring()
+    time.sleep(0.3)
+    monitor.stop_monitoring()
+    assert monitor.collection_count >= 5
+    assert monitor.collection_errors == 0
+
+
+def test_initialize_configures_the_shared_instance():
+    shared = asm.advanced_monitor
+    provider = LiveSnapshotProvider({})
+    assert asm.initialize_advanced_monitoring(snapshot_provider=provider) is shared
+    assert shared.snapshot_provider is provider
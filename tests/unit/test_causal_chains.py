@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.orm import sessionmaker
+
+from backend.vault import enhanced_database_schema as schema
+from backend.vault import understanding_vault_manager as uvm_module
+from backend.vault.causal_chains import fetch_causal_chain
+from backend.vault.understanding_vault_manager import UnderstandingVaultManager
+
+RELATIONS = [
+    ("cloud", "rain", 0.9),
+    ("rain", "wet_ground", 0.8),
+    ("wet_ground", "mud", 0.5),
+    ("mud", "rain", 0.4),          # cycle back into the chain
+    ("sprinkler", "wet_ground", 0.6),
+    ("wind", "rain", 0.1),
+    ("mud", "slip", 0.7),
+]
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'causal.db'}")
+    schema.Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(uvm_module, "SessionLocal", factory)
+    manager = UnderstandingVaultManager()
+    for cause, effect, strength in RELATIONS:
+        manager.establish_causal_relationship(cause, effect, strength, f"{cause} -> {effect}")
+    yield factory
+    engine.dispose()
+
+
+def test_multi_hop_chain_in_one_statement(session_factory):
+    with session_factory() as db:
+        statements = []
+        event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+        chain = fetch_causal_chain(db, "wet_ground", max_depth=3)
+    assert len(statements) == 1
+
+    causes = [(c["cause_id"], c["depth"], c["path"]) for c in chain["causes"]]
+    assert causes[:2] == [("rain", 1, ["rain", "wet_ground"]), ("sprinkler", 1, ["sprinkler", "wet_ground"])]
+    assert ("cloud", 2, ["cloud", "rain", "wet_ground"]) in causes
+    assert ("mud", 2, ["mud", "rain", "wet_ground"]) in causes
+    # The cycle is not followed back through wet_ground
+    assert all(path.count("wet_ground") == 1 for _, _, path in causes)
+
+    effects = {e["effect_id"]: e for e in chain["effects"]}
+    assert effects["slip"]["path"] == ["wet_ground", "mud", "slip"]
+    assert effects["slip"]["chain_strength"] == pytest.approx(0.35)
+    assert effects["rain"]["depth"] == 2 and "cloud" not in effects
+
+
+def test_depth_fan_out_and_strength_limits(session_factory):
+    with session_factory() as db:
+        direct = fetch_causal_chain(db, "wet_ground", max_depth=1)
+        narrow = fetch_causal_chain(db, "wet_ground", max_depth=3, fan_out=1)
+        strong = fetch_causal_chain(db, "wet_ground", max_depth=3, min_strength=0.5)
+
+    assert {c["cause_id"] for c in direct["causes"]} == {"rain", "sprinkler"}
+    assert [c["path"] for c in narrow["causes"]] == [
+        ["rain", "wet_ground"], ["cloud", "rain", "wet_ground"]
+    ]
+    assert all(c["chain_strength"] >= 0.5 for c in strong["causes"] + strong["effects"])
+    assert {c["cause_id"] for c in strong["causes"]} == {"rain", "sprinkler", "cloud"}
+
+
+def test_manager_keeps_direct_fields(session_factory):
+    chain = UnderstandingVaultManager().get_causal_chain("rain", max_depth=1)
+    assert chain["concept_id"] == "rain"
+    cloud = next(c for c in chain["causes"] if c["cause_id"] == "cloud")
+    assert cloud["strength"] == 0.9 and cloud["mechanism"] == "cloud -> rain" and cloud["delay"] == 0.0
+    assert [e["effect_id"] for e in chain["effects"]] == ["wet_ground"]
+
+
+def test_traversal_indexes_exist(session_factory):
+    with session_factory() as db:
+        indexes = {i["name"]: i["column_names"] for i in inspect(db.get_bind()).get_indexes("causal_relationships")}
+    assert indexes["ix_causal_relationships_cause_strength"] == ["cause_concept_id", "causal_strength"]
+    assert indexes["ix_causal_relationships_effect_strength"] == ["effect_concept_id", "causal_strength"]
@@ -0,0 +1,90 @@
+import random
+
+import networkx as nx
+import pytest
+
+from backend.semantic_grounding.causal_index import CAUSES, EFFECTS, CausalIndex
+from backend.semantic_grounding.causal_reasoning_engine import CausalReasoningEngine
+
+
+def random_graph(seed, nodes=12, edges=30):
+    rng = random.Random(seed)
+    relations = []
+    for _ in range(edges):
+        cause, effect = rng.randrange(nodes), rng.randrange(nodes)
+        relations.append((cause, effect, round(rng.uniform(0.1, 1.0), 3)))
+    return relations
+
+
+def brute_force_chains(graph, node, direction, max_depth):
+    chains = []
+    for other in graph.nodes:
+        if other == node:
+            continue
+        source, target = (node, other) if direction == EFFECTS else (other, node)
+        for path in nx.all_simple_paths(graph, source, target, cutoff=max_depth):
+            strength = 1.0
+            for cause, effect in zip(path, path[1:]):
+                strength *= graph[cause][effect]["weight"]
+            chains.append((tuple(path), strength))
+    return sorted(chains, key=lambda c: -c[1])
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_index_matches_networkx_while_growing(seed):
+    index = CausalIndex()
+    graph = nx.DiGraph()
+    for step, (cause, effect, weight) in enumerate(random_graph(seed)):
+        index.add_relation(cause, effect, weight)
+        graph.add_edge(cause, effect, weight=weight)
+        # Query between insertions so cached answers must be invalidated correctly
+        node = step % 12
+        if node not in graph:
+            continue
+        assert index.reachable(node, 2) == {
+            n: d for n, d in nx.single_source_shortest_path_length(graph, node, cutoff=2).items() if n != node
+        }
+        for direction in (EFFECTS, CAUSES):
+            expected = brute_force_chains(graph, node, direction, 3)
+            found = index.strongest_chains(node, direction, max_depth=3, k=5)
+            assert [s for _, s in found] == pytest.approx([s for _, s in expected[:5]])
+            assert all(path in dict(expected) for path, _ in found)
+
+    components = sorted(sorted(c) for c in index.strongly_connected_components())
+    assert components == sorted(sorted(c) for c in nx.strongly_connected_components(graph))
+    for node in graph.nodes:
+        assert index.descendants(node) == nx.descendants(graph, node)
+        for other in graph.nodes:
+            assert index.has_path(node, other) == nx.has_path(graph, node, other)
+
+
+def test_condensation_merges_cycles():
+    index = CausalIndex()
+    for cause, effect in [("a", "b"), ("b", "c"), ("c", "d"), ("x", "a")]:
+        index.add_relation(cause, effect, 0.5)
+    assert len(index.condensation()) == 5
+
+    index.add_relation("d", "b", 0.5)
+    assert {"b", "c", "d"} in index.strongly_connected_components()
+    merged = index.component_of("b")
+    assert index.condensation()[index.component_of("a")] == {merged}
+    assert index.descendants("c") == {"b", "d"}
+    assert not index.has_path("b", "a")
+
+
+def test_rejects_strengths_outside_unit_interval():
+    with pytest.raises(ValueError):
+        CausalIndex().add_relation("a", "b", 1.5)
+
+
+def test_engine_returns_strongest_chains():
+    engine = CausalReasoningEngine()
+    engine._add_causal_relation("cloud", "condensation", "rain", "cooling", strength=0.9, confidence=0.9)
+    engine._add_causal_relation("wind", "transport", "rain", "advection", strength=0.2, confidence=0.5)
+
+    chains = engine.identify_causes_effects("wet ground")["causal_chains"]
+    paths = [c["path"] for c in chains if c["type"] == "causes_of"]
+    assert paths == [["rain", "wet ground"], ["cloud", "rain", "wet ground"], ["wind", "rain", "wet ground"]]
+    strengths = [c["chain"].total_strength for c in chains]
+    assert strengths == sorted(strengths, reverse=True)
+    assert engine._is_plausible_cause("cloud", "wet ground")
@@ -0,0 +1,132 @@
+import io
+import threading
+
+import numpy as np
+from PIL import Image
+
+from backend.core.memo_cache import MemoCache
+from backend.engines.clip_service import (
+    ImageEmbeddingService,
+    content_hash,
+    fallback_image_embeddings,
+    image_hash,
+)
+
+
+def solid(color, size=(32, 32)):
+    return Image.new("RGB", size, color)
+
+
+def gradient(seed):
+    rng = np.random.default_rng(seed)
+    return Image.fromarray(rng.integers(0, 255, (24, 24, 3), dtype=np.uint8))
+
+
+class CountingService(ImageEmbeddingService):
+    """Uses the fallback encoder and records the batches it encodes."""
+
+    def __init__(self, **kwargs):
+        super().__init__(cache=MemoCache("clip_test", maxsize=64, ttl=60), **kwargs)
+        self.batch_sizes = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def encode_images(self, images):
+        self.release.wait(5)
+        self.batch_sizes.append(len(images))
+        return fallback_image_embeddings(images)
+
+
+def test_fallback_encoder_is_deterministic_unit_norm():
+    first = fallback_image_embeddings([gradient(1), gradient(2), solid((128, 128, 128))])
+    again = fallback_image_embeddings([gradient(1)])
+    assert first.shape == (3, 512)
+    np.testing.assert_array_equal(first[0], again[0])
+    assert np.isclose(np.linalg.norm(first[0]), 1.0) and not np.allclose(first[0], first[1])
+    assert np.all(np.isfinite(first[2]))
+
+
+def test_concurrent_requests_are_batched_and_deduplicated():
+    service = CountingService(batch_size=8, max_wait_ms=50)
+    service.release.clear()  # hold the worker so submissions pile up
+    images = [gradient(i % 5) for i in range(12)]
+    futures = [service.submit(image) for image in images]
+    service.release.set()
+    vectors = [f.result(timeout=5) for f in futures]
+    service.close()
+
+    assert sum(service.batch_sizes) == 5  # 12 requests, 5 distinct images
+    assert len(service.batch_sizes) <= 2
+    assert service.coalesced == 7
+    np.testing.assert_array_equal(vectors[0], vectors[5])
+    assert not vectors[0].flags.writeable
+
+
+def test_cache_hits_by_content_hash():
+    service = CountingService(max_wait_ms=0)
+    buffer = io.BytesIO()
+    gradient(7).save(buffer, format="PNG")
+    key = content_hash(buffer.getvalue())
+    first = service.get_image_embedding(Image.open(io.BytesIO(buffer.getvalue())), key=key)
+    second = service.get_image_embedding(Image.open(io.BytesIO(buffer.getvalue())), key=key)
+    service.close()
+    assert service.batch_sizes == [1]
+    assert service.cache.stats()["hits"] == 1
+    assert second is first
+
+
+def test_async_embedding_and_stats():
+    import asyncio
+
+    service = CountingService(max_wait_ms=20)
+
+    async def main():
+        return await asyncio.gather(*(service.embed_image(gradient(i)) for i in range(4)))
+
+    vectors = asyncio.run(main())
+    service.close()
+    assert len(vectors) == 4 and service.stats()["images_encoded"] == 4
+    assert service.stats()["avg_batch_size"] >= 1
+
+
+def test_cancelled_waiter_does_not_affect_coalesced_callers():
+    import asyncio
+
+    service = CountingService(max_wait_ms=0)
+    service.release.clear()  # hold the worker until the first caller gives up
+    image = gradient(3)
+
+    async def main():
+        impatient = asyncio.ensure_future(service.embed_image(image))
+        patient = asyncio.ensure_future(service.embed_image(image))
+        await asyncio.sleep(0.05)
+        impatient.cancel()
+        await asyncio.sleep(0.05)
+        service.release.set()
+        return await asyncio.wait_for(patient, 5), impatient.cancelled()
+
+    vector, cancelled = asyncio.run(main())
+    assert cancelled and service.coalesced == 1
+    np.testing.assert_array_equal(vector, fallback_image_embeddings([image])[0])
+
+    # The worker survived and later requests are served normally
+    assert service._worker.is_alive() and not service._inflight
+    later = service.get_image_embedding(gradient(4))
+    service.close()
+    assert later.shape == (512,)
+
+
+def test_all_waiters_cancelled_clears_inflight_entry():
+    service = CountingService(max_wait_ms=0)
+    service.release.clear()
+    blocker = service.submit(gradient(5))  # occupies the worker
+    first, second = service.submit(gradient(6)), service.submit(gradient(6))
+    assert first is not second
+    assert first.cancel() and second.cancel()
+    assert image_hash(gradient(6)) not in service._inflight
+    retry = service.submit(gradient(6))
+    service.release.set()
+    vector = retry.result(timeout=5)
+    blocker.result(timeout=5)
+    service.close()
+    np.testing.assert_array_equal(vector, fallback_image_embeddings([gradient(6)])[0])
@@ -0,0 +1,35 @@
+import asyncio
+import threading
+import time
+
+from backend.api import concurrency
+
+
+def test_blocking_calls_do_not_serialise_the_event_loop():
+    async def scenario():
+        start = time.perf_counter()
+        await asyncio.gather(*(concurrency.run_compute(time.sleep, 0.2) for _ in range(4)))
+        return time.perf_counter() - start
+
+    assert asyncio.run(scenario()) < 0.6
+
+
+def test_work_runs_on_named_pool_and_is_counted():
+    before = concurrency.get_executor_stats()["db"]["completed"]
+    name = asyncio.run(concurrency.run_db(lambda: threading.current_thread().name))
+    assert name.startswith("kimera-db")
+    stats = concurrency.get_executor_stats()["db"]
+    assert stats["completed"] == before + 1
+    assert stats["in_flight"] == 0
+
+
+def test_exceptions_propagate_to_caller():
+    def boom():
+        raise ValueError("bad input")
+
+    try:
+        asyncio.run(concurrency.run_compute(boom))
+    except ValueError as exc:
+        assert "bad input" in str(exc)
+    else:  # pragma: no cover
+        raise AssertionError("expected ValueError")
@@ -0,0 +1,35 @@
+from sqlalchemy import text
+
+from backend.vault.db_engine import create_db_engine, get_engine, get_pool_status
+
+
+def test_get_engine_is_shared_per_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'shared.db'}"
+    assert get_engine(url) is get_engine(url)
+
+
+def test_sqlite_file_engine_uses_wal_and_normal_sync(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'wal.db'}")
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        # synchronous=NORMAL is reported as 1
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+    engine.dispose()
+
+
+def test_pool_status_reports_utilization(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=2, max_overflow=2)
+    with engine.connect():
+        status = get_pool_status(engine)
+        assert status["checked_out"] == 1
+        assert status["capacity"] == 4
+        assert status["utilization"] == 0.25
+    assert get_pool_status(engine)["checked_out"] == 0
+    engine.dispose()
+
+
+def test_memory_database_skips_pool_sizing():
+    engine = create_db_engine("sqlite://")
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT 1")).scalar() == 1
+    engine.dispose()
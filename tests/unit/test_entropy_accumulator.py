@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from backend.core.geoid import GeoidState
+from backend.monitoring.entropy_monitor import EntropyMonitor
+
+VAULT_INFO = {"vault_a_scars": 3, "vault_b_scars": 4}
+
+
+def make_geoids(n, seed=0):
+    rng = random.Random(seed)
+    features = [f"f{i}" for i in range(12)]
+    return [
+        GeoidState(
+            geoid_id=f"g{i}",
+            semantic_state={f: rng.choice([1.0, rng.random()]) for f in rng.sample(features, rng.randint(1, 6))},
+            symbolic_state={"type": "concept", "tags": ["x"] * rng.randint(0, 5)},
+        )
+        for i in range(n)
+    ]
+
+
+def assert_matches_reference(monitor, geoids):
+    incremental = monitor.calculate_system_entropy(geoids, VAULT_INFO)
+    reference = monitor._calculate_system_entropy_full(geoids, VAULT_INFO)
+    for name in ("shannon_entropy", "thermodynamic_entropy", "conditional_entropy",
+                 "mutual_information", "system_complexity"):
+        assert getattr(incremental, name) == pytest.approx(getattr(reference, name), abs=1e-9), name
+    assert incremental.geoid_count == reference.geoid_count
+    assert incremental.metadata["feature_count"] == reference.metadata["feature_count"]
+
+
+@pytest.mark.parametrize("method", ["mle", "miller_madow", "chao_shen"])
+def test_incremental_measurement_matches_full_recompute(method):
+    monitor = EntropyMonitor(estimation_method=method)
+    geoids = make_geoids(30)
+    assert_matches_reference(monitor, geoids)
+
+    # Update a few, remove a few, add a few
+    geoids[0].semantic_state["f0"] = 2.5
+    geoids[1].symbolic_state["tags"] = ["y"] * 20
+    geoids = geoids[:2] + geoids[7:] + make_geoids(40, seed=1)[30:]
+    assert_matches_reference(monitor, geoids)
+    assert set(monitor.geoid_states) == {g.geoid_id for g in geoids}
+
+
+def test_nested_symbolic_change_in_place_is_seen():
+    monitor = EntropyMonitor()
+    geoids = make_geoids(3)
+    for geoid in geoids:
+        geoid.symbolic_state["tags"] = ["x"]
+    assert_matches_reference(monitor, geoids)
+
+    geoids[0].symbolic_state["tags"].extend(["y"] * 50)
+    assert monitor.accumulator.sync(geoids) == 1
+    assert_matches_reference(monitor, geoids)
+    assert monitor.calculate_system_entropy(geoids, VAULT_INFO).mutual_information > 0
+
+
+def test_unchanged_geoids_do_not_touch_aggregates():
+    monitor = EntropyMonitor()
+    geoids = make_geoids(10)
+    assert monitor.accumulator.sync(geoids) == 10
+    assert monitor.accumulator.sync(geoids) == 0
+    geoids[3].semantic_state["f1"] = 0.25
+    assert monitor.accumulator.sync(geoids) == 1
+
+
+def test_observe_and_remove_stream_measurements():
+    monitor = EntropyMonitor()
+    for geoid in make_geoids(5):
+        monitor.observe_geoid(geoid)
+    monitor.remove_geoid("g0")
+    measurement = monitor.measure(VAULT_INFO)
+    assert measurement.geoid_count == 4
+    assert list(monitor.measurements)[-1] is measurement
@@ -0,0 +1,111 @@
+import math
+
+import numpy as np
+import pytest
+
+from backend.linguistic import entropy_formulas
+from backend.linguistic.entropy_formulas import (
+    calculate_approximate_entropy,
+    calculate_multiscale_entropy,
+    calculate_permutation_entropy,
+    calculate_predictability_index,
+    calculate_sample_entropy,
+)
+
+
+def pair_matches(data, m, r, count):
+    """Reference O(n^2) loop: pairs i < j among the first ``count`` m-templates."""
+    matches = 0
+    for i in range(count):
+        for j in range(i + 1, count):
+            if max(abs(data[i + k] - data[j + k]) for k in range(m)) <= r:
+                matches += 1
+    return matches
+
+
+def reference_phi(data, m, r):
+    n = len(data) - m + 1
+    templates = [data[i:i + m] for i in range(n)]
+    logs = []
+    for t in templates:
+        c = sum(max(abs(x - y) for x, y in zip(t, u)) <= r for u in templates)
+        logs.append(math.log(c / n))
+    return sum(logs) / n
+
+
+def reference_sample_entropy(data, m, r):
+    # This module's sample entropy is the phi(m) - phi(m + 1) form (self-matches counted)
+    return reference_phi(data, m, r) - reference_phi(data, m + 1, r)
+
+
+SERIES = {
+    "float": np.random.default_rng(0).normal(size=200).tolist(),
+    "ties": np.random.default_rng(1).integers(0, 4, size=150).tolist(),
+    "periodic": np.sin(np.arange(120) / 4).tolist(),
+}
+
+
+@pytest.mark.parametrize("name", SERIES)
+@pytest.mark.parametrize("m", [1, 2, 3])
+def test_sample_entropy_matches_reference_loop(name, m):
+    data = SERIES[name]
+    r = 0.2 * np.std(data)
+    assert calculate_sample_entropy(data, m, r) == pytest.approx(reference_sample_entropy(data, m, r))
+
+
+@pytest.mark.parametrize("name", SERIES)
+def test_approximate_entropy_matches_reference_loop(name):
+    data = SERIES[name]
+    r = 0.2 * np.std(data)
+    expected = reference_phi(data, 2, r) - reference_phi(data, 3, r)
+    assert calculate_approximate_entropy(data, 2, r) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("name", SERIES)
+def test_predictability_index_matches_reference_loop(name):
+    data = SERIES[name]
+    r = 0.2 * np.std(data)
+    n = len(data)
+    expected = pair_matches(data, 3, r, n - 2) / pair_matches(data, 2, r, n - 2)
+    assert calculate_predictability_index(data, 2, r) == pytest.approx(expected)
+
+
+def test_kdtree_and_broadcast_paths_agree(monkeypatch):
+    if entropy_formulas.cKDTree is None:
+        pytest.skip("scipy not installed")
+    data = np.random.default_rng(2).integers(0, 20, size=3000).tolist()
+    kdtree = calculate_sample_entropy(data), calculate_predictability_index(data, 2, 1.0)
+    monkeypatch.setattr(entropy_formulas, "KDTREE_MIN_TEMPLATES", 10 ** 9)
+    monkeypatch.setattr(entropy_formulas, "_BLOCK_ELEMENTS", 10_000)
+    broadcast = calculate_sample_entropy(data), calculate_predictability_index(data, 2, 1.0)
+    assert kdtree == broadcast
+
+
+@pytest.mark.parametrize("m", [1, 2, 4])
+def test_range_tree_counts_match_broadcast(m):
+    rng = np.random.default_rng(3)
+    walk = np.cumsum(rng.normal(size=2500))
+    ties = rng.integers(0, 6, size=2500).astype(float)
+    for data, r in ((walk, 0.2 * walk.std()), (ties, 1.0), (ties, 0.0)):
+        templates = entropy_formulas._templates(data, m)
+        expected = entropy_formulas._blocked_match_counts(templates, templates, r)
+        assert np.array_equal(entropy_formulas._range_tree_match_counts(templates, r), expected)
+        assert np.array_equal(entropy_formulas._chebyshev_match_counts(templates, r), expected)
+
+
+def test_permutation_entropy_counts_ordinal_patterns():
+    # Strictly increasing: a single ordinal pattern
+    assert calculate_permutation_entropy(list(range(20)), order=3) == 0.0
+    # Alternating series visits exactly two patterns equally often
+    assert calculate_permutation_entropy([0, 1] * 20, order=3) == pytest.approx(math.log2(2) / math.log2(6), abs=0.02)
+    # Ties keep the first occurrence first (stable ordering)
+    assert calculate_permutation_entropy([1, 1, 1, 1], order=2) == 0.0
+
+
+def test_multiscale_entropy_coarse_grains_by_block_mean():
+    data = SERIES["float"]
+    r = 0.15 * np.std(data)
+    scales = calculate_multiscale_entropy(data, max_scale=3, r=r)
+    coarse = np.asarray(data[:len(data) // 2 * 2]).reshape(-1, 2).mean(axis=1).tolist()
+    assert scales[0] == pytest.approx(reference_sample_entropy(data, 2, r))
+    assert scales[1] == pytest.approx(reference_sample_entropy(coarse, 2, r))
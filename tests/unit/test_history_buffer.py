@@ -0,0 +1,99 @@
+import sys
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.core.history_buffer import HistoryBuffer, VaultSpill, compact_entry
+from backend.core.relevance_assessment import RelevanceAssessmentEngine
+from backend.vault.database import Base, EngineHistoryDB
+
+
+class Level(Enum):
+    HIGH = "high"
+
+
+@dataclass
+class Entry:
+    label: str
+    level: Level
+    score: float
+    when: datetime
+    details: dict
+
+
+def test_ring_buffer_keeps_most_recent_entries():
+    evicted = []
+    buf = HistoryBuffer("test", capacity=3, spill=evicted.append)
+    buf.extend(range(5))
+    assert len(buf) == 3
+    assert list(buf) == [2, 3, 4]
+    assert buf[-1] == 4
+    assert buf[-2:] == [3, 4]
+    assert buf[-10:] == [2, 3, 4]
+    assert evicted == [0, 1]
+    assert buf.stats()["total_appended"] == 5
+
+
+def test_concurrent_appends_keep_counts_consistent():
+    evicted = []
+    buf = HistoryBuffer("threads", capacity=50, spill=evicted.append)
+
+    def worker(offset):
+        for i in range(2000):
+            buf.append(offset + i)
+            buf[-5:]
+
+    # Switch threads as often as possible so unlocked updates would interleave
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=worker, args=(n * 10_000,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(previous)
+
+    assert buf.total_appended == 16_000
+    assert len(buf) == 50
+    assert buf.evicted == len(evicted) == 16_000 - 50
+    assert sorted(evicted + list(buf)) == sorted(n * 10_000 + i for n in range(8) for i in range(2000))
+
+
+def test_compact_entry_keeps_scalar_fields_only():
+    entry = Entry("x", Level.HIGH, 0.5, datetime(2025, 1, 1), {"big": "payload"})
+    assert compact_entry(entry) == {
+        "type": "Entry", "label": "x", "level": "high", "score": 0.5, "when": "2025-01-01T00:00:00",
+    }
+
+
+def test_vault_spill_writes_compact_rows(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'spill.db'}")
+    Base.metadata.create_all(bind=engine, tables=[EngineHistoryDB.__table__])
+    session_factory = sessionmaker(bind=engine)
+
+    spill = VaultSpill("test_spill", batch_size=2, session_factory=session_factory)
+    buf = HistoryBuffer("test_spill", capacity=1, spill=spill)
+    for i in range(4):
+        buf.append(Entry(f"e{i}", Level.HIGH, i, datetime(2025, 1, 1), {}))
+    spill.flush()
+
+    with session_factory() as db:
+        rows = db.execute(select(EngineHistoryDB.summary)).scalars().all()
+    assert [row["label"] for row in rows] == ["e0", "e1", "e2"]
+    assert spill.spilled == 3
+    engine.dispose()
+
+
+def test_engine_history_is_bounded():
+    engine = RelevanceAssessmentEngine()
+    engine.assessment_history = HistoryBuffer("assessment_history", capacity=5, spill=False)
+    for i in range(20):
+        engine.assess_context(f"explain topic {i}")
+    assert len(engine.assessment_history) == 5
+    assert len(engine.get_assessment_history(3)) == 3
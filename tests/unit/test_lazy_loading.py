@@ -0,0 +1,87 @@
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from backend.core.lazy_loading import ComponentRegistry, LazyModule, lazy_import, module_available
+
+
+def test_lazy_module_imports_on_first_attribute(tmp_path, monkeypatch):
+    (tmp_path / "kimera_lazy_probe.py").write_text("LOADED = True\ndef double(x):\n    return 2 * x\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = lazy_import("kimera_lazy_probe")
+    double = lazy_import("kimera_lazy_probe", "double")
+    assert isinstance(module, LazyModule)
+    assert "kimera_lazy_probe" not in sys.modules
+    assert double(21) == 42
+    assert module.LOADED and "kimera_lazy_probe" in sys.modules
+    assert module_available("kimera_lazy_probe") and not module_available("kimera_missing_probe")
+
+
+def test_component_loads_once_across_threads():
+    registry = ComponentRegistry()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    component = registry.register("model", factory)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(component.get())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1 and len({id(r) for r in results}) == 1
+    status = registry.report()["components"]["model"]
+    assert status["state"] == "ready" and status["seconds"] >= 0.05
+
+
+def test_failed_load_is_reported_and_retried():
+    registry = ComponentRegistry()
+    attempts = []
+
+    def flaky():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("weights missing")
+        return "model"
+
+    component = registry.register("flaky", flaky)
+    with pytest.raises(RuntimeError):
+        component.get()
+    assert registry.report()["components"]["flaky"]["error"] == "weights missing"
+    assert component.get() == "model" and registry.report()["components"]["flaky"]["state"] == "ready"
+
+
+def test_background_warm_up_and_phases():
+    registry = ComponentRegistry()
+    registry.register("a", lambda: time.sleep(0.02) or "a")
+    registry.register("b", lambda: "b")
+    assert registry.resolve_warmup("b, unknown") == ["b"]
+    assert registry.resolve_warmup("all") == ["a", "b"] and registry.resolve_warmup("none") == []
+
+    with registry.phase("startup_event"):
+        thread = registry.warm_up(["a", "b"], background=True)
+    thread.join()
+    report = registry.report()
+    assert not report["warming_up"]
+    assert {"startup_event", "warmup"} <= set(report["phases"])
+    assert all(c["state"] == "ready" and c["thread"] == "kimera-warmup" for c in report["components"].values())
+
+
+def test_statistical_and_clip_modules_import_without_heavy_dependencies():
+    code = (
+        "import sys\n"
+        "import backend.core.statistical_modeling, backend.monitoring.advanced_statistical_monitor\n"
+        "import backend.engines.clip_service as clip\n"
+        "heavy = [m for m in ('statsmodels', 'scipy.stats', 'pandas', 'transformers') if m in sys.modules]\n"
+        "assert not heavy, heavy\n"
+        "assert clip.clip_service._component.status.state == 'pending'\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr[-2000:]
@@ -0,0 +1,76 @@
+import asyncio
+import sys
+import threading
+
+from backend.core.living_neutrality import LivingNeutralityEngine
+from backend.core.revolutionary_intelligence import RevolutionaryIntelligenceOrchestrator
+
+INPUTS = [
+    "URGENT: I'm desperate, this is an emergency and I can't cope. Please help.",
+    "I want to create a novel approach to music, think outside the box!",
+    "Could you kindly explain the algorithm, its architecture and the database API?",
+    "I always thought art was useless, but now it seems essential.",
+]
+
+
+def fast_thread_switching():
+    """Switch threads as often as possible so shared-state races would interleave."""
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    return previous
+
+
+def test_concurrent_fields_only_contain_their_own_tensions():
+    engine = LivingNeutralityEngine()
+    contexts = [
+        {"type": "creative", "creativity_demand": 0.9, "innovation_need": 0.9},
+        {"type": "crisis", "urgency": 0.95, "stakes": "critical"},
+        {"type": "scientific", "evidence_strength": 0.9},
+        {"type": "relationship", "relationships": ["friend"]},
+    ]
+    assessments = [engine.assess_context_supremacy(context) for context in contexts]
+    expected = [
+        {t.value for t in assessment["required_tensions"]} for assessment in assessments
+    ]
+    assert len({frozenset(e) for e in expected}) > 1
+    mismatches = []
+
+    def worker(index):
+        for _ in range(200):
+            field = engine.orchestrate_living_tension(assessments[index])
+            found = {t.tension_type.value for t in field.cognitive_tensions}
+            if found != expected[index]:
+                mismatches.append((index, found))
+
+    previous = fast_thread_switching()
+    try:
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(len(assessments))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(previous)
+
+    assert not mismatches
+
+
+def test_concurrent_requests_keep_their_own_tension_fields():
+    orchestrator = RevolutionaryIntelligenceOrchestrator()
+
+    async def respond(text):
+        return await orchestrator.orchestrate_revolutionary_response(text)
+
+    sequential = [asyncio.run(respond(text))["living_tensions"] for text in INPUTS]
+
+    async def together():
+        return await asyncio.gather(*(respond(text) for text in INPUTS * 5))
+
+    previous = fast_thread_switching()
+    try:
+        responses = asyncio.run(together())
+    finally:
+        sys.setswitchinterval(previous)
+
+    for index, response in enumerate(responses):
+        assert response["living_tensions"] == sequential[index % len(INPUTS)]
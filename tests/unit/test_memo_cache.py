@@ -0,0 +1,53 @@
+import time
+
+from backend.core.context_supremacy import ContextSupremacyEngine
+from backend.core.memo_cache import MemoCache, get_memo_cache_stats, make_key
+from backend.core.relevance_assessment import RelevanceAssessmentEngine
+
+
+def test_key_normalises_text_and_fingerprints_context():
+    assert make_key("  Hello World ") == make_key("hello world")
+    assert make_key("hi", {"a": 1, "b": 2}) == make_key("hi", {"b": 2, "a": 1})
+    assert make_key("hi", {"a": 1}) != make_key("hi", {"a": 2})
+    assert make_key("hi", None, "v1") != make_key("hi", None, "v2")
+
+
+def test_lru_eviction_and_ttl_expiry():
+    cache = MemoCache("test_lru", maxsize=2, ttl=60)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)  # evicts "b", the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.evictions == 1
+
+    short = MemoCache("test_ttl", maxsize=4, ttl=0.01)
+    short.put("k", "v")
+    time.sleep(0.02)
+    assert short.get("k") is None
+    assert short.expirations == 1
+
+
+def test_context_profile_is_served_from_cache():
+    engine = ContextSupremacyEngine()
+    first = engine.analyze_context_supremacy("I want to create a new song", {"creative": True})
+    second = engine.analyze_context_supremacy("  I want to CREATE a new song", {"creative": True})
+    assert second is first
+    assert engine.profile_cache.hits == 1
+    assert len(engine.context_history) == 2
+
+    engine.invalidate_profile_cache()
+    third = engine.analyze_context_supremacy("I want to create a new song", {"creative": True})
+    assert third is not first
+    assert get_memo_cache_stats()["context_supremacy"]["misses"] == 2
+
+
+def test_relevance_assessment_is_cached_per_user_context():
+    engine = RelevanceAssessmentEngine()
+    a = engine.assess_context("Explain the thesis methodology", {"expertise": "expert"})
+    b = engine.assess_context("Explain the thesis methodology", {"expertise": "expert"})
+    c = engine.assess_context("Explain the thesis methodology", {"expertise": "novice"})
+    assert a is b
+    assert c is not a
+    assert engine.assessment_cache.stats()["hit_rate"] == 1 / 3
@@ -0,0 +1,118 @@
+import gc
+from collections import deque
+
+import numpy as np
+import torch
+
+from backend.core.history_buffer import HistoryBuffer
+from backend.core.memo_cache import MemoCache
+from backend.engines.cognitive_field_dynamics import CognitiveFieldDynamics
+from backend.monitoring import telemetry
+from backend.monitoring.memory_accounting import (
+    MemoryAccountant,
+    embedding_model_bytes,
+    estimate_size,
+    memory_snapshot,
+    module_bytes,
+    tensor_bytes,
+)
+
+
+class FakeBGEM3FlagModel:
+    """Shape of FlagEmbedding's wrapper: the torch module lives on ``.model``."""
+
+    def __init__(self, model):
+        self.model = model
+        self.tokenizer = {"vocab": "x" * 100}
+
+
+class FakeInferenceSession:
+    def __init__(self, path):
+        self._model_path = str(path)
+
+
+def two_layer_model():
+    return torch.nn.Sequential(torch.nn.Linear(1000, 1000), torch.nn.Linear(1000, 1000))
+
+
+def test_tensor_bytes():
+    assert tensor_bytes(np.zeros(1000, dtype=np.float64)) == 8000
+    assert tensor_bytes(torch.zeros(10, 4, dtype=torch.float16)) == 80
+    assert tensor_bytes([1, 2, 3]) == 0
+
+
+def test_embedding_model_sized_through_each_backend_dict(tmp_path, monkeypatch):
+    from backend.core import embedding_utils
+
+    weights = 2 * (1000 * 1000 + 1000) * 4
+    model_file = tmp_path / "model.onnx"
+    model_file.write_bytes(b"\0" * 1000)
+    (tmp_path / "model.onnx_data").write_bytes(b"\0" * 50_000)
+    (tmp_path / "tokenizer.json").write_bytes(b"\0" * 7)
+
+    shapes = {
+        "transformers": ({"model": two_layer_model(), "tokenizer": {"vocab": "x"}, "type": "transformers"}, weights),
+        "flag_embedding": ({"flag_model": FakeBGEM3FlagModel(two_layer_model()), "type": "flag_embedding"}, weights),
+        "onnx": ({"session": FakeInferenceSession(model_file), "tokenizer": {}, "type": "onnx"}, 51_000),
+        "dummy": ({"type": "dummy"}, 0),
+    }
+    for backend, (loaded, expected) in shapes.items():
+        assert embedding_model_bytes(loaded).get("model", 0) == expected, backend
+        monkeypatch.setattr(embedding_utils, "_embedding_model", loaded)
+        component = memory_snapshot()["components"]["embedding_model"]
+        assert component["bytes"] >= expected, backend
+    assert module_bytes(two_layer_model()) == weights
+
+
+def test_estimate_size_samples_and_extrapolates():
+    small = {1000 + i: f"{i:0100d}" for i in range(10)}
+    large = {1000 + i: f"{i:0100d}" for i in range(10000)}
+    exact = estimate_size(large, sample=100000)
+    sampled = estimate_size(large, sample=16)
+    assert estimate_size(small) < sampled
+    assert abs(sampled - exact) / exact < 0.1
+    assert estimate_size(deque([np.zeros(128)] * 4)) >= 128 * 8  # shared array counted once
+
+
+def test_snapshot_tracks_high_water_marks():
+    accountant = MemoryAccountant()
+    sizes = {"a": 100}
+    accountant.register("static", lambda: dict(sizes))
+    first = accountant.snapshot()
+    sizes["a"] = 40
+    second = accountant.snapshot()
+    assert first["components"]["static"]["bytes"] == 100
+    assert second["components"]["static"] == {"bytes": 40, "parts": {"a": 40}, "peak_bytes": 100}
+    assert second["peak_accounted_bytes"] == 100
+    accountant.reset_peaks()
+    assert accountant.snapshot()["components"]["static"]["peak_bytes"] == 40
+
+
+def test_bound_reporters_are_weak_and_errors_are_isolated():
+    accountant = MemoryAccountant()
+    engine = CognitiveFieldDynamics(dimension=16)
+    engine.add_geoid("g1", torch.randn(16))
+    accountant.register("fields", engine.memory_footprint)
+    accountant.register("broken", lambda: 1 / 0)
+    snapshot = accountant.snapshot()
+    assert snapshot["components"]["fields"]["parts"]["field_tensors"] > 16 * 2
+    assert "broken" in snapshot["errors"]
+    del engine
+    gc.collect()
+    assert "fields" not in accountant.snapshot()["components"]
+    assert "fields" not in accountant.names()
+
+
+def test_builtin_components_and_prometheus_export():
+    cache = MemoCache("memory_accounting_test", maxsize=10)
+    cache.put("k", "v" * 1000)
+    buffer = HistoryBuffer("memory_accounting_test", capacity=5, spill=False)
+    buffer.append({"payload": "y" * 1000})
+    snapshot = memory_snapshot()
+    assert snapshot["components"]["memo_caches"]["parts"]["memory_accounting_test"] >= 1000
+    assert snapshot["components"]["history_buffers"]["parts"]["memory_accounting_test"] >= 1000
+    assert snapshot["process"]["rss_bytes"] > 0
+
+    telemetry.update_memory_metrics()
+    assert telemetry.REGISTRY.get_sample_value(
+        "kimera_memory_component_peak_bytes", {"component": "memo_caches"}) >= 1000
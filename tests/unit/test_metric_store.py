@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from backend.core.geoid import GeoidState
+from backend.monitoring import metric_store
+from backend.monitoring.entropy_monitor import EntropyMonitor
+from backend.monitoring.metric_store import MetricRing, MetricStore
+
+
+def test_ring_wraps_and_returns_oldest_first():
+    ring = MetricRing(5)
+    for i in range(12):
+        ring.append(float(i), 100.0 + i)
+    assert len(ring) == 5 and ring.total == 12
+    assert ring.values().tolist() == [7, 8, 9, 10, 11]
+    assert ring.values(3).tolist() == [9, 10, 11]
+    assert ring.timestamps(2).tolist() == [110, 111]
+    assert ring.last() == 11
+    times, values = ring.since(109.0)
+    assert times.tolist() == [109, 110, 111] and values.tolist() == [9, 10, 11]
+
+
+def test_columns_stay_aligned_with_shared_timestamps():
+    store = MetricStore("aligned", capacity=4)
+    for i in range(6):
+        store.record({"a": i, "b": 10 * i}, timestamp=1000.0 + i)
+    columns = store.columns(["a", "b", "missing"], n=3)
+    assert columns["a"].tolist() == [3, 4, 5]
+    assert columns["b"].tolist() == [30, 40, 50]
+    assert columns["missing"].size == 0
+    assert columns["timestamps"].tolist() == [1003, 1004, 1005]
+    assert set(store) == {"a", "b"} and store.count("a") == 4
+
+
+def test_segments_reload_and_rotate(tmp_path, monkeypatch):
+    monkeypatch.setattr(metric_store, "FLUSH_EVERY", 1)
+    store = MetricStore("persisted", capacity=8, directory=str(tmp_path))
+    store._log.max_bytes = metric_store.RECORD_DTYPE.itemsize * 4
+    store._log.retain = 3
+    for i in range(20):
+        store.record({"x": i, "y": -i}, timestamp=float(i))
+    store.flush()
+
+    segments = sorted(p.name for p in (tmp_path / "persisted").glob("segment-*.bin"))
+    assert len(segments) == 3  # older segments pruned
+
+    reloaded = MetricStore("persisted", capacity=3, directory=str(tmp_path))
+    assert reloaded.values("x").tolist() == [17, 18, 19]
+    assert reloaded.tail("y")[0].tolist() == [17, 18, 19]
+
+
+def test_entropy_monitor_trends_and_anomalies_come_from_the_store():
+    monitor = EntropyMonitor(history_size=50)
+    geoids = [GeoidState(geoid_id=f"g{i}", semantic_state={"a": 1.0, "b": 1.0 + i}) for i in range(15)]
+    for geoid in geoids:
+        monitor.observe_geoid(geoid)
+        monitor.measure({})
+
+    trends = monitor.get_entropy_trends(window_size=5)
+    expected = [m.shannon_entropy for m in list(monitor.measurements)[-5:]]
+    assert trends["shannon_entropy"] == pytest.approx(expected)
+    assert len(trends["timestamps"]) == 5
+
+    values = np.array([m.shannon_entropy for m in monitor.measurements])
+    deviations = np.abs(values[-10:] - values.mean())
+    assert len(monitor.detect_entropy_anomalies(2.0)) == int((deviations > 2.0 * values.std()).sum())
@@ -0,0 +1,86 @@
+import sys
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.api.profiling_routes import router
+from backend.monitoring import profiler
+from backend.monitoring.profiler import ProfileStore, ProfilingMiddleware, StackSampler, collapse_stack
+
+TOKEN = "s3cret"
+
+
+def busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(i * i for i in range(200))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(profiler, "PROFILER_TOKEN", TOKEN)
+    store = ProfileStore(keep=5)
+    monkeypatch.setattr(profiler, "profile_store", store)
+    monkeypatch.setattr("backend.api.profiling_routes.profile_store", store)
+
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, store=store)
+    app.include_router(router)
+
+    @app.get("/slow")
+    def slow():
+        busy_loop(0.15)
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_collapse_stack_is_root_first():
+    stack = collapse_stack(sys._getframe())
+    assert stack.endswith("test_collapse_stack_is_root_first:" + str(test_collapse_stack_is_root_first.__code__.co_firstlineno))
+    assert ";" in stack and " " not in stack.split(";")[-1]
+
+
+def test_sampler_sees_busy_thread():
+    worker = threading.Thread(target=busy_loop, args=(0.3,), name="busy-worker")
+    sampler = StackSampler(interval_ms=2).start()
+    worker.start()
+    worker.join()
+    profile = sampler.stop()
+    busy = sum(count for stack, count in profile.stacks.items() if stack.startswith("busy-worker;") and "busy_loop" in stack)
+    assert profile.samples > 10 and busy > 5
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in profile.collapsed().strip().splitlines())
+
+
+def test_endpoints_require_the_admin_token(client, monkeypatch):
+    assert client.get("/profiling/profiles").status_code == 403
+    assert client.get("/profiling/profiles", headers={"X-Kimera-Admin-Token": "wrong"}).status_code == 403
+    monkeypatch.setattr(profiler, "PROFILER_TOKEN", "")
+    assert client.get("/profiling/profiles", headers={"X-Kimera-Admin-Token": TOKEN}).status_code == 404
+
+
+def test_flagged_request_is_profiled(client):
+    headers = {"X-Kimera-Admin-Token": TOKEN, "X-Kimera-Profiler": "1"}
+    response = client.get("/slow", headers=headers)
+    profile_id = response.headers["X-Kimera-Profile-Id"]
+
+    # Unflagged or unauthorised requests are not profiled
+    assert "X-Kimera-Profile-Id" not in client.get("/slow").headers
+    assert "X-Kimera-Profile-Id" not in client.get("/slow", headers={"X-Kimera-Profiler": "1"}).headers
+
+    collapsed = client.get(f"/profiling/profiles/{profile_id}", headers={"X-Kimera-Admin-Token": TOKEN}).text
+    assert "busy_loop" in collapsed
+    summary = client.get(f"/profiling/profiles/{profile_id}?format=json", headers={"X-Kimera-Admin-Token": TOKEN}).json()
+    assert summary["mode"] == "request" and summary["label"] == "GET /slow"
+    listed = client.get("/profiling/profiles", headers={"X-Kimera-Admin-Token": TOKEN}).json()["profiles"]
+    assert [p["profile_id"] for p in listed] == [profile_id]
+
+
+def test_window_profile(client):
+    response = client.post("/profiling/window?seconds=0.1&interval_ms=5&format=json",
+                           headers={"X-Kimera-Admin-Token": TOKEN})
+    assert response.status_code == 200
+    assert response.json()["mode"] == "window" and response.json()["samples"] > 0
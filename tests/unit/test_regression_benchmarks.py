@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+
+from backend.monitoring import regression_benchmarks as rb
+from backend.monitoring.benchmarking_suite import BenchmarkResult
+from backend.vault import vault_manager
+
+
+def result(name, median, scale=1.0, success=True):
+    metrics = {"median_s": median} if success else {}
+    return BenchmarkResult(name, datetime.now(), median, success, metrics, {"scale": scale, "kind": "micro"},
+                           error_message=None if success else "boom")
+
+
+def test_compare_flags_regressions_beyond_threshold_and_noise_floor():
+    baseline = rb.results_to_baseline({
+        "slow": result("slow", 0.100),
+        "fine": result("fine", 0.100),
+        "tiny": result("tiny", 0.0001),
+        "faster": result("faster", 0.100),
+    })
+    comparison = rb.compare_to_baseline({
+        "slow": result("slow", 0.140),
+        "fine": result("fine", 0.120),
+        "tiny": result("tiny", 0.0003),  # +200% but only 0.2ms
+        "faster": result("faster", 0.050),
+        "added": result("added", 0.010),
+    }, baseline, threshold=0.25, min_delta_ms=0.5)
+
+    statuses = {name: row["status"] for name, row in comparison["benchmarks"].items()}
+    assert statuses == {"slow": "regression", "fine": "ok", "tiny": "ok", "faster": "improved", "added": "new"}
+    assert comparison["passed"] is False
+    assert "FAIL" in rb.format_report(comparison)
+
+
+def test_errors_fail_and_scale_changes_are_not_compared():
+    baseline = rb.results_to_baseline({"a": result("a", 0.1), "b": result("b", 0.1)})
+    comparison = rb.compare_to_baseline({"a": result("a", 0.5, scale=2.0), "b": result("b", 0, success=False)}, baseline)
+    assert comparison["benchmarks"]["a"]["status"] == "incomparable"
+    assert comparison["benchmarks"]["b"]["status"] == "error"
+    assert comparison["passed"] is False
+
+
+def test_baseline_round_trip(tmp_path):
+    path = tmp_path / "nested" / "baseline.json"
+    rb.save_baseline({"a": result("a", 0.2)}, str(path))
+    loaded = rb.load_baseline(str(path))
+    assert loaded["benchmarks"]["a"]["median_s"] == 0.2
+    assert rb.compare_to_baseline({"a": result("a", 0.2)}, loaded)["passed"]
+
+
+@pytest.mark.parametrize("name", ["spde_diffusion", "tension_detection", "vault_insert", "vault_search"])
+def test_workloads_run_at_small_scale(name):
+    session_factory = vault_manager.SessionLocal
+    outcome = rb.run_benchmark(rb.BENCHMARKS[name], repeat=2, warmup=1, scale=0.05)
+    assert outcome.success, outcome.error_message
+    assert outcome.metrics["min_s"] <= outcome.metrics["median_s"] <= outcome.metrics["max_s"]
+    assert vault_manager.SessionLocal is session_factory  # isolated vault restored
+
+
+def test_unknown_benchmark_is_rejected():
+    with pytest.raises(ValueError):
+        rb.run_benchmarks(["nope"])
@@ -0,0 +1,62 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from backend.monitoring.telemetry import REGISTRY, UNMATCHED_ROUTE, RequestMetricsMiddleware
+
+app = FastAPI()
+app.add_middleware(RequestMetricsMiddleware)
+
+
+@app.get("/rm-items/{item_id}")
+async def read_item(item_id: str):
+    if item_id == "missing":
+        raise HTTPException(status_code=404, detail="not found")
+    return {"item_id": item_id, "in_progress": in_progress("GET", "/rm-items/{item_id}")}
+
+
+@app.post("/rm-echo")
+async def echo(payload: dict):
+    return payload
+
+
+client = TestClient(app)
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def in_progress(method, route):
+    return sample("kimera_http_requests_in_progress", method=method, route=route)
+
+
+def test_latency_is_labelled_by_route_template_and_status():
+    for item in ("a", "b", "c"):
+        assert client.get(f"/rm-items/{item}").status_code == 200
+    client.get("/rm-items/missing")
+
+    count = "kimera_http_request_duration_seconds_count"
+    assert sample(count, method="GET", route="/rm-items/{item_id}", status="200") == 3
+    assert sample(count, method="GET", route="/rm-items/{item_id}", status="404") == 1
+    assert sample(count, method="GET", route="/rm-items/a", status="200") == 0
+
+
+def test_in_flight_gauge_counts_the_current_request():
+    assert client.get("/rm-items/x").json()["in_progress"] == 1
+    assert in_progress("GET", "/rm-items/{item_id}") == 0
+
+
+def test_payload_sizes_are_recorded():
+    before = sample("kimera_http_request_size_bytes_sum", method="POST", route="/rm-echo")
+    response = client.post("/rm-echo", json={"text": "x" * 500})
+    body = len(response.content)
+    assert sample("kimera_http_request_size_bytes_sum", method="POST", route="/rm-echo") - before >= 500
+    assert sample("kimera_http_response_size_bytes_sum", method="POST", route="/rm-echo") >= body
+
+
+def test_unmatched_paths_share_one_label():
+    for i in range(5):
+        client.get(f"/rm-nowhere/{i}")
+    assert sample(
+        "kimera_http_request_duration_seconds_count", method="GET", route=UNMATCHED_ROUTE, status="404"
+    ) >= 5
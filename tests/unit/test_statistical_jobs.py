@@ -0,0 +1,74 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from backend.core import statistical_jobs
+from backend.core.statistical_jobs import StatisticalJobRunner, series_fingerprint
+from backend.core.statistical_modeling import STATSMODELS_AVAILABLE, analyze_semantic_market
+
+SERIES = (np.cumsum(np.random.default_rng(0).normal(size=120)) * 0.05 + 3.0).tolist()
+
+
+def finish(runner, job):
+    return asyncio.run(runner.wait(job, timeout=60))
+
+
+def test_fingerprint_depends_on_values_and_extra_inputs():
+    assert series_fingerprint([1.0, 2.0]) == series_fingerprint([1, 2])
+    assert series_fingerprint([1.0, 2.0]) != series_fingerprint([1.0, 2.5])
+    assert series_fingerprint([1.0], {"a": 1}) != series_fingerprint([1.0], {"a": 2})
+
+
+def test_identical_payloads_share_one_job_and_then_hit_the_cache():
+    runner = StatisticalJobRunner(executor="thread")
+    args = ([1.0, 2.0, 3.0], [1.0, 1.5, 2.0], [0.5, 0.4, 0.3])
+    first = runner.submit("semantic_market", series_fingerprint(*args), analyze_semantic_market, *args)
+    again = runner.submit("semantic_market", series_fingerprint(*args), analyze_semantic_market, *args)
+    assert again is first or again.cached
+    finish(runner, first)
+    assert first.status == "completed"
+
+    cached = runner.submit("semantic_market", series_fingerprint(*args), analyze_semantic_market, *args)
+    assert cached.cached and cached.result is first.result
+    assert runner.stats()["submitted"] == 1
+    runner.shutdown()
+
+
+def test_failures_are_recorded_on_the_job():
+    runner = StatisticalJobRunner(executor="thread")
+    job = runner.submit("broken", "x", lambda: 1 / 0)
+    finish(runner, job)
+    assert job.status == "failed" and "division" in job.error
+    assert runner.get_job(job.job_id) is job
+    runner.shutdown()
+
+
+@pytest.mark.skipif(not STATSMODELS_AVAILABLE, reason="statsmodels not installed")
+def test_extended_series_appends_then_warm_starts(monkeypatch):
+    monkeypatch.setattr(statistical_jobs, "STATS_APPEND_MAX_POINTS", 10)
+    runner = StatisticalJobRunner(executor="thread")
+
+    base = finish(runner, runner.submit_entropy_series(SERIES[:100]))
+    assert base.result.diagnostics["arima_update"] == "fit"
+
+    appended = finish(runner, runner.submit_entropy_series(SERIES[:105]))
+    assert appended.warm_start == "append"
+    assert appended.result.diagnostics["arima_update"] == "append"
+    assert appended.result.diagnostics["arima_params"] == base.result.diagnostics["arima_params"]
+    assert len(appended.result.predictions) == 5
+
+    refit = finish(runner, runner.submit_entropy_series(SERIES[:120]))
+    assert refit.warm_start == "warm_start"
+    assert refit.result.diagnostics["arima_update"] == "warm_start"
+    assert runner.stats()["appends"] == 1 and runner.stats()["warm_starts"] == 1
+    runner.shutdown()
+
+
+def test_process_pool_runs_fits_out_of_process():
+    runner = StatisticalJobRunner(max_workers=1, executor="process")
+    job = finish(runner, runner.submit_entropy_series(SERIES[:40]))
+    assert job.status == "completed", job.error
+    assert job.result.statistics["mean"] == pytest.approx(np.mean(SERIES[:40]))
+    assert runner.stats()["executor"] == "ProcessPoolExecutor"
+    runner.shutdown(wait=True)
@@ -0,0 +1,43 @@
+import time
+
+from backend.monitoring.status_snapshot import StatusSnapshotter
+
+
+def test_snapshot_is_collected_once_and_reused():
+    calls = []
+
+    def collector():
+        calls.append(1)
+        return {"active_geoids": len(calls)}
+
+    snapshotter = StatusSnapshotter(collector, interval=0)
+    first = snapshotter.get()
+    second = snapshotter.get()
+    assert first is second
+    assert first.to_dict() == {"active_geoids": 1}
+    assert len(calls) == 1
+
+    fresh = snapshotter.refresh()
+    assert fresh.to_dict() == {"active_geoids": 2}
+    assert snapshotter.snapshot is fresh
+
+
+def test_background_thread_refreshes_and_survives_errors():
+    state = {"n": 0}
+
+    def collector():
+        state["n"] += 1
+        if state["n"] == 2:
+            raise RuntimeError("transient")
+        return {"n": state["n"]}
+
+    snapshotter = StatusSnapshotter(collector, interval=0.01)
+    snapshotter.start()
+    try:
+        deadline = time.time() + 2
+        while snapshotter.refresh_count < 3 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        snapshotter.stop()
+    assert snapshotter.refresh_count >= 3
+    assert snapshotter.error_count >= 1
@@ -0,0 +1,40 @@
+import asyncio
+
+from backend.core.context_supremacy import ContextSupremacyEngine
+from backend.core.revolutionary_intelligence import RevolutionaryIntelligenceOrchestrator
+from backend.core.text_analysis import analyze_text
+
+
+def test_analysis_derives_every_form_once():
+    analysis = analyze_text("Art matters. But Science WINS.")
+    assert analysis.lower == "art matters. but science wins."
+    assert analysis.tokens == ("art", "matters.", "but", "science", "wins.")
+    assert analysis.sentences == ("Art matters", " But Science WINS", "")
+    assert analysis.sentences_lower == tuple(s.lower() for s in analysis.sentences)
+
+
+def test_pattern_counts_are_memoised_per_matcher():
+    engine = ContextSupremacyEngine()
+    analysis = analyze_text("I want to create something, this is urgent", [engine.signature_matcher])
+    counts = analysis.pattern_counts(engine.signature_matcher)
+    assert analysis.pattern_counts(engine.signature_matcher) is counts
+    assert counts == engine.signature_matcher.counts(analysis.lower)
+
+
+def test_context_profile_is_identical_with_shared_analysis():
+    engine = ContextSupremacyEngine()
+    text = "Help! This is an emergency, I can't cope."
+    direct = engine.analyze_context_supremacy(text, {})
+    engine.invalidate_profile_cache()
+    shared = engine.analyze_context_supremacy(text, {}, analyze_text(text))
+    assert shared.context_type == direct.context_type
+    assert shared.dimensions == direct.dimensions
+
+
+def test_orchestrator_runs_all_phases():
+    orchestrator = RevolutionaryIntelligenceOrchestrator()
+    response = asyncio.run(orchestrator.orchestrate_revolutionary_response(
+        "I always thought art was useless, but now it seems essential. I want to create."
+    ))
+    assert isinstance(response, dict)
+    assert orchestrator.revolutionary_moments
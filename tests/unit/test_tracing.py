@@ -0,0 +1,83 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from backend.engines import kccl
+from backend.engines.kccl import KimeraCognitiveCycle
+from backend.monitoring import tracing
+from backend.monitoring.tracing import Tracer
+
+
+def test_nested_spans_form_one_trace():
+    tracer = Tracer(buffer_size=5, trace_file="")
+    with tracer.span("root", n=1) as root:
+        with tracer.span("child") as child:
+            with tracer.span("grandchild"):
+                pass
+        root.set("done", True)
+
+    (trace,) = tracer.recent_traces()
+    spans = {s["name"]: s for s in trace["spans"]}
+    assert set(spans) == {"root", "child", "grandchild"}
+    assert spans["child"]["parent_id"] == spans["root"]["span_id"]
+    assert spans["grandchild"]["parent_id"] == child.span_id
+    assert {s["trace_id"] for s in trace["spans"]} == {trace["trace_id"]}
+    assert spans["root"]["attributes"] == {"n": 1, "done": True}
+    assert spans["root"]["duration_ms"] >= spans["child"]["duration_ms"]
+
+
+def test_errors_are_recorded_and_reraised():
+    tracer = Tracer(trace_file="")
+    with pytest.raises(ValueError):
+        with tracer.span("root"):
+            with tracer.span("failing"):
+                raise ValueError("boom")
+    spans = {s["name"]: s for s in tracer.recent_traces()[0]["spans"]}
+    assert spans["failing"]["status"] == "error" and "boom" in spans["failing"]["error"]
+    assert spans["root"]["status"] == "error"
+
+
+def test_ring_buffer_and_json_lines_file(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(buffer_size=3, trace_file=str(path))
+    for i in range(5):
+        with tracer.span("root", i=i):
+            pass
+    assert [t["spans"][0]["attributes"]["i"] for t in tracer.recent_traces()] == [4, 3, 2]
+    assert len(path.read_text().splitlines()) == 5
+    assert json.loads(path.read_text().splitlines()[0])["name"] == "root"
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(enabled=False)
+    with tracer.span("root") as s:
+        s.set("ignored", 1)
+    assert tracer.recent_traces() == []
+
+
+def test_cognitive_cycle_emits_phase_spans(monkeypatch):
+    tracer = Tracer(trace_file="")
+    monkeypatch.setattr(tracing, "tracer", tracer)
+    monkeypatch.setattr(kccl, "encode_text", lambda text: [0.0, 1.0])
+
+    geoid = SimpleNamespace(semantic_state={"a": 1.0}, calculate_entropy=lambda: 0.5)
+    tension = SimpleNamespace(geoid_a="g1", geoid_b="g2", tension_score=0.5)
+    inserted = []
+    system = {
+        "spde_engine": SimpleNamespace(diffuse=lambda state: state),
+        "contradiction_engine": SimpleNamespace(detect_tension_gradients=lambda geoids: [tension, tension]),
+        "vault_manager": SimpleNamespace(insert_scar=lambda scar, vector: inserted.append(scar)),
+        "active_geoids": {"g1": geoid, "g2": geoid},
+    }
+
+    assert KimeraCognitiveCycle().run_cycle(system) == "cycle complete"
+    (trace,) = tracer.recent_traces(name="cognitive_cycle")
+    names = [s["name"] for s in trace["spans"]]
+    for phase in ("spde_diffusion", "contradiction_detection", "scar_creation"):
+        assert names.count(phase) == 1
+    assert names.count("embedding.encode_text") == 2 and names.count("vault.insert_scar") == 2
+    assert trace["spans"][0]["attributes"] == {"active_geoids": 2, "status": "cycle complete"}
+
+    summary = tracer.phase_summary(name="cognitive_cycle")
+    assert summary["vault.insert_scar"]["count"] == 2
@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from backend.vault import database, enhanced_database_schema as schema, statistics
+from backend.vault import understanding_vault_manager as uvm_module
+from backend.vault.database import GeoidDB, ScarDB
+from backend.vault.understanding_vault_manager import UnderstandingVaultManager
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    database.Base.metadata.create_all(engine)
+    schema.Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(uvm_module, "SessionLocal", factory)
+    statistics.invalidate_vault_statistics()
+    yield factory
+    statistics.invalidate_vault_statistics()
+    engine.dispose()
+
+
+def count_statements(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_vault_summary_counts_in_one_statement(session_factory):
+    with session_factory() as db:
+        db.add_all([ScarDB(scar_id=f"s{i}", vault_id="vault_a" if i < 3 else "vault_b") for i in range(5)])
+        db.add_all([GeoidDB(geoid_id=f"g{i}") for i in range(7)])
+        db.commit()
+
+        statements = count_statements(db.get_bind())
+        assert statistics.vault_summary(db) == {"vault_a_scars": 3, "vault_b_scars": 2, "total_geoids": 7}
+        assert len(statements) == 1
+        assert statistics.vault_scar_counts(db) == {"vault_a": 3, "vault_b": 2}
+
+
+def test_understanding_metrics_use_aggregated_query_and_cache(session_factory):
+    with session_factory() as db:
+        db.add_all([schema.SelfModelDB(model_id=f"m{i}") for i in range(4)])
+        db.add_all([
+            schema.UnderstandingTestDB(test_id=f"t{i}", passed=i % 2 == 0, accuracy_score=0.5, understanding_quality=0.25)
+            for i in range(3)
+        ])
+        db.commit()
+        statements = count_statements(db.get_bind())
+
+    manager = UnderstandingVaultManager()
+    metrics = manager.get_understanding_metrics()
+    assert metrics["understanding_components"]["self_models"] == 4
+    assert metrics["understanding_components"]["genuine_opinions"] == 0
+    assert metrics["understanding_quality"]["tests_passed"] == 2
+    assert metrics["understanding_quality"]["average_test_accuracy"] == pytest.approx(0.5)
+    assert metrics["roadmap_progress"]["phase_2_self_awareness"] == pytest.approx(0.4)
+    assert len(statements) == 2  # counts + recent tests
+
+    manager.get_understanding_metrics()
+    assert len(statements) == 2  # served from the cache
+
+    statistics.invalidate_vault_statistics()
+    manager.get_understanding_metrics()
+    assert len(statements) == 4